@@ -1,29 +1,61 @@
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
+import asyncio
 import json
+import threading
+import time
 
 from ..domain.debate.models import DebateSession, DebateSettings, DebateStatus
 from ..domain.debate.orchestrator import DebateOrchestrator
+from ..domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from ..domain.debate.events import BackpressurePolicy, EventSubscription, EVENT_TYPES
 from ..domain.debate.judge import DebateJudge, create_judge
+from ..domain.debate.memory import Summarizer
 from ..domain.characters.base import Character
 from ..domain.topics import DebateTopics, create_topic_prompt
 from ..infrastructure.ai_client import AIClient
+from ..infrastructure.http_transport import PooledHTTPTransport, diff_transport_stats
 from ..infrastructure.logging_config import get_debate_logger
 from .character_service import CharacterService
+from .presenter import PacedPresenter
 
 
 class DebateService:
     """High-level service for managing debate sessions."""
     
-    def __init__(self, ai_client: AIClient, character_service: CharacterService = None):
-        """Initialize the debate service."""
+    def __init__(
+        self,
+        ai_client: AIClient,
+        character_service: CharacterService = None,
+        journal_dir: Optional[str] = None,
+        journal_fsync_interval: float = 1.0,
+        event_backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        event_buffer_size: int = 256,
+        summarizer: Optional[Summarizer] = None,
+        judge_options: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the debate service; ``journal_dir`` makes sessions resumable after a crash.
+
+        UI callbacks are fed from a buffer of ``event_buffer_size`` events
+        whose ``event_backpressure`` policy decides what happens to
+        generation when the display falls behind. ``summarizer`` compresses
+        older rounds for sessions with ``summary_memory`` on. Competitive
+        sessions get a judge from ``create_judge(**judge_options)``, an AI
+        judge by default.
+        """
         self.ai_client = ai_client
         self.character_service = character_service or CharacterService()
         self.logger = get_debate_logger()
+        self.journal_dir = journal_dir
+        self.journal_fsync_interval = journal_fsync_interval
+        self.event_backpressure = event_backpressure
+        self.event_buffer_size = event_buffer_size
+        self.summarizer = summarizer
+        self.judge_options = judge_options or {"judge_type": "ai"}
         
         # Initialize components
         self.topics = DebateTopics()
-        self.orchestrator: Optional[DebateOrchestrator] = None
+        self.orchestrator: Optional[AsyncDebateOrchestrator] = None
         self.judge: Optional[DebateJudge] = None
         
         # Session management
@@ -46,6 +78,60 @@ class DebateService:
             except Exception as e:
                 self.logger.error(f"Error in UI callback {event_name}: {str(e)}")
     
+    def _subscribe_ui(self) -> EventSubscription:
+        """Subscribe to the orchestrator events that have a UI callback."""
+        return self.orchestrator.events.subscribe(
+            policy=self.event_backpressure,
+            max_buffered=self.event_buffer_size,
+            event_types=[EVENT_TYPES[name] for name in self._ui_callbacks if name in EVENT_TYPES]
+        )
+    
+    def _run_presented(self, run_debate: Callable[[], None], delay: float) -> Dict[str, Any]:
+        """Generate on a worker thread while this thread delivers UI events at ``delay`` cadence."""
+        presenter = PacedPresenter(self._trigger_ui_callback, delay, subscription=self._subscribe_ui())
+        failures: List[BaseException] = []
+        generation = {}
+        
+        def produce():
+            started = time.perf_counter()
+            try:
+                run_debate()
+            except BaseException as e:
+                failures.append(e)
+            finally:
+                generation["seconds"] = time.perf_counter() - started
+                presenter.close()
+        
+        producer = threading.Thread(target=produce, name="debate-generator", daemon=True)
+        producer.start()
+        try:
+            presenter.run()
+        finally:
+            if producer.is_alive() and not failures:
+                # The display went away (e.g. a UI rerun); stop generating too
+                presenter.abort()
+                self.orchestrator.stop_debate()
+            producer.join()
+        
+        if failures:
+            raise failures[0]
+        return {"generation_seconds": generation.get("seconds", 0.0), **presenter.get_stats()}
+    
+    async def _deliver_async(self, subscription: EventSubscription) -> None:
+        """Deliver UI events on the event loop as the orchestrator publishes them."""
+        async for event in subscription:
+            self._trigger_ui_callback(event.name, *event.args())
+    
+    def _create_orchestrator(self) -> None:
+        """Create the orchestrator; UI callbacks subscribe to its events for each run."""
+        # Create orchestrator (supports both blocking and coroutine execution)
+        self.orchestrator = AsyncDebateOrchestrator(
+            self.ai_client, self.judge,
+            journal_dir=self.journal_dir,
+            journal_fsync_interval=self.journal_fsync_interval,
+            summarizer=self.summarizer
+        )
+    
     def get_available_topics(self) -> List[str]:
         """Get all available debate topics."""
         return self.topics.get_all_topics()
@@ -80,27 +166,9 @@ class DebateService:
             
             # Set up judge for competitive mode
             if settings and settings.competitive_mode:
-                self.judge = create_judge("ai", ai_client=self.ai_client)
-            
-            # Create orchestrator
-            self.orchestrator = DebateOrchestrator(self.ai_client, self.judge)
+                self.judge = create_judge(**self.judge_options, ai_client=self.ai_client)
             
-            # Set up orchestrator callbacks
-            self.orchestrator.on_message_generated = lambda msg, char: self._trigger_ui_callback(
-                "message_generated", msg, char
-            )
-            self.orchestrator.on_round_completed = lambda round_obj, round_num: self._trigger_ui_callback(
-                "round_completed", round_obj, round_num
-            )
-            self.orchestrator.on_judge_feedback = lambda feedback, round_num: self._trigger_ui_callback(
-                "judge_feedback", feedback, round_num
-            )
-            self.orchestrator.on_session_completed = lambda session: self._trigger_ui_callback(
-                "session_completed", session
-            )
-            self.orchestrator.on_progress_update = lambda progress, round_num, speaker: self._trigger_ui_callback(
-                "progress_update", progress, round_num, speaker
-            )
+            self._create_orchestrator()
             
             # Create debate session
             self.current_session = self.orchestrator.create_debate(topic, participants, settings)
@@ -113,7 +181,7 @@ class DebateService:
                 "participants": participants,
                 "warnings": character_validation.get("warnings", [])
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to create debate session: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -129,11 +197,73 @@ class DebateService:
             
             self.logger.info(f"Starting debate: {self.current_session.topic}")
             
-            # Start the orchestrator (this will run the debate)
-            self.orchestrator.start_debate(participants)
+            # Snapshot connection pool counters to report reuse for this debate
+            transport = getattr(self.ai_client, "transport", None)
+            if not isinstance(transport, PooledHTTPTransport):
+                transport = None
+            stats_before = transport.get_stats() if transport else None
+            
+            # Generate in the background; a display delay only paces what the UI shows
+            delay = self.current_session.settings.response_delay
+            pacing_stats = self._run_presented(lambda: self.orchestrator.start_debate(participants), max(delay, 0.0))
+            self.current_session.metadata["pacing_stats"] = pacing_stats
+            
+            if "pause_reason" in self.current_session.metadata:
+                self.logger.warning(f"Debate paused: {self.current_session.metadata['pause_reason']}")
+            
+            if transport:
+                transport_stats = diff_transport_stats(stats_before, transport.get_stats())
+                self.current_session.metadata["transport_stats"] = transport_stats
+                self.logger.info(
+                    f"Connection pool: {transport_stats['pool_hits']} hits, "
+                    f"{transport_stats['pool_misses']} misses, "
+                    f"~{transport_stats['estimated_seconds_saved']:.2f}s handshake time saved"
+                )
+            
+            if hasattr(self.ai_client, "get_rate_limit_stats"):
+                rate_limit_stats = self.ai_client.get_rate_limit_stats()
+                self.current_session.metadata["rate_limit_stats"] = rate_limit_stats
+                self.logger.info(
+                    f"Rate limiter: queue depth {rate_limit_stats['queue_depth']}, "
+                    f"avg wait {rate_limit_stats['avg_wait_seconds']:.2f}s, "
+                    f"{rate_limit_stats['rejections']} rejections"
+                )
+            
+            if hasattr(self.ai_client, "get_cache_stats"):
+                cache_stats = self.ai_client.get_cache_stats()
+                self.current_session.metadata["cache_stats"] = cache_stats
+                self.logger.info(
+                    f"Response cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                    f"{cache_stats['evictions']} evictions"
+                )
             
             return {"success": True}
+        
+        except Exception as e:
+            self.logger.error(f"Failed to start debate: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def start_debate_async(self, participants: List[Character]) -> Dict[str, Any]:
+        """Start the current debate session as a coroutine on the running event loop."""
+        try:
+            if not self.orchestrator or not self.current_session:
+                return {"success": False, "error": "No active debate session"}
+            
+            if self.current_session.status != DebateStatus.NOT_STARTED:
+                return {"success": False, "error": "Debate already started"}
+            
+            self.logger.info(f"Starting async debate: {self.current_session.topic}")
+            
+            subscription = self._subscribe_ui()
+            display = asyncio.create_task(self._deliver_async(subscription))
+            try:
+                await self.orchestrator.start_debate_async(participants)
+            finally:
+                subscription.close()
+                await display
             
+            return {"success": True}
+        
         except Exception as e:
             self.logger.error(f"Failed to start debate: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -148,7 +278,7 @@ class DebateService:
             self.logger.info(f"Stopped debate: {self.current_session.topic}")
             
             return {"success": True}
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to stop debate: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -163,7 +293,7 @@ class DebateService:
             self.logger.info(f"Paused debate: {self.current_session.topic}")
             
             return {"success": True}
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to pause debate: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -174,15 +304,43 @@ class DebateService:
             if not self.orchestrator or not self.current_session:
                 return {"success": False, "error": "No active debate session"}
             
-            self.orchestrator.resume_debate(participants)
+            delay = max(self.current_session.settings.response_delay, 0.0)
+            self._run_presented(lambda: self.orchestrator.resume_debate(participants), delay)
             self.logger.info(f"Resumed debate: {self.current_session.topic}")
             
             return {"success": True}
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to resume debate: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    def resume_from_journal(self, session_id: str) -> Dict[str, Any]:
+        """Restore a session interrupted by a crash or restart from its journal."""
+        try:
+            if not self.journal_dir:
+                return {"success": False, "error": "Session journaling is not enabled"}
+            
+            self.orchestrator = None
+            self.judge = None
+            self._create_orchestrator()
+            participants = self.orchestrator.resume_from_journal(session_id)
+            self.current_session = self.orchestrator.current_session
+            
+            if self.current_session.settings.competitive_mode:
+                self.judge = create_judge(**self.judge_options, ai_client=self.ai_client)
+                self.orchestrator.judge = self.judge
+            
+            self.logger.info(
+                f"Restored session {session_id} from journal: "
+                f"{len(self.current_session.conversation.rounds)} rounds, status {self.current_session.status.value}"
+            )
+            
+            return {"success": True, "session": self.current_session, "participants": participants}
+        
+        except Exception as e:
+            self.logger.error(f"Failed to restore session from journal: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
     def get_session_status(self) -> Dict[str, Any]:
         """Get the current session status."""
         if not self.current_session:
@@ -215,14 +373,14 @@ class DebateService:
         """Import a session from exported data."""
         try:
             if not self.orchestrator:
-                self.orchestrator = DebateOrchestrator(self.ai_client)
+                self.orchestrator = AsyncDebateOrchestrator(self.ai_client)
             
             self.current_session = self.orchestrator.import_session(session_data)
             
             self.logger.info(f"Imported session: {self.current_session.topic}")
             
             return {"success": True, "session": self.current_session}
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to import session: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -0,0 +1,133 @@
+from typing import Callable, Dict, Any, Optional, Tuple
+import queue
+import threading
+import time
+
+from ..domain.debate.events import EventSubscription
+
+
+class DisplayPacer:
+    """Spaces out displayed messages without holding up the work between them.
+
+    Time spent generating after ``mark()`` counts toward the interval, so a
+    turn costs max(generation, delay) instead of generation + delay.
+    """
+    
+    def __init__(
+        self,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize with the minimum interval between displayed messages."""
+        self.interval = interval
+        self._clock = clock
+        self._sleep = sleep
+        self._next_release = 0.0
+    
+    def wait(self) -> float:
+        """Sleep until the next message may be shown; return the seconds slept."""
+        remaining = self._next_release - self._clock()
+        if remaining <= 0:
+            return 0.0
+        self._sleep(remaining)
+        return remaining
+    
+    def mark(self) -> None:
+        """Record that a message was just shown."""
+        self._next_release = self._clock() + self.interval
+
+
+_CLOSED = object()
+
+
+class PacedPresenter:
+    """Bounded buffer between a generating thread and a display thread.
+
+    The producer publishes orchestrator events as fast as they are generated
+    (blocking only when ``max_buffered`` events are waiting); ``run`` replays
+    them in order on the calling thread, pausing ``delay`` seconds after each
+    ``message_generated`` event. Given an event bus ``subscription``, events
+    are read from it instead and its backpressure policy governs the producer.
+    """
+    
+    PACED_EVENT = "message_generated"
+    
+    def __init__(
+        self,
+        deliver: Callable[..., None],
+        delay: float = 0.0,
+        max_buffered: int = 256,
+        pacer: Optional[DisplayPacer] = None,
+        subscription: Optional[EventSubscription] = None
+    ):
+        """Initialize with ``deliver(event_name, *args)`` and the display cadence."""
+        self.deliver = deliver
+        self.subscription = subscription
+        self.pacer = pacer or DisplayPacer(delay)
+        self._queue: "queue.Queue[Tuple[str, tuple]]" = queue.Queue(maxsize=max_buffered)
+        self._aborted = threading.Event()
+        
+        # Metrics
+        self.published = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.display_wait_seconds = 0.0
+    
+    def publish(self, event_name: str, *args) -> bool:
+        """Buffer an event for display; returns False if the display has gone away."""
+        while not self._aborted.is_set():
+            try:
+                self._queue.put((event_name, args), timeout=0.1)
+            except queue.Full:
+                continue
+            self.published += 1
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+            return True
+        
+        self.dropped += 1
+        return False
+    
+    def close(self) -> None:
+        """Signal that the producer is done; ``run`` returns once the buffer drains."""
+        if self.subscription is not None:
+            self.subscription.close()
+        else:
+            self.publish(_CLOSED)
+    
+    def abort(self) -> None:
+        """Stop displaying and unblock the producer; later events are dropped."""
+        self._aborted.set()
+        if self.subscription is not None:
+            self.subscription.close(drain=False)
+    
+    def _next(self) -> Tuple[Any, tuple]:
+        """Wait for the next buffered event as ``(event_name, args)``."""
+        if self.subscription is None:
+            return self._queue.get()
+        event = self.subscription.get()
+        return (_CLOSED, ()) if event is None else (event.name, event.args())
+    
+    def run(self) -> None:
+        """Deliver buffered events at display cadence until the producer closes."""
+        while not self._aborted.is_set():
+            event_name, args = self._next()
+            if event_name is _CLOSED:
+                return
+            
+            self.display_wait_seconds += self.pacer.wait()
+            self.deliver(event_name, *args)
+            if event_name == self.PACED_EVENT:
+                self.pacer.mark()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer and pacing metrics."""
+        stats = {
+            "published": self.published,
+            "dropped": self.dropped,
+            "max_buffer_depth": self.max_depth,
+            "display_wait_seconds": self.display_wait_seconds
+        }
+        if self.subscription is not None:
+            stats.update(self.subscription.get_stats())
+        return stats
@@ -0,0 +1,372 @@
+"""Headless batch runner for generating debate corpora.
+
+Usage::
+
+    python -m debate_simulator.batch matrix.json --out corpus.jsonl --concurrency 8
+
+``matrix.json`` lists topics, character line-ups and settings to combine::
+
+    {
+        "topics": ["Should the minimum wage be raised?"],
+        "lineups": [["democratic_commentator", "republican_commentator"]],
+        "settings": [{"total_rounds": 3}, {"total_rounds": 3, "competitive_mode": true}],
+        "repeats": 2
+    }
+
+Every finished debate is appended to the output as one JSON line. Rerunning
+with the same output skips debates that already completed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Iterable, Set
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+
+from .application.character_service import CharacterService
+from .application.debate_service import DebateService
+from .domain.debate.context import TokenCounter, create_token_counter
+from .domain.debate.models import DebateSession, DebateSettings
+from .infrastructure.ai_client import AIClient, create_ai_client
+from .infrastructure.session_journal import read_journal
+
+
+@dataclass
+class BatchJob:
+    """One debate to run: a topic, a character line-up and its settings."""
+    topic: str
+    character_types: List[str]
+    settings: DebateSettings = field(default_factory=DebateSettings)
+    repeat: int = 0
+    
+    @property
+    def job_id(self) -> str:
+        """Stable identifier, so reruns can tell which debates are already done."""
+        canonical = json.dumps(
+            {"topic": self.topic, "lineup": self.character_types, "settings": self.settings.to_dict(), "repeat": self.repeat},
+            sort_keys=True
+        )
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "topic": self.topic,
+            "character_types": self.character_types,
+            "settings": self.settings.to_dict(),
+            "repeat": self.repeat
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BatchJob':
+        """Create from dictionary."""
+        return cls(
+            topic=data["topic"],
+            character_types=list(data["character_types"]),
+            settings=DebateSettings.from_dict(data.get("settings", {})),
+            repeat=data.get("repeat", 0)
+        )
+
+
+def expand_matrix(
+    topics: List[str],
+    lineups: List[List[str]],
+    settings_grid: Optional[List[Dict[str, Any]]] = None,
+    repeats: int = 1
+) -> List[BatchJob]:
+    """Build one job per topic x line-up x settings x repeat."""
+    jobs = []
+    for topic in topics:
+        for lineup in lineups:
+            for settings in settings_grid or [{}]:
+                for repeat in range(repeats):
+                    jobs.append(BatchJob(topic, list(lineup), DebateSettings.from_dict(settings), repeat))
+    return jobs
+
+
+def load_matrix(path: str) -> List[BatchJob]:
+    """Load a job matrix from a JSON file."""
+    with open(path, "r", encoding="utf-8") as matrix_file:
+        matrix = json.load(matrix_file)
+    
+    return expand_matrix(
+        matrix["topics"],
+        matrix["lineups"],
+        matrix.get("settings"),
+        matrix.get("repeats", 1)
+    )
+
+
+def completed_job_ids(output_path: str) -> Set[str]:
+    """Get the jobs an earlier run already finished successfully."""
+    if not os.path.exists(output_path):
+        return set()
+    return {record["job_id"] for record in read_journal(output_path) if record.get("status") == "completed"}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(fraction * len(ordered))))
+    return ordered[rank - 1]
+
+
+def debate_metrics(session: DebateSession, token_counter: TokenCounter, wall_seconds: float) -> Dict[str, Any]:
+    """Measure one finished debate: turns, tokens and per-turn latency."""
+    messages = session.conversation.get_all_messages()
+    return {
+        "turns": len(messages),
+        "failed_turns": sum(1 for m in messages if m.metadata.get("error")),
+        "prompt_tokens": sum(m.metadata.get("prompt_tokens", 0) for m in messages),
+        "completion_tokens": sum(token_counter.count_text(m.message) for m in messages if not m.metadata.get("error")),
+        "turn_latencies_ms": [m.metadata["latency_ms"] for m in messages if "latency_ms" in m.metadata],
+        "wall_seconds": wall_seconds
+    }
+
+
+async def run_job_async(job: BatchJob, ai_client: AIClient, token_counter: TokenCounter) -> Dict[str, Any]:
+    """Run one debate to completion and build its output record."""
+    record = {"job_id": job.job_id, "job": job.to_dict()}
+    started = time.perf_counter()
+    
+    service = DebateService(ai_client, CharacterService())
+    created = service.create_debate_session(job.topic, job.character_types, job.settings)
+    if not created["success"]:
+        return {**record, "status": "failed", "error": str(created["error"])}
+    
+    result = await service.start_debate_async(created["participants"])
+    session = service.current_session
+    if not result["success"]:
+        return {**record, "status": "failed", "error": result["error"]}
+    
+    return {
+        **record,
+        "status": "completed",
+        "session": session.to_dict(),
+        "summary": service.orchestrator.get_session_summary(),
+        "metrics": debate_metrics(session, token_counter, time.perf_counter() - started)
+    }
+
+
+class BatchStats:
+    """Running totals for a batch, reported as progress and as the final summary."""
+    
+    def __init__(self, total: int, skipped: int = 0, clock: Callable[[], float] = time.perf_counter):
+        """Initialize with the number of jobs to run and how many were already done."""
+        self.total = total
+        self.skipped = skipped
+        self.completed = 0
+        self.failed = 0
+        self.turns = 0
+        self.tokens = 0
+        self.turn_latencies_ms: List[float] = []
+        self._clock = clock
+        self._started = clock()
+    
+    def record(self, record: Dict[str, Any]) -> None:
+        """Fold one finished debate into the totals."""
+        if record["status"] != "completed":
+            self.failed += 1
+            return
+        
+        metrics = record["metrics"]
+        self.completed += 1
+        self.turns += metrics["turns"]
+        self.tokens += metrics["prompt_tokens"] + metrics["completion_tokens"]
+        self.turn_latencies_ms.extend(metrics["turn_latencies_ms"])
+    
+    def summary(self) -> Dict[str, Any]:
+        """Get throughput and latency figures so far."""
+        elapsed = self._clock() - self._started
+        minutes = elapsed / 60 if elapsed > 0 else float("inf")
+        return {
+            "total": self.total,
+            "skipped": self.skipped,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed_seconds": elapsed,
+            "debates_per_min": self.completed / minutes,
+            "tokens_per_min": self.tokens / minutes,
+            "turns": self.turns,
+            "p50_turn_latency_ms": percentile(self.turn_latencies_ms, 0.50),
+            "p95_turn_latency_ms": percentile(self.turn_latencies_ms, 0.95)
+        }
+
+
+class BatchRunner:
+    """Runs many debates in parallel under one concurrency limit and streams them to JSONL.
+
+    By default debates run as coroutines on one event loop sharing a single
+    AI client. With ``processes`` set, each debate runs in a worker process
+    instead (for CPU-heavy judging or clients that hold the GIL); the
+    parent process is always the only writer of the output file.
+    """
+    
+    def __init__(
+        self,
+        output_path: str,
+        client_options: Optional[Dict[str, Any]] = None,
+        concurrency: int = 4,
+        processes: int = 0,
+        resume: bool = True,
+        on_progress: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+    ):
+        """Initialize; ``client_options`` are passed to ``create_ai_client`` in each worker."""
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        
+        self.output_path = output_path
+        self.client_options = client_options or {"client_type": "mock"}
+        self.concurrency = concurrency
+        self.processes = processes
+        self.resume = resume
+        self.on_progress = on_progress
+    
+    def run(self, jobs: Iterable[BatchJob]) -> Dict[str, Any]:
+        """Run every job not already in the output and return the throughput summary."""
+        jobs = list(jobs)
+        done = completed_job_ids(self.output_path) if self.resume else set()
+        pending = [job for job in jobs if job.job_id not in done]
+        stats = BatchStats(total=len(jobs), skipped=len(jobs) - len(pending))
+        
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(self.output_path, "a" if self.resume else "w", encoding="utf-8") as output:
+            def write(record: Dict[str, Any]) -> None:
+                output.write(json.dumps(record, default=str) + "\n")
+                output.flush()
+                stats.record(record)
+                if self.on_progress:
+                    self.on_progress(record, stats.summary())
+            
+            if self.processes > 0:
+                self._run_in_processes(pending, write)
+            else:
+                asyncio.run(self._run_async(pending, write))
+        
+        return stats.summary()
+    
+    async def _run_async(self, jobs: List[BatchJob], write: Callable[[Dict[str, Any]], None]) -> None:
+        """Run jobs as coroutines, at most ``concurrency`` at a time."""
+        ai_client = create_ai_client(**_async_client_options(self.client_options))
+        token_counter = create_token_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run_one(job: BatchJob) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await run_job_async(job, ai_client, token_counter)
+                except Exception as e:
+                    return {"job_id": job.job_id, "job": job.to_dict(), "status": "failed", "error": str(e)}
+        
+        for finished in asyncio.as_completed([run_one(job) for job in jobs]):
+            write(await finished)
+    
+    def _run_in_processes(self, jobs: List[BatchJob], write: Callable[[Dict[str, Any]], None]) -> None:
+        """Run jobs in worker processes, at most ``concurrency`` at a time overall."""
+        workers = max(1, min(self.processes, self.concurrency))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.client_options,)) as pool:
+            futures = [pool.submit(_run_job_in_worker, job.to_dict()) for job in jobs]
+            for future in as_completed(futures):
+                write(future.result())
+
+
+def _async_client_options(client_options: Dict[str, Any]) -> Dict[str, Any]:
+    """Prefer the coroutine flavour of a client type on the event loop."""
+    options = dict(client_options)
+    client_type = options.get("client_type", "openai")
+    if client_type in ("openai", "mock"):
+        options["client_type"] = f"{client_type}_async"
+    return options
+
+
+# Per-process state for ProcessPoolExecutor workers
+_worker_client: Optional[AIClient] = None
+_worker_token_counter: Optional[TokenCounter] = None
+
+
+def _init_worker(client_options: Dict[str, Any]) -> None:
+    """Create the AI client once per worker process."""
+    global _worker_client, _worker_token_counter
+    _worker_client = create_ai_client(**_async_client_options(client_options))
+    _worker_token_counter = create_token_counter()
+
+
+def _run_job_in_worker(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one job inside a worker process."""
+    job = BatchJob.from_dict(job_data)
+    try:
+        return asyncio.run(run_job_async(job, _worker_client, _worker_token_counter))
+    except Exception as e:
+        return {"job_id": job.job_id, "job": job.to_dict(), "status": "failed", "error": str(e)}
+
+
+def _print_progress(record: Dict[str, Any], summary: Dict[str, Any]) -> None:
+    """Report one finished debate on stderr."""
+    finished = summary["completed"] + summary["failed"] + summary["skipped"]
+    status = "ok" if record["status"] == "completed" else f"FAILED ({record.get('error')})"
+    print(
+        f"[{finished}/{summary['total']}] {record['job']['topic'][:50]!r} {status} - "
+        f"{summary['debates_per_min']:.1f} debates/min, {summary['tokens_per_min']:.0f} tokens/min",
+        file=sys.stderr
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run a batch from the command line."""
+    parser = argparse.ArgumentParser(description="Run a matrix of debates headlessly and write them as JSONL")
+    parser.add_argument("matrix", help="JSON file with topics, lineups, settings and repeats")
+    parser.add_argument("--out", default="debates.jsonl", help="JSONL file to append finished sessions to")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum debates in flight at once")
+    parser.add_argument("--processes", type=int, default=0, help="Run debates in this many worker processes instead of one event loop")
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite the output instead of skipping finished debates")
+    parser.add_argument("--mock", action="store_true", help="Use the mock AI client")
+    parser.add_argument("--mock-latency", type=float, default=0.0, help="Simulated mock latency in seconds")
+    parser.add_argument("--summary-out", help="Also write the throughput summary to this JSON file")
+    args = parser.parse_args(argv)
+    
+    if args.mock:
+        client_options = {"client_type": "mock", "latency": args.mock_latency}
+    else:
+        from .infrastructure.config import get_config_manager
+        from .infrastructure.resilience import RetryPolicy
+        config_manager = get_config_manager()
+        ai_config = config_manager.get_ai_config()
+        client_options = {
+            "client_type": "mock" if ai_config["use_mock"] else "openai",
+            "api_key": ai_config["api_key"],
+            "model": ai_config["model"],
+            "api_base": ai_config["api_base"],
+            "structured_output": ai_config["structured_output"],
+            "retry_policy": RetryPolicy.from_config(config_manager.config)
+        }
+    
+    runner = BatchRunner(
+        args.out,
+        client_options=client_options,
+        concurrency=args.concurrency,
+        processes=args.processes,
+        resume=not args.no_resume,
+        on_progress=_print_progress
+    )
+    summary = runner.run(load_matrix(args.matrix))
+    
+    print(json.dumps(summary, indent=2))
+    if args.summary_out:
+        with open(args.summary_out, "w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
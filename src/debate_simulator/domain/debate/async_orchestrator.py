@@ -0,0 +1,303 @@
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterable
+import asyncio
+import time
+
+from .events import DebateEvent, MessageGenerated, MessageDelta, RoundCompleted
+from .judging import AsyncJudgingPipeline, Verdict
+from .models import DebateMessage, DebateRound
+from .orchestrator import DebateOrchestrator
+from ..characters.base import Character
+from ...infrastructure.cancellation import await_cancellable, cancellation_scope
+from ...infrastructure.errors import CircuitOpenError, DeadlineExceededError
+
+
+class AsyncDebateOrchestrator(DebateOrchestrator):
+    """Runs a debate as a coroutine so many debates can share one event loop."""
+    
+    async def start_debate_async(self, participants: List[Character]) -> None:
+        """Start the debate session and run it to completion."""
+        if not self.current_session:
+            raise ValueError("No active debate session")
+        
+        self.current_session.start()
+        self._open_journal(participants)
+        try:
+            with cancellation_scope(self._begin_run()):
+                await self._conduct_debate_async(participants)
+        finally:
+            self._close_journal()
+    
+    async def resume_debate_async(self, participants: List[Character]) -> None:
+        """Resume a paused debate."""
+        if self.current_session and self.current_session.status.value == "paused":
+            self.current_session.resume()
+            self._open_journal(participants)
+            try:
+                with cancellation_scope(self._begin_run()):
+                    await self._conduct_debate_async(participants, resume=True)
+            finally:
+                self._close_journal()
+    
+    async def _conduct_debate_async(self, participants: List[Character], resume: bool = False) -> None:
+        """Main debate loop, awaiting the AI client instead of blocking on it."""
+        if not self.current_session:
+            return
+        
+        start_round, current_message, unfinished = self._resume_point(resume)
+        
+        pipeline = AsyncJudgingPipeline(self.judge) if self._should_pipeline_judging() else None
+        self._open_memory()
+        self._open_novelty_index(unfinished)
+        try:
+            await self._run_rounds_async(participants, start_round, current_message, pipeline, unfinished)
+            if pipeline:
+                await self._apply_verdicts_async(await pipeline.drain(), participants)
+                self.current_session.metadata["judge_wait_seconds"] = pipeline.wait_seconds
+        finally:
+            if pipeline:
+                pipeline.shutdown()
+            self._close_memory()
+        
+        event = self._finish_session(participants)
+        if event:
+            await self._publish_async(event)
+    
+    async def _run_rounds_async(
+        self,
+        participants: List[Character],
+        start_round: int,
+        current_message: str,
+        pipeline: Optional[AsyncJudgingPipeline] = None,
+        unfinished: Optional[DebateRound] = None
+    ) -> None:
+        """Run the debate rounds, judging inline or through ``pipeline``."""
+        settings = self.current_session.settings
+        
+        for round_num in range(start_round, settings.total_rounds):
+            if self._debate_deadline_passed() or not self.current_session.is_running():
+                break
+            
+            if pipeline:
+                await self._apply_verdicts_async(await pipeline.collect(wait_for_round=round_num - 1), participants)
+            
+            debate_round, round_messages = self._open_round(round_num, unfinished)
+            
+            if settings.is_simultaneous_round(round_num):
+                if pipeline:
+                    await self._apply_verdicts_async(await pipeline.collect(), participants)
+                current_message = await self._run_simultaneous_round_async(
+                    round_num, debate_round, round_messages, participants, current_message
+                )
+            else:
+                current_message = await self._run_sequential_round_async(
+                    round_num, debate_round, round_messages, participants, current_message, pipeline
+                )
+            
+            if not self._close_round(debate_round, round_messages, participants):
+                break
+            self._remember_rounds()
+            
+            batch = self._judging_batch(round_num, debate_round, round_messages)
+            if batch and pipeline:
+                pipeline.submit_batch(batch, participants)
+            elif batch:
+                try:
+                    verdicts = await await_cancellable(
+                        self.judge.judge_rounds_async([messages for _, messages in batch], participants)
+                    )
+                    await self._apply_verdicts_async(list(zip((r for r, _ in batch), verdicts)), participants)
+                except Exception as e:
+                    pass
+            
+            await self._publish_async(RoundCompleted(debate_round, round_num + 1))
+            
+            if not self.current_session.is_running():
+                break
+    
+    async def _run_sequential_round_async(
+        self,
+        round_num: int,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        participants: List[Character],
+        current_message: str,
+        pipeline: Optional[AsyncJudgingPipeline] = None
+    ) -> str:
+        """Let each participant reply to the previous speaker in turn; returns the last reply."""
+        already_spoke = {message.speaker_name for message in round_messages}
+        
+        for participant_index, participant in enumerate(participants):
+            if self._debate_deadline_passed() or not self.current_session.is_running():
+                break
+            
+            if participant.name in already_spoke:
+                continue
+            
+            if pipeline:
+                await self._apply_verdicts_async(await pipeline.collect(), participants)
+            
+            await self._publish_async(self._begin_turn(round_num, participant_index, participant, participants))
+            
+            try:
+                turn_metrics = {}
+                response = await self._generate_turn_async(participant, current_message, round_num + 1, turn_metrics)
+                
+                message = self._create_message(round_num, participant, response, turn_metrics)
+                self._store_message(debate_round, round_messages, message)
+                await self._publish_async(MessageGenerated(message, participant))
+                
+                current_message = response
+            
+            except CircuitOpenError as e:
+                self._pause_for_outage(e)
+                break
+            
+            except Exception as e:
+                if self._was_cancelled(e):
+                    break
+                message = self._create_error_message(round_num, participant, e)
+                self._store_message(debate_round, round_messages, message)
+        
+        return current_message
+    
+    async def _run_simultaneous_round_async(
+        self,
+        round_num: int,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        participants: List[Character],
+        current_message: str
+    ) -> str:
+        """Have every participant answer the same prompt concurrently on the event loop."""
+        settings = self.current_session.settings
+        semaphore = asyncio.Semaphore(max(1, settings.max_concurrent_responses))
+        already_spoke = {message.speaker_name for message in round_messages}
+        
+        for participant_index, participant in enumerate(participants):
+            if participant.name not in already_spoke:
+                await self._publish_async(self._begin_turn(round_num, participant_index, participant, participants))
+        
+        async def take_turn(participant_index: int, participant: Character):
+            turn_metrics = {}
+            async with semaphore:
+                try:
+                    response = await self._generate_turn_async(
+                        participant, current_message, round_num + 1, turn_metrics
+                    )
+                except Exception as e:
+                    return participant_index, participant, e
+            return participant_index, participant, self._create_message(round_num, participant, response, turn_metrics)
+        
+        slots: List[Optional[DebateMessage]] = [None] * len(participants)
+        outage: Optional[CircuitOpenError] = None
+        turns = [
+            take_turn(index, participant) for index, participant in enumerate(participants)
+            if participant.name not in already_spoke
+        ]
+        for completed in asyncio.as_completed(turns):
+            participant_index, participant, outcome = await completed
+            if isinstance(outcome, CircuitOpenError):
+                outage = outcome
+            elif isinstance(outcome, Exception):
+                if self._was_cancelled(outcome):
+                    continue
+                slots[participant_index] = self._create_error_message(round_num, participant, outcome)
+            else:
+                slots[participant_index] = outcome
+                await self._publish_async(MessageGenerated(outcome, participant))
+        
+        return self._finish_simultaneous_round(debate_round, round_messages, slots, outage, current_message)
+    
+    async def _generate_turn_async(
+        self,
+        character: Character,
+        current_message: str,
+        round_number: int,
+        turn_metrics: Dict[str, Any]
+    ) -> str:
+        """Generate a reply within the turn's deadline, falling back per ``timeout_fallback`` on a miss."""
+        misses = []
+        for client in self._turn_clients():
+            budget, scope = self._turn_budget()
+            if misses and budget == 0:
+                break
+            token = self._turn_token(budget)
+            try:
+                with cancellation_scope(token):
+                    response = await await_cancellable(self._generate_character_response_async(
+                        character, current_message, self.current_session.conversation.iter_messages_newest_first(),
+                        round_number, turn_metrics, client=client
+                    ))
+            except DeadlineExceededError as e:
+                misses.append(self._deadline_miss(client, budget, scope))
+                error = e
+                continue
+            finally:
+                token.close()
+            
+            self._note_recovered_turn(misses, turn_metrics)
+            return response
+        
+        return self._fallback_line(character, error, misses, turn_metrics)
+    
+    async def _generate_character_response_async(
+        self,
+        character: Character,
+        current_message: str,
+        history: Iterable[DebateMessage],
+        round_number: Optional[int] = None,
+        turn_metrics: Optional[Dict[str, Any]] = None,
+        client=None
+    ) -> str:
+        """Generate a response for a character without blocking the event loop."""
+        client = client or self.ai_client
+        context_for_ai = self._build_character_messages(character, current_message, history, turn_metrics)
+        start = time.perf_counter()
+        
+        if self._wants_deltas():
+            deltas = []
+            async for delta in self._stream_async(context_for_ai, client):
+                if not deltas and turn_metrics is not None:
+                    turn_metrics["ttft_ms"] = (time.perf_counter() - start) * 1000
+                deltas.append(delta)
+                await self._publish_async(MessageDelta(delta, character, round_number))
+            response = "".join(deltas).strip()
+        elif hasattr(client, "generate_response_async"):
+            response = await client.generate_response_async(context_for_ai)
+        else:
+            # Synchronous clients run in a worker thread
+            response = await asyncio.to_thread(client.generate_response, context_for_ai)
+        
+        if turn_metrics is not None:
+            turn_metrics["latency_ms"] = (time.perf_counter() - start) * 1000
+        
+        return response
+    
+    async def _apply_verdicts_async(self, verdicts: List[Verdict], participants: List[Character]) -> None:
+        """Apply verdicts in round order, announcing each without blocking the event loop."""
+        for debate_round, judge_adjustments in verdicts:
+            if judge_adjustments is not None:
+                await self._publish_async(self._record_judgement(debate_round, judge_adjustments, participants))
+    
+    async def _publish_async(self, event: DebateEvent) -> None:
+        """Publish ``event`` without blocking the event loop on a full subscriber buffer."""
+        await self.events.publish_async(event)
+        callback = getattr(self, f"on_{event.name}", None)
+        if callback:
+            callback(*event.args())
+    
+    async def _stream_async(self, context_for_ai: List[Dict[str, str]], client=None) -> AsyncIterator[str]:
+        """Stream deltas from the AI client, pulling sync iterators from a worker thread."""
+        client = client or self.ai_client
+        if hasattr(client, "stream_response_async"):
+            async for delta in client.stream_response_async(context_for_ai):
+                yield delta
+            return
+        
+        iterator = client.stream_response(context_for_ai)
+        done = object()
+        while True:
+            delta = await asyncio.to_thread(next, iterator, done)
+            if delta is done:
+                break
+            yield delta
@@ -0,0 +1,163 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Iterable, Optional
+import math
+import re
+
+from .models import DebateMessage
+
+
+# Per-message framing tokens and reply priming used by OpenAI chat models
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+# Approximation of the GPT pre-tokenizer: contractions, words, numbers, punctuation runs
+_PRETOKENIZE_PATTERN = re.compile(r"'(?:s|t|re|ve|m|ll|d)|\s?[A-Za-z]+|\s?\d{1,3}|\s?[^\sA-Za-z\d]+|\s+")
+
+
+class TokenCounter(ABC):
+    """Abstract base class for prompt token counters."""
+    
+    @abstractmethod
+    def count_text(self, text: str) -> int:
+        """Count the tokens in a piece of text."""
+        pass
+    
+    def count_message(self, message: Dict[str, str]) -> int:
+        """Count the tokens a chat message costs, including framing."""
+        return MESSAGE_OVERHEAD_TOKENS + self.count_text(message.get("content", ""))
+    
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Count the prompt tokens for a full chat request."""
+        return REPLY_PRIMING_TOKENS + sum(self.count_message(msg) for msg in messages)
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Dependency-free estimator that mimics BPE splitting of English text."""
+    
+    def count_text(self, text: str) -> int:
+        """Estimate tokens: common short pieces are one token, long ones ~4 chars each."""
+        return _estimate_tokens(text)
+
+
+@lru_cache(maxsize=4096)
+def _estimate_tokens(text: str) -> int:
+    """Estimate the BPE token count of ``text`` (cached; system prompts repeat every turn)."""
+    total = 0
+    for piece in _PRETOKENIZE_PATTERN.findall(text):
+        stripped = piece.strip()
+        if not stripped:
+            # Whitespace runs are usually merged into neighbouring tokens
+            total += 1 if len(piece) > 1 else 0
+        else:
+            total += max(1, math.ceil(len(stripped) / 4))
+    return total
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact token counts using ``tiktoken``."""
+    
+    def __init__(self, model: str = "gpt-4o"):
+        """Load the encoding for the model."""
+        import tiktoken
+        try:
+            self.encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            self.encoding = tiktoken.get_encoding("o200k_base")
+        self._count = lru_cache(maxsize=4096)(self._encode_length)
+    
+    def _encode_length(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+    
+    def count_text(self, text: str) -> int:
+        """Count tokens with the model's BPE encoding."""
+        return self._count(text)
+
+
+def create_token_counter(model: str = "gpt-4o") -> TokenCounter:
+    """Factory returning an exact counter when ``tiktoken`` is available."""
+    try:
+        return TiktokenCounter(model)
+    except Exception:
+        # tiktoken missing, or its encoding files cannot be downloaded
+        return HeuristicTokenCounter()
+
+
+@dataclass
+class ContextWindow:
+    """Chat messages selected for one turn and what they cost."""
+    messages: List[Dict[str, str]]
+    prompt_tokens: int
+    history_included: int
+    history_truncated: bool
+    summary_tokens: int = 0
+
+
+class ContextBuilder:
+    """Packs as much recent history as fits a prompt-token budget, oldest dropped first."""
+    
+    def __init__(
+        self,
+        counter: Optional[TokenCounter] = None,
+        prompt_token_budget: int = 1500,
+        max_history_messages: Optional[int] = None
+    ):
+        """Initialize with a token counter and budget."""
+        self.counter = counter or HeuristicTokenCounter()
+        self.prompt_token_budget = prompt_token_budget
+        self.max_history_messages = max_history_messages
+    
+    def build(
+        self,
+        system_prompt: str,
+        history: Iterable[DebateMessage],
+        speaker_name: str,
+        current_message: str,
+        summary: Optional[str] = None
+    ) -> ContextWindow:
+        """Build the message list from ``history`` given newest first.
+
+        The system prompt, ``summary`` of earlier rounds and current message
+        are always sent; history is consumed lazily and stops at the first
+        message that would overflow.
+        """
+        system = {"role": "system", "content": system_prompt}
+        current = {"role": "user", "content": current_message}
+        used = REPLY_PRIMING_TOKENS + self.counter.count_message(system) + self.counter.count_message(current)
+        
+        preamble = [system]
+        summary_tokens = 0
+        if summary:
+            memory = {"role": "system", "content": f"Summary of the earlier rounds:\n{summary}"}
+            summary_tokens = self.counter.count_message(memory)
+            used += summary_tokens
+            preamble.append(memory)
+        
+        selected = []
+        truncated = False
+        for msg in history:
+            if self.max_history_messages is not None and len(selected) >= self.max_history_messages:
+                truncated = True
+                break
+            
+            entry = {
+                "role": "user" if msg.speaker_name != speaker_name else "assistant",
+                "content": msg.message
+            }
+            cost = self.counter.count_message(entry)
+            if used + cost > self.prompt_token_budget:
+                truncated = True
+                break
+            
+            used += cost
+            selected.append(entry)
+        
+        selected.reverse()
+        return ContextWindow(
+            messages=preamble + selected + [current],
+            prompt_tokens=used,
+            history_included=len(selected),
+            history_truncated=truncated,
+            summary_tokens=summary_tokens
+        )
@@ -0,0 +1,371 @@
+from typing import List, Dict, Any, Optional, Callable, ClassVar, Iterable, Iterator, AsyncIterator, Tuple, Type
+from collections import deque
+from dataclasses import dataclass, fields
+from enum import Enum
+import asyncio
+import logging
+import threading
+import time
+
+from .models import DebateMessage, DebateRound, DebateSession
+from ..characters.base import Character
+
+
+class BackpressurePolicy(Enum):
+    """What a subscriber's full buffer does to the publisher."""
+    BLOCK = "block"  # Wait for the subscriber to catch up
+    DROP_PROGRESS = "drop_progress"  # Drop transient events, wait for the rest
+    COALESCE = "coalesce"  # Merge transient events into pending ones, wait for the rest
+
+
+@dataclass(frozen=True)
+class DebateEvent:
+    """Something that happened during a debate, delivered to event bus subscribers."""
+    
+    name: ClassVar[str] = "event"
+    transient: ClassVar[bool] = False  # Superseded by later events, so safe to drop or merge
+    
+    def args(self) -> tuple:
+        """Get the positional arguments of the matching ``on_<name>`` callback."""
+        return tuple(getattr(self, field.name) for field in fields(self))
+    
+    def merge(self, newer: 'DebateEvent') -> Optional['DebateEvent']:
+        """Combine with a newer event into one, or None if they cannot be combined."""
+        return None
+
+
+@dataclass(frozen=True)
+class MessageGenerated(DebateEvent):
+    """A speaker's reply was recorded."""
+    
+    name: ClassVar[str] = "message_generated"
+    
+    message: DebateMessage
+    character: Character
+
+
+@dataclass(frozen=True)
+class MessageDelta(DebateEvent):
+    """A chunk of a reply that is still streaming."""
+    
+    name: ClassVar[str] = "message_delta"
+    transient: ClassVar[bool] = True
+    
+    delta: str
+    character: Character
+    round_number: Optional[int]
+    
+    def merge(self, newer: DebateEvent) -> Optional[DebateEvent]:
+        """Concatenate consecutive chunks of the same reply."""
+        if isinstance(newer, MessageDelta) and newer.character is self.character and newer.round_number == self.round_number:
+            return MessageDelta(self.delta + newer.delta, self.character, self.round_number)
+        return None
+
+
+@dataclass(frozen=True)
+class RoundCompleted(DebateEvent):
+    """A round finished."""
+    
+    name: ClassVar[str] = "round_completed"
+    
+    debate_round: DebateRound
+    round_number: int
+
+
+@dataclass(frozen=True)
+class JudgeFeedback(DebateEvent):
+    """The judge scored a round."""
+    
+    name: ClassVar[str] = "judge_feedback"
+    
+    feedback: Dict[str, Dict[str, int]]
+    round_number: int
+
+
+@dataclass(frozen=True)
+class SessionCompleted(DebateEvent):
+    """The debate ran to completion."""
+    
+    name: ClassVar[str] = "session_completed"
+    
+    session: DebateSession
+
+
+@dataclass(frozen=True)
+class ProgressUpdate(DebateEvent):
+    """A speaker is about to take a turn."""
+    
+    name: ClassVar[str] = "progress_update"
+    transient: ClassVar[bool] = True
+    
+    progress: float
+    round_number: int
+    speaker: str
+    
+    def merge(self, newer: DebateEvent) -> Optional[DebateEvent]:
+        """Keep only the latest progress."""
+        return newer if isinstance(newer, ProgressUpdate) else None
+
+
+EVENT_TYPES: Dict[str, Type[DebateEvent]] = {
+    event_type.name: event_type
+    for event_type in (MessageGenerated, MessageDelta, RoundCompleted, JudgeFeedback, SessionCompleted, ProgressUpdate)
+}
+
+
+class EventSubscription:
+    """One subscriber's bounded buffer of debate events.
+
+    Iterate it (or ``async for`` over it) to consume events in order; the
+    iteration ends once the subscription is closed and drained. When the
+    buffer is full the ``policy`` decides whether the publisher waits,
+    transient events are dropped, or they are merged into pending ones.
+    """
+    
+    def __init__(
+        self,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        max_buffered: int = 256,
+        event_types: Optional[Iterable[Type[DebateEvent]]] = None,
+        bus: Optional['EventBus'] = None
+    ):
+        """Initialize an open subscription to ``event_types`` (all events if None)."""
+        self.policy = policy
+        self.max_buffered = max(max_buffered, 1)
+        self.event_types = tuple(event_types) if event_types is not None else None
+        self._bus = bus
+        self._buffer: deque = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        
+        # Metrics
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.blocked_seconds = 0.0
+    
+    @property
+    def closed(self) -> bool:
+        """Check whether the subscription stopped accepting events."""
+        return self._closed
+    
+    def accepts(self, event: DebateEvent) -> bool:
+        """Check whether this subscriber wants ``event``."""
+        return self.event_types is None or isinstance(event, self.event_types)
+    
+    def _offer(self, event: DebateEvent) -> bool:
+        """Buffer ``event`` if the policy allows it without waiting (caller holds the lock)."""
+        if self._closed:
+            return True
+        
+        if self.policy is BackpressurePolicy.COALESCE and event.transient and self._buffer:
+            merged = self._buffer[-1].merge(event)
+            if merged is not None:
+                self._buffer[-1] = merged
+                self.published += 1
+                self.coalesced += 1
+                self._wake_async_waiters()
+                return True
+        
+        if len(self._buffer) >= self.max_buffered:
+            if self.policy is BackpressurePolicy.DROP_PROGRESS and event.transient:
+                self.dropped += 1
+                return True
+            return False
+        
+        self._buffer.append(event)
+        self.published += 1
+        self.max_depth = max(self.max_depth, len(self._buffer))
+        self._cond.notify_all()
+        self._wake_async_waiters()
+        return True
+    
+    def _wake_async_waiters(self) -> None:
+        """Hand the news to every ``async for`` consumer on its own loop (caller holds the lock)."""
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # The consumer's loop has already closed
+    
+    def offer(self, event: DebateEvent) -> bool:
+        """Buffer ``event`` without waiting; returns False if the publisher would have to wait."""
+        with self._cond:
+            return self._offer(event)
+    
+    def put(self, event: DebateEvent) -> None:
+        """Buffer ``event``, waiting for room when the policy requires it."""
+        with self._cond:
+            if self._offer(event):
+                return
+            started = time.perf_counter()
+            self._cond.wait_for(lambda: self._offer(event))
+            self.blocked_seconds += time.perf_counter() - started
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[DebateEvent]:
+        """Take the next event; None once closed and drained, or after ``timeout`` seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._buffer or self._closed, timeout):
+                return None
+            if not self._buffer:
+                return None
+            event = self._buffer.popleft()
+            self.delivered += 1
+            self._cond.notify_all()
+            return event
+    
+    def close(self, drain: bool = True) -> None:
+        """Stop accepting events and unblock the publisher; ``drain=False`` also discards buffered ones."""
+        with self._cond:
+            self._closed = True
+            if not drain:
+                self.dropped += len(self._buffer)
+                self._buffer.clear()
+            self._cond.notify_all()
+            self._wake_async_waiters()
+        if self._bus is not None:
+            self._bus.unsubscribe(self)
+    
+    def __iter__(self) -> Iterator[DebateEvent]:
+        """Yield events until the subscription is closed and drained."""
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            yield event
+    
+    async def __aiter__(self) -> AsyncIterator[DebateEvent]:
+        """Yield events without blocking the event loop while waiting for them.
+        
+        An empty buffer parks the consumer on a future that the publisher
+        resolves through the consumer's loop, so no thread is tied up waiting.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._buffer:
+                    event = self._buffer.popleft()
+                    self.delivered += 1
+                    self._cond.notify_all()
+                elif self._closed:
+                    return
+                else:
+                    event = None
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+            
+            if event is not None:
+                yield event
+                continue
+            try:
+                await waiter[1]
+            finally:
+                with self._cond:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer and backpressure metrics."""
+        return {
+            "policy": self.policy.value,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "max_buffer_depth": self.max_depth,
+            "blocked_seconds": self.blocked_seconds
+        }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Wake a parked ``async for`` consumer."""
+    if not future.done():
+        future.set_result(None)
+
+
+class EventBus:
+    """Fans debate events out to independent subscribers.
+
+    Each subscriber has its own bounded buffer and backpressure policy, so a
+    slow consumer only holds up the publisher when its policy says so.
+    Events are published synchronously; coroutines use ``publish_async`` so
+    a full buffer does not block the event loop.
+    """
+    
+    def __init__(self):
+        """Initialize a bus without subscribers."""
+        self._subscriptions: List[EventSubscription] = []
+        self._lock = threading.Lock()
+    
+    def subscribe(
+        self,
+        handler: Optional[Callable[[DebateEvent], None]] = None,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        max_buffered: int = 256,
+        event_types: Optional[Iterable[Type[DebateEvent]]] = None
+    ) -> EventSubscription:
+        """Subscribe to ``event_types`` (all events if None).
+
+        Without a ``handler`` the caller consumes the returned subscription;
+        with one, a daemon thread calls ``handler(event)`` for each event
+        until the subscription is closed.
+        """
+        subscription = EventSubscription(policy, max_buffered, event_types, bus=self)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        
+        if handler is not None:
+            threading.Thread(
+                target=self._dispatch, args=(subscription, handler), name="debate-event-handler", daemon=True
+            ).start()
+        return subscription
+    
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Stop publishing to ``subscription``."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+    
+    def _subscribers(self, event: DebateEvent) -> List[EventSubscription]:
+        """Get the subscriptions that want ``event``."""
+        with self._lock:
+            return [subscription for subscription in self._subscriptions if subscription.accepts(event)]
+    
+    def wants(self, event_type: Type[DebateEvent]) -> bool:
+        """Check whether anyone is subscribed to ``event_type``."""
+        with self._lock:
+            return any(
+                subscription.event_types is None or issubclass(event_type, subscription.event_types)
+                for subscription in self._subscriptions
+            )
+    
+    def publish(self, event: DebateEvent) -> None:
+        """Deliver ``event`` to every interested subscriber, waiting where their policy requires."""
+        for subscription in self._subscribers(event):
+            subscription.put(event)
+    
+    async def publish_async(self, event: DebateEvent) -> None:
+        """Deliver ``event``, waiting for full buffers on a worker thread instead of the event loop."""
+        for subscription in self._subscribers(event):
+            if not subscription.offer(event):
+                await asyncio.to_thread(subscription.put, event)
+    
+    def close(self) -> None:
+        """Close every subscription; buffered events can still be consumed."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
+    
+    @staticmethod
+    def _dispatch(subscription: EventSubscription, handler: Callable[[DebateEvent], None]) -> None:
+        """Feed a subscription's events to its handler."""
+        for event in subscription:
+            try:
+                handler(event)
+            except Exception as e:
+                logging.error(f"Error in debate event handler for {event.name}: {e}")
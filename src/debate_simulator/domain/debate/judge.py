@@ -1,8 +1,35 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
-from .models import DebateMessage, DebateRound
+from .models import DebateMessage, DebateRound, group_by_speaker
+from .phrase_matcher import PhraseMatcher
+from .novelty import REPETITION_THRESHOLD
+from .verdict_parser import STAT_NAMES, index_by_round, normalize_adjustments, parse_json_reply
 from ..characters.base import Character
+import asyncio
 import json
+import logging
+import threading
+
+
+# Reply budget of a batched verdict: per participant per round, with slack for stray reasoning
+BATCH_VERDICT_TOKENS = 40
+BATCH_BASE_TOKENS = 300  # Also the floor: what a single-round verdict gets
+BATCH_MAX_TOKENS = 4096  # Most chat models' output cap
+
+# Rating instructions shared by the single-round and batched judge prompts
+_RATING_RUBRIC = """For each participant, rate them on a scale of -10 to +10 for each category:
+
+1. ANGER: How much their anger increased/decreased this round
+   - Negative = they became calmer/more patient
+   - Positive = they became more enraged/frustrated
+
+2. PATIENCE: How much their patience changed this round  
+   - Negative = they became more impatient/agitated
+   - Positive = they became more patient/calm
+
+3. UNIQUENESS: How unique/creative their argument was compared to others
+   - Negative = repetitive or unoriginal points
+   - Positive = fresh perspective or unique insights"""
 
 
 class DebateJudge(ABC):
@@ -17,6 +44,18 @@ class DebateJudge(ABC):
     def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
         """Judge overall performance across all rounds."""
         pass
+    
+    async def judge_round_async(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Judge a round without blocking the event loop."""
+        return await asyncio.to_thread(self.judge_round, round_messages, participants)
+    
+    def judge_rounds(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge several finished rounds, returning adjustments in the same order."""
+        return [self.judge_round(round_messages, participants) for round_messages in rounds]
+    
+    async def judge_rounds_async(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge several finished rounds without blocking the event loop."""
+        return [await self.judge_round_async(round_messages, participants) for round_messages in rounds]
 
 
 class AIDebateJudge(DebateJudge):
@@ -25,36 +64,107 @@ class AIDebateJudge(DebateJudge):
     def __init__(self, ai_client):
         """Initialize with AI client for making judgment calls."""
         self.ai_client = ai_client
+        self._stats_lock = threading.Lock()
+        
+        # Metrics, counted per round verdict
+        self.verdicts = 0
+        self.repaired_verdicts = 0
+        self.parse_failures = 0
+        self.call_failures = 0
     
     def judge_round(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
         """Judge a round using AI evaluation."""
         if not round_messages:
-            return {p.name: {"anger": 0, "patience": 0, "uniqueness": 0} for p in participants}
+            return self._neutral_adjustments(participants)
         
         try:
-            # Build context for the judge
-            round_context = "\n".join([f"{msg.speaker_name}: {msg.message}" for msg in round_messages])
+            judge_prompt = self._build_round_prompt(round_messages, participants)
             
-            judge_prompt = f"""You are an impartial debate judge evaluating a political debate round. Analyze the following responses and rate each participant on three metrics:
+            # Make the AI call
+            response = self.ai_client.generate_judge_response(judge_prompt, **self._format_kwargs(_round_schema(participants)))
+            
+            return self._parse_adjustments(response, participants)
+        
+        except Exception as e:
+            # Return neutral adjustments if any error occurs
+            logging.warning(f"Judge call failed, using neutral adjustments: {str(e)}")
+            self._record_call_failure(1)
+            return self._neutral_adjustments(participants)
+    
+    async def judge_round_async(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Judge a round using the AI client's async interface when available."""
+        if not hasattr(self.ai_client, "generate_judge_response_async"):
+            return await super().judge_round_async(round_messages, participants)
+        
+        if not round_messages:
+            return self._neutral_adjustments(participants)
+        
+        try:
+            judge_prompt = self._build_round_prompt(round_messages, participants)
+            response = await self.ai_client.generate_judge_response_async(
+                judge_prompt, **self._format_kwargs(_round_schema(participants))
+            )
+            return self._parse_adjustments(response, participants)
+        except Exception as e:
+            logging.warning(f"Judge call failed, using neutral adjustments: {str(e)}")
+            self._record_call_failure(1)
+            return self._neutral_adjustments(participants)
+    
+    def judge_rounds(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge several rounds with one AI call sharing a single copy of the rubric."""
+        if len(rounds) <= 1:
+            return super().judge_rounds(rounds, participants)
+        
+        try:
+            response = self.ai_client.generate_judge_response(
+                self._build_batch_prompt(rounds, participants),
+                max_tokens=_batch_max_tokens(rounds, participants),
+                **self._format_kwargs(_batch_schema(rounds, participants))
+            )
+            return self._parse_batch_adjustments(response, rounds, participants)
+        except Exception as e:
+            logging.warning(f"Batched judge call failed, using neutral adjustments: {str(e)}")
+            self._record_call_failure(len(rounds))
+            return [self._neutral_adjustments(participants) for _ in rounds]
+    
+    async def judge_rounds_async(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge several rounds with one call on the AI client's async interface when available."""
+        if len(rounds) <= 1:
+            return await super().judge_rounds_async(rounds, participants)
+        if not hasattr(self.ai_client, "generate_judge_response_async"):
+            return await asyncio.to_thread(self.judge_rounds, rounds, participants)
+        
+        try:
+            response = await self.ai_client.generate_judge_response_async(
+                self._build_batch_prompt(rounds, participants),
+                max_tokens=_batch_max_tokens(rounds, participants),
+                **self._format_kwargs(_batch_schema(rounds, participants))
+            )
+            return self._parse_batch_adjustments(response, rounds, participants)
+        except Exception as e:
+            logging.warning(f"Batched judge call failed, using neutral adjustments: {str(e)}")
+            self._record_call_failure(len(rounds))
+            return [self._neutral_adjustments(participants) for _ in rounds]
+    
+    def _format_kwargs(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Ask for output constrained to ``schema`` when the AI client supports it."""
+        if not getattr(self.ai_client, "structured_output", False):
+            return {}
+        return {"response_format": {"type": "json_schema", "json_schema": schema}}
+    
+    def _build_round_prompt(self, round_messages: List[DebateMessage], participants: List[Character]) -> str:
+        """Build the judging prompt for a round."""
+        # Build context for the judge
+        round_context = "\n".join([f"{msg.speaker_name}: {msg.message}" for msg in round_messages])
+        
+        judge_prompt = f"""You are an impartial debate judge evaluating a political debate round. Analyze the following responses and rate each participant on three metrics:
 
 ROUND CONTEXT:
 {round_context}
 
 PARTICIPANTS: {[p.name for p in participants]}
 
-For each participant, rate them on a scale of -10 to +10 for each category:
-
-1. ANGER: How much their anger increased/decreased this round
-   - Negative = they became calmer/more patient
-   - Positive = they became more enraged/frustrated
-
-2. PATIENCE: How much their patience changed this round  
-   - Negative = they became more impatient/agitated
-   - Positive = they became more patient/calm
-
-3. UNIQUENESS: How unique/creative their argument was compared to others
-   - Negative = repetitive or unoriginal points
-   - Positive = fresh perspective or unique insights
+{_RATING_RUBRIC}
 
 Respond ONLY with a JSON object like this:
 {{
@@ -63,64 +173,92 @@ Respond ONLY with a JSON object like this:
 }}
 
 Be fair and consistent. Consider emotional escalation, argument quality, and originality."""
+        
+        return judge_prompt
+    
+    def _build_batch_prompt(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> str:
+        """Build one judging prompt covering several rounds."""
+        rounds_context = "\n\n".join(
+            f"ROUND {round_messages[0].round_number}:\n" + "\n".join(f"{msg.speaker_name}: {msg.message}" for msg in round_messages)
+            for round_messages in rounds
+        )
+        example_rounds = [str(round_messages[0].round_number) for round_messages in rounds[:2]]
+        
+        judge_prompt = f"""You are an impartial debate judge evaluating several rounds of a political debate. Judge each round on its own, in order, and rate each participant on three metrics:
 
-            # Make the AI call
-            response = self.ai_client.generate_judge_response(judge_prompt)
-            
-            # Parse the JSON response
-            try:
-                adjustments = json.loads(response)
-                return adjustments
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails
-                return {p.name: {"anger": 0, "patience": 0, "uniqueness": 0} for p in participants}
-                
-        except Exception as e:
-            # Return neutral adjustments if any error occurs
-            return {p.name: {"anger": 0, "patience": 0, "uniqueness": 0} for p in participants}
+{rounds_context}
+
+PARTICIPANTS: {[p.name for p in participants]}
+
+{_RATING_RUBRIC}
+
+Respond ONLY with a JSON object keyed by round number, with one entry for every round above, like this:
+{{
+  "{example_rounds[0]}": {{"Participant Name 1": {{"anger": 5, "patience": -3, "uniqueness": 2}}, "Participant Name 2": {{"anger": -2, "patience": 4, "uniqueness": -1}}}},
+  "{example_rounds[-1]}": {{"Participant Name 1": {{"anger": 1, "patience": 0, "uniqueness": -2}}, "Participant Name 2": {{"anger": 3, "patience": -1, "uniqueness": 4}}}}
+}}
+
+Be fair and consistent. Consider emotional escalation, argument quality, and originality."""
+        
+        return judge_prompt
     
-    def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
-        """Judge overall performance across the entire debate."""
-        results = {}
+    def _parse_batch_adjustments(
+        self,
+        response: str,
+        rounds: List[List[DebateMessage]],
+        participants: List[Character]
+    ) -> List[Dict[str, Dict[str, int]]]:
+        """Parse a batched reply into per-round adjustments; rounds it leaves out are neutral."""
+        by_round, repaired = parse_json_reply(response)
+        verdicts = index_by_round(by_round)
+        return [
+            self._read_verdict(verdicts.get(round_messages[0].round_number), repaired, participants)
+            for round_messages in rounds
+        ]
+    
+    def _parse_adjustments(self, response: str, participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Parse the judge's JSON reply into stat adjustments, repairing it where possible."""
+        verdict, repaired = parse_json_reply(response)
+        return self._read_verdict(verdict, repaired, participants)
+    
+    def _read_verdict(self, verdict: Any, repaired: bool, participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Turn one parsed verdict into adjustments and count it; unusable verdicts are neutral."""
+        adjustments, fixed = normalize_adjustments(verdict, [p.name for p in participants])
+        with self._stats_lock:
+            self.verdicts += 1
+            if adjustments is None:
+                self.parse_failures += 1
+            elif repaired or fixed:
+                self.repaired_verdicts += 1
         
-        for participant in participants:
-            participant_messages = [msg for msg in conversation_history if msg.speaker_name == participant.name]
-            
-            # Calculate basic metrics
-            total_messages = len(participant_messages)
-            avg_message_length = sum(len(msg.message) for msg in participant_messages) / max(total_messages, 1)
-            
-            # Get final stats
-            final_stats = participant.stats.to_dict()
-            
-            # Calculate performance rating
-            total_score = sum(final_stats.values())
-            if total_score >= 240:
-                performance = "EXCELLENT"
-                rating = 5
-            elif total_score >= 180:
-                performance = "GOOD"
-                rating = 4
-            elif total_score >= 120:
-                performance = "AVERAGE"
-                rating = 3
-            elif total_score >= 60:
-                performance = "POOR"
-                rating = 2
-            else:
-                performance = "VERY POOR"
-                rating = 1
-            
-            results[participant.name] = {
-                "final_stats": final_stats,
-                "total_messages": total_messages,
-                "avg_message_length": avg_message_length,
-                "performance": performance,
-                "rating": rating,
-                "total_score": total_score
+        if adjustments is None:
+            logging.warning("Judge reply had no usable verdict, using neutral adjustments")
+            return self._neutral_adjustments(participants)
+        return adjustments
+    
+    def _record_call_failure(self, rounds: int) -> None:
+        """Count verdicts lost to a failed judge call."""
+        with self._stats_lock:
+            self.call_failures += rounds
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reply parsing metrics; the failure rate counts verdicts whose reply was unusable."""
+        with self._stats_lock:
+            return {
+                "verdicts": self.verdicts,
+                "repaired_verdicts": self.repaired_verdicts,
+                "parse_failures": self.parse_failures,
+                "parse_failure_rate": self.parse_failures / self.verdicts if self.verdicts else 0.0,
+                "call_failures": self.call_failures
             }
-        
-        return results
+    
+    def _neutral_adjustments(self, participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Adjustments that leave every participant's stats unchanged."""
+        return {p.name: {stat: 0 for stat in STAT_NAMES} for p in participants}
+    
+    def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
+        """Judge overall performance across the entire debate."""
+        return summarize_performance(participants, conversation_history)
 
 
 class MockDebateJudge(DebateJudge):
@@ -149,10 +287,11 @@ class MockDebateJudge(DebateJudge):
     def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
         """Return mock performance results."""
         results = {}
+        messages_by_speaker = group_by_speaker(conversation_history)
         for participant in participants:
             results[participant.name] = {
                 "final_stats": participant.stats.to_dict(),
-                "total_messages": len([msg for msg in conversation_history if msg.speaker_name == participant.name]),
+                "total_messages": len(messages_by_speaker.get(participant.name, [])),
                 "avg_message_length": 50,  # Mock value
                 "performance": "AVERAGE",
                 "rating": 3,
@@ -164,47 +303,62 @@ class MockDebateJudge(DebateJudge):
 class RuleBasedJudge(DebateJudge):
     """Rule-based judge that evaluates based on predefined criteria."""
     
-    def __init__(self):
-        """Initialize with rule-based criteria."""
-        self.criteria = {
-            "anger_triggers": ["CAPS", "!!!", "OUTRAGED", "FURIOUS", "ENRAGED"],
-            "patience_indicators": ["calm", "measured", "thoughtful", "consider"],
-            "uniqueness_indicators": ["innovative", "unique", "different approach", "fresh perspective"]
-        }
+    DEFAULT_CRITERIA = {
+        "anger_triggers": ["CAPS", "!!!", "OUTRAGED", "FURIOUS", "ENRAGED"],
+        "patience_indicators": ["calm", "measured", "thoughtful", "consider"],
+        "uniqueness_indicators": ["innovative", "unique", "different approach", "fresh perspective"]
+    }
+    
+    def __init__(self, criteria: Optional[Dict[str, List[str]]] = None, criteria_file: Optional[str] = None):
+        """Initialize with the default criteria, extended by ``criteria`` and a JSON ``criteria_file``."""
+        self.criteria = {category: list(phrases) for category, phrases in self.DEFAULT_CRITERIA.items()}
+        if criteria_file:
+            self._extend_criteria(load_criteria(criteria_file))
+        if criteria:
+            self._extend_criteria(criteria)
+        self.matcher = PhraseMatcher(self.criteria)
+    
+    def _extend_criteria(self, criteria: Dict[str, List[str]]) -> None:
+        """Add phrases to the known criteria categories."""
+        for category, phrases in criteria.items():
+            if category not in self.criteria:
+                raise ValueError(f"Unknown judging criteria: {category}")
+            self.criteria[category].extend(phrase for phrase in phrases if phrase not in self.criteria[category])
     
     def judge_round(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
         """Judge based on text analysis rules."""
         adjustments = {}
+        messages_by_speaker = group_by_speaker(round_messages)
         
         for participant in participants:
-            participant_messages = [msg for msg in round_messages if msg.speaker_name == participant.name]
-            
             anger_adjustment = 0
             patience_adjustment = 0
             uniqueness_adjustment = 0
             
-            for message in participant_messages:
-                text = message.message.upper()
+            for message in messages_by_speaker.get(participant.name, []):
+                counts = self.matcher.count(message.message)
                 
                 # Anger assessment
-                anger_indicators = sum(1 for trigger in self.criteria["anger_triggers"] if trigger in text)
-                if anger_indicators > 0:
-                    anger_adjustment += min(anger_indicators * 2, 5)
+                if counts["anger_triggers"] > 0:
+                    anger_adjustment += min(counts["anger_triggers"] * 2, 5)
                 
                 # Patience assessment
-                patience_indicators = sum(1 for indicator in self.criteria["patience_indicators"] if indicator.upper() in text)
-                if patience_indicators > 0:
-                    patience_adjustment += min(patience_indicators, 3)
+                if counts["patience_indicators"] > 0:
+                    patience_adjustment += min(counts["patience_indicators"], 3)
                 
                 # Uniqueness assessment
-                uniqueness_indicators = sum(1 for indicator in self.criteria["uniqueness_indicators"] if indicator.upper() in text)
-                if uniqueness_indicators > 0:
-                    uniqueness_adjustment += min(uniqueness_indicators, 3)
+                if counts["uniqueness_indicators"] > 0:
+                    uniqueness_adjustment += min(counts["uniqueness_indicators"], 3)
+                
+                # Repetition assessment, from the novelty score recorded when the message was said
+                novelty = message.metadata.get("novelty")
+                if novelty and novelty["overlap"] >= REPETITION_THRESHOLD:
+                    uniqueness_adjustment -= 2
                 
                 # Message length factor
                 if len(message.message) > 100:
                     patience_adjustment -= 1  # Long messages indicate impatience
-                
+            
             adjustments[participant.name] = {
                 "anger": anger_adjustment,
                 "patience": patience_adjustment,
@@ -216,13 +370,14 @@ class RuleBasedJudge(DebateJudge):
     def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
         """Judge overall performance using rule-based criteria."""
         results = {}
+        messages_by_speaker = group_by_speaker(conversation_history)
         
         for participant in participants:
-            participant_messages = [msg for msg in conversation_history if msg.speaker_name == participant.name]
+            participant_messages = messages_by_speaker.get(participant.name, [])
             
             # Calculate metrics
             total_messages = len(participant_messages)
-            total_words = sum(len(msg.message.split()) for msg in participant_messages)
+            total_words = sum(msg.word_count for msg in participant_messages)
             avg_words_per_message = total_words / max(total_messages, 1)
             
             # Analyze consistency
@@ -272,6 +427,120 @@ def create_judge(judge_type: str = "ai", **kwargs) -> DebateJudge:
     elif judge_type == "mock":
         return MockDebateJudge(kwargs.get("fixed_adjustments"))
     elif judge_type == "rule_based":
-        return RuleBasedJudge()
+        return RuleBasedJudge(kwargs.get("criteria"), kwargs.get("criteria_file"))
+    elif judge_type == "local":
+        from .local_judge import LocalDebateJudge
+        return LocalDebateJudge()
+    elif judge_type == "cascade":
+        ai_client = kwargs.get("ai_client")
+        if not ai_client:
+            raise ValueError("AI client required for cascade judge")
+        from .local_judge import CascadeJudge, LocalDebateJudge
+        return CascadeJudge(
+            LocalDebateJudge(),
+            AIDebateJudge(ai_client),
+            min_confidence=kwargs.get("min_confidence", 0.5),
+            min_margin=kwargs.get("min_margin", 1.0)
+        )
     else:
-        raise ValueError(f"Unknown judge type: {judge_type}")
\ No newline at end of file
+        raise ValueError(f"Unknown judge type: {judge_type}")
+
+
+def summarize_performance(participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
+    """Rate each participant's overall performance from their final stats."""
+    results = {}
+    messages_by_speaker = group_by_speaker(conversation_history)
+    
+    for participant in participants:
+        participant_messages = messages_by_speaker.get(participant.name, [])
+        
+        # Calculate basic metrics
+        total_messages = len(participant_messages)
+        avg_message_length = sum(len(msg.message) for msg in participant_messages) / max(total_messages, 1)
+        
+        # Get final stats
+        final_stats = participant.stats.to_dict()
+        
+        # Calculate performance rating
+        total_score = sum(final_stats.values())
+        if total_score >= 240:
+            performance = "EXCELLENT"
+            rating = 5
+        elif total_score >= 180:
+            performance = "GOOD"
+            rating = 4
+        elif total_score >= 120:
+            performance = "AVERAGE"
+            rating = 3
+        elif total_score >= 60:
+            performance = "POOR"
+            rating = 2
+        else:
+            performance = "VERY POOR"
+            rating = 1
+        
+        results[participant.name] = {
+            "final_stats": final_stats,
+            "total_messages": total_messages,
+            "avg_message_length": avg_message_length,
+            "performance": performance,
+            "rating": rating,
+            "total_score": total_score
+        }
+    
+    return results
+
+
+def load_criteria(path: str) -> Dict[str, List[str]]:
+    """Load extra rule-judge phrases from a JSON file mapping criteria names to phrase lists."""
+    with open(path, "r", encoding="utf-8") as criteria_file:
+        criteria = json.load(criteria_file)
+    
+    if not isinstance(criteria, dict) or not all(
+        isinstance(phrases, list) and all(isinstance(phrase, str) for phrase in phrases) for phrases in criteria.values()
+    ):
+        raise ValueError(f"Criteria file {path} must map criteria names to lists of phrases")
+    return criteria
+
+
+def _batch_max_tokens(rounds: List[List[DebateMessage]], participants: List[Character]) -> int:
+    """Reply budget for a verdict scoring every participant in every round of a batch."""
+    needed = BATCH_BASE_TOKENS + BATCH_VERDICT_TOKENS * len(rounds) * len(participants)
+    return min(needed, BATCH_MAX_TOKENS)
+
+
+def _verdict_schema(participants: List[Character]) -> Dict[str, Any]:
+    """JSON schema of one round's adjustments, keyed by participant name."""
+    stats = {
+        "type": "object",
+        "properties": {stat: {"type": "integer"} for stat in STAT_NAMES},
+        "required": list(STAT_NAMES),
+        "additionalProperties": False
+    }
+    return {
+        "type": "object",
+        "properties": {p.name: stats for p in participants},
+        "required": [p.name for p in participants],
+        "additionalProperties": False
+    }
+
+
+def _round_schema(participants: List[Character]) -> Dict[str, Any]:
+    """Structured output format for a single-round judge reply."""
+    return {"name": "round_verdict", "strict": True, "schema": _verdict_schema(participants)}
+
+
+def _batch_schema(rounds: List[List[DebateMessage]], participants: List[Character]) -> Dict[str, Any]:
+    """Structured output format for a batched judge reply, keyed by round number."""
+    round_keys = [str(round_messages[0].round_number) for round_messages in rounds]
+    verdict = _verdict_schema(participants)
+    return {
+        "name": "batch_verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {key: verdict for key in round_keys},
+            "required": round_keys,
+            "additionalProperties": False
+        }
+    }
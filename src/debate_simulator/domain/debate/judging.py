@@ -0,0 +1,136 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import contextvars
+import logging
+import time
+
+from .judge import DebateJudge
+from .models import DebateMessage, DebateRound
+from ..characters.base import Character
+from ...infrastructure.cancellation import await_cancellable
+
+
+Verdict = Tuple[DebateRound, Optional[Dict[str, Dict[str, int]]]]
+RoundBatch = List[Tuple[DebateRound, List[DebateMessage]]]
+
+
+class JudgingPipeline:
+    """Judges finished rounds on a single background worker while the debate continues.
+
+    Verdicts are handed back strictly in round order, and only when the
+    orchestrator asks for them between turns, so stat changes never land
+    mid-turn and never out of order.
+    """
+    
+    def __init__(self, judge: DebateJudge):
+        """Initialize with the judge to run in the background."""
+        self.judge = judge
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debate-judge")
+        self._pending = deque()
+        self.wait_seconds = 0.0
+    
+    def submit(self, debate_round: DebateRound, round_messages: List[DebateMessage], participants: List[Character]) -> None:
+        """Start judging a finished round."""
+        self.submit_batch([(debate_round, round_messages)], participants)
+    
+    def submit_batch(self, batch: RoundBatch, participants: List[Character]) -> None:
+        """Start judging several finished rounds in one judge call."""
+        # Run in the submitter's context so its cancellation token reaches the judge call
+        future = self._executor.submit(
+            contextvars.copy_context().run, self.judge.judge_rounds,
+            [list(round_messages) for _, round_messages in batch], list(participants)
+        )
+        for index, (debate_round, _) in enumerate(batch):
+            self._pending.append((debate_round, future, index))
+    
+    def collect(self, wait_for_round: int = 0) -> List[Verdict]:
+        """Pop finished verdicts in round order, blocking for rounds up to ``wait_for_round``."""
+        verdicts = []
+        while self._pending:
+            debate_round, future, index = self._pending[0]
+            if not future.done():
+                if debate_round.round_number > wait_for_round:
+                    break
+                started = time.perf_counter()
+                future.exception()
+                self.wait_seconds += time.perf_counter() - started
+            
+            self._pending.popleft()
+            verdicts.append((debate_round, _verdict_or_none(future, index)))
+        return verdicts
+    
+    def drain(self) -> List[Verdict]:
+        """Wait for every outstanding verdict."""
+        return self.collect(wait_for_round=float("inf"))
+    
+    def shutdown(self) -> None:
+        """Stop the worker; verdicts not yet collected are discarded."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
+
+
+class AsyncJudgingPipeline:
+    """Event-loop twin of ``JudgingPipeline`` built on tasks chained in round order."""
+    
+    def __init__(self, judge: DebateJudge):
+        """Initialize with the judge to run in the background."""
+        self.judge = judge
+        self._pending = deque()
+        self.wait_seconds = 0.0
+    
+    def submit(self, debate_round: DebateRound, round_messages: List[DebateMessage], participants: List[Character]) -> None:
+        """Start judging a finished round once the previous judgement is done."""
+        self.submit_batch([(debate_round, round_messages)], participants)
+    
+    def submit_batch(self, batch: RoundBatch, participants: List[Character]) -> None:
+        """Start judging several finished rounds in one judge call, after the previous judgement."""
+        previous = self._pending[-1][1] if self._pending else None
+        task = asyncio.create_task(self._judge_after(
+            previous, [list(round_messages) for _, round_messages in batch], list(participants)
+        ))
+        for index, (debate_round, _) in enumerate(batch):
+            self._pending.append((debate_round, task, index))
+    
+    async def _judge_after(self, previous: Optional[asyncio.Task], rounds, participants):
+        """Run one judgement after ``previous`` so only one judge call is in flight."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await await_cancellable(self.judge.judge_rounds_async(rounds, participants))
+    
+    async def collect(self, wait_for_round: int = 0) -> List[Verdict]:
+        """Pop finished verdicts in round order, awaiting rounds up to ``wait_for_round``."""
+        verdicts = []
+        while self._pending:
+            debate_round, task, index = self._pending[0]
+            if not task.done():
+                if debate_round.round_number > wait_for_round:
+                    break
+                started = time.perf_counter()
+                await asyncio.wait([task])
+                self.wait_seconds += time.perf_counter() - started
+            
+            self._pending.popleft()
+            verdicts.append((debate_round, _verdict_or_none(task, index)))
+        return verdicts
+    
+    async def drain(self) -> List[Verdict]:
+        """Await every outstanding verdict."""
+        return await self.collect(wait_for_round=float("inf"))
+    
+    def shutdown(self) -> None:
+        """Cancel judgements that were not collected."""
+        for _, task, _ in self._pending:
+            task.cancel()
+        self._pending.clear()
+
+
+def _verdict_or_none(future, index: int = 0) -> Optional[Dict[str, Dict[str, int]]]:
+    """Get round ``index`` of a finished batch judgement, or None if the judge failed."""
+    if future.cancelled():
+        return None
+    if future.exception() is not None:
+        logging.warning(f"Pipelined judge call failed: {future.exception()}")
+        return None
+    return future.result()[index]
@@ -0,0 +1,271 @@
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+import re
+import threading
+import time
+
+from .judge import DebateJudge, summarize_performance
+from .models import DebateMessage, group_by_speaker
+from .novelty import NoveltyIndex, NoveltyScore
+from .phrase_matcher import PhraseMatcher
+from .verdict_parser import ADJUSTMENT_LIMIT, STAT_NAMES
+from ..characters.base import Character
+
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9']+")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+")
+
+HOSTILE_PHRASES = [
+    "outrageous", "outraged", "furious", "enraged", "disgrace", "disgusting", "pathetic", "ridiculous", "absurd",
+    "nonsense", "idiot", "moron", "clueless", "liar", "lies", "lying", "insane", "shut up", "how dare", "sick of",
+    "hate", "garbage", "joke", "delusional", "fed up"
+]
+CALM_PHRASES = [
+    "i understand", "i agree", "fair point", "good point", "common ground", "compromise", "respect", "appreciate",
+    "reasonable", "consider", "perhaps", "let's", "let us", "together", "calm", "measured", "thoughtful",
+    "both sides", "i hear you", "evidence"
+]
+
+SHOUT_SATURATION = 0.3  # Share of shouted words that counts as all-out shouting
+EVIDENCE_WORDS = 15  # Words a speaker needs in a round before their scores are fully trusted
+EXPECTED_NOVELTY = 0.8  # Share of fresh word n-grams in an ordinary reply; scores zero uniqueness
+
+
+@dataclass
+class SpeakerFeatures:
+    """Lexical features of one participant's messages in a round."""
+    words: int = 0
+    shouted_words: int = 0
+    sentences: int = 0
+    exclamations: int = 0
+    hostile_hits: int = 0
+    calm_hits: int = 0
+    ngrams: int = 0
+    novel_ngrams: int = 0
+    
+    @property
+    def shouting(self) -> float:
+        """Share of shouted words, scaled so ``SHOUT_SATURATION`` and above is 1."""
+        return min(self.shouted_words / self.words / SHOUT_SATURATION, 1.0) if self.words else 0.0
+    
+    @property
+    def exclaiming(self) -> float:
+        """Exclamation marks per sentence, capped at 1."""
+        return min(self.exclamations / max(self.sentences, 1), 1.0)
+    
+    @property
+    def novelty(self) -> Optional[float]:
+        """Share of word n-grams not heard earlier in the debate (None if too short to tell)."""
+        return self.novel_ngrams / self.ngrams if self.ngrams else None
+
+
+@dataclass
+class RoundAssessment:
+    """A locally judged round with how far its scores can be trusted."""
+    adjustments: Dict[str, Dict[str, int]]
+    confidence: float  # 0-1, lowest among the participants who spoke
+    margin: Optional[int]  # Lead of the best round standing over the next; None with fewer than two speakers
+
+
+class LocalDebateJudge(DebateJudge):
+    """Offline judge that scores rounds from lexical features, without AI calls.
+
+    Anger follows shouted words, exclamation marks and hostile phrases;
+    patience follows conciliatory phrases and the absence of those signals;
+    uniqueness is the share of a speaker's word n-grams not heard before.
+    That share comes from the novelty score the orchestrator records on each
+    message, or else from the judge's own index of every round it scored, so
+    it should see a debate's rounds in order.
+    """
+    
+    def __init__(
+        self,
+        ngram_size: int = 3,
+        hostile_phrases: Optional[List[str]] = None,
+        calm_phrases: Optional[List[str]] = None
+    ):
+        """Initialize with the n-gram size for novelty and optional replacement lexicons."""
+        self.ngram_size = ngram_size
+        self.matcher = PhraseMatcher({
+            "hostile": hostile_phrases or HOSTILE_PHRASES,
+            "calm": calm_phrases or CALM_PHRASES
+        })
+        self.novelty_index = NoveltyIndex(shingle_size=ngram_size)
+        self._lock = threading.Lock()
+    
+    def judge_round(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Judge a round from its lexical features."""
+        return self.assess_round(round_messages, participants).adjustments
+    
+    def assess_round(self, round_messages: List[DebateMessage], participants: List[Character]) -> RoundAssessment:
+        """Score a round, rate the confidence in the scores, and add its n-grams to the history."""
+        messages_by_speaker = group_by_speaker(round_messages)
+        adjustments = {}
+        confidences = []
+        standings = []
+        
+        with self._lock:
+            for participant in participants:
+                messages = messages_by_speaker.get(participant.name)
+                if not messages:
+                    adjustments[participant.name] = {stat: 0 for stat in STAT_NAMES}
+                    continue
+                
+                features = self._extract_features(messages)
+                scores = _score(features)
+                adjustments[participant.name] = scores
+                confidences.append(_confidence(features))
+                standings.append(scores["patience"] + scores["uniqueness"] - scores["anger"])
+            
+            # Without recorded scores, speakers in the same round are compared with earlier rounds only
+            for message in round_messages:
+                self.novelty_index.add_message(message)
+        
+        standings.sort(reverse=True)
+        return RoundAssessment(
+            adjustments,
+            min(confidences, default=1.0),
+            standings[0] - standings[1] if len(standings) > 1 else None
+        )
+    
+    def _extract_features(self, messages: List[DebateMessage]) -> SpeakerFeatures:
+        """Measure one speaker's messages."""
+        features = SpeakerFeatures()
+        for message in messages:
+            text = message.message
+            words = _WORD_PATTERN.findall(text)
+            features.words += len(words)
+            features.shouted_words += sum(1 for word in words if len(word) >= 3 and word.isupper())
+            features.sentences += max(len(_SENTENCE_END_PATTERN.findall(text)), 1)
+            features.exclamations += text.count("!")
+            
+            hits = self.matcher.count(text)
+            features.hostile_hits += hits["hostile"]
+            features.calm_hits += hits["calm"]
+            
+            novelty = self._novelty_score(message)
+            features.ngrams += novelty.shingles
+            features.novel_ngrams += novelty.shingles - novelty.repeated_shingles
+        return features
+    
+    def _novelty_score(self, message: DebateMessage) -> NoveltyScore:
+        """Use the novelty score recorded on the message, or score it against the judge's own index."""
+        recorded = message.metadata.get("novelty")
+        if recorded is not None:
+            return NoveltyScore.from_dict(recorded)
+        return self.novelty_index.score(message.message)
+    
+    def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
+        """Judge overall performance from the participants' final stats."""
+        return summarize_performance(participants, conversation_history)
+
+
+class CascadeJudge(DebateJudge):
+    """Judges rounds locally and only asks a slower judge about contested ones.
+
+    A round is escalated when the local scores have low confidence (short
+    or mixed signals) or when the two best round standings are within
+    ``min_margin`` points of each other. Escalated rounds of a batch go to
+    the escalation judge together.
+    """
+    
+    def __init__(
+        self,
+        local_judge: LocalDebateJudge,
+        escalation_judge: DebateJudge,
+        min_confidence: float = 0.5,
+        min_margin: float = 1.0
+    ):
+        """Initialize with the local judge, the judge for contested rounds and the escalation thresholds."""
+        self.local_judge = local_judge
+        self.escalation_judge = escalation_judge
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+        self._stats_lock = threading.Lock()
+        
+        # Metrics
+        self.rounds = 0
+        self.escalated_rounds = 0
+        self.local_seconds = 0.0
+    
+    def judge_round(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Judge a round locally, escalating it if contested."""
+        return self.judge_rounds([round_messages], participants)[0]
+    
+    async def judge_round_async(self, round_messages: List[DebateMessage], participants: List[Character]) -> Dict[str, Dict[str, int]]:
+        """Judge a round locally, escalating it without blocking the event loop if contested."""
+        return (await self.judge_rounds_async([round_messages], participants))[0]
+    
+    def judge_rounds(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge rounds locally and escalate the contested ones in one batch."""
+        adjustments, contested = self._triage(rounds, participants)
+        if contested:
+            verdicts = self.escalation_judge.judge_rounds([rounds[i] for i in contested], participants)
+            for index, verdict in zip(contested, verdicts):
+                adjustments[index] = verdict
+        return adjustments
+    
+    async def judge_rounds_async(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> List[Dict[str, Dict[str, int]]]:
+        """Judge rounds locally and escalate the contested ones in one batch without blocking the event loop."""
+        adjustments, contested = self._triage(rounds, participants)
+        if contested:
+            verdicts = await self.escalation_judge.judge_rounds_async([rounds[i] for i in contested], participants)
+            for index, verdict in zip(contested, verdicts):
+                adjustments[index] = verdict
+        return adjustments
+    
+    def _triage(self, rounds: List[List[DebateMessage]], participants: List[Character]) -> Tuple[List[Dict[str, Dict[str, int]]], List[int]]:
+        """Score rounds locally; returns the local adjustments and the indexes of contested rounds."""
+        started = time.perf_counter()
+        assessments = [self.local_judge.assess_round(round_messages, participants) for round_messages in rounds]
+        contested = [index for index, assessment in enumerate(assessments) if self._is_contested(assessment)]
+        
+        with self._stats_lock:
+            self.rounds += len(rounds)
+            self.escalated_rounds += len(contested)
+            self.local_seconds += time.perf_counter() - started
+        return [assessment.adjustments for assessment in assessments], contested
+    
+    def _is_contested(self, assessment: RoundAssessment) -> bool:
+        """Check whether the local scores are too uncertain or too close to stand."""
+        if assessment.confidence < self.min_confidence:
+            return True
+        return assessment.margin is not None and assessment.margin < self.min_margin
+    
+    def judge_overall_performance(self, participants: List[Character], conversation_history: List[DebateMessage]) -> Dict[str, Any]:
+        """Judge overall performance with the escalation judge."""
+        return self.escalation_judge.judge_overall_performance(participants, conversation_history)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get how many rounds were judged locally and how many were escalated."""
+        with self._stats_lock:
+            stats = {
+                "rounds": self.rounds,
+                "escalated_rounds": self.escalated_rounds,
+                "escalation_rate": self.escalated_rounds / self.rounds if self.rounds else 0.0,
+                "local_seconds": self.local_seconds
+            }
+        if hasattr(self.escalation_judge, "get_stats"):
+            stats["escalation_judge"] = self.escalation_judge.get_stats()
+        return stats
+
+
+def _score(features: SpeakerFeatures) -> Dict[str, int]:
+    """Turn a speaker's features into stat adjustments."""
+    anger = 6 * features.shouting + 3 * features.exclaiming + 2 * features.hostile_hits - 2 * features.calm_hits - 1
+    patience = 2 * features.calm_hits + 1 - 2 * features.hostile_hits - 3 * features.shouting - 2 * features.exclaiming
+    novelty = features.novelty
+    uniqueness = 0.0 if novelty is None else 20 * (novelty - EXPECTED_NOVELTY)
+    return {"anger": _clamp(anger), "patience": _clamp(patience), "uniqueness": _clamp(uniqueness)}
+
+
+def _confidence(features: SpeakerFeatures) -> float:
+    """How much to trust a speaker's scores: short replies and mixed signals count for less."""
+    evidence = min(features.words / EVIDENCE_WORDS, 1.0)
+    mixed = features.calm_hits > 0 and (features.hostile_hits > 0 or features.shouting >= 0.5)
+    return evidence * (0.5 if mixed else 1.0)
+
+
+def _clamp(value: float) -> int:
+    """Round a score to a whole adjustment within the judging range."""
+    return max(-ADJUSTMENT_LIMIT, min(ADJUSTMENT_LIMIT, round(value)))
@@ -0,0 +1,261 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+import contextvars
+import logging
+import re
+import threading
+import time
+
+from .models import DebateMessage, DebateRound, group_by_speaker
+
+
+_SENTENCE_PATTERN = re.compile(r"[^.!?]+[.!?]*")
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+_SUMMARY_LINE_PATTERN = re.compile(r"^([^:\n]+):\s*(.*)$")
+
+SUMMARY_TOKENS_PER_WORD = 2  # Reply budget per summary word, leaving room for names and figures
+
+_STOPWORDS = frozenset("""
+a about after all also am an and any are as at be because been but by can could did do does for from had has
+have he her his how i if in into is it its just like me more most my no not of on or our out so some than that
+the their them then there these they this to too up us very was we were what when which who why will with would
+you your yeah lol omg tbh fr ngl imo btw idk smh yk
+""".split())
+
+
+class Summarizer(ABC):
+    """Abstract base class for debate summarizers."""
+    
+    @abstractmethod
+    def summarize(self, previous_summary: str, messages: List[DebateMessage]) -> str:
+        """Fold ``messages`` into ``previous_summary`` and return the new summary."""
+        pass
+
+
+class AISummarizer(Summarizer):
+    """Summarizer that asks the AI service to update the running summary.
+
+    The request goes out as a judge call: one low-temperature instruction
+    with a reply budget sized to ``max_words``. Character replies are capped
+    far below a full summary and would be cut off mid-sentence.
+    """
+    
+    def __init__(self, ai_client, max_words: int = 150):
+        """Initialize with the AI client and the summary's word budget."""
+        self.ai_client = ai_client
+        self.max_words = max_words
+    
+    def summarize(self, previous_summary: str, messages: List[DebateMessage]) -> str:
+        """Summarize with one AI call."""
+        transcript = "\n".join(f"{msg.speaker_name}: {msg.message}" for msg in messages)
+        prompt = f"""SUMMARY SO FAR:
+{previous_summary or "(none)"}
+
+NEW ROUNDS:
+{transcript}
+
+Rewrite the summary so it also covers the new rounds. Keep each debater's main claims, statistics and attacks on opponents, one line per debater in the form "Name: ...". Use at most {self.max_words} words and output plain text only."""
+        
+        return self.ai_client.generate_judge_response(
+            f"You keep a concise running summary of a political debate.\n\n{prompt}",
+            max_tokens=self.max_words * SUMMARY_TOKENS_PER_WORD
+        ).strip()
+
+
+class ExtractiveSummarizer(Summarizer):
+    """Offline summarizer that keeps each speaker's most representative sentences.
+
+    Sentences are scored by how often their content words recur across the
+    new messages; each speaker's line keeps its newest picks within an equal
+    share of ``max_words``.
+    """
+    
+    def __init__(self, sentences_per_speaker: int = 2, max_words: int = 150):
+        """Initialize with how many sentences to take per speaker and the summary's word budget."""
+        self.sentences_per_speaker = sentences_per_speaker
+        self.max_words = max_words
+    
+    def summarize(self, previous_summary: str, messages: List[DebateMessage]) -> str:
+        """Append the best new sentences to each speaker's line, trimming the oldest ones."""
+        lines = _parse_summary(previous_summary)
+        frequencies = Counter(
+            word for msg in messages for word in _WORD_PATTERN.findall(msg.message.lower()) if word not in _STOPWORDS
+        )
+        
+        for speaker, speaker_messages in group_by_speaker(messages).items():
+            sentences = [
+                sentence.strip() for msg in speaker_messages
+                for sentence in _SENTENCE_PATTERN.findall(msg.message) if sentence.strip()
+            ]
+            ranked = sorted(range(len(sentences)), key=lambda i: -_score_sentence(sentences[i], frequencies))
+            picked = [sentences[i] for i in sorted(ranked[:self.sentences_per_speaker])]
+            lines[speaker] = lines.get(speaker, []) + picked
+        
+        budget = self.max_words // max(len(lines), 1)
+        return "\n".join(f"{speaker}: {' '.join(_trim_oldest(sentences, budget))}" for speaker, sentences in lines.items())
+
+
+def create_summarizer(summarizer_type: str = "ai", **kwargs) -> Summarizer:
+    """Factory function to create different types of summarizers."""
+    if summarizer_type == "ai":
+        ai_client = kwargs.get("ai_client")
+        if not ai_client:
+            raise ValueError("AI client required for AI summarizer")
+        return AISummarizer(ai_client, kwargs.get("max_words", 150))
+    elif summarizer_type == "extractive":
+        return ExtractiveSummarizer(max_words=kwargs.get("max_words", 150))
+    else:
+        raise ValueError(f"Unknown summarizer type: {summarizer_type}")
+
+
+class DebateMemory:
+    """Rolling summary of a debate's older rounds, refreshed on a background worker.
+
+    Once a round drops out of the last ``recent_rounds`` it is folded into
+    the summary off the critical path; until the new summary is ready the
+    round stays in the verbatim history, so nothing goes missing between
+    the two. Turns read ``context()`` to get the summary and the last round
+    it covers.
+    """
+    
+    def __init__(
+        self,
+        summarizer: Summarizer,
+        recent_rounds: int = 2,
+        summary: str = "",
+        summarized_through: int = 0
+    ):
+        """Initialize with the summarizer and, when resuming, the summary so far."""
+        self.summarizer = summarizer
+        self.recent_rounds = recent_rounds
+        self.summary = summary
+        self.summarized_through = summarized_through
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debate-memory")
+        self._pending: Optional[Tuple[int, Future]] = None
+        self._lock = threading.Lock()
+        
+        # Metrics
+        self.updates = 0
+        self.failures = 0
+        self.summarize_seconds = 0.0
+    
+    @classmethod
+    def from_dict(cls, summarizer: Summarizer, data: Dict[str, Any], recent_rounds: int = 2) -> 'DebateMemory':
+        """Restore the summary saved by ``to_dict``."""
+        memory = cls(summarizer, recent_rounds, data.get("summary", ""), data.get("summarized_through", 0))
+        memory.updates = data.get("updates", 0)
+        memory.failures = data.get("failures", 0)
+        memory.summarize_seconds = data.get("summarize_seconds", 0.0)
+        return memory
+    
+    def update(self, rounds: List[DebateRound]) -> None:
+        """Start folding finished rounds that left the recent window into the summary."""
+        self.refresh()
+        finished = [r for r in rounds if r.end_time is not None]
+        if not finished:
+            return
+        
+        with self._lock:
+            target = finished[-1].round_number - self.recent_rounds
+            if self._pending is not None or target <= self.summarized_through:
+                return
+            
+            messages = [
+                msg for r in finished if self.summarized_through < r.round_number <= target
+                for msg in r.messages if not msg.metadata.get("error")
+            ]
+            # Run in the caller's context so stopping the debate cancels an AI summary too
+            future = self._executor.submit(
+                contextvars.copy_context().run, self._summarize, self.summary, messages
+            )
+            self._pending = (target, future)
+    
+    def _summarize(self, previous_summary: str, messages: List[DebateMessage]) -> Tuple[str, float]:
+        """Run the summarizer and time it."""
+        started = time.perf_counter()
+        summary = self.summarizer.summarize(previous_summary, messages) if messages else previous_summary
+        return summary, time.perf_counter() - started
+    
+    def refresh(self) -> None:
+        """Adopt a finished background summary; a failed one is retried on the next update."""
+        with self._lock:
+            if self._pending is None or not self._pending[1].done():
+                return
+            target, future = self._pending
+            self._pending = None
+            try:
+                summary, seconds = future.result()
+            except Exception as e:
+                self.failures += 1
+                logging.warning(f"Debate summary failed: {e}")
+                return
+            
+            self.summary = summary
+            self.summarized_through = target
+            self.updates += 1
+            self.summarize_seconds += seconds
+    
+    def context(self) -> Tuple[str, int]:
+        """Get the current summary and the last round number it covers."""
+        self.refresh()
+        with self._lock:
+            return self.summary, self.summarized_through
+    
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until the summary in progress, if any, is adopted."""
+        with self._lock:
+            pending = self._pending
+        if pending is not None:
+            try:
+                pending[1].exception(timeout)
+            except Exception:
+                pass
+        self.refresh()
+    
+    def shutdown(self) -> None:
+        """Stop the worker; a summary still in progress is discarded."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the summary and its metrics to a dictionary."""
+        return {
+            "summary": self.summary,
+            "summarized_through": self.summarized_through,
+            "updates": self.updates,
+            "failures": self.failures,
+            "summarize_seconds": self.summarize_seconds
+        }
+
+
+def _parse_summary(summary: str) -> Dict[str, List[str]]:
+    """Split a "Name: sentences" summary back into each speaker's sentences."""
+    lines: Dict[str, List[str]] = {}
+    for line in summary.splitlines():
+        match = _SUMMARY_LINE_PATTERN.match(line.strip())
+        if match:
+            lines[match.group(1)] = [s.strip() for s in _SENTENCE_PATTERN.findall(match.group(2)) if s.strip()]
+    return lines
+
+
+def _score_sentence(sentence: str, frequencies: Counter) -> float:
+    """Score a sentence by the mean frequency of its content words."""
+    words = [word for word in _WORD_PATTERN.findall(sentence.lower()) if word not in _STOPWORDS]
+    if not words:
+        return 0.0
+    return sum(frequencies[word] for word in words) / len(words)
+
+
+def _trim_oldest(sentences: List[str], max_words: int) -> List[str]:
+    """Keep the newest sentences that fit ``max_words`` (always at least one)."""
+    kept: List[str] = []
+    words = 0
+    for sentence in reversed(sentences):
+        words += len(sentence.split())
+        if kept and words > max_words:
+            break
+        kept.append(sentence)
+    kept.reverse()
+    return kept
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Callable
+from collections import deque
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 
@@ -13,6 +15,28 @@ class DebateStatus(Enum):
     COMPLETED = "completed"
 
 
+class RoundMode(Enum):
+    """How participants take their turns within a round."""
+    SEQUENTIAL = "sequential"  # Each speaker replies to the previous one
+    SIMULTANEOUS = "simultaneous"  # Everyone answers the same prompt at once (panel format)
+    OPENING_CLOSING = "opening_closing"  # Simultaneous first and last rounds, sequential in between
+
+
+class TimeoutFallback(Enum):
+    """What to record for a turn that misses its deadline."""
+    SKIP = "skip"  # Record the missed turn and move on to the next speaker
+    CANNED = "canned"  # Say ``DebateSettings.fallback_line`` instead
+    CACHED = "cached"  # Repeat the speaker's most recent successful line
+    MODEL = "model"  # Retry once with ``DebateSettings.fallback_model``, then use the canned line
+
+
+class JudgeCadence(Enum):
+    """How often competitive rounds are sent to the judge."""
+    EVERY_ROUND = "every_round"  # One judge call per round
+    EVERY_K_ROUNDS = "every_k_rounds"  # One call per ``DebateSettings.judge_interval`` rounds
+    END_OF_DEBATE = "end_of_debate"  # One call for the whole debate
+
+
 @dataclass
 class DebateMessage:
     """A single message in a debate conversation."""
@@ -22,6 +46,11 @@ class DebateMessage:
     timestamp: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words, computed once."""
+        return len(self.message.split())
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -52,10 +81,15 @@ class DebateRound:
     judge_feedback: Optional[Dict[str, Any]] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    _listener: Optional[Callable[['DebateRound', DebateMessage], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def add_message(self, message: DebateMessage) -> None:
         """Add a message to this round."""
         self.messages.append(message)
+        if self._listener:
+            self._listener(self, message)
     
     def get_messages_by_speaker(self, speaker_name: str) -> List[DebateMessage]:
         """Get all messages from a specific speaker in this round."""
@@ -89,15 +123,100 @@ class DebateRound:
 
 @dataclass
 class DebateConversation:
-    """Complete conversation history for a debate."""
+    """Complete conversation history for a debate.
+
+    Besides ``rounds``, the conversation keeps a flat message list, a rolling
+    window of recent messages, round offsets and per-speaker totals, all
+    updated in O(1) per message. Add rounds with ``add_round`` and messages
+    with ``add_message`` (or ``DebateRound.add_message`` on an attached round)
+    so the indexes stay current.
+    """
     topic: str
     rounds: List[DebateRound] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
     
+    CONTEXT_WINDOW = 32
+    
+    _messages: List[DebateMessage] = field(default_factory=list, init=False, repr=False, compare=False)
+    _recent: deque = field(default=None, init=False, repr=False, compare=False)
+    _round_offsets: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _speaker_totals: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _totals: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Build the indexes for any rounds passed in."""
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild every index from ``rounds``."""
+        self._messages = []
+        self._recent = deque(maxlen=self.CONTEXT_WINDOW)
+        self._round_offsets = []
+        self._speaker_totals = {}
+        self._totals = {"messages": 0, "words": 0, "characters": 0}
+        for round_obj in self.rounds:
+            self._attach(round_obj)
+    
+    def _attach(self, round_obj: DebateRound) -> None:
+        """Index a round's existing messages and watch it for new ones."""
+        self._round_offsets.append(len(self._messages))
+        for message in round_obj.messages:
+            self._index_message(message)
+        round_obj._listener = self._on_round_message
+    
+    def _on_round_message(self, round_obj: DebateRound, message: DebateMessage) -> None:
+        """Index a message added to an attached round."""
+        if self.rounds and round_obj is self.rounds[-1]:
+            self._index_message(message)
+        else:
+            # Editing an earlier round shifts every later offset
+            self._reindex()
+    
+    def _index_message(self, message: DebateMessage) -> None:
+        """Fold one message into the indexes."""
+        self._messages.append(message)
+        self._recent.append(message)
+        
+        totals = self._speaker_totals.setdefault(
+            message.speaker_name, {"messages": 0, "words": 0, "characters": 0, "prompt_tokens": 0}
+        )
+        totals["messages"] += 1
+        totals["words"] += message.word_count
+        totals["characters"] += len(message.message)
+        totals["prompt_tokens"] += message.metadata.get("prompt_tokens", 0)
+        
+        self._totals["messages"] += 1
+        self._totals["words"] += message.word_count
+        self._totals["characters"] += len(message.message)
+    
+    def _sync(self) -> None:
+        """Catch up with rounds appended to ``rounds`` directly."""
+        if len(self._round_offsets) != len(self.rounds):
+            self._reindex()
+    
     def add_round(self, round_obj: DebateRound) -> None:
         """Add a new round to the conversation."""
+        self._sync()
         self.rounds.append(round_obj)
+        self._attach(round_obj)
+    
+    def add_message(self, message: DebateMessage) -> None:
+        """Add a message to the current round, starting one if needed."""
+        current = self.get_current_round()
+        if current is None or current.round_number != message.round_number:
+            current = DebateRound(round_number=message.round_number)
+            self.add_round(current)
+        current.add_message(message)
+    
+    def reopen_unfinished_round(self) -> Optional[DebateRound]:
+        """Detach the last round if it never finished, so the debate can continue it."""
+        if not self.rounds or self.rounds[-1].end_time is not None:
+            return None
+        round_obj = self.rounds.pop()
+        round_obj._listener = None
+        self._reindex()
+        return round_obj
     
     def get_current_round(self) -> Optional[DebateRound]:
         """Get the current (last) round."""
@@ -105,19 +224,46 @@ class DebateConversation:
     
     def get_all_messages(self) -> List[DebateMessage]:
         """Get all messages from all rounds."""
-        messages = []
-        for round_obj in self.rounds:
-            messages.extend(round_obj.messages)
-        return messages
+        self._sync()
+        return list(self._messages)
+    
+    def iter_messages_newest_first(self) -> Iterator[DebateMessage]:
+        """Iterate over messages from the most recent backwards without copying."""
+        self._sync()
+        return reversed(self._messages)
     
     def get_messages_for_context(self, last_n: int = 6) -> List[DebateMessage]:
         """Get the last N messages for context."""
-        all_messages = self.get_all_messages()
-        return all_messages[-last_n:] if len(all_messages) > last_n else all_messages
+        self._sync()
+        if last_n <= 0:
+            return []
+        if last_n <= len(self._recent):
+            return list(self._recent)[-last_n:]
+        return self._messages[-last_n:]
+    
+    def get_messages_since_round(self, round_index: int) -> List[DebateMessage]:
+        """Get every message from the round at ``round_index`` (0-based) onwards."""
+        self._sync()
+        if round_index >= len(self._round_offsets):
+            return []
+        return self._messages[self._round_offsets[max(round_index, 0)]:]
     
     def get_participant_message_count(self, speaker_name: str) -> int:
         """Get total message count for a participant."""
-        return sum(1 for msg in self.get_all_messages() if msg.speaker_name == speaker_name)
+        return self.get_participant_totals(speaker_name)["messages"]
+    
+    def get_participant_totals(self, speaker_name: str) -> Dict[str, int]:
+        """Get message, word, character and prompt-token totals for a participant."""
+        self._sync()
+        totals = self._speaker_totals.get(speaker_name)
+        if totals is None:
+            return {"messages": 0, "words": 0, "characters": 0, "prompt_tokens": 0}
+        return dict(totals)
+    
+    def get_totals(self) -> Dict[str, int]:
+        """Get message, word and character totals for the whole conversation."""
+        self._sync()
+        return dict(self._totals)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -143,11 +289,40 @@ class DebateConversation:
 class DebateSettings:
     """Configuration settings for a debate."""
     total_rounds: int = 5
-    response_delay: float = 1.0
+    response_delay: float = 1.0  # Display pacing only; generation never waits on it
     competitive_mode: bool = False
     auto_judge: bool = True
     max_response_length: int = 100
-    timeout_per_response: int = 30
+    timeout_per_response: float = 30  # Per-turn deadline in seconds; 0 disables it
+    debate_timeout: Optional[float] = None  # Deadline for a whole run of the debate, in seconds
+    timeout_fallback: TimeoutFallback = TimeoutFallback.SKIP
+    fallback_model: Optional[str] = None
+    fallback_line: str = "I'll yield my time on this one."
+    context_token_budget: int = 1500
+    max_context_messages: Optional[int] = None
+    summary_memory: bool = False  # Fold rounds older than memory_recent_rounds into a running summary
+    memory_recent_rounds: int = 2
+    pipelined_judging: bool = False
+    judge_cadence: JudgeCadence = JudgeCadence.EVERY_ROUND
+    judge_interval: int = 3
+    round_mode: RoundMode = RoundMode.SEQUENTIAL
+    max_concurrent_responses: int = 8
+    
+    def is_simultaneous_round(self, round_num: int) -> bool:
+        """Check whether round ``round_num`` (0-based) is answered concurrently."""
+        if self.round_mode == RoundMode.SIMULTANEOUS:
+            return True
+        if self.round_mode == RoundMode.OPENING_CLOSING:
+            return round_num in (0, self.total_rounds - 1)
+        return False
+    
+    def is_judging_round(self, round_num: int) -> bool:
+        """Check whether the rounds judged so far should go to the judge after round ``round_num`` (0-based)."""
+        if round_num >= self.total_rounds - 1 or self.judge_cadence == JudgeCadence.EVERY_ROUND:
+            return True
+        if self.judge_cadence == JudgeCadence.EVERY_K_ROUNDS:
+            return (round_num + 1) % max(self.judge_interval, 1) == 0
+        return False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -157,7 +332,20 @@ class DebateSettings:
             "competitive_mode": self.competitive_mode,
             "auto_judge": self.auto_judge,
             "max_response_length": self.max_response_length,
-            "timeout_per_response": self.timeout_per_response
+            "timeout_per_response": self.timeout_per_response,
+            "debate_timeout": self.debate_timeout,
+            "timeout_fallback": self.timeout_fallback.value,
+            "fallback_model": self.fallback_model,
+            "fallback_line": self.fallback_line,
+            "context_token_budget": self.context_token_budget,
+            "max_context_messages": self.max_context_messages,
+            "summary_memory": self.summary_memory,
+            "memory_recent_rounds": self.memory_recent_rounds,
+            "pipelined_judging": self.pipelined_judging,
+            "judge_cadence": self.judge_cadence.value,
+            "judge_interval": self.judge_interval,
+            "round_mode": self.round_mode.value,
+            "max_concurrent_responses": self.max_concurrent_responses
         }
     
     @classmethod
@@ -169,7 +357,20 @@ class DebateSettings:
             competitive_mode=data.get("competitive_mode", False),
             auto_judge=data.get("auto_judge", True),
             max_response_length=data.get("max_response_length", 100),
-            timeout_per_response=data.get("timeout_per_response", 30)
+            timeout_per_response=data.get("timeout_per_response", 30),
+            debate_timeout=data.get("debate_timeout"),
+            timeout_fallback=TimeoutFallback(data.get("timeout_fallback", TimeoutFallback.SKIP.value)),
+            fallback_model=data.get("fallback_model"),
+            fallback_line=data.get("fallback_line", "I'll yield my time on this one."),
+            context_token_budget=data.get("context_token_budget", 1500),
+            max_context_messages=data.get("max_context_messages"),
+            summary_memory=data.get("summary_memory", False),
+            memory_recent_rounds=data.get("memory_recent_rounds", 2),
+            pipelined_judging=data.get("pipelined_judging", False),
+            judge_cadence=JudgeCadence(data.get("judge_cadence", JudgeCadence.EVERY_ROUND.value)),
+            judge_interval=data.get("judge_interval", 3),
+            round_mode=RoundMode(data.get("round_mode", RoundMode.SEQUENTIAL.value)),
+            max_concurrent_responses=data.get("max_concurrent_responses", 8)
         )
 
 
@@ -254,9 +455,75 @@ class DebateSession:
             created_at=datetime.fromisoformat(data["created_at"]),
             metadata=data.get("metadata", {})
         )
+    
+    @classmethod
+    def resume_from_journal(cls, events: Iterable[Dict[str, Any]]) -> 'DebateSession':
+        """Rebuild a session from its journal events without regenerating any turn.
+
+        A round that was cut off mid-way is kept without an ``end_time`` so
+        the orchestrator can finish it. A session that was still running when
+        the journal stopped comes back paused, ready for ``resume_debate``.
+        """
+        session = None
+        open_round: Optional[DebateRound] = None
+        
+        for event in events:
+            event_type = event.get("type")
+            if event_type == "session":
+                session = cls.from_dict(event["session"])
+                session.conversation = DebateConversation(
+                    topic=session.topic, start_time=session.conversation.start_time
+                )
+                open_round = None
+            elif session is None:
+                continue
+            elif event_type == "round_start":
+                open_round = DebateRound(
+                    round_number=event["round"],
+                    start_time=datetime.fromisoformat(event["start_time"]) if event.get("start_time") else None
+                )
+            elif event_type == "message":
+                message = DebateMessage.from_dict(event["message"])
+                if open_round is None or open_round.round_number != message.round_number:
+                    open_round = DebateRound(round_number=message.round_number)
+                open_round.add_message(message)
+            elif event_type == "round_end" and open_round is not None:
+                open_round.end_time = datetime.fromisoformat(event["end_time"])
+                session.conversation.add_round(open_round)
+                open_round = None
+            elif event_type == "verdict":
+                for round_obj in reversed(session.conversation.rounds):
+                    if round_obj.round_number == event["round"]:
+                        round_obj.judge_feedback = event["adjustments"]
+                        break
+            elif event_type == "status":
+                session.status = DebateStatus(event["status"])
+                if event.get("end_time"):
+                    session.conversation.end_time = datetime.fromisoformat(event["end_time"])
+                if event.get("metadata"):
+                    session.metadata.update(event["metadata"])
+        
+        if session is None:
+            raise ValueError("Journal has no session header")
+        
+        if open_round is not None and open_round.messages:
+            session.conversation.add_round(open_round)
+        
+        if session.status in (DebateStatus.NOT_STARTED, DebateStatus.RUNNING):
+            session.status = DebateStatus.PAUSED
+        session.metadata["resumed_from_journal"] = True
+        return session
 
 
 # Utility functions
+def group_by_speaker(messages: Iterable[DebateMessage]) -> Dict[str, List[DebateMessage]]:
+    """Bucket messages by speaker in a single pass, keeping first-appearance order."""
+    grouped: Dict[str, List[DebateMessage]] = {}
+    for message in messages:
+        grouped.setdefault(message.speaker_name, []).append(message)
+    return grouped
+
+
 def create_debate_session(
     session_id: str,
     topic: str,
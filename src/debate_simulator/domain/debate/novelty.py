@@ -0,0 +1,148 @@
+from typing import List, Dict, Any, Optional, Set, FrozenSet, Iterable
+from dataclasses import dataclass
+import hashlib
+import heapq
+import re
+import threading
+
+from .models import DebateMessage
+
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+REPETITION_THRESHOLD = 0.5  # Share of recycled shingles from which a message counts as rehashing the debate
+
+
+@dataclass
+class NoveltyScore:
+    """How much of a message repeats what was already said in the debate."""
+    shingles: int  # Distinct word shingles in the message
+    repeated_shingles: int  # Shingles already heard earlier in the debate
+    nearest_similarity: float = 0.0  # Estimated Jaccard similarity to the closest earlier message
+    nearest: Optional[Any] = None  # Key of that message
+    
+    @property
+    def overlap(self) -> float:
+        """Share of the message's shingles heard before."""
+        return self.repeated_shingles / self.shingles if self.shingles else 0.0
+    
+    @property
+    def novelty(self) -> Optional[float]:
+        """Share of the message's shingles not heard before (None if too short to tell)."""
+        return 1.0 - self.overlap if self.shingles else None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "shingles": self.shingles,
+            "repeated_shingles": self.repeated_shingles,
+            "overlap": round(self.overlap, 3),
+            "nearest_similarity": round(self.nearest_similarity, 3),
+            "nearest": self.nearest
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NoveltyScore':
+        """Create from dictionary."""
+        return cls(
+            shingles=data.get("shingles", 0),
+            repeated_shingles=data.get("repeated_shingles", 0),
+            nearest_similarity=data.get("nearest_similarity", 0.0),
+            nearest=data.get("nearest")
+        )
+
+
+class NoveltyIndex:
+    """Incremental index of a debate's hashed word shingles for scoring how new a message is.
+
+    Every added message leaves its shingle hashes in one set, so the share
+    of a new message's shingles heard before costs a single set
+    intersection. Each message also keeps a bottom-k MinHash sketch, its
+    ``sketch_size`` smallest shingle hashes, filed under those hashes;
+    only earlier messages sharing a sketch hash are compared to find the
+    closest one. Scoring never rescans the transcript.
+    """
+    
+    def __init__(self, shingle_size: int = 3, sketch_size: int = 32):
+        """Initialize with the words per shingle and the MinHash sketch size."""
+        self.shingle_size = shingle_size
+        self.sketch_size = sketch_size
+        self._seen: Set[int] = set()
+        self._sketches: List[FrozenSet[int]] = []
+        self._keys: List[Any] = []
+        self._postings: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_messages(cls, messages: Iterable[DebateMessage], **kwargs) -> 'NoveltyIndex':
+        """Build an index holding the given messages, e.g. to pick up a resumed debate."""
+        index = cls(**kwargs)
+        for message in messages:
+            index.add_message(message)
+        return index
+    
+    def __len__(self) -> int:
+        """Number of messages in the index."""
+        return len(self._keys)
+    
+    def shingles(self, text: str) -> Set[int]:
+        """Hash the overlapping word n-grams of ``text``."""
+        words = _WORD_PATTERN.findall(text.lower())
+        size = self.shingle_size
+        return {_hash(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)}
+    
+    def score(self, text: str) -> NoveltyScore:
+        """Score ``text`` against every message added so far, without adding it."""
+        shingles = self.shingles(text)
+        with self._lock:
+            return self._score(shingles, self._sketch(shingles))
+    
+    def add(self, text: str, key: Any = None) -> NoveltyScore:
+        """Score ``text`` against the history, then add it under ``key``."""
+        shingles = self.shingles(text)
+        sketch = self._sketch(shingles)
+        with self._lock:
+            score = self._score(shingles, sketch)
+            message_id = len(self._keys)
+            self._seen |= shingles
+            self._sketches.append(sketch)
+            self._keys.append(key)
+            for value in sketch:
+                self._postings.setdefault(value, []).append(message_id)
+        return score
+    
+    def add_message(self, message: DebateMessage) -> NoveltyScore:
+        """Add a debate message, keyed by its round number and speaker."""
+        return self.add(message.message, [message.round_number, message.speaker_name])
+    
+    def _sketch(self, shingles: Set[int]) -> FrozenSet[int]:
+        """Bottom-k MinHash sketch: the ``sketch_size`` smallest shingle hashes."""
+        if len(shingles) <= self.sketch_size:
+            return frozenset(shingles)
+        return frozenset(heapq.nsmallest(self.sketch_size, shingles))
+    
+    def _score(self, shingles: Set[int], sketch: FrozenSet[int]) -> NoveltyScore:
+        """Score a message's shingles against the history (caller holds the lock)."""
+        score = NoveltyScore(len(shingles), len(shingles & self._seen))
+        if not score.repeated_shingles:
+            return score
+        
+        candidates = {message_id for value in sketch for message_id in self._postings.get(value, ())}
+        for message_id in candidates:
+            similarity = _estimate_similarity(sketch, self._sketches[message_id], self.sketch_size)
+            if similarity > score.nearest_similarity:
+                score.nearest_similarity = similarity
+                score.nearest = self._keys[message_id]
+        return score
+
+
+def _hash(shingle: str) -> int:
+    """Stable 64-bit hash of a shingle, so sketches agree across runs."""
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+
+
+def _estimate_similarity(a: FrozenSet[int], b: FrozenSet[int], sketch_size: int) -> float:
+    """Estimate the Jaccard similarity of two messages from their bottom-k sketches."""
+    union = heapq.nsmallest(sketch_size, a | b)
+    shared = a & b
+    return sum(1 for value in union if value in shared) / len(union)
@@ -1,28 +1,68 @@
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import contextvars
+import itertools
 import random
 import time
 
 from .models import (
     DebateSession, DebateRound, DebateMessage, DebateSettings, 
-    DebateStatus, create_debate_session, generate_session_id
+    DebateStatus, TimeoutFallback, create_debate_session, generate_session_id
+)
+from .context import ContextBuilder, TokenCounter, create_token_counter
+from .events import (
+    DebateEvent, EventBus, MessageGenerated, MessageDelta, RoundCompleted,
+    JudgeFeedback, SessionCompleted, ProgressUpdate
 )
 from .judge import DebateJudge
-from ..characters.base import Character
+from .judging import JudgingPipeline, Verdict
+from .memory import AISummarizer, DebateMemory, Summarizer
+from .novelty import NoveltyIndex
+from ..characters.base import Character, CharacterStats
 from ..topics import create_topic_prompt
+from ...infrastructure.cancellation import CancellationToken, cancellation_scope, current_cancellation_token
+from ...infrastructure.errors import CircuitOpenError, RequestCancelledError, DeadlineExceededError
+from ...infrastructure.session_journal import SessionJournal, journal_path, read_journal
 
 
 class DebateOrchestrator:
     """Orchestrates the flow of a political debate between AI characters."""
     
-    def __init__(self, ai_client, judge: Optional[DebateJudge] = None):
-        """Initialize the orchestrator with required dependencies."""
+    def __init__(
+        self,
+        ai_client,
+        judge: Optional[DebateJudge] = None,
+        journal_dir: Optional[str] = None,
+        journal_fsync_interval: float = 1.0,
+        summarizer: Optional[Summarizer] = None
+    ):
+        """Initialize the orchestrator; ``journal_dir`` enables crash-safe session journals.
+
+        ``summarizer`` compresses older rounds when the session's
+        ``summary_memory`` setting is on (an AI summarizer by default).
+        """
         self.ai_client = ai_client
         self.judge = judge
+        self.summarizer = summarizer
+        self._memory: Optional[DebateMemory] = None
+        self._novelty_index: Optional[NoveltyIndex] = None
         self.current_session: Optional[DebateSession] = None
+        self._token_counter: Optional[TokenCounter] = None
+        self._context_builder: Optional[ContextBuilder] = None
+        self.journal_dir = journal_dir
+        self.journal_fsync_interval = journal_fsync_interval
+        self._journal: Optional[SessionJournal] = None
+        self._cancel_token: Optional[CancellationToken] = None
+        self._unjudged: List[Tuple[DebateRound, List[DebateMessage]]] = []
+        self._debate_deadline: Optional[float] = None
         
-        # Callbacks for UI updates
+        # Typed events for any number of subscribers
+        self.events = EventBus()
+        
+        # Single synchronous callbacks, still honoured alongside the event bus
         self.on_message_generated: Optional[Callable] = None
+        self.on_message_delta: Optional[Callable] = None
         self.on_round_completed: Optional[Callable] = None
         self.on_judge_feedback: Optional[Callable] = None
         self.on_session_completed: Optional[Callable] = None
@@ -40,6 +80,7 @@ class DebateOrchestrator:
         
         session_id = generate_session_id()
         participant_names = [p.name for p in participants]
+        self._unjudged = []
         
         self.current_session = create_debate_session(
             session_id=session_id,
@@ -59,23 +100,140 @@ class DebateOrchestrator:
             raise ValueError("No active debate session")
         
         self.current_session.start()
-        self._conduct_debate(participants)
+        self._open_journal(participants)
+        try:
+            with cancellation_scope(self._begin_run()):
+                self._conduct_debate(participants)
+        finally:
+            self._close_journal()
     
     def stop_debate(self) -> None:
-        """Stop the current debate."""
+        """Stop the current debate, aborting any AI request in flight."""
         if self.current_session:
             self.current_session.stop()
+            self._journal_status()
+            self._cancel_in_flight("Debate stopped")
     
     def pause_debate(self) -> None:
-        """Pause the current debate."""
+        """Pause the current debate, aborting any AI request in flight."""
         if self.current_session:
             self.current_session.pause()
+            self._journal_status()
+            self._cancel_in_flight("Debate paused")
     
     def resume_debate(self, participants: List[Character]) -> None:
         """Resume a paused debate."""
         if self.current_session and self.current_session.status.value == "paused":
             self.current_session.resume()
-            self._conduct_debate(participants, resume=True)
+            self._open_journal(participants)
+            try:
+                with cancellation_scope(self._begin_run()):
+                    self._conduct_debate(participants, resume=True)
+            finally:
+                self._close_journal()
+    
+    def _begin_run(self) -> CancellationToken:
+        """Start this run's debate deadline and create the token that stopping or pausing fires."""
+        debate_timeout = self.current_session.settings.debate_timeout
+        self._debate_deadline = time.monotonic() + debate_timeout if debate_timeout else None
+        self._cancel_token = CancellationToken()
+        return self._cancel_token
+    
+    def _cancel_in_flight(self, reason: str) -> None:
+        """Fire the current run's token so blocked AI calls return immediately."""
+        if self._cancel_token is not None:
+            self._cancel_token.cancel(reason)
+    
+    def _was_cancelled(self, error: Exception) -> bool:
+        """Check whether ``error`` is this run being stopped rather than a failed turn."""
+        return (
+            isinstance(error, RequestCancelledError)
+            and self._cancel_token is not None
+            and self._cancel_token.is_cancelled
+        )
+    
+    def resume_from_journal(
+        self,
+        session_id: str,
+        participants: Optional[List[Character]] = None
+    ) -> List[Character]:
+        """Restore a session and its participants' stats from the journal.
+        
+        Returns the participants to pass to ``resume_debate``; when
+        ``participants`` is given, their stats are reset and replayed in place.
+        """
+        if not self.journal_dir:
+            raise ValueError("Session journaling is not enabled")
+        
+        events = read_journal(journal_path(self.journal_dir, session_id))
+        self.current_session = DebateSession.resume_from_journal(events)
+        return self._restore_participants(events, participants)
+    
+    def _restore_participants(
+        self,
+        events: List[Dict[str, Any]],
+        participants: Optional[List[Character]] = None
+    ) -> List[Character]:
+        """Rebuild participants from the journal header and replay every verdict's adjustments."""
+        snapshots = next(event["participants"] for event in events if event.get("type") == "session")
+        if participants is None:
+            participants = [Character.from_dict(snapshot) for snapshot in snapshots]
+        else:
+            by_name = {snapshot["name"]: snapshot for snapshot in snapshots}
+            for participant in participants:
+                snapshot = by_name.get(participant.name)
+                if snapshot:
+                    participant.stats = CharacterStats.from_dict(snapshot["stats"])
+                    participant.position = snapshot.get("position")
+        
+        by_name = {participant.name: participant for participant in participants}
+        for event in events:
+            if event.get("type") != "verdict":
+                continue
+            for name, adjustments in event["adjustments"].items():
+                if name in by_name:
+                    by_name[name].adjust_stats(adjustments)
+        return participants
+    
+    def _open_journal(self, participants: List[Character]) -> None:
+        """Start journaling the current session, writing its header on first use."""
+        if not self.journal_dir or self._journal is not None:
+            return
+        
+        self._journal = SessionJournal.for_session(
+            self.journal_dir, self.current_session.session_id, self.journal_fsync_interval
+        )
+        if self._journal.is_empty:
+            self._journal.append(
+                "session",
+                session=self.current_session.to_dict(),
+                participants=[participant.to_dict() for participant in participants]
+            )
+        self._journal_status()
+    
+    def _close_journal(self) -> None:
+        """Record the final status and close the journal."""
+        if self._journal is None:
+            return
+        self._journal_status()
+        self.current_session.metadata["journal_stats"] = self._journal.get_stats()
+        self._journal.close()
+        self._journal = None
+    
+    def _journal_event(self, event_type: str, **fields) -> None:
+        """Append an event to the session journal, if journaling."""
+        if self._journal is not None:
+            self._journal.append(event_type, **fields)
+    
+    def _journal_status(self) -> None:
+        """Journal the session's current status."""
+        session = self.current_session
+        end_time = session.conversation.end_time
+        self._journal_event(
+            "status",
+            status=session.status.value,
+            end_time=end_time.isoformat() if end_time else None
+        )
     
     def _assign_positions(self, participants: List[Character]) -> None:
         """Assign left/right positions to participants."""
@@ -97,144 +255,668 @@ class DebateOrchestrator:
         if not self.current_session:
             return
         
-        settings = self.current_session.settings
-        conversation = self.current_session.conversation
+        start_round, current_message, unfinished = self._resume_point(resume)
         
-        # Starting round number for resume functionality
-        start_round = len(conversation.rounds) if resume else 0
+        pipeline = JudgingPipeline(self.judge) if self._should_pipeline_judging() else None
+        self._open_memory()
+        self._open_novelty_index(unfinished)
+        try:
+            self._run_rounds(participants, start_round, current_message, pipeline, unfinished)
+            if pipeline:
+                self._apply_verdicts(pipeline.drain(), participants)
+                self.current_session.metadata["judge_wait_seconds"] = pipeline.wait_seconds
+        finally:
+            if pipeline:
+                pipeline.shutdown()
+            self._close_memory()
         
-        # Create initial prompt
-        current_message = create_topic_prompt(self.current_session.topic)
+        self._complete_session(participants)
+    
+    def _run_rounds(
+        self,
+        participants: List[Character],
+        start_round: int,
+        current_message: str,
+        pipeline: Optional[JudgingPipeline] = None,
+        unfinished: Optional[DebateRound] = None
+    ) -> None:
+        """Run the debate rounds, judging inline or through ``pipeline``."""
+        settings = self.current_session.settings
         
         for round_num in range(start_round, settings.total_rounds):
-            if not self.current_session.is_running():
+            if self._debate_deadline_passed() or not self.current_session.is_running():
                 break
             
-            # Create new round
-            debate_round = DebateRound(
-                round_number=round_num + 1,
-                start_time=datetime.now()
-            )
+            if pipeline:
+                # Verdicts are at most one round stale: round N's lands before round N+2 starts
+                self._apply_verdicts(pipeline.collect(wait_for_round=round_num - 1), participants)
             
-            # Collect messages for this round
-            round_messages = []
+            debate_round, round_messages = self._open_round(round_num, unfinished)
             
-            # Each participant responds in this round
-            for participant_index, participant in enumerate(participants):
-                if not self.current_session.is_running():
-                    break
-                
-                # Update progress
-                total_responses = settings.total_rounds * len(participants)
-                current_response = round_num * len(participants) + participant_index
-                progress = current_response / total_responses
-                
-                if self.on_progress_update:
-                    self.on_progress_update(progress, round_num + 1, participant.name)
-                
-                # Update character style for competitive mode
-                if settings.competitive_mode:
-                    participant.style = participant.get_dynamic_style()
-                
-                # Generate response
-                try:
-                    response = self._generate_character_response(
-                        participant, current_message, conversation.get_messages_for_context()
-                    )
-                    
-                    # Create debate message
-                    message = DebateMessage(
-                        round_number=round_num + 1,
-                        speaker_name=participant.name,
-                        message=response,
-                        timestamp=datetime.now()
-                    )
-                    
-                    # Add to round and conversation
-                    debate_round.add_message(message)
-                    round_messages.append(message)
-                    
-                    # Callback for UI update
-                    if self.on_message_generated:
-                        self.on_message_generated(message, participant)
-                    
-                    current_message = response
-                    
-                    # Delay between responses
-                    if settings.response_delay > 0:
-                        time.sleep(settings.response_delay)
-                        
-                except Exception as e:
-                    # Handle AI generation errors gracefully
-                    error_message = f"Error generating response: {str(e)}"
-                    message = DebateMessage(
-                        round_number=round_num + 1,
-                        speaker_name=participant.name,
-                        message=error_message,
-                        timestamp=datetime.now(),
-                        metadata={"error": True}
-                    )
-                    debate_round.add_message(message)
-                    round_messages.append(message)
+            if settings.is_simultaneous_round(round_num):
+                if pipeline:
+                    self._apply_verdicts(pipeline.collect(), participants)
+                current_message = self._run_simultaneous_round(
+                    round_num, debate_round, round_messages, participants, current_message
+                )
+            else:
+                current_message = self._run_sequential_round(
+                    round_num, debate_round, round_messages, participants, current_message, pipeline
+                )
             
-            # Finish the round
-            debate_round.end_time = datetime.now()
-            conversation.add_round(debate_round)
+            if not self._close_round(debate_round, round_messages, participants):
+                break
+            self._remember_rounds()
             
-            # Judge the round in competitive mode
-            if settings.competitive_mode and self.judge and round_messages:
+            # Judge in competitive mode, batching rounds per the judging cadence
+            batch = self._judging_batch(round_num, debate_round, round_messages)
+            if batch and pipeline:
+                pipeline.submit_batch(batch, participants)
+            elif batch:
                 try:
-                    judge_adjustments = self.judge.judge_round(round_messages, participants)
-                    debate_round.judge_feedback = judge_adjustments
-                    
-                    # Apply adjustments to participants
-                    for participant in participants:
-                        if participant.name in judge_adjustments:
-                            participant.adjust_stats(judge_adjustments[participant.name])
-                    
-                    if self.on_judge_feedback:
-                        self.on_judge_feedback(judge_adjustments, round_num + 1)
-                        
+                    verdicts = self.judge.judge_rounds([messages for _, messages in batch], participants)
+                    self._apply_verdicts(list(zip((r for r, _ in batch), verdicts)), participants)
                 except Exception as e:
                     # Handle judge errors gracefully
                     pass
             
-            # Round completed callback
-            if self.on_round_completed:
-                self.on_round_completed(debate_round, round_num + 1)
+            self._publish(RoundCompleted(debate_round, round_num + 1))
             
             # Check if we should stop
             if not self.current_session.is_running():
                 break
+    
+    def _run_sequential_round(
+        self,
+        round_num: int,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        participants: List[Character],
+        current_message: str,
+        pipeline: Optional[JudgingPipeline] = None
+    ) -> str:
+        """Let each participant reply to the previous speaker in turn; returns the last reply."""
+        already_spoke = {message.speaker_name for message in round_messages}
+        
+        for participant_index, participant in enumerate(participants):
+            if self._debate_deadline_passed() or not self.current_session.is_running():
+                break
+            
+            if participant.name in already_spoke:
+                continue
+            
+            if pipeline:
+                self._apply_verdicts(pipeline.collect(), participants)
+            
+            self._prepare_turn(round_num, participant_index, participant, participants)
+            
+            # Generate response
+            try:
+                turn_metrics = {}
+                response = self._generate_turn(participant, current_message, round_num + 1, turn_metrics)
+                
+                message = self._create_message(round_num, participant, response, turn_metrics)
+                self._record_message(debate_round, round_messages, message, participant)
+                
+                current_message = response
+            
+            except CircuitOpenError as e:
+                # The provider is down; pause instead of filling the debate with failed turns
+                self._pause_for_outage(e)
+                break
+            
+            except Exception as e:
+                if self._was_cancelled(e):
+                    # Stopped mid-turn; the unfinished turn is not part of the transcript
+                    break
+                # Handle AI generation errors gracefully
+                message = self._create_error_message(round_num, participant, e)
+                self._store_message(debate_round, round_messages, message)
         
-        # Complete the debate
-        if self.current_session.is_running():
-            self.current_session.complete()
+        return current_message
+    
+    def _run_simultaneous_round(
+        self,
+        round_num: int,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        participants: List[Character],
+        current_message: str
+    ) -> str:
+        """Have every participant answer the same prompt concurrently.
+        
+        Messages are announced as they complete but stored in participant
+        order, so the transcript does not depend on response timing.
+        Returns the last participant's reply as the next prompt.
+        """
+        settings = self.current_session.settings
+        already_spoke = {message.speaker_name for message in round_messages}
+        
+        for participant_index, participant in enumerate(participants):
+            if participant.name not in already_spoke:
+                self._prepare_turn(round_num, participant_index, participant, participants)
+        
+        slots: List[Optional[DebateMessage]] = [None] * len(participants)
+        outage: Optional[CircuitOpenError] = None
+        workers = max(1, min(settings.max_concurrent_responses, len(participants)))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="debate-turn") as executor:
+            futures = {}
+            for participant_index, participant in enumerate(participants):
+                if participant.name in already_spoke:
+                    continue
+                turn_metrics = {}
+                # Deltas from worker threads would interleave, so replies are not streamed here
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self._generate_turn, participant, current_message, round_num + 1, turn_metrics, False
+                )
+                futures[future] = (participant_index, participant, turn_metrics)
             
-            # Final performance evaluation
-            if settings.competitive_mode and self.judge:
+            for future in as_completed(futures):
+                participant_index, participant, turn_metrics = futures[future]
                 try:
-                    overall_performance = self.judge.judge_overall_performance(
-                        participants, conversation.get_all_messages()
-                    )
-                    self.current_session.metadata["final_performance"] = overall_performance
+                    response = future.result()
+                except CircuitOpenError as e:
+                    outage = e
+                    continue
                 except Exception as e:
-                    pass
+                    if not self._was_cancelled(e):
+                        slots[participant_index] = self._create_error_message(round_num, participant, e)
+                    continue
+                
+                message = self._create_message(round_num, participant, response, turn_metrics)
+                slots[participant_index] = message
+                self._publish(MessageGenerated(message, participant))
+        
+        return self._finish_simultaneous_round(debate_round, round_messages, slots, outage, current_message)
+    
+    def _finish_simultaneous_round(
+        self,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        slots: List[Optional[DebateMessage]],
+        outage: Optional[CircuitOpenError],
+        current_message: str
+    ) -> str:
+        """Store concurrently generated messages in participant order; returns the next prompt."""
+        for message in slots:
+            if message is None:
+                continue
+            self._store_message(debate_round, round_messages, message)
+            if not message.metadata.get("error"):
+                current_message = message.message
+        
+        if outage is not None:
+            self._pause_for_outage(outage)
+        
+        return current_message
+    
+    def _resume_point(self, resume: bool) -> Tuple[int, str, Optional[DebateRound]]:
+        """Get the round to start from, the prompt to answer and any round left unfinished."""
+        conversation = self.current_session.conversation
+        topic_prompt = create_topic_prompt(self.current_session.topic)
+        if not resume:
+            return 0, topic_prompt, None
+        
+        unfinished = conversation.reopen_unfinished_round()
+        start_round = len(conversation.rounds)
+        
+        # Continue from the last real reply, including any in the unfinished round
+        history = list(conversation.iter_messages_newest_first())
+        if unfinished:
+            history = list(reversed(unfinished.messages)) + history
+        last_reply = next((m.message for m in history if not m.metadata.get("error")), None)
+        
+        return start_round, last_reply or topic_prompt, unfinished
+    
+    def _open_round(
+        self,
+        round_num: int,
+        unfinished: Optional[DebateRound] = None
+    ) -> Tuple[DebateRound, List[DebateMessage]]:
+        """Start round ``round_num``, or continue it if it was left unfinished."""
+        if unfinished is not None and unfinished.round_number == round_num + 1:
+            return unfinished, list(unfinished.messages)
+        
+        debate_round = self._begin_round(round_num)
+        self._journal_event(
+            "round_start", round=debate_round.round_number, start_time=debate_round.start_time.isoformat()
+        )
+        return debate_round, []
+    
+    def _finish_round(self, debate_round: DebateRound) -> None:
+        """Close a round and add it to the conversation."""
+        debate_round.end_time = datetime.now()
+        self.current_session.conversation.add_round(debate_round)
+        self._journal_event("round_end", round=debate_round.round_number, end_time=debate_round.end_time.isoformat())
+    
+    def _close_round(
+        self,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        participants: List[Character]
+    ) -> bool:
+        """Finish the round, or leave it open if a pause cut it short; returns whether it finished."""
+        spoke = {message.speaker_name for message in round_messages}
+        if self.current_session.status == DebateStatus.PAUSED and len(spoke) < len(participants):
+            # Resuming reopens the round and re-runs the turns the pause aborted
+            self.current_session.conversation.add_round(debate_round)
+            return False
+        
+        self._finish_round(debate_round)
+        return True
+    
+    def _begin_round(self, round_num: int) -> DebateRound:
+        """Create a new round starting now."""
+        return DebateRound(
+            round_number=round_num + 1,
+            start_time=datetime.now()
+        )
+    
+    def _prepare_turn(
+        self,
+        round_num: int,
+        participant_index: int,
+        participant: Character,
+        participants: List[Character]
+    ) -> None:
+        """Report progress and refresh the speaker's style before a turn."""
+        self._publish(self._begin_turn(round_num, participant_index, participant, participants))
+    
+    def _begin_turn(
+        self,
+        round_num: int,
+        participant_index: int,
+        participant: Character,
+        participants: List[Character]
+    ) -> ProgressUpdate:
+        """Refresh the speaker's style and build the progress update for their turn."""
+        settings = self.current_session.settings
+        
+        # Update progress
+        total_responses = settings.total_rounds * len(participants)
+        current_response = round_num * len(participants) + participant_index
+        progress = current_response / total_responses
+        
+        # Update character style for competitive mode
+        if settings.competitive_mode:
+            participant.style = participant.get_dynamic_style()
+        
+        return ProgressUpdate(progress, round_num + 1, participant.name)
+    
+    def _create_message(
+        self,
+        round_num: int,
+        participant: Character,
+        response: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> DebateMessage:
+        """Create a debate message for a generated response."""
+        return DebateMessage(
+            round_number=round_num + 1,
+            speaker_name=participant.name,
+            message=response,
+            timestamp=datetime.now(),
+            metadata=metadata or {}
+        )
+    
+    def _create_error_message(self, round_num: int, participant: Character, error: Exception) -> DebateMessage:
+        """Create a debate message recording a failed turn."""
+        metadata = {"error": True, "error_type": type(error).__name__}
+        if isinstance(error, DeadlineExceededError):
+            metadata.update(fallback=TimeoutFallback.SKIP.value, deadline_misses=getattr(error, "misses", []))
+        
+        return DebateMessage(
+            round_number=round_num + 1,
+            speaker_name=participant.name,
+            message=f"Error generating response: {str(error)}",
+            timestamp=datetime.now(),
+            metadata=metadata
+        )
+    
+    def _pause_for_outage(self, error: CircuitOpenError) -> None:
+        """Pause the session because the AI provider is failing fast."""
+        self.current_session.pause()
+        self.current_session.metadata["pause_reason"] = str(error)
+        self.current_session.metadata["retry_after"] = error.retry_after
+        self._journal_status()
+    
+    def _store_message(
+        self,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        message: DebateMessage
+    ) -> None:
+        """Add a message to the round, score its novelty and journal it."""
+        if self._novelty_index is not None and not message.metadata.get("error"):
+            message.metadata["novelty"] = self._novelty_index.add_message(message).to_dict()
+        debate_round.add_message(message)
+        round_messages.append(message)
+        self._journal_event("message", message=message.to_dict())
+    
+    def _record_message(
+        self,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage],
+        message: DebateMessage,
+        participant: Character
+    ) -> None:
+        """Add a message to the round and announce it."""
+        self._store_message(debate_round, round_messages, message)
+        self._publish(MessageGenerated(message, participant))
+    
+    def _publish(self, event: DebateEvent) -> None:
+        """Publish ``event`` on the event bus and to its ``on_<name>`` callback, if set."""
+        self.events.publish(event)
+        callback = getattr(self, f"on_{event.name}", None)
+        if callback:
+            callback(*event.args())
+    
+    def _wants_deltas(self) -> bool:
+        """Check whether anyone listens for streamed reply chunks."""
+        return bool(self.on_message_delta) or self.events.wants(MessageDelta)
+    
+    def _open_memory(self) -> None:
+        """Start the session's summary memory, picking up a summary saved by an earlier run."""
+        settings = self.current_session.settings
+        if not settings.summary_memory:
+            self._memory = None
+            return
+        
+        summarizer = self.summarizer or AISummarizer(self.ai_client)
+        self._memory = DebateMemory.from_dict(
+            summarizer, self.current_session.metadata.get("memory", {}), settings.memory_recent_rounds
+        )
+    
+    def _remember_rounds(self) -> None:
+        """Let the summary memory fold in rounds that left the recent window."""
+        if self._memory:
+            self._memory.update(self.current_session.conversation.rounds)
+    
+    def _close_memory(self) -> None:
+        """Save the summary on the session and stop its worker."""
+        if self._memory:
+            self._memory.refresh()
+            self.current_session.metadata["memory"] = self._memory.to_dict()
+            self._memory.shutdown()
+            self._memory = None
+    
+    def _open_novelty_index(self, unfinished: Optional[DebateRound] = None) -> None:
+        """Index the messages said so far, so new ones are scored against the whole debate."""
+        history = self.current_session.conversation.get_all_messages()
+        if unfinished is not None:
+            history += unfinished.messages
+        self._novelty_index = NoveltyIndex.from_messages(m for m in history if not m.metadata.get("error"))
+    
+    def _should_judge(self, round_messages: List[DebateMessage]) -> bool:
+        """Check whether the finished round should be judged."""
+        return bool(self.current_session.settings.competitive_mode and self.judge and round_messages)
+    
+    def _judging_batch(
+        self,
+        round_num: int,
+        debate_round: DebateRound,
+        round_messages: List[DebateMessage]
+    ) -> List[Tuple[DebateRound, List[DebateMessage]]]:
+        """Queue a finished round for judging; returns the rounds due for a judge call under the cadence."""
+        if self._should_judge(round_messages):
+            self._unjudged.append((debate_round, list(round_messages)))
+        if not self._unjudged or not self.current_session.settings.is_judging_round(round_num):
+            return []
+        
+        batch, self._unjudged = self._unjudged, []
+        metadata = self.current_session.metadata
+        metadata["judge_calls"] = metadata.get("judge_calls", 0) + 1
+        return batch
+    
+    def _should_pipeline_judging(self) -> bool:
+        """Check whether rounds should be judged in the background."""
+        settings = self.current_session.settings
+        return bool(settings.pipelined_judging and settings.competitive_mode and self.judge)
+    
+    def _apply_verdicts(self, verdicts: List[Verdict], participants: List[Character]) -> None:
+        """Apply verdicts in round order; rounds whose judgement failed (None) are skipped."""
+        for debate_round, judge_adjustments in verdicts:
+            if judge_adjustments is not None:
+                self._apply_judgement(debate_round, judge_adjustments, participants)
+    
+    def _apply_judgement(
+        self,
+        debate_round: DebateRound,
+        judge_adjustments: Dict[str, Dict[str, int]],
+        participants: List[Character]
+    ) -> None:
+        """Store judge feedback on the round and apply stat adjustments."""
+        self._publish(self._record_judgement(debate_round, judge_adjustments, participants))
+    
+    def _record_judgement(
+        self,
+        debate_round: DebateRound,
+        judge_adjustments: Dict[str, Dict[str, int]],
+        participants: List[Character]
+    ) -> JudgeFeedback:
+        """Store judge feedback and apply stat adjustments; returns the event announcing them."""
+        debate_round.judge_feedback = judge_adjustments
+        self._journal_event("verdict", round=debate_round.round_number, adjustments=judge_adjustments)
+        
+        # Apply adjustments to participants
+        for participant in participants:
+            if participant.name in judge_adjustments:
+                participant.adjust_stats(judge_adjustments[participant.name])
+        
+        return JudgeFeedback(judge_adjustments, debate_round.round_number)
+    
+    def _complete_session(self, participants: List[Character]) -> None:
+        """Complete the debate and run the final evaluation."""
+        event = self._finish_session(participants)
+        if event:
+            self._publish(event)
+    
+    def _finish_session(self, participants: List[Character]) -> Optional[SessionCompleted]:
+        """Complete a running debate and run the final evaluation; returns the event to announce."""
+        if not self.current_session.is_running():
+            return None
+        
+        settings = self.current_session.settings
+        conversation = self.current_session.conversation
+        
+        self.current_session.complete()
+        
+        # Final performance evaluation
+        if settings.competitive_mode and self.judge:
+            try:
+                overall_performance = self.judge.judge_overall_performance(
+                    participants, conversation.get_all_messages()
+                )
+                self.current_session.metadata["final_performance"] = overall_performance
+            except Exception as e:
+                pass
+            if hasattr(self.judge, "get_stats"):
+                self.current_session.metadata["judge_stats"] = self.judge.get_stats()
+        
+        return SessionCompleted(self.current_session)
+    
+    def _debate_deadline_passed(self) -> bool:
+        """Stop the debate once its overall deadline has passed; returns whether it has."""
+        if self._debate_deadline is None or time.monotonic() < self._debate_deadline:
+            return False
+        if self.current_session.is_running():
+            self.current_session.metadata["deadline_exceeded"] = True
+            self.stop_debate()
+        return True
+    
+    def _turn_budget(self) -> Tuple[Optional[float], str]:
+        """Get the seconds the next turn may take and which deadline sets it ("turn" or "debate")."""
+        budget = self.current_session.settings.timeout_per_response or None
+        if self._debate_deadline is None:
+            return budget, "turn"
+        
+        remaining = max(self._debate_deadline - time.monotonic(), 0.0)
+        if budget is None or remaining < budget:
+            return remaining, "debate"
+        return budget, "turn"
+    
+    def _turn_token(self, budget: Optional[float]) -> CancellationToken:
+        """Create a token for one turn that expires after ``budget`` and follows the run's token."""
+        parent = current_cancellation_token()
+        return parent.child(budget) if parent is not None else CancellationToken(timeout=budget)
+    
+    def _turn_clients(self) -> Iterator[Any]:
+        """Yield the clients to try in order: the main one, then the fallback model if configured."""
+        yield self.ai_client
+        
+        settings = self.current_session.settings
+        if settings.timeout_fallback == TimeoutFallback.MODEL and settings.fallback_model:
+            if hasattr(self.ai_client, "with_model"):
+                yield self.ai_client.with_model(settings.fallback_model)
+    
+    def _deadline_miss(self, client, budget: Optional[float], scope: str) -> Dict[str, Any]:
+        """Describe one missed deadline for the message metadata."""
+        return {"scope": scope, "budget_s": round(budget or 0.0, 3), "model": getattr(client, "model", None)}
+    
+    def _generate_turn(
+        self,
+        character: Character,
+        current_message: str,
+        round_number: int,
+        turn_metrics: Dict[str, Any],
+        stream: bool = True
+    ) -> str:
+        """Generate a reply within the turn's deadline, falling back per ``timeout_fallback`` on a miss.
+        
+        Misses and the fallback used are recorded in ``turn_metrics``. With
+        the skip fallback the miss is raised as ``DeadlineExceededError``.
+        """
+        misses = []
+        for client in self._turn_clients():
+            budget, scope = self._turn_budget()
+            if misses and budget == 0:
+                break
+            token = self._turn_token(budget)
+            try:
+                with cancellation_scope(token):
+                    response = self._generate_character_response(
+                        character, current_message, self.current_session.conversation.iter_messages_newest_first(),
+                        round_number, turn_metrics, stream, client=client
+                    )
+            except DeadlineExceededError as e:
+                misses.append(self._deadline_miss(client, budget, scope))
+                error = e
+                continue
+            finally:
+                token.close()
             
-            if self.on_session_completed:
-                self.on_session_completed(self.current_session)
+            self._note_recovered_turn(misses, turn_metrics)
+            return response
+        
+        return self._fallback_line(character, error, misses, turn_metrics)
+    
+    def _note_recovered_turn(self, misses: List[Dict[str, Any]], turn_metrics: Dict[str, Any]) -> None:
+        """Record that a turn was answered by the fallback model after missing its deadline."""
+        if misses:
+            turn_metrics.update(
+                fallback=TimeoutFallback.MODEL.value,
+                fallback_model=self.current_session.settings.fallback_model,
+                deadline_misses=misses
+            )
+    
+    def _fallback_line(
+        self,
+        character: Character,
+        error: DeadlineExceededError,
+        misses: List[Dict[str, Any]],
+        turn_metrics: Dict[str, Any]
+    ) -> str:
+        """Get the stand-in line for a turn that missed its deadline, or raise ``error`` to skip it."""
+        policy = self.current_session.settings.timeout_fallback
+        if policy == TimeoutFallback.SKIP:
+            error.misses = misses
+            raise error
+        
+        line = self._last_line(character.name) if policy == TimeoutFallback.CACHED else None
+        fallback = TimeoutFallback.CACHED if line is not None else TimeoutFallback.CANNED
+        turn_metrics.update(fallback=fallback.value, deadline_misses=misses)
+        return line if line is not None else self.current_session.settings.fallback_line
+    
+    def _last_line(self, speaker_name: str) -> Optional[str]:
+        """Get the speaker's most recent real reply in this debate."""
+        for message in self.current_session.conversation.iter_messages_newest_first():
+            if message.speaker_name != speaker_name:
+                continue
+            if not message.metadata.get("error") and not message.metadata.get("fallback"):
+                return message.message
+        return None
     
     def _generate_character_response(
         self, 
         character: Character, 
         current_message: str, 
-        context_messages: List[DebateMessage]
+        history: Iterable[DebateMessage],
+        round_number: Optional[int] = None,
+        turn_metrics: Optional[Dict[str, Any]] = None,
+        stream: bool = True,
+        client=None
     ) -> str:
-        """Generate a response for a character."""
-        # Build conversation context for AI
-        context_for_ai = []
+        """Generate a response for a character.
+        
+        When someone listens for deltas (and ``stream`` is true) the reply is
+        streamed and each delta is published as it arrives. Timings are
+        written to ``turn_metrics``. ``client`` overrides ``ai_client``.
+        """
+        client = client or self.ai_client
+        context_for_ai = self._build_character_messages(character, current_message, history, turn_metrics)
+        start = time.perf_counter()
+        
+        if self._wants_deltas() and stream:
+            deltas = []
+            for delta in client.stream_response(context_for_ai):
+                if not deltas and turn_metrics is not None:
+                    turn_metrics["ttft_ms"] = (time.perf_counter() - start) * 1000
+                deltas.append(delta)
+                self._publish(MessageDelta(delta, character, round_number))
+            response = "".join(deltas).strip()
+        else:
+            # Generate response using AI client
+            response = client.generate_response(context_for_ai)
+        
+        if turn_metrics is not None:
+            turn_metrics["latency_ms"] = (time.perf_counter() - start) * 1000
+        
+        return response
+    
+    def _build_character_messages(
+        self,
+        character: Character,
+        current_message: str,
+        history: Iterable[DebateMessage],
+        turn_metrics: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat message list sent to the AI for a character's turn.
         
-        # Add system message
+        ``history`` is consumed newest first and packed into the session's
+        prompt-token budget; the prompt size is written to ``turn_metrics``.
+        """
+        summary, summarized_through = self._memory.context() if self._memory else ("", 0)
+        if summarized_through:
+            # Rounds the summary covers are not repeated verbatim
+            history = itertools.takewhile(lambda msg: msg.round_number > summarized_through, history)
+        
+        window = self._get_context_builder().build(
+            self._build_system_prompt(character), history, character.name, current_message, summary
+        )
+        
+        if turn_metrics is not None:
+            turn_metrics["prompt_tokens"] = window.prompt_tokens
+            turn_metrics["context_messages"] = window.history_included
+            if summarized_through:
+                turn_metrics["summary_tokens"] = window.summary_tokens
+                turn_metrics["summarized_rounds"] = summarized_through
+        
+        return window.messages
+    
+    def _build_system_prompt(self, character: Character) -> str:
+        """Build the system prompt describing the character."""
         system_prompt = f"""
 You are {character.name}, a {character.role}.
 Personality: {character.personality}
@@ -262,29 +944,26 @@ Communication Style: {character.style}
 - Do NOT use HTML, Markdown, or code fences.
 """
         
-        context_for_ai.append({
-            "role": "system",
-            "content": system_prompt
-        })
-        
-        # Add conversation history
-        for msg in context_messages[-6:]:  # Last 6 messages for context
-            role = "user" if msg.speaker_name != character.name else "assistant"
-            context_for_ai.append({
-                "role": role,
-                "content": msg.message
-            })
-        
-        # Add current message
-        context_for_ai.append({
-            "role": "user",
-            "content": current_message
-        })
-        
-        # Generate response using AI client
-        response = self.ai_client.generate_response(context_for_ai)
-        
-        return response
+        return system_prompt
+    
+    def _get_context_builder(self) -> ContextBuilder:
+        """Get the context builder for the current session's token budget."""
+        settings = self.current_session.settings if self.current_session else DebateSettings()
+        builder = self._context_builder
+        if (
+            builder is None
+            or builder.prompt_token_budget != settings.context_token_budget
+            or builder.max_history_messages != settings.max_context_messages
+        ):
+            if self._token_counter is None:
+                self._token_counter = create_token_counter(getattr(self.ai_client, "model", "gpt-4o"))
+            builder = ContextBuilder(
+                self._token_counter,
+                prompt_token_budget=settings.context_token_budget,
+                max_history_messages=settings.max_context_messages
+            )
+            self._context_builder = builder
+        return builder
     
     def get_session_summary(self) -> Optional[Dict[str, Any]]:
         """Get a summary of the current session."""
@@ -292,16 +971,16 @@ Communication Style: {character.style}
             return None
         
         conversation = self.current_session.conversation
-        all_messages = conversation.get_all_messages()
         
-        # Calculate statistics
+        # Calculate statistics from the conversation's running totals
         participant_stats = {}
         for participant_name in self.current_session.participants:
-            participant_messages = [msg for msg in all_messages if msg.speaker_name == participant_name]
+            totals = conversation.get_participant_totals(participant_name)
             participant_stats[participant_name] = {
-                "message_count": len(participant_messages),
-                "total_words": sum(len(msg.message.split()) for msg in participant_messages),
-                "avg_words_per_message": sum(len(msg.message.split()) for msg in participant_messages) / max(len(participant_messages), 1)
+                "message_count": totals["messages"],
+                "total_words": totals["words"],
+                "avg_words_per_message": totals["words"] / max(totals["messages"], 1),
+                "total_prompt_tokens": totals["prompt_tokens"]
             }
         
         return {
@@ -309,7 +988,7 @@ Communication Style: {character.style}
             "topic": self.current_session.topic,
             "status": self.current_session.status.value,
             "total_rounds": len(conversation.rounds),
-            "total_messages": len(all_messages),
+            "total_messages": conversation.get_totals()["messages"],
             "duration": (conversation.end_time - conversation.start_time).total_seconds() if conversation.end_time else None,
             "participant_stats": participant_stats,
             "competitive_mode": self.current_session.settings.competitive_mode,
@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, Set, Tuple
+import re
+
+
+class PhraseMatcher:
+    """Finds which of many case-insensitive phrases occur in a text in one scan.
+
+    The phrases are compiled once into a single trie-shaped regex, so the
+    regex engine follows shared prefixes instead of trying every phrase at
+    every position and skips positions no phrase can start at. Each hit is
+    the longest phrase starting there, and the scan resumes one character
+    later so overlapping phrases are found too; a hit also implies every
+    phrase contained in it.
+    """
+    
+    def __init__(self, phrases: Dict[str, Iterable[str]]):
+        """Initialize with phrase lists keyed by category."""
+        self.categories = list(phrases)
+        categories_by_phrase: Dict[str, Set[str]] = {}
+        for category, category_phrases in phrases.items():
+            for phrase in category_phrases:
+                if phrase:
+                    categories_by_phrase.setdefault(phrase.lower(), set()).add(category)
+        
+        # What a hit on each phrase implies: every phrase it contains, with its categories
+        self._implied: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            phrase: tuple(
+                (category, contained)
+                for contained in categories_by_phrase if contained in phrase
+                for category in categories_by_phrase[contained]
+            )
+            for phrase in categories_by_phrase
+        }
+        self._pattern = re.compile(_trie_pattern(categories_by_phrase)) if categories_by_phrase else None
+    
+    def find(self, text: str) -> Dict[str, Set[str]]:
+        """Get the distinct phrases of each category that occur in ``text``."""
+        found: Dict[str, Set[str]] = {category: set() for category in self.categories}
+        if self._pattern is None:
+            return found
+        
+        text = text.lower()
+        search = self._pattern.search
+        hits = set()
+        match = search(text)
+        while match is not None:
+            hits.add(match.group())
+            match = search(text, match.start() + 1)
+        
+        for hit in hits:
+            for category, phrase in self._implied[hit]:
+                found[category].add(phrase)
+        return found
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """Get how many distinct phrases of each category occur in ``text``."""
+        return {category: len(phrases) for category, phrases in self.find(text).items()}
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Build a regex matching the longest of ``phrases`` at a position, branching like a trie."""
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of a phrase
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: Dict[str, dict]) -> str:
+    """Regex for the phrase endings below one trie node."""
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A phrase may also end here; the greedy "?" still prefers the longer phrases below
+    return f"(?:{pattern})?" if "" in node else pattern
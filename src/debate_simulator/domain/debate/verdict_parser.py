@@ -0,0 +1,184 @@
+from typing import List, Dict, Any, Optional, Tuple
+import difflib
+import json
+import math
+import re
+
+
+STAT_NAMES = ("anger", "patience", "uniqueness")
+ADJUSTMENT_LIMIT = 10  # Judges rate each stat change from -10 to +10
+
+_FENCE_PATTERN = re.compile(r"```[a-zA-Z]*\s*(.*?)(?:```|$)", re.DOTALL)
+_NUMBER_PATTERN = re.compile(r"[+-]?\d+(?:\.\d+)?")
+_NAME_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+_ROUND_KEY_PATTERN = re.compile(r"\d+")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def parse_json_reply(text: str) -> Tuple[Optional[Any], bool]:
+    """Parse the JSON object in a model reply.
+
+    Returns the parsed value (None if nothing usable was found) and whether
+    the reply needed repair: markdown fences, prose around the object,
+    trailing commas or a reply cut off mid-object.
+    """
+    text = (text or "").strip()
+    try:
+        return json.loads(text), False
+    except json.JSONDecodeError:
+        pass
+    
+    fenced = _FENCE_PATTERN.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start = text.find("{")
+    if start < 0:
+        return None, True
+    
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, start)
+        return value, True
+    except json.JSONDecodeError:
+        return _recover_prefix(text[start:]), True
+
+
+def _recover_prefix(text: str) -> Optional[Any]:
+    """Parse the longest prefix of a broken object that can be closed into valid JSON.
+
+    One pass records every point where the text could be cut and closed,
+    right after an opening bracket, a closing bracket or before a comma,
+    along with the brackets still open there. Candidates are then tried
+    from the longest down.
+    """
+    stack: List[str] = []
+    cut_points: List[Tuple[int, str]] = []
+    in_string = escaped = False
+    
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+            cut_points.append((i + 1, "".join(_CLOSERS[c] for c in reversed(stack))))
+        elif char in "}]":
+            if not stack:
+                break
+            stack.pop()
+            cut_points.append((i + 1, "".join(_CLOSERS[c] for c in reversed(stack))))
+            if not stack:
+                break
+        elif char == ",":
+            cut_points.append((i, "".join(_CLOSERS[c] for c in reversed(stack))))
+    else:
+        # The reply ran out mid-object, possibly right after a complete value
+        if not in_string:
+            cut_points.append((len(text), "".join(_CLOSERS[c] for c in reversed(stack))))
+    
+    for cut, closers in reversed(cut_points):
+        try:
+            return json.loads(text[:cut].rstrip() + closers)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def match_participant(key: str, names: List[str]) -> Optional[str]:
+    """Map a name as the judge wrote it to one of ``names``, or None if none fits."""
+    if key in names:
+        return key
+    
+    normalized = {_normalize_name(name): name for name in names}
+    wanted = _normalize_name(key)
+    if not wanted:
+        return None
+    if wanted in normalized:
+        return normalized[wanted]
+    
+    # "Senator Alice Smith" for "Alice Smith", or "Alice" for "Alice Smith"
+    containing = [name for norm, name in normalized.items() if norm and (norm in wanted or wanted in norm)]
+    if len(containing) == 1:
+        return containing[0]
+    
+    close = difflib.get_close_matches(wanted, list(normalized), n=1, cutoff=0.75)
+    return normalized[close[0]] if close else None
+
+
+def normalize_adjustments(verdict: Any, names: List[str]) -> Tuple[Optional[Dict[str, Dict[str, int]]], bool]:
+    """Key a parsed verdict by participant name with whole, in-range stat changes.
+
+    Returns None if no entry matches a participant, and whether anything
+    had to be fixed up. Participants the verdict leaves out get no change.
+    """
+    if not isinstance(verdict, dict):
+        return None, True
+    
+    adjustments: Dict[str, Dict[str, int]] = {}
+    repaired = False
+    for key, stats in verdict.items():
+        name = match_participant(str(key), names)
+        if name is None or name in adjustments or not isinstance(stats, dict):
+            repaired = True
+            continue
+        repaired = repaired or name != key
+        adjustments[name], fixed = _normalize_stats(stats)
+        repaired = repaired or fixed
+    
+    if not adjustments:
+        return None, True
+    for name in names:
+        if name not in adjustments:
+            adjustments[name] = {stat: 0 for stat in STAT_NAMES}
+            repaired = True
+    return adjustments, repaired
+
+
+def index_by_round(by_round: Any) -> Dict[int, Any]:
+    """Key a batched verdict by round number, accepting keys such as "3" or "Round 3"."""
+    if not isinstance(by_round, dict):
+        return {}
+    indexed = {}
+    for key, verdict in by_round.items():
+        match = _ROUND_KEY_PATTERN.search(str(key))
+        if match:
+            indexed.setdefault(int(match.group()), verdict)
+    return indexed
+
+
+def _normalize_stats(stats: Dict[str, Any]) -> Tuple[Dict[str, int], bool]:
+    """Read the three stat changes, coercing numbers in any form and clamping them."""
+    by_stat = {str(key).strip().lower(): value for key, value in stats.items()}
+    normalized = {}
+    repaired = False
+    for stat in STAT_NAMES:
+        value = by_stat.get(stat)
+        number = _to_int(value)
+        clamped = max(-ADJUSTMENT_LIMIT, min(ADJUSTMENT_LIMIT, number))
+        repaired = repaired or type(value) is not int or clamped != value
+        normalized[stat] = clamped
+    return normalized, repaired
+
+
+def _to_int(value: Any) -> int:
+    """Convert a stat value such as 3, 2.6 or "+4" to an integer (0 if it is not a finite number)."""
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, str):
+        match = _NUMBER_PATTERN.search(value)
+        value = float(match.group()) if match else None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and math.isfinite(value):
+        return round(value)
+    return 0
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase a name and reduce punctuation and spacing to single spaces."""
+    return _NAME_SEPARATOR_PATTERN.sub(" ", name.lower()).strip()
@@ -1,9 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, Iterator, Iterable, AsyncIterator
+import asyncio
+import copy
+import functools
 import os
 import json
-import requests
 import logging
+import weakref
+
+import requests
+
+from .errors import (
+    AIClientError, TransientAIError, RateLimitError, ServerError, AITimeoutError,
+    PermanentAIError, CircuitOpenError, RequestCancelledError, classify_http_error
+)
+from .cancellation import current_cancellation_token, cancellable_sleep
+from .http_transport import PooledHTTPTransport, get_shared_transport, release_cancellation
+from .payload_trace import get_payload_tracer
+from .resilience import RetryPolicy, CircuitBreaker, get_circuit_breaker
 
 
 class AIClient(ABC):
@@ -15,123 +29,569 @@ class AIClient(ABC):
         pass
     
     @abstractmethod
-    def generate_judge_response(self, prompt: str) -> str:
-        """Generate a judge response for competitive mode."""
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response for competitive mode, constrained to ``response_format`` if supported.
+
+        ``max_tokens`` overrides the reply budget, e.g. for a verdict covering several rounds.
+        """
         pass
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Generate a response as an iterator of text deltas."""
+        yield self.generate_response(messages)
+    
+    def with_model(self, model: str) -> 'AIClient':
+        """Get a client that answers with ``model``; clients without a model choice return themselves."""
+        return self
+
+
+class AsyncAIClient(ABC):
+    """Abstract base class for asyncio-native AI clients."""
+    
+    @abstractmethod
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response from the AI model without blocking the event loop."""
+        pass
+    
+    @abstractmethod
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response for competitive mode without blocking the event loop."""
+        pass
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Generate a response as an async iterator of text deltas."""
+        yield await self.generate_response_async(messages)
+
+
+# Sentinel returned by parse_sse_delta at the end of a stream
+SSE_DONE = object()
+
+
+def parse_sse_delta(line: str) -> Union[str, None, object]:
+    """Extract the content delta from one SSE line.
+    
+    Returns the delta text, None for lines without content (comments,
+    role-only or malformed chunks), or ``SSE_DONE`` at the end of the stream.
+    """
+    if not line or not line.startswith("data:"):
+        return None
+    
+    data = line[len("data:"):].strip()
+    if data == "[DONE]":
+        return SSE_DONE
+    
+    try:
+        chunk = json.loads(data)
+    except json.JSONDecodeError:
+        logging.warning(f"Skipping malformed stream chunk: {data[:80]!r}")
+        return None
+    if not isinstance(chunk, dict):
+        return None
+    
+    choices = chunk.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content")
+
+
+def iter_sse_deltas(lines: Iterable[str]) -> Iterator[str]:
+    """Yield content deltas from an OpenAI server-sent event stream."""
+    for line in lines:
+        delta = parse_sse_delta(line)
+        if delta is SSE_DONE:
+            break
+        if delta:
+            yield delta
+
+
+def extract_message_content(result: Dict[str, Any]) -> str:
+    """Extract the reply text from a chat completion body."""
+    try:
+        return result["choices"][0]["message"]["content"].strip()
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise PermanentAIError(f"Malformed completion response: {str(e)}") from e
+
+
+def judge_call_kwargs(response_format: Optional[Dict[str, Any]] = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """Keyword arguments passing a judge call's options on, only the ones it asked for."""
+    kwargs: Dict[str, Any] = {}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    if max_tokens is not None:
+        kwargs["max_tokens"] = max_tokens
+    return kwargs
 
 
 class OpenAIClient(AIClient):
     """OpenAI API client for generating responses."""
     
-    def __init__(self, api_key: str = None, model: str = "gpt-4o"):
-        """Initialize with API key and model configuration."""
+    DEFAULT_API_BASE = "https://api.openai.com/v1"
+    REQUEST_TIMEOUT = 30
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4o",
+        transport: Optional[PooledHTTPTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        api_base: Optional[str] = None,
+        structured_output: bool = True
+    ):
+        """Initialize with API key, model, resilience configuration, API root URL and structured output support."""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
-        self.base_url = "https://api.openai.com/v1/chat/completions"
+        self.api_base = (api_base or self.DEFAULT_API_BASE).rstrip("/")
+        self.base_url = f"{self.api_base}/chat/completions"
+        self._transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breaker = circuit_breaker
+        self.structured_output = structured_output  # Send response_format JSON schemas with judge calls
         
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
     
-    def generate_response(self, messages: List[Dict[str, str]]) -> str:
-        """Generate a character response using OpenAI API."""
+    def with_model(self, model: str) -> 'OpenAIClient':
+        """Get a copy of this client that uses ``model`` and shares its connections."""
+        clone = copy.copy(self)
+        clone.model = model
+        return clone
+    
+    def _request_timeout(self, cancel_token) -> float:
+        """Socket timeout for one request, shortened to the caller's deadline."""
+        remaining = cancel_token.remaining() if cancel_token is not None else None
+        if remaining is None:
+            return self.REQUEST_TIMEOUT
+        return max(min(self.REQUEST_TIMEOUT, remaining), 0.001)
+    
+    @property
+    def transport(self) -> PooledHTTPTransport:
+        """Get the HTTP transport, defaulting to the shared connection pool."""
+        if self._transport is None:
+            self._transport = get_shared_transport()
+        return self._transport
+    
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get the circuit breaker, defaulting to the process-wide one."""
+        if self._circuit_breaker is None:
+            self._circuit_breaker = get_circuit_breaker()
+        return self._circuit_breaker
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build request headers."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+    
+    @property
+    def response_params(self) -> Dict[str, Any]:
+        """Sampling parameters used for character responses."""
+        return {
+            "max_tokens": 100,  # Reduced to ensure ~50 word limit
+            "temperature": 0.8,
+            "presence_penalty": 0.1,
+            "frequency_penalty": 0.1,
+        }
+    
+    @property
+    def judge_params(self) -> Dict[str, Any]:
+        """Sampling parameters used for judge responses."""
+        return {
+            "max_tokens": 300,
+            "temperature": 0.3,
+        }
+    
+    def _build_response_payload(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """Build the request body for a character response."""
+        return {"model": self.model, "messages": messages, **self.response_params}
+    
+    def _build_judge_payload(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for a judge response."""
+        data = {"model": self.model, "messages": [{"role": "user", "content": prompt}], **self.judge_params}
+        if max_tokens is not None:
+            data["max_tokens"] = max_tokens
+        if response_format is not None and self.structured_output:
+            data["response_format"] = response_format
+        return data
+    
+    def _reject_response_format(self, data: Dict[str, Any], error: AIClientError) -> bool:
+        """Stop sending response_format after the backend refuses it; True if the call should be retried without it."""
+        if "response_format" not in data or error.status_code != 400:
+            return False
+        logging.warning(f"Backend rejected structured judge output, falling back to plain JSON prompts: {error}")
+        self.structured_output = False
+        return True
+    
+    def _send(self, data: Dict[str, Any], stream: bool = False) -> requests.Response:
+        """Send one request through the circuit breaker, raising typed errors."""
+        cancel_token = current_cancellation_token()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        
+        breaker = self.circuit_breaker
+        breaker.before_call()
+        
+        # Every exit settles the call, so a half-open trial can never stay in flight
+        healthy = None  # Unknown until the provider answered or failed transiently
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
+            try:
+                response = self.transport.post(
+                    self.base_url,
+                    cancel_token=cancel_token,
+                    headers=self._build_headers(),
+                    json=data,
+                    timeout=self._request_timeout(cancel_token),
+                    proxies=None,  # Explicitly disable proxies
+                    stream=stream,
+                )
+            except RequestCancelledError:
+                # Aborted by us, which says nothing about the provider's health
+                raise
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                healthy = False
+                raise AITimeoutError(f"Request failed: {str(e)}") from e
+            except requests.exceptions.RequestException as e:
+                raise PermanentAIError(f"Request failed: {str(e)}") from e
             
-            data = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": 100,  # Reduced to ensure ~50 word limit
-                "temperature": 0.8,
-                "presence_penalty": 0.1,
-                "frequency_penalty": 0.1,
-            }
+            if response.status_code != 200:
+                error = classify_http_error(response.status_code, response.text, response.headers)
+                response.close()
+                release_cancellation(response)
+                healthy = not isinstance(error, TransientAIError)
+                raise error
             
-            # Log the request for debugging
-            logging.debug(f"[OpenAI REQUEST] Payload: {json.dumps(data, indent=2)}")
-            
-            # Make the request with explicit proxy disabling
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=data,
-                timeout=30,
-                proxies=None,  # Explicitly disable proxies
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result["choices"][0]["message"]["content"].strip()
-                
-                logging.debug(f"[OpenAI RESPONSE] Generated response: {ai_response}")
-                return ai_response
-            else:
-                error_msg = f"HTTP {response.status_code} - {response.text}"
-                logging.error(f"[OpenAI ERROR] {error_msg}")
-                return f"Error: {error_msg}"
-                
-        except Exception as e:
-            error_msg = f"Error generating response: {str(e)}"
-            logging.error(f"[OpenAI ERROR] {error_msg}")
-            return error_msg
+            healthy = True
+            return response
+        finally:
+            breaker.settle(healthy)
+    
+    def _complete(self, data: Dict[str, Any]) -> str:
+        """Send a completion request with retries and return the reply text."""
+        response = self.retry_policy.call(lambda: self._send(data))
+        return extract_message_content(response.json())
     
-    def generate_judge_response(self, prompt: str) -> str:
+    def generate_response(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a character response using OpenAI API."""
+        data = self._build_response_payload(messages)
+        
+        trace_id = get_payload_tracer().trace_request("response", data)
+        
+        try:
+            ai_response = self._complete(data)
+        except AIClientError as e:
+            logging.error(f"[OpenAI ERROR] {str(e)}")
+            raise
+        
+        get_payload_tracer().trace_response(trace_id, ai_response)
+        return ai_response
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a character response as server-sent event deltas."""
+        data = self._build_response_payload(messages)
+        data["stream"] = True
+        
+        get_payload_tracer().trace_request("stream", data)
+        
+        # Only opening the stream is retried; a stream that breaks mid-way is not replayed
+        try:
+            response = self.retry_policy.call(lambda: self._send(data, stream=True))
+        except AIClientError as e:
+            logging.error(f"[OpenAI ERROR] {str(e)}")
+            raise
+        
+        cancel_token = current_cancellation_token()
+        try:
+            with response:
+                # Small SSE events must not wait for a full 512-byte read buffer
+                yield from iter_sse_deltas(response.iter_lines(chunk_size=1, decode_unicode=True))
+        except requests.exceptions.RequestException as e:
+            if cancel_token is not None and cancel_token.is_cancelled:
+                raise cancel_token.error() from e
+            raise
+        finally:
+            release_cancellation(response)
+        
+        # A severed stream can end quietly instead of raising
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
         """Generate a judge response for competitive mode."""
+        data = self._build_judge_payload(prompt, response_format, max_tokens)
+        
+        trace_id = get_payload_tracer().trace_request("judge", data)
+        
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-            
-            data = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 300,
-                "temperature": 0.3,
-            }
+            judge_response = self._complete(data)
+        except PermanentAIError as e:
+            if self._reject_response_format(data, e):
+                return self.generate_judge_response(prompt, max_tokens=max_tokens)
+            logging.error(f"[OpenAI JUDGE ERROR] {str(e)}")
+            raise
+        except AIClientError as e:
+            logging.error(f"[OpenAI JUDGE ERROR] {str(e)}")
+            raise
+        
+        get_payload_tracer().trace_response(trace_id, judge_response)
+        return judge_response
+
+
+class AsyncOpenAIClient(OpenAIClient, AsyncAIClient):
+    """OpenAI API client with native asyncio support via httpx."""
+    
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4o",
+        transport: Optional[PooledHTTPTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        api_base: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        structured_output: bool = True
+    ):
+        """Initialize with API key, model, resilience settings and async connection limits."""
+        super().__init__(
+            api_key=api_key, model=model, transport=transport, retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker, api_base=api_base, structured_output=structured_output
+        )
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        # httpx pools are bound to the loop that opened them, so each loop gets its own
+        self._http_clients = weakref.WeakKeyDictionary()
+    
+    def _get_http_client(self):
+        """Get the running loop's async HTTP client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None:
+            import httpx
+            # Pools of loops that have since closed can no longer be used or closed
+            for stale in [other for other in self._http_clients if other.is_closed()]:
+                del self._http_clients[stale]
+            client = self._http_clients[loop] = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                timeout=self.REQUEST_TIMEOUT,
+                trust_env=False
+            )
+        return client
+    
+    async def _send_async(self, data: Dict[str, Any]):
+        """Send one async request through the circuit breaker, raising typed errors."""
+        import httpx
+        cancel_token = current_cancellation_token()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        
+        breaker = self.circuit_breaker
+        breaker.before_call()
+        
+        # Cancellation and unexpected errors give the call back without judging the provider
+        healthy = None
+        try:
+            try:
+                response = await self._get_http_client().post(
+                    self.base_url,
+                    headers=self._build_headers(),
+                    json=data,
+                    timeout=self._request_timeout(cancel_token)
+                )
+            except httpx.TransportError as e:
+                healthy = False
+                raise AITimeoutError(f"Request failed: {str(e)}") from e
             
-            # Log the request for debugging
-            logging.debug(f"[OpenAI JUDGE REQUEST] Payload: {json.dumps(data, indent=2)}")
+            if response.status_code != 200:
+                error = classify_http_error(response.status_code, response.text, response.headers)
+                healthy = not isinstance(error, TransientAIError)
+                raise error
             
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=data,
-                timeout=30,
-                proxies=None,
-            )
+            healthy = True
+            return response
+        finally:
+            breaker.settle(healthy)
+    
+    async def _complete_async(self, data: Dict[str, Any]) -> str:
+        """Send an async completion request with retries and return the reply text."""
+        response = await self.retry_policy.call_async(lambda: self._send_async(data))
+        return extract_message_content(response.json())
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a character response using OpenAI API."""
+        data = self._build_response_payload(messages)
+        
+        trace_id = get_payload_tracer().trace_request("response", data)
+        
+        try:
+            ai_response = await self._complete_async(data)
+        except AIClientError as e:
+            logging.error(f"[OpenAI ERROR] {str(e)}")
+            raise
+        
+        get_payload_tracer().trace_response(trace_id, ai_response)
+        return ai_response
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a character response as server-sent event deltas."""
+        import httpx
+        data = self._build_response_payload(messages)
+        data["stream"] = True
+        
+        get_payload_tracer().trace_request("stream", data)
+        
+        async def open_stream():
+            cancel_token = current_cancellation_token()
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
             
-            if response.status_code == 200:
-                result = response.json()
-                judge_response = result["choices"][0]["message"]["content"].strip()
+            breaker = self.circuit_breaker
+            breaker.before_call()
+            healthy = None
+            try:
+                request = self._get_http_client().build_request(
+                    "POST",
+                    self.base_url,
+                    headers=self._build_headers(),
+                    json=data,
+                    timeout=self._request_timeout(cancel_token)
+                )
+                try:
+                    response = await self._get_http_client().send(request, stream=True)
+                except httpx.TransportError as e:
+                    healthy = False
+                    raise AITimeoutError(f"Request failed: {str(e)}") from e
                 
-                logging.debug(f"[OpenAI JUDGE RESPONSE] {judge_response}")
-                return judge_response
-            else:
-                error_msg = f"HTTP {response.status_code} - {response.text}"
-                logging.error(f"[OpenAI JUDGE ERROR] {error_msg}")
-                return "{}"  # Return empty JSON for graceful failure
+                if response.status_code != 200:
+                    body = (await response.aread()).decode("utf-8", errors="replace")
+                    await response.aclose()
+                    error = classify_http_error(response.status_code, body, response.headers)
+                    healthy = not isinstance(error, TransientAIError)
+                    raise error
                 
-        except Exception as e:
-            error_msg = f"Error generating judge response: {str(e)}"
-            logging.error(f"[OpenAI JUDGE ERROR] {error_msg}")
-            return "{}"  # Return empty JSON for graceful failure
+                healthy = True
+                return response
+            finally:
+                breaker.settle(healthy)
+        
+        # Only opening the stream is retried; a stream that breaks mid-way is not replayed
+        try:
+            response = await self.retry_policy.call_async(open_stream)
+        except AIClientError as e:
+            logging.error(f"[OpenAI ERROR] {str(e)}")
+            raise
+        
+        try:
+            async for line in response.aiter_lines():
+                delta = parse_sse_delta(line)
+                if delta is SSE_DONE:
+                    break
+                if delta:
+                    yield delta
+        finally:
+            await response.aclose()
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response for competitive mode."""
+        data = self._build_judge_payload(prompt, response_format, max_tokens)
+        
+        trace_id = get_payload_tracer().trace_request("judge", data)
+        
+        try:
+            judge_response = await self._complete_async(data)
+        except PermanentAIError as e:
+            if self._reject_response_format(data, e):
+                return await self.generate_judge_response_async(prompt, max_tokens=max_tokens)
+            logging.error(f"[OpenAI JUDGE ERROR] {str(e)}")
+            raise
+        except AIClientError as e:
+            logging.error(f"[OpenAI JUDGE ERROR] {str(e)}")
+            raise
+        
+        get_payload_tracer().trace_response(trace_id, judge_response)
+        return judge_response
+    
+    async def aclose(self) -> None:
+        """Close the running loop's pooled async connections."""
+        client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
 
 
 class MockAIClient(AIClient):
     """Mock AI client for testing purposes."""
     
-    def __init__(self, fixed_response: str = None, fixed_judge_response: str = None):
-        """Initialize with optional fixed responses."""
+    def __init__(
+        self,
+        fixed_response: str = None,
+        fixed_judge_response: str = None,
+        latency: float = 0.0,
+        judge_latency: float = None,
+        structured_output: bool = False
+    ):
+        """Initialize with optional fixed responses, simulated latency in seconds and structured output support."""
         self.fixed_response = fixed_response
         self.fixed_judge_response = fixed_judge_response
+        self.latency = latency
+        self.judge_latency = latency if judge_latency is None else judge_latency
+        self.structured_output = structured_output
         self.call_count = 0
         self.judge_call_count = 0
+        self.judge_response_formats: List[Optional[Dict[str, Any]]] = []
+        self.judge_max_tokens: List[Optional[int]] = []
     
     def generate_response(self, messages: List[Dict[str, str]]) -> str:
         """Generate a mock response."""
+        if self.latency > 0:
+            cancellable_sleep(self.latency)
+        return self._mock_response(messages)
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a mock judge response."""
+        if self.judge_latency > 0:
+            cancellable_sleep(self.judge_latency)
+        return self._mock_judge_response(prompt, response_format, max_tokens)
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a mock response word by word."""
+        if self.latency > 0:
+            cancellable_sleep(self.latency)
+        yield from _split_into_deltas(self._mock_response(messages))
+    
+    def _mock_response(self, messages: List[Dict[str, str]]) -> str:
+        """Build the mock character response."""
         self.call_count += 1
         
         if self.fixed_response:
@@ -157,9 +617,16 @@ class MockAIClient(AIClient):
         
         return f"Mock response from {character_name} (call #{self.call_count}): {last_message[:20]}..."
     
-    def generate_judge_response(self, prompt: str) -> str:
-        """Generate a mock judge response."""
+    def _mock_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Build the mock judge response."""
         self.judge_call_count += 1
+        self.judge_response_formats.append(response_format)
+        self.judge_max_tokens.append(max_tokens)
         
         if self.fixed_judge_response:
             return self.fixed_judge_response
@@ -168,9 +635,128 @@ class MockAIClient(AIClient):
         return '{"Character 1": {"anger": 1, "patience": 0, "uniqueness": 2}, "Character 2": {"anger": -1, "patience": 1, "uniqueness": 1}}'
 
 
-class AIClientError(Exception):
-    """Custom exception for AI client errors."""
-    pass
+def _split_into_deltas(text: str) -> List[str]:
+    """Split text into word-sized deltas that concatenate back to the original."""
+    words = text.split(" ")
+    return [word if i == 0 else f" {word}" for i, word in enumerate(words)]
+
+
+class AsyncMockAIClient(MockAIClient, AsyncAIClient):
+    """Async twin of MockAIClient whose latency is awaited instead of slept."""
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a mock response."""
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._mock_response(messages)
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a mock judge response."""
+        if self.judge_latency > 0:
+            await asyncio.sleep(self.judge_latency)
+        return self._mock_judge_response(prompt, response_format, max_tokens)
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a mock response word by word."""
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        for delta in _split_into_deltas(self._mock_response(messages)):
+            yield delta
+
+
+class ThreadedAsyncAIClient(AsyncAIClient):
+    """Adapts a synchronous AIClient to the async interface using worker threads."""
+    
+    def __init__(self, client: AIClient):
+        """Initialize with the synchronous client to wrap."""
+        self.client = client
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response in a worker thread."""
+        return await asyncio.to_thread(self.client.generate_response, messages)
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response in a worker thread."""
+        return await asyncio.to_thread(
+            functools.partial(self.client.generate_judge_response, prompt, **judge_call_kwargs(response_format, max_tokens))
+        )
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a response, pulling each delta from a worker thread."""
+        iterator = self.client.stream_response(messages)
+        done = object()
+        while True:
+            delta = await asyncio.to_thread(next, iterator, done)
+            if delta is done:
+                break
+            yield delta
+
+
+class DelegatingAIClient(AIClient, AsyncAIClient):
+    """Base for client decorators that forward every call to a wrapped client."""
+    
+    def __init__(self, client: Union[AIClient, AsyncAIClient]):
+        """Initialize with the client to wrap."""
+        self.client = client
+    
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped client (model, transport, counters...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+    
+    def with_model(self, model: str) -> 'DelegatingAIClient':
+        """Get a copy of this decorator wrapping a client that uses ``model``."""
+        clone = copy.copy(self)
+        clone.client = self.client.with_model(model) if hasattr(self.client, "with_model") else self.client
+        return clone
+    
+    def generate_response(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response with the wrapped client."""
+        return self.client.generate_response(messages)
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response with the wrapped client."""
+        return self.client.generate_judge_response(prompt, **judge_call_kwargs(response_format, max_tokens))
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a response from the wrapped client."""
+        yield from self.client.stream_response(messages)
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response with the wrapped client without blocking the event loop."""
+        return await ensure_async_client(self.client).generate_response_async(messages)
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response with the wrapped client without blocking the event loop."""
+        return await ensure_async_client(self.client).generate_judge_response_async(
+            prompt, **judge_call_kwargs(response_format, max_tokens)
+        )
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a response from the wrapped client without blocking the event loop."""
+        async for delta in ensure_async_client(self.client).stream_response_async(messages):
+            yield delta
 
 
 def create_ai_client(client_type: str = "openai", **kwargs) -> AIClient:
@@ -178,17 +764,50 @@ def create_ai_client(client_type: str = "openai", **kwargs) -> AIClient:
     if client_type == "openai":
         return OpenAIClient(
             api_key=kwargs.get("api_key"),
-            model=kwargs.get("model", "gpt-4o")
+            model=kwargs.get("model", "gpt-4o"),
+            transport=kwargs.get("transport"),
+            retry_policy=kwargs.get("retry_policy"),
+            circuit_breaker=kwargs.get("circuit_breaker"),
+            api_base=kwargs.get("api_base"),
+            structured_output=kwargs.get("structured_output", True)
+        )
+    elif client_type == "openai_async":
+        return AsyncOpenAIClient(
+            api_key=kwargs.get("api_key"),
+            model=kwargs.get("model", "gpt-4o"),
+            transport=kwargs.get("transport"),
+            retry_policy=kwargs.get("retry_policy"),
+            circuit_breaker=kwargs.get("circuit_breaker"),
+            api_base=kwargs.get("api_base"),
+            structured_output=kwargs.get("structured_output", True)
         )
     elif client_type == "mock":
         return MockAIClient(
             fixed_response=kwargs.get("fixed_response"),
-            fixed_judge_response=kwargs.get("fixed_judge_response")
+            fixed_judge_response=kwargs.get("fixed_judge_response"),
+            latency=kwargs.get("latency", 0.0),
+            judge_latency=kwargs.get("judge_latency"),
+            structured_output=kwargs.get("structured_output", False)
+        )
+    elif client_type == "mock_async":
+        return AsyncMockAIClient(
+            fixed_response=kwargs.get("fixed_response"),
+            fixed_judge_response=kwargs.get("fixed_judge_response"),
+            latency=kwargs.get("latency", 0.0),
+            judge_latency=kwargs.get("judge_latency"),
+            structured_output=kwargs.get("structured_output", False)
         )
     else:
         raise ValueError(f"Unknown AI client type: {client_type}")
 
 
+def ensure_async_client(client: Union[AIClient, AsyncAIClient]) -> AsyncAIClient:
+    """Return an async client, wrapping synchronous clients in worker threads."""
+    if isinstance(client, AsyncAIClient):
+        return client
+    return ThreadedAsyncAIClient(client)
+
+
 def validate_api_key(api_key: str) -> bool:
     """Validate if an API key is properly formatted."""
     if not api_key:
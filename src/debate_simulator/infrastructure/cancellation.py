@@ -0,0 +1,219 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Any, Optional, Callable, Awaitable, Iterator, TypeVar
+import asyncio
+import logging
+import threading
+import time
+
+from .errors import RequestCancelledError, DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class CancellationToken:
+    """One-shot, thread-safe stop signal that in-flight work can hook into.
+
+    Code doing blocking I/O registers a callback that aborts it (closing a
+    socket, cancelling a task); ``cancel`` runs every callback once, from
+    whichever thread asked to stop. A token with a ``timeout`` cancels
+    itself when the deadline passes, and a child token is cancelled along
+    with its ``parent``; call ``close`` once a child is no longer needed.
+    """
+    
+    def __init__(self, parent: Optional['CancellationToken'] = None, timeout: Optional[float] = None):
+        """Initialize an uncancelled token, optionally linked to ``parent`` and expiring after ``timeout`` seconds."""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.expired = False
+        
+        self._timer: Optional[threading.Timer] = None
+        if timeout is not None:
+            self._timer = threading.Timer(max(timeout, 0.0), self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+        
+        self._unlink = parent.register(self._cancel_from_parent) if parent is not None else None
+    
+    def child(self, timeout: Optional[float] = None) -> 'CancellationToken':
+        """Create a token cancelled with this one, and on its own after ``timeout`` seconds."""
+        return CancellationToken(parent=self, timeout=timeout)
+    
+    @property
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation was requested."""
+        return self._event.is_set()
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one)."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+    
+    def _expire(self) -> None:
+        """Cancel because the deadline passed."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.expired = True
+        self.cancel(f"Deadline of {self.timeout:.1f}s exceeded")
+    
+    def _cancel_from_parent(self) -> None:
+        """Follow the parent token's cancellation."""
+        self.cancel("Cancelled")
+    
+    def close(self) -> None:
+        """Stop the deadline timer and detach from the parent."""
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._unlink is not None:
+            self._unlink()
+            self._unlink = None
+    
+    def error(self) -> RequestCancelledError:
+        """Build the exception describing why this token was cancelled."""
+        if self.expired or self.remaining() == 0:
+            return DeadlineExceededError(f"Deadline of {self.timeout:.1f}s exceeded", budget=self.timeout)
+        return RequestCancelledError(self.reason or "Cancelled")
+    
+    def cancel(self, reason: str = "Cancelled") -> None:
+        """Request cancellation and abort everything registered."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logging.debug(f"Cancellation callback failed: {e}")
+    
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run ``callback`` on cancellation (now, if already cancelled); returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                
+                def unregister() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+                return unregister
+        
+        callback()
+        return lambda: None
+    
+    def raise_if_cancelled(self) -> None:
+        """Raise ``RequestCancelledError`` (``DeadlineExceededError`` past the deadline) if cancelled."""
+        if not self._event.is_set() and self.deadline is not None and time.monotonic() >= self.deadline:
+            self._expire()
+        if self._event.is_set():
+            raise self.error()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to ``timeout`` seconds, waking early on cancellation; returns whether cancelled."""
+        return self._event.wait(timeout)
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Get the token governing work in the current context, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Make ``token`` govern AI calls made in this context (and tasks or copied contexts it spawns)."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """Sleep, but raise ``RequestCancelledError`` as soon as the current token fires."""
+    token = current_cancellation_token()
+    if token is None:
+        time.sleep(seconds)
+        return
+    token.wait(seconds)
+    token.raise_if_cancelled()
+
+
+async def await_cancellable(awaitable: Awaitable[T], token: Optional[CancellationToken] = None) -> T:
+    """Await ``awaitable`` as a task that is cancelled the moment ``token`` fires.
+
+    Cancelling the task tears down whatever it is awaiting (an httpx request
+    releases its connection), so the caller gets ``RequestCancelledError``
+    immediately instead of after the response arrives.
+    """
+    token = token or current_cancellation_token()
+    if token is None:
+        return await awaitable
+    
+    try:
+        token.raise_if_cancelled()
+    except RequestCancelledError:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()  # Never started, so close it rather than leave it unawaited
+        raise
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(awaitable)
+    unregister = token.register(lambda: loop.call_soon_threadsafe(task.cancel))
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if token.is_cancelled:
+            raise token.error() from None
+        raise
+    finally:
+        unregister()
+
+
+def run_cancellable(
+    operation: Callable[[], T],
+    token: CancellationToken,
+    poll: Optional[Callable[[], Any]] = None,
+    interval: float = 0.1
+) -> T:
+    """Run blocking ``operation`` on a worker thread while this thread stays responsive.
+
+    ``poll`` is called every ``interval`` seconds while waiting; if it (or
+    anything else) interrupts the wait, the token is cancelled so the
+    operation aborts and its worker thread is freed.
+    """
+    outcome = {}
+    done = threading.Event()
+    
+    def work():
+        with cancellation_scope(token):
+            try:
+                outcome["result"] = operation()
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+    
+    threading.Thread(target=work, name="cancellable-call", daemon=True).start()
+    try:
+        while not done.wait(interval):
+            if poll:
+                poll()
+            token.raise_if_cancelled()
+    except BaseException:
+        token.cancel("Interrupted while waiting")
+        raise
+    
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -11,11 +11,63 @@ class AppConfig:
     # API Configuration
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o"
+    fallback_model: Optional[str] = "gpt-4o-mini"  # Cheaper model for replies that miss their deadline
+    openai_api_base: Optional[str] = None
+    judge_structured_output: bool = True  # Request JSON-schema judge replies; turned off if the backend refuses
+    
+    # HTTP Transport Configuration
+    http_pool_connections: int = 10
+    http_pool_maxsize: int = 20
+    http_pool_block: bool = False
+    
+    # Resilience Configuration
+    ai_retry_attempts: int = 4
+    ai_retry_base_delay: float = 0.5
+    ai_retry_max_delay: float = 20.0
+    ai_circuit_failure_threshold: int = 5
+    ai_circuit_recovery_timeout: float = 30.0
+    
+    # Rate Limit Configuration (0 disables a budget)
+    rate_limit_rpm: int = 0
+    rate_limit_tpm: int = 0
+    rate_limit_max_queue: int = 100
+    rate_limit_max_wait: float = 60.0
+    
+    # Share one upstream call among identical concurrent requests
+    single_flight_enabled: bool = True
+    
+    # Response Cache Configuration
+    response_cache_enabled: bool = False
+    response_cache_max_entries: int = 1024
+    response_cache_ttl: float = 3600.0
+    response_cache_path: Optional[str] = None
+    response_cache_skip_nonzero_temperature: bool = True  # Sampled replies are meant to vary; never replay them
     
     # Logging Configuration
     log_level: str = "INFO"
     log_file: str = "debate.log"
     enable_debug_logging: bool = False
+    payload_trace_enabled: bool = False
+    payload_trace_file: str = "payload_trace.jsonl"
+    payload_trace_sample_rate: float = 1.0
+    
+    # Session Journal Configuration
+    session_journal_enabled: bool = False
+    session_journal_dir: str = "journals"
+    session_journal_fsync_interval: float = 1.0
+    
+    # Event Delivery Configuration
+    event_backpressure: str = "coalesce"  # block, drop_progress or coalesce
+    event_buffer_size: int = 256
+    
+    # Debate Memory Configuration
+    memory_summarizer: str = "ai"  # ai or extractive
+    memory_summary_max_words: int = 150
+    
+    # Judge Configuration
+    judge_type: str = "ai"  # ai, local, cascade or rule_based
+    cascade_min_confidence: float = 0.5  # Cascade rounds scored locally with less confidence go to the AI judge
+    cascade_min_margin: float = 1.0  # ...as do rounds whose two best speakers are closer than this
     
     # Application Settings
     default_rounds: int = 5
@@ -43,6 +95,39 @@ class AppConfig:
         
         if self.max_participants < 2 or self.max_participants > 20:
             raise ValueError("Max participants must be between 2 and 20")
+        
+        if self.http_pool_connections < 1 or self.http_pool_maxsize < 1:
+            raise ValueError("HTTP pool sizes must be at least 1")
+        
+        if self.ai_retry_attempts < 1 or self.ai_circuit_failure_threshold < 1:
+            raise ValueError("Retry attempts and circuit failure threshold must be at least 1")
+        
+        if self.rate_limit_rpm < 0 or self.rate_limit_tpm < 0 or self.rate_limit_max_queue < 1:
+            raise ValueError("Rate limits must be non-negative and the queue must hold at least 1 caller")
+        
+        if self.response_cache_max_entries < 1:
+            raise ValueError("Response cache must hold at least one entry")
+        
+        if not 0.0 <= self.payload_trace_sample_rate <= 1.0:
+            raise ValueError("Payload trace sample rate must be between 0 and 1")
+        
+        if self.session_journal_fsync_interval < 0:
+            raise ValueError("Session journal fsync interval must be non-negative")
+        
+        if self.event_backpressure not in ("block", "drop_progress", "coalesce"):
+            raise ValueError("Event backpressure must be block, drop_progress or coalesce")
+        
+        if self.event_buffer_size < 1:
+            raise ValueError("Event buffer must hold at least one event")
+        
+        if self.memory_summarizer not in ("ai", "extractive"):
+            raise ValueError("Memory summarizer must be ai or extractive")
+        
+        if self.judge_type not in ("ai", "local", "cascade", "rule_based"):
+            raise ValueError("Judge type must be ai, local, cascade or rule_based")
+        
+        if not 0 <= self.cascade_min_confidence <= 1:
+            raise ValueError("Cascade minimum confidence must be between 0 and 1")
     
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -50,9 +135,43 @@ class AppConfig:
         return cls(
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            fallback_model=os.getenv("OPENAI_FALLBACK_MODEL", "gpt-4o-mini") or None,
+            openai_api_base=os.getenv("OPENAI_API_BASE"),
+            judge_structured_output=os.getenv("JUDGE_STRUCTURED_OUTPUT", "true").lower() == "true",
+            http_pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+            http_pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "20")),
+            http_pool_block=os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true",
+            ai_retry_attempts=int(os.getenv("AI_RETRY_ATTEMPTS", "4")),
+            ai_retry_base_delay=float(os.getenv("AI_RETRY_BASE_DELAY", "0.5")),
+            ai_retry_max_delay=float(os.getenv("AI_RETRY_MAX_DELAY", "20")),
+            ai_circuit_failure_threshold=int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            ai_circuit_recovery_timeout=float(os.getenv("AI_CIRCUIT_RECOVERY_TIMEOUT", "30")),
+            rate_limit_rpm=int(os.getenv("RATE_LIMIT_RPM", "0")),
+            rate_limit_tpm=int(os.getenv("RATE_LIMIT_TPM", "0")),
+            rate_limit_max_queue=int(os.getenv("RATE_LIMIT_MAX_QUEUE", "100")),
+            rate_limit_max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", "60")),
+            single_flight_enabled=os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true",
+            response_cache_enabled=os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true",
+            response_cache_max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024")),
+            response_cache_ttl=float(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+            response_cache_path=os.getenv("RESPONSE_CACHE_PATH"),
+            response_cache_skip_nonzero_temperature=os.getenv("RESPONSE_CACHE_SKIP_NONZERO_TEMPERATURE", "true").lower() == "true",
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             log_file=os.getenv("LOG_FILE", "debate.log"),
             enable_debug_logging=os.getenv("ENABLE_DEBUG_LOGGING", "false").lower() == "true",
+            payload_trace_enabled=os.getenv("PAYLOAD_TRACE_ENABLED", "false").lower() == "true",
+            payload_trace_file=os.getenv("PAYLOAD_TRACE_FILE", "payload_trace.jsonl"),
+            payload_trace_sample_rate=float(os.getenv("PAYLOAD_TRACE_SAMPLE_RATE", "1.0")),
+            session_journal_enabled=os.getenv("SESSION_JOURNAL_ENABLED", "false").lower() == "true",
+            session_journal_dir=os.getenv("SESSION_JOURNAL_DIR", "journals"),
+            session_journal_fsync_interval=float(os.getenv("SESSION_JOURNAL_FSYNC_INTERVAL", "1.0")),
+            event_backpressure=os.getenv("EVENT_BACKPRESSURE", "coalesce").lower(),
+            event_buffer_size=int(os.getenv("EVENT_BUFFER_SIZE", "256")),
+            memory_summarizer=os.getenv("MEMORY_SUMMARIZER", "ai").lower(),
+            memory_summary_max_words=int(os.getenv("MEMORY_SUMMARY_MAX_WORDS", "150")),
+            judge_type=os.getenv("JUDGE_TYPE", "ai").lower(),
+            cascade_min_confidence=float(os.getenv("CASCADE_MIN_CONFIDENCE", "0.5")),
+            cascade_min_margin=float(os.getenv("CASCADE_MIN_MARGIN", "1.0")),
             default_rounds=int(os.getenv("DEFAULT_ROUNDS", "5")),
             default_delay=float(os.getenv("DEFAULT_DELAY", "1.0")),
             max_participants=int(os.getenv("MAX_PARTICIPANTS", "10")),
@@ -70,9 +189,40 @@ class AppConfig:
         return {
             "openai_api_key": "***" if self.openai_api_key else None,  # Hide sensitive data
             "openai_model": self.openai_model,
+            "fallback_model": self.fallback_model,
+            "openai_api_base": self.openai_api_base,
+            "http_pool_connections": self.http_pool_connections,
+            "http_pool_maxsize": self.http_pool_maxsize,
+            "http_pool_block": self.http_pool_block,
+            "ai_retry_attempts": self.ai_retry_attempts,
+            "ai_retry_base_delay": self.ai_retry_base_delay,
+            "ai_retry_max_delay": self.ai_retry_max_delay,
+            "ai_circuit_failure_threshold": self.ai_circuit_failure_threshold,
+            "ai_circuit_recovery_timeout": self.ai_circuit_recovery_timeout,
+            "rate_limit_rpm": self.rate_limit_rpm,
+            "rate_limit_tpm": self.rate_limit_tpm,
+            "rate_limit_max_queue": self.rate_limit_max_queue,
+            "rate_limit_max_wait": self.rate_limit_max_wait,
+            "single_flight_enabled": self.single_flight_enabled,
+            "response_cache_enabled": self.response_cache_enabled,
+            "response_cache_max_entries": self.response_cache_max_entries,
+            "response_cache_ttl": self.response_cache_ttl,
+            "response_cache_path": self.response_cache_path,
+            "response_cache_skip_nonzero_temperature": self.response_cache_skip_nonzero_temperature,
             "log_level": self.log_level,
             "log_file": self.log_file,
             "enable_debug_logging": self.enable_debug_logging,
+            "payload_trace_enabled": self.payload_trace_enabled,
+            "payload_trace_file": self.payload_trace_file,
+            "payload_trace_sample_rate": self.payload_trace_sample_rate,
+            "event_backpressure": self.event_backpressure,
+            "event_buffer_size": self.event_buffer_size,
+            "memory_summarizer": self.memory_summarizer,
+            "memory_summary_max_words": self.memory_summary_max_words,
+            "judge_type": self.judge_type,
+            "judge_structured_output": self.judge_structured_output,
+            "cascade_min_confidence": self.cascade_min_confidence,
+            "cascade_min_margin": self.cascade_min_margin,
             "default_rounds": self.default_rounds,
             "default_delay": self.default_delay,
             "max_participants": self.max_participants,
@@ -151,7 +301,10 @@ class ConfigManager:
             "log_level": self._config.log_level,
             "log_file": self._config.log_file,
             "enable_file": self._config.enable_file_logging,
-            "enable_console": self._config.enable_console_logging
+            "enable_console": self._config.enable_console_logging,
+            "payload_trace_enabled": self._config.payload_trace_enabled,
+            "payload_trace_file": self._config.payload_trace_file,
+            "payload_trace_sample_rate": self._config.payload_trace_sample_rate
         }
     
     def get_ai_config(self) -> Dict[str, Any]:
@@ -159,9 +312,70 @@ class ConfigManager:
         return {
             "api_key": self._config.openai_api_key,
             "model": self._config.openai_model,
+            "fallback_model": self._config.fallback_model,
+            "api_base": self._config.openai_api_base,
+            "structured_output": self._config.judge_structured_output,
             "use_mock": self._config.enable_mock_ai
         }
     
+    def get_http_config(self) -> Dict[str, Any]:
+        """Get configuration for the pooled HTTP transport."""
+        return {
+            "pool_connections": self._config.http_pool_connections,
+            "pool_maxsize": self._config.http_pool_maxsize,
+            "pool_block": self._config.http_pool_block
+        }
+    
+    def get_rate_limit_config(self) -> Dict[str, Any]:
+        """Get configuration for the process-wide rate limiter."""
+        return {
+            "enabled": bool(self._config.rate_limit_rpm or self._config.rate_limit_tpm),
+            "requests_per_minute": self._config.rate_limit_rpm,
+            "tokens_per_minute": self._config.rate_limit_tpm,
+            "max_queue": self._config.rate_limit_max_queue,
+            "max_wait": self._config.rate_limit_max_wait
+        }
+    
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get configuration for the response cache."""
+        return {
+            "enabled": self._config.response_cache_enabled,
+            "max_entries": self._config.response_cache_max_entries,
+            "ttl_seconds": self._config.response_cache_ttl,
+            "disk_path": self._config.response_cache_path,
+            "skip_nonzero_temperature": self._config.response_cache_skip_nonzero_temperature
+        }
+    
+    def get_journal_config(self) -> Dict[str, Any]:
+        """Get configuration for crash-safe session journals."""
+        return {
+            "enabled": self._config.session_journal_enabled,
+            "directory": self._config.session_journal_dir,
+            "fsync_interval": self._config.session_journal_fsync_interval
+        }
+    
+    def get_event_config(self) -> Dict[str, Any]:
+        """Get configuration for delivering debate events to the UI."""
+        return {
+            "backpressure": self._config.event_backpressure,
+            "buffer_size": self._config.event_buffer_size
+        }
+    
+    def get_memory_config(self) -> Dict[str, Any]:
+        """Get configuration for summarizing older debate rounds."""
+        return {
+            "summarizer_type": self._config.memory_summarizer,
+            "max_words": self._config.memory_summary_max_words
+        }
+    
+    def get_judge_config(self) -> Dict[str, Any]:
+        """Get configuration for judging competitive debates."""
+        return {
+            "judge_type": self._config.judge_type,
+            "min_confidence": self._config.cascade_min_confidence,
+            "min_margin": self._config.cascade_min_margin
+        }
+    
     def check_required_config(self) -> list[str]:
         """Check for missing required configuration."""
         missing = []
@@ -0,0 +1,97 @@
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping
+import time
+
+
+class AIClientError(Exception):
+    """Custom exception for AI client errors."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """Initialize with a message and the HTTP status that caused it, if any."""
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TransientAIError(AIClientError):
+    """Failure that is expected to clear up and is safe to retry."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """Initialize with an optional server-provided retry delay in seconds."""
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+
+class RateLimitError(TransientAIError):
+    """The provider rejected the request with HTTP 429."""
+    pass
+
+
+class ServerError(TransientAIError):
+    """The provider failed with a 5xx status."""
+    pass
+
+
+class AITimeoutError(TransientAIError):
+    """The request timed out or the connection dropped."""
+    pass
+
+
+class PermanentAIError(AIClientError):
+    """Failure that will not succeed on retry (bad request, auth, malformed reply)."""
+    pass
+
+
+class CircuitOpenError(AIClientError):
+    """The circuit breaker is open and calls fail fast."""
+    
+    def __init__(self, message: str, retry_after: float = 0.0):
+        """Initialize with the seconds remaining until the breaker allows a trial call."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimiterRejectedError(AIClientError):
+    """The local rate limiter refused to queue or admit a request."""
+    pass
+
+
+class RequestCancelledError(AIClientError):
+    """The request was aborted because its cancellation token fired."""
+    pass
+
+
+class DeadlineExceededError(RequestCancelledError):
+    """The request was aborted because its turn or debate deadline passed."""
+    
+    def __init__(self, message: str, budget: Optional[float] = None):
+        """Initialize with the time budget, in seconds, that was exceeded."""
+        super().__init__(message)
+        self.budget = budget
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    if not value or not isinstance(value, str):
+        return None
+    
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_http_error(status_code: int, body: str, headers: Optional[Mapping[str, str]] = None) -> AIClientError:
+    """Map a non-200 HTTP response to a typed AI client error."""
+    message = f"HTTP {status_code} - {body}"
+    retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+    
+    if status_code == 429:
+        return RateLimitError(message, status_code, retry_after)
+    if status_code >= 500 or status_code == 408:
+        return ServerError(message, status_code, retry_after)
+    return PermanentAIError(message, status_code)
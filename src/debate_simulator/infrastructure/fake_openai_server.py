@@ -0,0 +1,305 @@
+"""
+Local OpenAI-compatible stand-in for ``/v1/chat/completions``.
+
+Serves non-streaming and SSE streaming completions with configurable
+latency, injected 429/5xx failures and canned or templated replies, so
+benchmarks and integration tests can run the full debate stack offline.
+
+Run standalone with::
+
+    python -m src.debate_simulator.infrastructure.fake_openai_server --port 8001
+
+and point the app at it with ``OPENAI_API_BASE=http://127.0.0.1:8001/v1``.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Union
+import argparse
+import itertools
+import json
+import math
+import random
+import threading
+import time
+
+
+class LatencyModel:
+    """Samples simulated response latency in seconds."""
+    
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+    
+    def __init__(self, distribution: str = "fixed", a: float = 0.0, b: float = 0.0, rng: Optional[random.Random] = None):
+        """Initialize a distribution.
+
+        ``fixed``: always ``a``; ``uniform``: between ``a`` and ``b``;
+        ``normal``: mean ``a``, stddev ``b``; ``lognormal``: median ``a``, sigma ``b``.
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        
+        self.distribution = distribution
+        self.a = a
+        self.b = b
+        self.rng = rng or random.Random()
+    
+    @classmethod
+    def parse(cls, spec: str, rng: Optional[random.Random] = None) -> 'LatencyModel':
+        """Parse a spec such as ``"0.2"``, ``"uniform:0.1,0.5"`` or ``"lognormal:0.3,0.5"``."""
+        name, _, args = spec.partition(":")
+        if not args:
+            return cls("fixed", float(name), rng=rng)
+        
+        values = [float(value) for value in args.split(",")]
+        return cls(name, values[0], values[1] if len(values) > 1 else 0.0, rng=rng)
+    
+    def sample(self) -> float:
+        """Draw one latency value (never negative)."""
+        if self.distribution == "fixed":
+            value = self.a
+        elif self.distribution == "uniform":
+            value = self.rng.uniform(self.a, self.b)
+        elif self.distribution == "normal":
+            value = self.rng.gauss(self.a, self.b)
+        else:
+            value = self.rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        return max(value, 0.0)
+
+
+def _extract_speaker(messages: List[Dict[str, str]]) -> str:
+    """Find the character name in a "You are X, a ..." system prompt."""
+    for msg in messages:
+        if msg.get("role") == "system" and "You are" in msg.get("content", ""):
+            return msg["content"].split("You are", 1)[1].split(",")[0].strip()
+    return "Speaker"
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler for ``/v1/chat/completions``."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        fake = self.server.fake
+        
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+        
+        request_number, fault = fake._admit(payload)
+        if fault == 429:
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached (injected)", "type": "rate_limit_exceeded"}},
+                {"Retry-After": str(fake.retry_after)}
+            )
+            return
+        if fault:
+            self._send_json(fault, {"error": {"message": "Server error (injected)", "type": "server_error"}})
+            return
+        
+        time.sleep(fake.latency.sample())
+        reply = fake.render_reply(payload, request_number)
+        
+        if payload.get("stream"):
+            self._send_stream(reply, fake.chunk_delay)
+        else:
+            self._send_json(200, {
+                "id": f"chatcmpl-fake-{request_number}",
+                "object": "chat.completion",
+                "model": payload.get("model", "fake"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}]
+            })
+    
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        """Send a JSON response with an explicit length so the connection stays open."""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _send_stream(self, reply: str, chunk_delay: float):
+        """Send the reply as server-sent event chunks, one word at a time."""
+        words = reply.split(" ")
+        events = []
+        for i, word in enumerate(words):
+            delta = {"content": word if i == 0 else f" {word}"}
+            events.append(f"data: {json.dumps({'choices': [{'index': 0, 'delta': delta}]})}\n\n".encode("utf-8"))
+        events.append(b"data: [DONE]\n\n")
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(sum(len(event) for event in events)))
+        self.end_headers()
+        
+        for event in events:
+            self.wfile.write(event)
+            self.wfile.flush()
+            if chunk_delay:
+                time.sleep(chunk_delay)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOpenAIServer:
+    """Local OpenAI-compatible server for offline tests and benchmarks."""
+    
+    def __init__(
+        self,
+        reply: str = "Fake reply",
+        replies: Optional[List[str]] = None,
+        template: Optional[str] = None,
+        latency: Union[LatencyModel, str, float, None] = None,
+        chunk_delay: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1,
+        fail_first: int = 0,
+        fail_status: int = 429,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None
+    ):
+        """Initialize the server; ``port=0`` picks a free port.
+
+        Replies come from ``template`` (formatted with ``n``, ``model``,
+        ``speaker`` and ``last_user``), else cycle through ``replies``, else
+        ``reply``. ``fail_first`` deterministically fails the first N
+        requests with ``fail_status`` before random injection applies.
+        """
+        self.rng = random.Random(seed)
+        if isinstance(latency, LatencyModel):
+            self.latency = latency
+        elif isinstance(latency, str):
+            self.latency = LatencyModel.parse(latency, rng=self.rng)
+        else:
+            self.latency = LatencyModel("fixed", float(latency or 0.0))
+        
+        self.reply = reply
+        self.replies = replies
+        self.template = template
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.received: List[Dict[str, Any]] = []
+        self.status_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        
+        self.httpd = ThreadingHTTPServer((host, port), _ChatCompletionHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def api_base(self) -> str:
+        """API root to use as ``OPENAI_API_BASE``."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+    
+    @property
+    def url(self) -> str:
+        """Full chat completions endpoint URL."""
+        return f"{self.api_base}/chat/completions"
+    
+    def _admit(self, payload: Dict[str, Any]):
+        """Record a request and decide whether to inject a failure (returns number, status)."""
+        with self._lock:
+            self.received.append(payload)
+            request_number = next(self._counter)
+            
+            fault = 0
+            if request_number <= self.fail_first:
+                fault = self.fail_status
+            else:
+                roll = self.rng.random()
+                if roll < self.rate_limit_rate:
+                    fault = 429
+                elif roll < self.rate_limit_rate + self.error_rate:
+                    fault = 500
+            
+            status = fault or 200
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            return request_number, fault
+    
+    def render_reply(self, payload: Dict[str, Any], request_number: int) -> str:
+        """Build the reply text for a request."""
+        if self.template:
+            messages = payload.get("messages", [])
+            user_messages = [m.get("content", "") for m in messages if m.get("role") == "user"]
+            return self.template.format(
+                n=request_number,
+                model=payload.get("model", "fake"),
+                speaker=_extract_speaker(messages),
+                last_user=(user_messages[-1] if user_messages else "")[:40]
+            )
+        if self.replies:
+            return self.replies[(request_number - 1) % len(self.replies)]
+        return self.reply
+    
+    def start(self) -> 'FakeOpenAIServer':
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread = None
+        self.httpd.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--reply", default="This is a simulated debate reply.")
+    parser.add_argument("--template", help='e.g. "{speaker} makes point #{n} on {last_user}"')
+    parser.add_argument("--latency", default="0", help='"0.2", "uniform:0.1,0.5", "normal:0.3,0.05" or "lognormal:0.3,0.5"')
+    parser.add_argument("--chunk-delay", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    
+    server = FakeOpenAIServer(
+        reply=args.reply,
+        template=args.template,
+        latency=args.latency,
+        chunk_delay=args.chunk_delay,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        host=args.host,
+        port=args.port,
+        seed=args.seed
+    )
+    print(f"Fake OpenAI server listening on {server.api_base}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import logging
+import socket
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .cancellation import CancellationToken
+
+
+class TransportStats:
+    """Thread-safe counters describing connection pool reuse."""
+    
+    def __init__(self):
+        """Initialize all counters at zero."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.handshake_seconds = 0.0
+    
+    def record_request(self) -> None:
+        """Record a request sent through the transport."""
+        with self._lock:
+            self.requests += 1
+    
+    def record_connection(self, elapsed: float) -> None:
+        """Record a new TCP (and TLS) handshake and how long it took."""
+        with self._lock:
+            self.connections_opened += 1
+            self.handshake_seconds += elapsed
+    
+    @property
+    def pool_hits(self) -> int:
+        """Requests that were served on an already open connection."""
+        return max(self.requests - self.connections_opened, 0)
+    
+    @property
+    def pool_misses(self) -> int:
+        """Requests that had to open a new connection."""
+        return self.connections_opened
+    
+    @property
+    def avg_handshake_seconds(self) -> float:
+        """Average time spent establishing a new connection."""
+        return self.handshake_seconds / self.connections_opened if self.connections_opened else 0.0
+    
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """Handshake time avoided thanks to connection reuse."""
+        return self.pool_hits * self.avg_handshake_seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "pool_hits": self.pool_hits,
+                "pool_misses": self.pool_misses,
+                "handshake_seconds": self.handshake_seconds,
+                "avg_handshake_seconds": self.avg_handshake_seconds,
+                "estimated_seconds_saved": self.estimated_seconds_saved
+            }
+    
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.requests = 0
+            self.connections_opened = 0
+            self.handshake_seconds = 0.0
+
+
+def diff_transport_stats(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the counter deltas between two ``TransportStats.to_dict`` snapshots."""
+    requests_made = after["requests"] - before["requests"]
+    misses = after["pool_misses"] - before["pool_misses"]
+    handshake_seconds = after["handshake_seconds"] - before["handshake_seconds"]
+    hits = max(requests_made - misses, 0)
+    avg_handshake = handshake_seconds / misses if misses else after["avg_handshake_seconds"]
+    
+    return {
+        "requests": requests_made,
+        "pool_hits": hits,
+        "pool_misses": misses,
+        "handshake_seconds": handshake_seconds,
+        "estimated_seconds_saved": hits * avg_handshake
+    }
+
+
+class _CancelScope:
+    """Connections used by one in-flight request, so a cancellation can sever them."""
+    
+    def __init__(self):
+        """Initialize with no connections attached."""
+        self._lock = threading.Lock()
+        self._connections: List[Any] = []
+        self.aborted = False
+    
+    def attach(self, connection) -> None:
+        """Track a connection the request is about to use."""
+        with self._lock:
+            connection._cancel_scope = self
+            self._connections.append(connection)
+            if self.aborted:
+                _sever(connection)
+    
+    def detach(self, connection) -> None:
+        """Stop tracking a connection that has moved on to another request."""
+        with self._lock:
+            connection._cancel_scope = None
+            if connection in self._connections:
+                self._connections.remove(connection)
+    
+    def abort(self) -> None:
+        """Shut down every attached socket, waking any thread blocked on it."""
+        with self._lock:
+            self.aborted = True
+            for connection in self._connections:
+                _sever(connection)
+
+
+def _sever(connection) -> None:
+    """Shut down a connection's socket; a blocked read then fails immediately."""
+    sock = getattr(connection, "sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError as e:
+        logging.debug(f"Socket shutdown during cancellation failed: {e}")
+
+
+# Cancel scope of the request being sent on each thread
+_active = threading.local()
+
+
+def _counting_pool_class(pool_cls: type, stats: TransportStats) -> type:
+    """Build a connection pool class whose connections report handshakes to ``stats``.
+    
+    Only the public ``ConnectionCls`` extension point is used, since
+    urllib3's private pool methods change between releases. Each connection
+    joins the calling thread's cancel scope, if one is active, whenever it
+    sends a request, and leaves the scope of the request that used it before.
+    """
+    base_connection_cls = pool_cls.ConnectionCls
+    
+    def connect(self):
+        start = time.perf_counter()
+        base_connection_cls.connect(self)
+        stats.record_connection(time.perf_counter() - start)
+        scope = getattr(_active, "scope", None)
+        if scope is not None and scope.aborted:
+            _sever(self)
+    
+    def request(self, *args, **kwargs):
+        scope = getattr(_active, "scope", None)
+        previous = getattr(self, "_cancel_scope", None)
+        if previous is not None and previous is not scope:
+            previous.detach(self)
+        if scope is not None and previous is not scope:
+            scope.attach(self)
+        return base_connection_cls.request(self, *args, **kwargs)
+    
+    connection_cls = type(
+        f"Counting{base_connection_cls.__name__}", (base_connection_cls,), {"connect": connect, "request": request}
+    )
+    return type(f"Counting{pool_cls.__name__}", (pool_cls,), {"ConnectionCls": connection_cls})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter whose pools count how often a new connection is opened."""
+    
+    def __init__(self, stats: TransportStats, **kwargs):
+        """Initialize with the stats object that connections report to."""
+        self.stats = stats
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Create the pool manager and swap in counting pool classes."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats)
+        }
+
+
+class PooledHTTPTransport:
+    """Keep-alive HTTP transport backed by a shared ``requests.Session``."""
+    
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 20
+    
+    def __init__(
+        self,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        pool_block: bool = False
+    ):
+        """Initialize the session and mount the pooled adapter."""
+        self.pool_connections = pool_connections or self.DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.DEFAULT_POOL_MAXSIZE
+        self.pool_block = pool_block
+        self.stats = TransportStats()
+        
+        # Automatic retries are handled by callers, not by urllib3
+        adapter = PooledHTTPAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    @classmethod
+    def from_config(cls, config) -> 'PooledHTTPTransport':
+        """Create a transport from an ``AppConfig``."""
+        return cls(
+            pool_connections=config.http_pool_connections,
+            pool_maxsize=config.http_pool_maxsize,
+            pool_block=config.http_pool_block
+        )
+    
+    def post(self, url: str, cancel_token: Optional[CancellationToken] = None, **kwargs) -> requests.Response:
+        """Send a POST request over a pooled connection.
+        
+        If ``cancel_token`` fires while the request is in flight, its socket
+        is shut down and ``RequestCancelledError`` is raised right away. For
+        streamed responses the hook stays armed until ``release_cancellation``
+        (set on the response) is called once the body has been consumed.
+        """
+        self.stats.record_request()
+        if cancel_token is None:
+            return self.session.post(url, **kwargs)
+        
+        cancel_token.raise_if_cancelled()
+        scope = _CancelScope()
+        unregister = cancel_token.register(scope.abort)
+        _active.scope = scope
+        try:
+            response = self.session.post(url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            unregister()
+            # A socket timeout at the deadline counts as the deadline, not a retryable failure
+            if cancel_token.is_cancelled or cancel_token.remaining() == 0:
+                raise cancel_token.error() from e
+            raise
+        except BaseException:
+            unregister()
+            raise
+        finally:
+            _active.scope = None
+        
+        if kwargs.get("stream"):
+            response.release_cancellation = unregister
+        else:
+            unregister()
+        return response
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool hit/miss counters."""
+        return self.stats.to_dict()
+    
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+def release_cancellation(response: requests.Response) -> None:
+    """Disarm the cancellation hook of a streamed response once it is finished with."""
+    release = getattr(response, "release_cancellation", None)
+    if release is not None:
+        release()
+
+
+# Global transport instance shared by every client in the process
+_shared_transport: Optional[PooledHTTPTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> PooledHTTPTransport:
+    """Get the process-wide HTTP transport, creating it from configuration on first use."""
+    global _shared_transport
+    
+    if _shared_transport is None:
+        with _shared_transport_lock:
+            if _shared_transport is None:
+                from .config import get_config
+                _shared_transport = PooledHTTPTransport.from_config(get_config())
+    
+    return _shared_transport
+
+
+def set_shared_transport(transport: Optional[PooledHTTPTransport]) -> None:
+    """Replace the process-wide HTTP transport, closing the previous one."""
+    global _shared_transport
+    
+    with _shared_transport_lock:
+        if _shared_transport is not None and _shared_transport is not transport:
+            _shared_transport.close()
+        _shared_transport = transport
@@ -0,0 +1,186 @@
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Dict, Any, Optional, Callable
+import hashlib
+import itertools
+import json
+import logging
+import queue
+import random
+import threading
+import time
+
+
+PAYLOAD_LOGGER_NAME = "debate_simulator.ai.payload"
+
+
+class _JsonLine:
+    """Defers ``json.dumps`` until a handler actually formats the record."""
+    
+    __slots__ = ("entry",)
+    
+    def __init__(self, entry: Dict[str, Any]):
+        self.entry = entry
+    
+    def __str__(self) -> str:
+        return json.dumps(self.entry, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stock ``QueueHandler`` formats in the calling thread; trace entries
+    are private snapshots, so serialization can safely happen off the hot path.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class PayloadTracer:
+    """Samples AI request/response payloads into compact JSON-line trace records."""
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        sample_rate: float = 1.0,
+        max_known_prompts: int = 1024,
+        rng: Callable[[], float] = random.random
+    ):
+        """Initialize with the trace logger and the fraction of requests to keep."""
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("Sample rate must be between 0 and 1")
+        
+        self.logger = logger or logging.getLogger(PAYLOAD_LOGGER_NAME)
+        self.sample_rate = sample_rate
+        self.max_known_prompts = max_known_prompts
+        self.rng = rng
+        self._lock = threading.Lock()
+        self._known_prompts: "OrderedDict[str, None]" = OrderedDict()
+        self._trace_ids = itertools.count(1)
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether trace records would currently be emitted."""
+        return self.sample_rate > 0 and self.logger.isEnabledFor(logging.DEBUG)
+    
+    def _emit(self, entry: Dict[str, Any]) -> None:
+        """Log one trace record."""
+        entry.setdefault("ts", time.time())
+        self.logger.debug("%s", _JsonLine(entry))
+    
+    def _system_prompt_ref(self, content: str) -> str:
+        """Hash a system prompt, emitting its full text the first time it is seen."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            if digest in self._known_prompts:
+                self._known_prompts.move_to_end(digest)
+                return digest
+            self._known_prompts[digest] = None
+            if len(self._known_prompts) > self.max_known_prompts:
+                self._known_prompts.popitem(last=False)
+        
+        self._emit({"event": "system_prompt", "hash": digest, "content": content})
+        return digest
+    
+    def _compact_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy messages, replacing system prompts with references to their hash."""
+        compact = []
+        for msg in messages:
+            if msg.get("role") == "system":
+                compact.append({"role": "system", "ref": self._system_prompt_ref(msg.get("content", ""))})
+            else:
+                compact.append(dict(msg))
+        return compact
+    
+    def trace_request(self, kind: str, payload: Dict[str, Any]) -> Optional[int]:
+        """Trace a request payload; returns a trace id, or None when not sampled."""
+        if not self.enabled or self.rng() >= self.sample_rate:
+            return None
+        
+        trace_id = next(self._trace_ids)
+        entry = {key: value for key, value in payload.items() if key != "messages"}
+        entry["messages"] = self._compact_messages(payload.get("messages", []))
+        self._emit({"event": "request", "id": trace_id, "kind": kind, "payload": entry})
+        return trace_id
+    
+    def trace_response(self, trace_id: Optional[int], content: str, **fields: Any) -> None:
+        """Trace the reply to a sampled request."""
+        if trace_id is None or not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self._emit({"event": "response", "id": trace_id, "content": content, **fields})
+    
+    def forget_prompts(self) -> None:
+        """Forget known system prompts so the next use logs them in full again."""
+        with self._lock:
+            self._known_prompts.clear()
+
+
+def configure_payload_trace(
+    log_file: str = "payload_trace.jsonl",
+    sample_rate: float = 1.0,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5
+) -> QueueListener:
+    """Route payload traces to a dedicated JSON-lines file through a background thread.
+
+    Traces no longer propagate to the application log. Reconfiguring stops
+    the previous listener. Returns the started listener; call ``stop()`` on
+    it to flush at shutdown.
+    """
+    global _payload_trace_listener
+    
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    trace_queue = queue.SimpleQueue()
+    listener = QueueListener(trace_queue, file_handler, respect_handler_level=False)
+    listener.start()
+    
+    logger = logging.getLogger(PAYLOAD_LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(DeferredQueueHandler(trace_queue))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    
+    with _payload_tracer_lock:
+        previous, _payload_trace_listener = _payload_trace_listener, listener
+    if previous is not None:
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()
+    
+    set_payload_tracer(PayloadTracer(logger, sample_rate=sample_rate))
+    return listener
+
+
+def is_payload_trace_configured() -> bool:
+    """Whether traces are routed to a dedicated sink."""
+    return _payload_trace_listener is not None
+
+
+# Global tracer shared by every client in the process
+_payload_tracer: Optional[PayloadTracer] = None
+_payload_trace_listener: Optional[QueueListener] = None
+_payload_tracer_lock = threading.Lock()
+
+
+def get_payload_tracer() -> PayloadTracer:
+    """Get the process-wide payload tracer (follows the root log level until configured)."""
+    global _payload_tracer
+    
+    if _payload_tracer is None:
+        with _payload_tracer_lock:
+            if _payload_tracer is None:
+                _payload_tracer = PayloadTracer()
+    
+    return _payload_tracer
+
+
+def set_payload_tracer(tracer: Optional[PayloadTracer]) -> None:
+    """Replace the process-wide payload tracer."""
+    global _payload_tracer
+    
+    with _payload_tracer_lock:
+        _payload_tracer = tracer
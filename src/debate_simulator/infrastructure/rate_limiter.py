@@ -0,0 +1,309 @@
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Iterator, AsyncIterator, Union
+import asyncio
+import itertools
+import threading
+import time
+
+from .ai_client import AIClient, AsyncAIClient, DelegatingAIClient, judge_call_kwargs
+from .cancellation import current_cancellation_token, await_cancellable
+from .errors import RateLimiterRejectedError
+
+
+def estimate_tokens(messages: List[Dict[str, str]], completion_tokens: int = 0) -> int:
+    """Roughly estimate the tokens a request consumes (about 4 characters per token)."""
+    prompt_tokens = sum(len(msg.get("content", "")) // 4 + 4 for msg in messages)
+    return prompt_tokens + completion_tokens
+
+
+class TokenBucket:
+    """Continuously refilling budget; callers must hold the owning limiter's lock."""
+    
+    def __init__(self, per_minute: float, clock: Callable[[], float]):
+        """Initialize a full bucket holding one minute of budget."""
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self.available = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+    
+    def _refill(self) -> None:
+        """Add the budget accrued since the last update."""
+        now = self._clock()
+        self.available = min(self.capacity, self.available + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.refill_per_second
+    
+    def take(self, amount: float) -> None:
+        """Consume budget; ``wait_time`` must have returned 0."""
+        self.available -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Process-wide requests/tokens-per-minute limiter that admits callers in FIFO order."""
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_queue: int = 100,
+        max_wait: Optional[float] = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the limiter; a budget of ``None`` or 0 is unlimited."""
+        self.requests_per_minute = requests_per_minute or None
+        self.tokens_per_minute = tokens_per_minute or None
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._clock = clock
+        self._request_bucket = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self._token_bucket = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._tickets = itertools.count()
+        
+        # Metrics
+        self.admitted = 0
+        self.rejections = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.max_queue_depth = 0
+    
+    @classmethod
+    def from_config(cls, config) -> 'RateLimiter':
+        """Create a rate limiter from an ``AppConfig``."""
+        return cls(
+            requests_per_minute=config.rate_limit_rpm,
+            tokens_per_minute=config.rate_limit_tpm,
+            max_queue=config.rate_limit_max_queue,
+            max_wait=config.rate_limit_max_wait
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is enforced."""
+        return self._request_bucket is not None or self._token_bucket is not None
+    
+    def _enqueue(self) -> int:
+        """Take a place in line, rejecting when the queue is full."""
+        if len(self._queue) >= self.max_queue:
+            self.rejections += 1
+            raise RateLimiterRejectedError(f"Rate limiter queue full ({self.max_queue} waiting)")
+        ticket = next(self._tickets)
+        self._queue.append(ticket)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        return ticket
+    
+    def _try_admit(self, ticket: int, tokens: int) -> float:
+        """Admit ``ticket`` if it is first in line and budget allows; else return the wait."""
+        if self._queue[0] != ticket:
+            return -1.0
+        
+        wait = 0.0
+        if self._request_bucket:
+            wait = max(wait, self._request_bucket.wait_time(1))
+        if self._token_bucket:
+            wait = max(wait, self._token_bucket.wait_time(tokens))
+        if wait > 0:
+            return wait
+        
+        if self._request_bucket:
+            self._request_bucket.take(1)
+        if self._token_bucket:
+            self._token_bucket.take(tokens)
+        self._queue.popleft()
+        self._condition.notify_all()
+        return 0.0
+    
+    def _abandon(self, ticket: int) -> None:
+        """Leave the queue after a timeout or cancellation."""
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            self._condition.notify_all()
+    
+    def _record_admission(self, waited: float) -> None:
+        """Update wait metrics for an admitted caller."""
+        self.admitted += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+    
+    def _check_deadline(self, ticket: int, started: float, wait: float) -> None:
+        """Reject a caller that cannot be admitted within ``max_wait``."""
+        if self.max_wait is not None and self._clock() - started + max(wait, 0.0) > self.max_wait:
+            self._abandon(ticket)
+            self.rejections += 1
+            raise RateLimiterRejectedError(f"Waited more than {self.max_wait:.0f}s for rate limit budget")
+    
+    def _wake(self) -> None:
+        """Wake every waiting caller so a cancelled one can leave the queue."""
+        with self._condition:
+            self._condition.notify_all()
+    
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request and ``tokens`` fit the budget; return seconds waited.
+        
+        Raises ``RequestCancelledError`` as soon as the current cancellation
+        token fires, giving up the caller's place in line.
+        """
+        if not self.enabled:
+            return 0.0
+        
+        token = current_cancellation_token()
+        unregister = token.register(self._wake) if token is not None else None
+        started = self._clock()
+        try:
+            with self._condition:
+                ticket = self._enqueue()
+                try:
+                    while True:
+                        if token is not None:
+                            token.raise_if_cancelled()
+                        wait = self._try_admit(ticket, tokens)
+                        if wait == 0.0:
+                            break
+                        self._check_deadline(ticket, started, wait)
+                        # Not first in line: sleep until the head is admitted
+                        self._condition.wait(timeout=wait if wait > 0 else 1.0)
+                except BaseException:
+                    self._abandon(ticket)
+                    raise
+                
+                waited = self._clock() - started
+                self._record_admission(waited)
+                return waited
+        finally:
+            if unregister is not None:
+                unregister()
+    
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Wait without blocking the event loop until the budget allows; return seconds waited."""
+        if not self.enabled:
+            return 0.0
+        
+        started = self._clock()
+        with self._condition:
+            ticket = self._enqueue()
+        try:
+            while True:
+                with self._condition:
+                    wait = self._try_admit(ticket, tokens)
+                    if wait == 0.0:
+                        waited = self._clock() - started
+                        self._record_admission(waited)
+                        return waited
+                    self._check_deadline(ticket, started, wait)
+                await await_cancellable(asyncio.sleep(wait if wait > 0 else 0.01))
+        except BaseException:
+            with self._condition:
+                self._abandon(ticket)
+            raise
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and rejection metrics."""
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self.max_queue_depth,
+                "admitted": self.admitted,
+                "rejections": self.rejections,
+                "total_wait_seconds": self.total_wait_seconds,
+                "avg_wait_seconds": self.total_wait_seconds / self.admitted if self.admitted else 0.0,
+                "max_wait_seconds": self.max_wait_seconds
+            }
+
+
+class RateLimitedAIClient(DelegatingAIClient):
+    """AI client decorator that admits every call through a RateLimiter."""
+    
+    def __init__(self, client: Union[AIClient, AsyncAIClient], limiter: Optional['RateLimiter'] = None):
+        """Initialize with the client to wrap and the limiter to go through."""
+        super().__init__(client)
+        self.limiter = limiter if limiter is not None else get_rate_limiter()
+    
+    def _response_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """Estimate tokens for a character response."""
+        params = getattr(self.client, "response_params", {})
+        return estimate_tokens(messages, params.get("max_tokens", 0))
+    
+    def _judge_tokens(self, prompt: str) -> int:
+        """Estimate tokens for a judge response."""
+        params = getattr(self.client, "judge_params", {})
+        return estimate_tokens([{"role": "user", "content": prompt}], params.get("max_tokens", 0))
+    
+    def generate_response(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response once the limiter admits it."""
+        self.limiter.acquire(self._response_tokens(messages))
+        return self.client.generate_response(messages)
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response once the limiter admits it."""
+        self.limiter.acquire(self._judge_tokens(prompt))
+        return self.client.generate_judge_response(prompt, **judge_call_kwargs(response_format, max_tokens))
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a response once the limiter admits it."""
+        self.limiter.acquire(self._response_tokens(messages))
+        yield from self.client.stream_response(messages)
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response asynchronously once the limiter admits it."""
+        await self.limiter.acquire_async(self._response_tokens(messages))
+        return await super().generate_response_async(messages)
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response asynchronously once the limiter admits it."""
+        await self.limiter.acquire_async(self._judge_tokens(prompt))
+        return await super().generate_judge_response_async(prompt, response_format, max_tokens)
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a response asynchronously once the limiter admits it."""
+        await self.limiter.acquire_async(self._response_tokens(messages))
+        async for delta in super().stream_response_async(messages):
+            yield delta
+    
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get the limiter's queue and wait metrics."""
+        return self.limiter.get_stats()
+
+
+# Global rate limiter shared by every client in the process
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter, creating it from configuration on first use."""
+    global _rate_limiter
+    
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                from .config import get_config
+                _rate_limiter = RateLimiter.from_config(get_config())
+    
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Replace the process-wide rate limiter."""
+    global _rate_limiter
+    
+    with _rate_limiter_lock:
+        _rate_limiter = limiter
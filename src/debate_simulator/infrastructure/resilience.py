@@ -0,0 +1,221 @@
+from typing import Callable, Awaitable, Dict, Any, Optional, TypeVar
+import asyncio
+import logging
+import random
+import threading
+import time
+
+from .cancellation import await_cancellable, cancellable_sleep
+from .errors import TransientAIError, CircuitOpenError
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """Retries transient AI errors with jittered exponential backoff."""
+    
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        sleep: Callable[[float], None] = cancellable_sleep,
+        rng: Callable[[], float] = random.random
+    ):
+        """Initialize the policy; ``max_attempts`` counts the first try.
+        
+        The default ``sleep`` wakes early (raising ``RequestCancelledError``)
+        when the caller's cancellation token fires during a backoff.
+        """
+        if max_attempts < 1:
+            raise ValueError("Retry policy needs at least one attempt")
+        
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.rng = rng
+    
+    @classmethod
+    def from_config(cls, config) -> 'RetryPolicy':
+        """Create a retry policy from an ``AppConfig``."""
+        return cls(
+            max_attempts=config.ai_retry_attempts,
+            base_delay=config.ai_retry_base_delay,
+            max_delay=config.ai_retry_max_delay
+        )
+    
+    def compute_delay(self, attempt: int, error: TransientAIError) -> float:
+        """Delay before retry number ``attempt`` (1-based), honoring ``Retry-After``."""
+        if error.retry_after is not None:
+            return min(error.retry_after, self.max_delay)
+        
+        # Full jitter keeps concurrent debates from retrying in lockstep
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self.rng() * ceiling
+    
+    def call(self, operation: Callable[[], T]) -> T:
+        """Run ``operation``, retrying transient failures."""
+        attempt = 1
+        while True:
+            try:
+                return operation()
+            except TransientAIError as e:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.compute_delay(attempt, e)
+                logging.warning(f"[AI RETRY] attempt {attempt} failed ({e}); retrying in {delay:.2f}s")
+                self.sleep(delay)
+                attempt += 1
+    
+    async def call_async(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Await ``operation``, retrying transient failures without blocking the loop."""
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except TransientAIError as e:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.compute_delay(attempt, e)
+                logging.warning(f"[AI RETRY] attempt {attempt} failed ({e}); retrying in {delay:.2f}s")
+                await await_cancellable(asyncio.sleep(delay))
+                attempt += 1
+
+
+class CircuitBreaker:
+    """Fails fast after repeated transient failures until a cool-down passes."""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self.rejected_calls = 0
+    
+    @classmethod
+    def from_config(cls, config) -> 'CircuitBreaker':
+        """Create a circuit breaker from an ``AppConfig``."""
+        return cls(
+            failure_threshold=config.ai_circuit_failure_threshold,
+            recovery_timeout=config.ai_circuit_recovery_timeout
+        )
+    
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the cool-down has passed."""
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        """Resolve the state; callers must hold the lock."""
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+    
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call is currently allowed."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                # Let exactly one trial call probe the provider
+                self._trial_in_flight = True
+                return
+            
+            self.rejected_calls += 1
+            remaining = max(self.recovery_timeout - (self._clock() - self._opened_at), 0.0)
+            raise CircuitOpenError(
+                f"AI provider unavailable; circuit open for another {remaining:.1f}s",
+                retry_after=remaining
+            )
+    
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                    logging.error(f"[AI CIRCUIT] opened after {self._failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+    
+    def release(self) -> None:
+        """Give up a call without judging the provider (e.g. it was cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def settle(self, healthy: Optional[bool]) -> None:
+        """Record a call's outcome: a success, a transient failure, or None to just give up the call."""
+        if healthy is None:
+            self.release()
+        elif healthy:
+            self.record_success()
+        else:
+            self.record_failure()
+    
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        self.record_success()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters."""
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected_calls
+            }
+
+
+# Global circuit breaker shared by every client in the process
+_circuit_breaker: Optional[CircuitBreaker] = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker, creating it from configuration on first use."""
+    global _circuit_breaker
+    
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                from .config import get_config
+                _circuit_breaker = CircuitBreaker.from_config(get_config())
+    
+    return _circuit_breaker
+
+
+def set_circuit_breaker(breaker: Optional[CircuitBreaker]) -> None:
+    """Replace the process-wide circuit breaker."""
+    global _circuit_breaker
+    
+    with _circuit_breaker_lock:
+        _circuit_breaker = breaker
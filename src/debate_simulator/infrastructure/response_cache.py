@@ -0,0 +1,328 @@
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Union
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from .ai_client import AIClient, AsyncAIClient, DelegatingAIClient, _split_into_deltas, judge_call_kwargs
+
+
+def request_fingerprint(model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+    """Compute a stable content hash for a completion request."""
+    canonical = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CacheStats:
+    """Counters describing response cache effectiveness."""
+    
+    def __init__(self):
+        """Initialize all counters at zero."""
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bypasses = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "bypasses": self.bypasses,
+            "hit_rate": self.hit_rate
+        }
+
+
+class ResponseCache:
+    """Bounded LRU cache of completions with TTL expiry and an optional SQLite tier."""
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 3600.0,
+        disk_path: Optional[str] = None,
+        clock=time.time
+    ):
+        """Initialize the cache; ``ttl_seconds=None`` disables expiry."""
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry")
+        
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    @classmethod
+    def from_config(cls, config) -> 'ResponseCache':
+        """Create a cache from an ``AppConfig``."""
+        return cls(
+            max_entries=config.response_cache_max_entries,
+            ttl_seconds=config.response_cache_ttl or None,
+            disk_path=config.response_cache_path
+        )
+    
+    def _is_expired(self, created_at: float) -> bool:
+        """Check whether an entry created at ``created_at`` has outlived the TTL."""
+        return self.ttl_seconds is not None and self._clock() - created_at > self.ttl_seconds
+    
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, promoting it to most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._is_expired(created_at):
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+                self._delete_from_disk(key)
+                self.stats.expirations += 1
+            
+            entry = self._load_from_disk(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._is_expired(created_at):
+                    self._store_in_memory(key, value, created_at)
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    return value
+                self._delete_from_disk(key)
+                self.stats.expirations += 1
+            
+            self.stats.misses += 1
+            return None
+    
+    def record_bypass(self) -> None:
+        """Count a request that skipped the cache."""
+        with self._lock:
+            self.stats.bypasses += 1
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a response in memory and, when configured, on disk."""
+        created_at = self._clock()
+        with self._lock:
+            self._store_in_memory(key, value, created_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, created_at)
+                )
+                self._db.commit()
+    
+    def _store_in_memory(self, key: str, value: str, created_at: float) -> None:
+        """Insert into the LRU, evicting the least recently used entries."""
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+    
+    def _load_from_disk(self, key: str) -> Optional[tuple]:
+        """Read an entry from the disk tier."""
+        if self._db is None:
+            return None
+        return self._db.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+    
+    def _delete_from_disk(self, key: str) -> None:
+        """Remove an entry from the disk tier."""
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters."""
+        with self._lock:
+            stats = self.stats.to_dict()
+            stats["entries"] = len(self._entries)
+            return stats
+    
+    def clear(self) -> None:
+        """Drop every cached entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+    
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class CachingAIClient(DelegatingAIClient):
+    """AI client decorator that serves repeated requests from a ResponseCache."""
+    
+    def __init__(
+        self,
+        client: Union[AIClient, AsyncAIClient],
+        cache: Optional[ResponseCache] = None,
+        skip_nonzero_temperature: bool = True
+    ):
+        """Initialize with the client to wrap and the cache to consult.
+        
+        Requests sampled at a non-zero temperature bypass the cache unless
+        ``skip_nonzero_temperature`` is turned off.
+        """
+        super().__init__(client)
+        self.cache = cache if cache is not None else ResponseCache()
+        self.skip_nonzero_temperature = skip_nonzero_temperature
+    
+    def _response_key(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Cache key for a character response, or None when caching is bypassed."""
+        return self._key("response", messages, getattr(self.client, "response_params", {}))
+    
+    def _judge_key(self, prompt: str, max_tokens: Optional[int] = None) -> Optional[str]:
+        """Cache key for a judge response, or None when caching is bypassed."""
+        messages = [{"role": "user", "content": prompt}]
+        return self._key("judge", messages, _judge_call_params(self.client, max_tokens))
+    
+    def _key(self, kind: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> Optional[str]:
+        """Fingerprint a request, honoring the non-zero temperature opt-out."""
+        if self.skip_nonzero_temperature and params.get("temperature", 0) != 0:
+            self.cache.record_bypass()
+            return None
+        
+        model = getattr(self.client, "model", type(self.client).__name__)
+        return request_fingerprint(model, messages, {"kind": kind, **params})
+    
+    def _store(self, key: Optional[str], response: str) -> None:
+        """Cache a successful response."""
+        if key is not None and response and not response.startswith("Error"):
+            self.cache.set(key, response)
+    
+    def generate_response(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response, reusing a cached completion when available."""
+        key = self._response_key(messages)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            logging.debug("[CACHE HIT] character response")
+            return cached
+        
+        response = self.client.generate_response(messages)
+        self._store(key, response)
+        return response
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response, reusing a cached completion when available."""
+        key = self._judge_key(prompt, max_tokens)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            logging.debug("[CACHE HIT] judge response")
+            return cached
+        
+        response = self.client.generate_judge_response(prompt, **judge_call_kwargs(response_format, max_tokens))
+        self._store(key, response)
+        return response
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a response, replaying cached completions as word deltas."""
+        key = self._response_key(messages)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            yield from _split_into_deltas(cached)
+            return
+        
+        deltas = []
+        for delta in self.client.stream_response(messages):
+            deltas.append(delta)
+            yield delta
+        self._store(key, "".join(deltas).strip())
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response asynchronously, reusing a cached completion when available."""
+        key = self._response_key(messages)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+        
+        response = await super().generate_response_async(messages)
+        self._store(key, response)
+        return response
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response asynchronously, reusing a cached completion when available."""
+        key = self._judge_key(prompt, max_tokens)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+        
+        response = await super().generate_judge_response_async(prompt, response_format, max_tokens)
+        self._store(key, response)
+        return response
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a response asynchronously, replaying cached completions as word deltas."""
+        key = self._response_key(messages)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            for delta in _split_into_deltas(cached):
+                yield delta
+            return
+        
+        deltas = []
+        async for delta in super().stream_response_async(messages):
+            deltas.append(delta)
+            yield delta
+        self._store(key, "".join(deltas).strip())
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters of the underlying cache."""
+        return self.cache.get_stats()
+
+
+def _judge_call_params(client: Any, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """Sampling parameters of a judge call, with its reply budget when the call sets one."""
+    params = dict(getattr(client, "judge_params", {}))
+    if max_tokens is not None:
+        params["max_tokens"] = max_tokens
+    return params
@@ -0,0 +1,310 @@
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Iterator, AsyncIterator, Tuple, Union
+import asyncio
+import threading
+
+from .ai_client import AIClient, AsyncAIClient, DelegatingAIClient, _split_into_deltas, judge_call_kwargs
+from .cancellation import CancellationToken, current_cancellation_token
+from .errors import RequestCancelledError
+from .response_cache import _judge_call_params, request_fingerprint
+
+
+class _LeaderGaveUp(Exception):
+    """The leader stopped for its own reasons, so a follower has to make the call itself."""
+    pass
+
+
+def _gave_up(error: Optional[BaseException]) -> bool:
+    """Check whether the leader was cancelled or abandoned by its caller rather than the call failing."""
+    return isinstance(error, (RequestCancelledError, asyncio.CancelledError, GeneratorExit))
+
+
+class _InFlightCall:
+    """A pending call that followers can wait on from any thread."""
+    
+    def __init__(self):
+        """Initialize an unfinished call."""
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+        self._lock = threading.Lock()
+        self._waiters: List[threading.Event] = []
+    
+    def finish(self, result: Optional[str] = None, error: Optional[BaseException] = None) -> None:
+        """Record the leader's outcome and wake every follower."""
+        with self._lock:
+            self.result = result
+            self.error = error
+            self.done.set()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.set()
+    
+    def wait(self, cancel_token: Optional[CancellationToken] = None) -> str:
+        """Block until the leader finishes or ``cancel_token`` fires, then return (or raise) the outcome.
+
+        Raises ``_LeaderGaveUp`` if the leader was cancelled, since that says
+        nothing about the call this follower still wants made.
+        """
+        if cancel_token is None:
+            self.done.wait()
+        else:
+            woken = threading.Event()
+            with self._lock:
+                if not self.done.is_set():
+                    self._waiters.append(woken)
+            unregister = cancel_token.register(woken.set)
+            try:
+                woken.wait()
+            finally:
+                unregister()
+                with self._lock:
+                    if woken in self._waiters:
+                        self._waiters.remove(woken)
+            if not self.done.is_set():
+                raise cancel_token.error()
+        
+        if _gave_up(self.error):
+            raise _LeaderGaveUp()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one outstanding call."""
+    
+    def __init__(self):
+        """Initialize empty in-flight tables and counters."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._async_calls: Dict[Tuple[int, str], asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+    
+    def join(self, key: str) -> Tuple[_InFlightCall, bool]:
+        """Get the in-flight call for ``key`` and whether the caller must lead it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                self.coalesced += 1
+                return call, False
+            
+            call = _InFlightCall()
+            self._calls[key] = call
+            self.executed += 1
+            return call, True
+    
+    def complete(self, key: str, call: _InFlightCall, result: Optional[str] = None, error: Optional[BaseException] = None) -> None:
+        """Publish the leader's outcome and release every follower."""
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        call.finish(result, error)
+    
+    def follow(self, key: str) -> Tuple[_InFlightCall, Optional[str]]:
+        """Join the call for ``key``, waiting out any leader; returns the call to lead, or None and the result.
+
+        Followers wait only as long as their own cancellation token allows.
+        If the leader is cancelled, the waiting followers join again and one
+        of them leads a fresh call.
+        """
+        cancel_token = current_cancellation_token()
+        while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            call, leader = self.join(key)
+            if leader:
+                return call, None
+            try:
+                return None, call.wait(cancel_token)
+            except _LeaderGaveUp:
+                continue
+    
+    def do(self, key: str, operation: Callable[[], str]) -> str:
+        """Run ``operation`` unless an identical call is in flight, then share its result."""
+        call, result = self.follow(key)
+        if call is None:
+            return result
+        
+        try:
+            result = operation()
+        except BaseException as e:
+            self.complete(key, call, error=e)
+            raise
+        self.complete(key, call, result=result)
+        return result
+    
+    def join_async(self, key: str) -> Tuple[asyncio.Future, bool]:
+        """Async twin of ``join``; futures are scoped to the running event loop."""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            future = self._async_calls.get(loop_key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            
+            future = loop.create_future()
+            self._async_calls[loop_key] = future
+            self.executed += 1
+            return future, True
+    
+    def complete_async(self, key: str, future: asyncio.Future, result: Optional[str] = None, error: Optional[BaseException] = None) -> None:
+        """Publish the async leader's outcome."""
+        loop_key = (id(future.get_loop()), key)
+        with self._lock:
+            if self._async_calls.get(loop_key) is future:
+                del self._async_calls[loop_key]
+        if future.done():
+            return
+        if _gave_up(error):
+            # Followers were not cancelled themselves; they join again and one of them leads
+            error = _LeaderGaveUp()
+        if error is not None:
+            future.set_exception(error)
+            # Mark retrieved so a leader without followers does not log a warning
+            future.exception()
+        else:
+            future.set_result(result)
+    
+    async def follow_async(self, key: str) -> Tuple[Optional[asyncio.Future], Optional[str]]:
+        """Async twin of ``follow``."""
+        while True:
+            future, leader = self.join_async(key)
+            if leader:
+                return future, None
+            try:
+                # Shield so a cancelled follower does not cancel the shared call
+                return None, await asyncio.shield(future)
+            except _LeaderGaveUp:
+                continue
+    
+    async def do_async(self, key: str, operation: Callable[[], Awaitable[str]]) -> str:
+        """Await ``operation`` unless an identical call is in flight, then share its result."""
+        future, result = await self.follow_async(key)
+        if future is None:
+            return result
+        
+        try:
+            result = await operation()
+        except BaseException as e:
+            self.complete_async(key, future, error=e)
+            raise
+        self.complete_async(key, future, result=result)
+        return result
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executed/coalesced counters."""
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._async_calls)
+            }
+
+
+class SingleFlightAIClient(DelegatingAIClient):
+    """AI client decorator that shares one upstream call among identical concurrent requests."""
+    
+    def __init__(self, client: Union[AIClient, AsyncAIClient], group: Optional[SingleFlight] = None):
+        """Initialize with the client to wrap and an optional shared group."""
+        super().__init__(client)
+        self.group = group if group is not None else SingleFlight()
+    
+    def _response_key(self, messages: List[Dict[str, str]]) -> str:
+        """Key identifying an identical character request."""
+        model = getattr(self.client, "model", type(self.client).__name__)
+        params = getattr(self.client, "response_params", {})
+        return request_fingerprint(model, messages, {"kind": "response", **params})
+    
+    def _judge_key(self, prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Key identifying an identical judge request."""
+        model = getattr(self.client, "model", type(self.client).__name__)
+        params = _judge_call_params(self.client, max_tokens)
+        return request_fingerprint(model, [{"role": "user", "content": prompt}], {"kind": "judge", **params})
+    
+    def generate_response(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response, joining an identical in-flight call if there is one."""
+        return self.group.do(self._response_key(messages), lambda: self.client.generate_response(messages))
+    
+    def generate_judge_response(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response, joining an identical in-flight call if there is one."""
+        return self.group.do(
+            self._judge_key(prompt, max_tokens),
+            lambda: self.client.generate_judge_response(prompt, **judge_call_kwargs(response_format, max_tokens))
+        )
+    
+    def stream_response(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Stream a response; followers replay the leader's completed text."""
+        key = self._response_key(messages)
+        call, result = self.group.follow(key)
+        if call is None:
+            yield from _split_into_deltas(result)
+            return
+        
+        deltas = []
+        try:
+            for delta in self.client.stream_response(messages):
+                deltas.append(delta)
+                yield delta
+        except BaseException as e:
+            self.group.complete(key, call, error=e)
+            raise
+        self.group.complete(key, call, result="".join(deltas).strip())
+    
+    async def generate_response_async(self, messages: List[Dict[str, str]]) -> str:
+        """Generate a response asynchronously, joining an identical in-flight call."""
+        return await self.group.do_async(
+            self._response_key(messages), lambda: DelegatingAIClient.generate_response_async(self, messages)
+        )
+    
+    async def generate_judge_response_async(
+        self,
+        prompt: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate a judge response asynchronously, joining an identical in-flight call."""
+        return await self.group.do_async(
+            self._judge_key(prompt, max_tokens),
+            lambda: DelegatingAIClient.generate_judge_response_async(self, prompt, response_format, max_tokens)
+        )
+    
+    async def stream_response_async(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream a response asynchronously; followers replay the leader's completed text."""
+        key = self._response_key(messages)
+        future, result = await self.group.follow_async(key)
+        if future is None:
+            for delta in _split_into_deltas(result):
+                yield delta
+            return
+        
+        deltas = []
+        try:
+            async for delta in super().stream_response_async(messages):
+                deltas.append(delta)
+                yield delta
+        except BaseException as e:
+            self.group.complete_async(key, future, error=e)
+            raise
+        self.group.complete_async(key, future, result="".join(deltas).strip())
+    
+    def get_single_flight_stats(self) -> Dict[str, Any]:
+        """Get executed/coalesced counters of the underlying group."""
+        return self.group.get_stats()
+
+
+# Global group shared by every client in the process
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight group."""
+    return _single_flight
@@ -7,10 +7,17 @@ from typing import Dict, Any, List
 # Import the refactored application
 from ..infrastructure.config import get_config_manager, validate_environment
 from ..infrastructure.ai_client import create_ai_client
+from ..infrastructure.response_cache import CachingAIClient, ResponseCache
+from ..infrastructure.resilience import RetryPolicy
+from ..infrastructure.rate_limiter import RateLimitedAIClient, get_rate_limiter
+from ..infrastructure.single_flight import SingleFlightAIClient, get_single_flight
 from ..infrastructure.logging_config import setup_default_logging, log_debate_start, log_debate_end
+from ..infrastructure.payload_trace import configure_payload_trace, is_payload_trace_configured
 from ..application.debate_service import DebateService
 from ..application.character_service import CharacterService
-from ..domain.debate.models import DebateSettings
+from ..domain.debate.models import DebateSettings, DebateMessage, RoundMode, TimeoutFallback, JudgeCadence
+from ..domain.debate.events import BackpressurePolicy
+from ..domain.debate.memory import create_summarizer
 from ..domain.topics import get_default_topics
 from .ui.styles import get_css_styles
 from .ui.components import (
@@ -27,6 +34,9 @@ class StreamlitDebateApp:
         # Setup configuration and logging
         self.config_manager = get_config_manager()
         setup_default_logging()
+        logging_config = self.config_manager.get_logging_config()
+        if logging_config["payload_trace_enabled"] and not is_payload_trace_configured():
+            configure_payload_trace(logging_config["payload_trace_file"], logging_config["payload_trace_sample_rate"])
         
         # Validate environment
         validation = validate_environment()
@@ -41,10 +51,44 @@ class StreamlitDebateApp:
         if ai_config["use_mock"]:
             self.ai_client = create_ai_client("mock")
         else:
-            self.ai_client = create_ai_client("openai", api_key=ai_config["api_key"])
+            self.ai_client = create_ai_client(
+                "openai",
+                api_key=ai_config["api_key"],
+                model=ai_config["model"],
+                api_base=ai_config["api_base"],
+                structured_output=ai_config["structured_output"],
+                retry_policy=RetryPolicy.from_config(self.config_manager.config)
+            )
+        
+        # Every session in the process shares one request/token budget
+        if self.config_manager.get_rate_limit_config()["enabled"]:
+            self.ai_client = RateLimitedAIClient(self.ai_client, get_rate_limiter())
+        
+        # Identical in-flight prompts from concurrent sessions share one call
+        if self.config_manager.config.single_flight_enabled:
+            self.ai_client = SingleFlightAIClient(self.ai_client, get_single_flight())
+        
+        cache_config = self.config_manager.get_cache_config()
+        if cache_config["enabled"]:
+            self.ai_client = CachingAIClient(
+                self.ai_client,
+                ResponseCache.from_config(self.config_manager.config),
+                skip_nonzero_temperature=cache_config["skip_nonzero_temperature"]
+            )
         
         self.character_service = CharacterService()
-        self.debate_service = DebateService(self.ai_client, self.character_service)
+        journal_config = self.config_manager.get_journal_config()
+        event_config = self.config_manager.get_event_config()
+        self.debate_service = DebateService(
+            self.ai_client,
+            self.character_service,
+            journal_dir=journal_config["directory"] if journal_config["enabled"] else None,
+            journal_fsync_interval=journal_config["fsync_interval"],
+            event_backpressure=BackpressurePolicy(event_config["backpressure"]),
+            event_buffer_size=event_config["buffer_size"],
+            summarizer=create_summarizer(**self.config_manager.get_memory_config(), ai_client=self.ai_client),
+            judge_options=self.config_manager.get_judge_config()
+        )
         
         # Setup UI callbacks
         self._setup_callbacks()
@@ -55,6 +99,7 @@ class StreamlitDebateApp:
     def _setup_callbacks(self):
         """Setup callbacks for debate events."""
         self.debate_service.register_ui_callback("message_generated", self._on_message_generated)
+        self.debate_service.register_ui_callback("message_delta", self._on_message_delta)
         self.debate_service.register_ui_callback("round_completed", self._on_round_completed)
         self.debate_service.register_ui_callback("judge_feedback", self._on_judge_feedback)
         self.debate_service.register_ui_callback("session_completed", self._on_session_completed)
@@ -74,8 +119,31 @@ class StreamlitDebateApp:
         if "participants" not in st.session_state:
             st.session_state.participants = []
     
+    def _on_message_delta(self, delta, character, round_num):
+        """Handle a streamed token by repainting the in-progress message."""
+        stream = st.session_state.get("streaming_message")
+        if not stream or stream["character"] is not character:
+            stream = {"character": character, "text": "", "placeholder": st.empty()}
+            st.session_state.streaming_message = stream
+        
+        stream["text"] += delta
+        partial_message = DebateMessage(
+            round_number=round_num,
+            speaker_name=character.name,
+            message=stream["text"],
+            timestamp=datetime.now()
+        )
+        render_debate_message(
+            partial_message,
+            character,
+            st.session_state.get("competitive_mode", False),
+            container=stream["placeholder"]
+        )
+    
     def _on_message_generated(self, message, character):
         """Handle message generated callback."""
+        # The streamed placeholder already shows this message
+        st.session_state.streaming_message = None
         st.session_state.debate_messages.append({
             "message": message,
             "character": character,
@@ -199,7 +267,47 @@ class StreamlitDebateApp:
             min_value=0.0,
             max_value=5.0,
             value=self.config_manager.config.default_delay,
-            step=0.5
+            step=0.5,
+            help="Display pacing only; replies keep generating in the background"
+        )
+        
+        # Round format
+        round_modes = {
+            "Sequential replies": RoundMode.SEQUENTIAL,
+            "Simultaneous statements (panel)": RoundMode.SIMULTANEOUS,
+            "Simultaneous opening & closing": RoundMode.OPENING_CLOSING
+        }
+        st.session_state.round_mode = round_modes[st.selectbox(
+            "Round Format",
+            list(round_modes),
+            help="Simultaneous rounds have every participant answer the same prompt at once"
+        )]
+        
+        # Turn deadline
+        st.session_state.timeout_per_response = st.slider(
+            "Time limit per reply (seconds):",
+            min_value=5,
+            max_value=60,
+            value=30,
+            step=5,
+            help="Replies that take longer are cut off"
+        )
+        timeout_fallbacks = {
+            "Skip the speaker": TimeoutFallback.SKIP,
+            "Say a stock line": TimeoutFallback.CANNED,
+            "Repeat their last point": TimeoutFallback.CACHED,
+            "Retry with a faster model": TimeoutFallback.MODEL
+        }
+        st.session_state.timeout_fallback = timeout_fallbacks[st.selectbox(
+            "When a reply runs out of time",
+            list(timeout_fallbacks)
+        )]
+        
+        # Long-debate memory
+        st.session_state.summary_memory = st.checkbox(
+            "Summarize Older Rounds",
+            value=False,
+            help="Keep the last two rounds verbatim and a running summary of the rest, so long debates stay coherent"
         )
         
         # Competitive mode
@@ -208,6 +316,25 @@ class StreamlitDebateApp:
             value=self.config_manager.config.enable_competitive_mode,
             help="Characters have dynamic stats that change based on performance"
         )
+        
+        st.session_state.pipelined_judging = st.checkbox(
+            "Judge in Background",
+            value=False,
+            disabled=not st.session_state.competitive_mode,
+            help="Start the next round while the judge scores the last one; stat changes apply a turn later"
+        )
+        
+        judge_cadences = {
+            "Every round": JudgeCadence.EVERY_ROUND,
+            "Every 3 rounds": JudgeCadence.EVERY_K_ROUNDS,
+            "End of debate only": JudgeCadence.END_OF_DEBATE
+        }
+        st.session_state.judge_cadence = judge_cadences[st.selectbox(
+            "Judging Frequency",
+            list(judge_cadences),
+            disabled=not st.session_state.competitive_mode,
+            help="Judging several rounds in one call saves judge requests on long debates; stat changes land later"
+        )]
     
     def _render_character_selection_sidebar(self):
         """Render character selection in sidebar."""
@@ -381,7 +508,14 @@ class StreamlitDebateApp:
             settings = DebateSettings(
                 total_rounds=st.session_state.rounds,
                 response_delay=st.session_state.delay,
-                competitive_mode=st.session_state.competitive_mode
+                competitive_mode=st.session_state.competitive_mode,
+                pipelined_judging=st.session_state.get("pipelined_judging", False),
+                judge_cadence=st.session_state.get("judge_cadence", JudgeCadence.EVERY_ROUND),
+                round_mode=st.session_state.get("round_mode", RoundMode.SEQUENTIAL),
+                timeout_per_response=st.session_state.get("timeout_per_response", 30),
+                timeout_fallback=st.session_state.get("timeout_fallback", TimeoutFallback.SKIP),
+                fallback_model=self.config_manager.config.fallback_model,
+                summary_memory=st.session_state.get("summary_memory", False)
             )
             
             # Create debate session
@@ -415,7 +549,7 @@ class StreamlitDebateApp:
             
             # Rerun to update UI
             st.rerun()
-            
+        
         except Exception as e:
             st.error(f"Error starting debate: {str(e)}")
             st.session_state.debate_running = False
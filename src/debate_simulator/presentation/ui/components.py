@@ -10,8 +10,17 @@ from .styles import (
 )
 
 
-def render_debate_message(message: DebateMessage, character: Character, competitive_mode: bool = False):
-    """Render a single debate message with proper styling."""
+def render_debate_message(
+    message: DebateMessage,
+    character: Character,
+    competitive_mode: bool = False,
+    container=None
+):
+    """Render a single debate message with proper styling.
+    
+    Pass an ``st.empty()`` placeholder as ``container`` to repaint the same
+    bubble in place while a streamed reply is still arriving.
+    """
     # Get display information
     message_class = get_character_message_class(character.name)
     emoji = get_character_emoji(character.name, character.metadata)
@@ -54,7 +63,8 @@ def render_debate_message(message: DebateMessage, character: Character, competit
     </div>
     """
     
-    st.markdown(html_template, unsafe_allow_html=True)
+    target = container if container is not None else st
+    target.markdown(html_template, unsafe_allow_html=True)
 
 
 def render_competitive_results(results: Dict[str, Any]):
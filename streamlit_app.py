@@ -4,12 +4,17 @@ import time
 from datetime import datetime
 import os
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Callable, Optional
 import openai
 import logging
 import sys
 from logging.handlers import RotatingFileHandler
 
+from src.debate_simulator.application.presenter import DisplayPacer
+from src.debate_simulator.infrastructure.cancellation import CancellationToken, run_cancellable
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.payload_trace import get_payload_tracer
+
 LOG_LEVEL = (
     logging.INFO
 )  # Default log level, can be set to logging.DEBUG for more verbosity
@@ -43,6 +48,10 @@ class StreamlitPoliticalDebate:
     def __init__(self):
         """Initialize the debate system for Streamlit."""
         self.api_key = os.getenv("OPENAI_API_KEY")
+        self.transport = PooledHTTPTransport()
+
+        # Called while waiting on the API; a Streamlit call here lets Stop interrupt the wait
+        self.wait_callback: Optional[Callable[[], Any]] = None
 
         # Define the two AI commentators
         self.democratic_commentator = {
@@ -724,7 +733,6 @@ Communication Style: {commentator['style']}
             context_messages.append({"role": "user", "content": message})
 
             # Use direct HTTP request to bypass proxy issues
-            import requests
             import json
 
             # Prepare the request
@@ -742,25 +750,16 @@ Communication Style: {commentator['style']}
                 "frequency_penalty": 0.1,
             }
 
-            # Before the requests.post call, add:
-            logging.debug(
-                f"[OpenAI REQUEST] Payload for generate_response: {json.dumps(data, indent=2)}"
-            )
+            trace_id = get_payload_tracer().trace_request("response", data)
 
             # Make the request
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30,
-                proxies=None,  # Explicitly disable proxies
-            )
+            response = self._post_chat_completion(headers, data)
 
             if response.status_code == 200:
                 result = response.json()
                 ai_response = result["choices"][0]["message"]["content"].strip()
 
-                logging.debug(f"AI Response: {ai_response}")
+                get_payload_tracer().trace_response(trace_id, ai_response)
 
                 return ai_response
             else:
@@ -774,6 +773,27 @@ Communication Style: {commentator['style']}
                 f"Error generating response: {str(e)}\n\nDebug info:\n{error_details}"
             )
 
+    def _post_chat_completion(self, headers: Dict[str, str], data: Dict[str, Any]):
+        """POST to the chat completions API on a worker thread.
+
+        The script thread keeps calling ``wait_callback`` meanwhile; when the
+        user presses Stop, Streamlit raises there and the request's socket is
+        shut down instead of being waited out.
+        """
+        token = CancellationToken()
+        return run_cancellable(
+            lambda: self.transport.post(
+                "https://api.openai.com/v1/chat/completions",
+                cancel_token=token,
+                headers=headers,
+                json=data,
+                timeout=30,
+                proxies=None,  # Explicitly disable proxies
+            ),
+            token,
+            poll=self.wait_callback,
+        )
+
     def conduct_debate(self, topic: str, rounds: int = 5) -> List[Dict[str, Any]]:
         """Conduct a debate between the two commentators on a given topic."""
         conversation = []
@@ -860,7 +880,6 @@ Respond ONLY with a JSON object like this:
 Be fair and consistent. Consider emotional escalation, argument quality, and originality."""
 
             # Use direct HTTP request to bypass proxy issues
-            import requests
             import json
 
             headers = {
@@ -875,27 +894,15 @@ Be fair and consistent. Consider emotional escalation, argument quality, and ori
                 "temperature": 0.3,
             }
 
-            # Log the OpenAI request payload
-            logging.debug(
-                f"[OpenAI REQUEST] Payload for judge_round: {json.dumps(data, indent=2)}"
-            )
+            trace_id = get_payload_tracer().trace_request("judge", data)
 
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30,
-                proxies=None,
-            )
+            response = self._post_chat_completion(headers, data)
 
             if response.status_code == 200:
                 result = response.json()
                 judge_response = result["choices"][0]["message"]["content"].strip()
 
-                # Log the OpenAI response payload
-                logging.debug(
-                    f"[OpenAI RESPONSE] Response for judge_round: {response.text}"
-                )
+                get_payload_tracer().trace_response(trace_id, judge_response)
 
                 # Parse the JSON response
                 try:
@@ -1806,9 +1813,12 @@ def main():
             # Progress bar
             progress_bar = st.progress(0)
             status_text = st.empty()
+            progress = 0.0
+            debate_system.wait_callback = lambda: progress_bar.progress(progress)
 
             # Conduct debate
             conversation = []
+            pacer = DisplayPacer(delay)
             current_message = (
                 f"Let's discuss {topic}. What are your thoughts on this issue?"
             )
@@ -1984,10 +1994,12 @@ def main():
                         </div>
                         """
 
+                    # Generation of the next turn already overlapped the display delay
+                    pacer.wait()
                     st.html(html_template)
+                    pacer.mark()
 
                     current_message = debate_response
-                    time.sleep(delay)
 
                 # Judge the round in competitive mode
                 if competitive_mode and round_messages:
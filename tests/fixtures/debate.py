@@ -0,0 +1,45 @@
+from typing import List, Optional
+
+from src.debate_simulator.domain.characters.base import Character, CharacterStats
+from src.debate_simulator.domain.debate.judge import DebateJudge
+from src.debate_simulator.domain.debate.models import DebateSettings
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+
+TOPIC = "Test political debate topic"
+
+
+def make_participants(*names: str) -> List[Character]:
+    """Create fresh test characters: Alice (an analyst) and Bob (a pundit) unless ``names`` are given."""
+    if not names:
+        return [
+            Character(name="Alice", role="analyst", personality="Calm", style="Measured", stats=CharacterStats()),
+            Character(name="Bob", role="pundit", personality="Loud", style="Brash", stats=CharacterStats())
+        ]
+    return [
+        Character(name=name, role="pundit", personality="Calm", style="Measured", stats=CharacterStats())
+        for name in names
+    ]
+
+
+def make_speakers(count: int) -> List[Character]:
+    """Create ``count`` fresh test characters named Speaker0, Speaker1, ..."""
+    return make_participants(*(f"Speaker{i}" for i in range(count)))
+
+
+def create_orchestrator(
+    orchestrator_class: type,
+    client,
+    participants: List[Character],
+    judge: Optional[DebateJudge] = None,
+    **settings
+) -> DebateOrchestrator:
+    """Create an orchestrator with a fresh session on ``TOPIC``.
+
+    ``settings`` are ``DebateSettings`` fields; unless given, the debate
+    has one round and replies are not delayed.
+    """
+    orchestrator = orchestrator_class(client, judge)
+    settings.setdefault("total_rounds", 1)
+    settings.setdefault("response_delay", 0.0)
+    orchestrator.create_debate(TOPIC, participants, DebateSettings(**settings))
+    return orchestrator
@@ -0,0 +1,3 @@
+from src.debate_simulator.infrastructure.fake_openai_server import FakeOpenAIServer, LatencyModel
+
+__all__ = ["FakeOpenAIServer", "LatencyModel"]
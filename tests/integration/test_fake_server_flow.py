@@ -0,0 +1,79 @@
+import unittest
+
+from src.debate_simulator.application.debate_service import DebateService
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus
+from src.debate_simulator.infrastructure.ai_client import OpenAIClient
+from src.debate_simulator.infrastructure.fake_openai_server import FakeOpenAIServer
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+
+
+class TestFakeServerDebateFlow(unittest.TestCase):
+    """Integration tests running DebateService against the local OpenAI stand-in."""
+    
+    def setUp(self):
+        """Start the fake server and build the full service stack on top of it."""
+        self.server = FakeOpenAIServer(
+            template="{speaker} argues point {n} forcefully.",
+            latency="uniform:0.0,0.01",
+            fail_first=1,
+            seed=42
+        ).start()
+        self.transport = PooledHTTPTransport()
+        self.ai_client = OpenAIClient(
+            api_key="sk-test123",
+            transport=self.transport,
+            retry_policy=RetryPolicy(sleep=lambda delay: None),
+            circuit_breaker=CircuitBreaker(),
+            api_base=self.server.api_base
+        )
+        self.debate_service = DebateService(self.ai_client)
+    
+    def tearDown(self):
+        """Stop the server and close pooled connections."""
+        self.transport.close()
+        self.server.stop()
+    
+    def test_full_debate_over_http(self):
+        """Test a competitive debate end to end, recovering from an injected 429."""
+        result = self.debate_service.create_debate_session(
+            topic="Test political debate topic",
+            selected_character_types=["democratic_commentator", "republican_commentator"],
+            settings=DebateSettings(total_rounds=2, response_delay=0.0, competitive_mode=True)
+        )
+        self.assertTrue(result["success"])
+        
+        start_result = self.debate_service.start_debate(result["participants"])
+        
+        self.assertTrue(start_result["success"])
+        session = self.debate_service.current_session
+        self.assertEqual(session.status, DebateStatus.COMPLETED)
+        
+        messages = session.conversation.get_all_messages()
+        self.assertEqual(len(messages), 4)
+        self.assertTrue(all("argues point" in msg.message for msg in messages))
+        self.assertFalse(any(msg.metadata.get("error") for msg in messages))
+        
+        # 4 turns + 2 judge calls, plus the injected 429
+        self.assertEqual(self.server.status_counts, {429: 1, 200: 6})
+        self.assertEqual(session.metadata["transport_stats"]["pool_misses"], 1)
+    
+    def test_streamed_debate_over_http(self):
+        """Test that streamed turns arrive as deltas over SSE."""
+        deltas = []
+        self.debate_service.register_ui_callback("message_delta", lambda delta, char, round_num: deltas.append(delta))
+        result = self.debate_service.create_debate_session(
+            topic="Test political debate topic",
+            selected_character_types=["democratic_commentator", "republican_commentator"],
+            settings=DebateSettings(total_rounds=1, response_delay=0.0)
+        )
+        
+        self.debate_service.start_debate(result["participants"])
+        
+        messages = self.debate_service.current_session.conversation.get_all_messages()
+        self.assertEqual("".join(deltas), "".join(msg.message for msg in messages))
+        self.assertTrue(all("ttft_ms" in msg.metadata for msg in messages))
+
+
+if __name__ == "__main__":
+    unittest.main()
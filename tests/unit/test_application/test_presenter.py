@@ -0,0 +1,148 @@
+import threading
+import time
+import unittest
+
+from src.debate_simulator.application.character_service import CharacterService
+from src.debate_simulator.application.debate_service import DebateService
+from src.debate_simulator.application.presenter import DisplayPacer, PacedPresenter
+from src.debate_simulator.domain.characters.base import Character, CharacterStats
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import MockAIClient
+
+
+class _FakeClock:
+    """Manually advanced clock whose sleep moves time forward."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestDisplayPacer(unittest.TestCase):
+    """Test cases for DisplayPacer."""
+    
+    def setUp(self):
+        """Set up a pacer on a fake clock."""
+        self.clock = _FakeClock()
+        self.pacer = DisplayPacer(1.0, clock=self.clock, sleep=self.clock.sleep)
+    
+    def test_first_message_is_not_delayed(self):
+        """Test that nothing waits before the first mark."""
+        self.assertEqual(self.pacer.wait(), 0.0)
+        self.assertEqual(self.clock.sleeps, [])
+    
+    def test_work_between_messages_counts_toward_delay(self):
+        """Test that only the remainder of the interval is slept."""
+        self.pacer.mark()
+        self.clock.now += 0.3  # generating the next reply
+        
+        self.assertAlmostEqual(self.pacer.wait(), 0.7)
+    
+    def test_slow_work_is_not_delayed_further(self):
+        """Test that no sleep happens once the interval has passed."""
+        self.pacer.mark()
+        self.clock.now += 2.0
+        
+        self.assertEqual(self.pacer.wait(), 0.0)
+
+
+class TestPacedPresenter(unittest.TestCase):
+    """Test cases for PacedPresenter."""
+    
+    def setUp(self):
+        """Set up a presenter on a fake clock that records deliveries."""
+        self.clock = _FakeClock()
+        self.delivered = []
+        self.presenter = PacedPresenter(
+            lambda name, *args: self.delivered.append((name, args)),
+            pacer=DisplayPacer(0.5, clock=self.clock, sleep=self.clock.sleep)
+        )
+    
+    def test_events_delivered_in_order_with_pacing_after_messages(self):
+        """Test that only events after a message wait for the cadence."""
+        self.presenter.publish("progress_update", 0.0)
+        self.presenter.publish("message_generated", "first")
+        self.presenter.publish("progress_update", 0.5)
+        self.presenter.publish("message_generated", "second")
+        self.presenter.close()
+        
+        self.presenter.run()
+        
+        self.assertEqual([args[0] for _, args in self.delivered], [0.0, "first", 0.5, "second"])
+        self.assertEqual(self.clock.sleeps, [0.5])
+        self.assertEqual(self.presenter.get_stats()["published"], 5)
+    
+    def test_buffer_is_bounded_and_abort_unblocks_producer(self):
+        """Test that a full buffer blocks the producer until the display aborts."""
+        presenter = PacedPresenter(lambda *args: None, max_buffered=2)
+        results = []
+        producer = threading.Thread(target=lambda: results.extend(presenter.publish("message_generated", i) for i in range(4)))
+        producer.start()
+        time.sleep(0.2)
+        
+        self.assertTrue(producer.is_alive())
+        presenter.abort()
+        producer.join(timeout=1.0)
+        
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(presenter.get_stats()["dropped"], 2)
+
+
+class TestNonBlockingResponseDelay(unittest.TestCase):
+    """Test cases for decoupling generation from display pacing."""
+    
+    def test_orchestrator_ignores_display_delay(self):
+        """Test that generation no longer sleeps between turns."""
+        participants = [
+            Character(name="Alice", role="analyst", personality="Calm", style="Measured", stats=CharacterStats()),
+            Character(name="Bob", role="pundit", personality="Loud", style="Brash", stats=CharacterStats())
+        ]
+        orchestrator = DebateOrchestrator(MockAIClient())
+        orchestrator.create_debate("Test political debate topic", participants, DebateSettings(total_rounds=2, response_delay=1.0))
+        
+        start = time.perf_counter()
+        orchestrator.start_debate(participants)
+        
+        self.assertLess(time.perf_counter() - start, 0.5)
+    
+    def test_service_generates_ahead_of_display(self):
+        """Test that generation finishes in about turns x RTT while display keeps its cadence."""
+        latency, delay = 0.02, 0.15
+        service = DebateService(MockAIClient(latency=latency), CharacterService())
+        displayed = []
+        display_threads = set()
+        
+        def on_message(message, character):
+            displayed.append(message.speaker_name)
+            display_threads.add(threading.current_thread())
+        
+        service.register_ui_callback("message_generated", on_message)
+        result = service.create_debate_session(
+            topic="Test political debate topic",
+            selected_character_types=["democratic_commentator", "republican_commentator"],
+            settings=DebateSettings(total_rounds=2, response_delay=delay)
+        )
+        
+        start = time.perf_counter()
+        self.assertTrue(service.start_debate(result["participants"])["success"])
+        elapsed = time.perf_counter() - start
+        
+        stats = service.current_session.metadata["pacing_stats"]
+        self.assertEqual(service.current_session.status, DebateStatus.COMPLETED)
+        self.assertEqual(len(displayed), 4)
+        self.assertEqual(display_threads, {threading.current_thread()})
+        self.assertLess(stats["generation_seconds"], 4 * latency + delay)
+        self.assertGreaterEqual(elapsed, 3 * delay)
+
+
+if __name__ == '__main__':
+    unittest.main()
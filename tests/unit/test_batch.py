@@ -0,0 +1,122 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from src.debate_simulator.batch import BatchRunner, expand_matrix, load_matrix, main, percentile
+from src.debate_simulator.infrastructure.session_journal import read_journal
+
+TOPICS = ["Should the minimum wage be raised?", "Should college tuition be free?"]
+LINEUPS = [["democratic_commentator", "republican_commentator"]]
+
+
+class TestMatrix(unittest.TestCase):
+    """Test cases for building batch jobs."""
+    
+    def test_expand_matrix_cartesian_product(self):
+        """Test that every combination gets its own job with a stable id."""
+        jobs = expand_matrix(TOPICS, LINEUPS, [{"total_rounds": 1}, {"total_rounds": 2}], repeats=2)
+        
+        self.assertEqual(len(jobs), 8)
+        self.assertEqual(len({job.job_id for job in jobs}), 8)
+        self.assertEqual(jobs[0].job_id, expand_matrix(TOPICS, LINEUPS, [{"total_rounds": 1}])[0].job_id)
+    
+    def test_load_matrix(self):
+        """Test loading a matrix file with default settings."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "matrix.json")
+            with open(path, "w") as f:
+                json.dump({"topics": TOPICS, "lineups": LINEUPS}, f)
+            
+            jobs = load_matrix(path)
+        
+        self.assertEqual([job.topic for job in jobs], TOPICS)
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test cases for BatchRunner."""
+    
+    def setUp(self):
+        """Set up an output path in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, "out", "debates.jsonl")
+        self.jobs = expand_matrix(TOPICS, LINEUPS, [{"total_rounds": 2, "response_delay": 0.0}], repeats=2)
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+    
+    def test_runs_in_parallel_and_streams_jsonl(self):
+        """Test that debates overlap under the concurrency limit and land as JSON lines."""
+        latency = 0.05
+        progress = []
+        runner = BatchRunner(
+            self.output,
+            client_options={"client_type": "mock", "latency": latency},
+            concurrency=4,
+            on_progress=lambda record, summary: progress.append(summary["completed"])
+        )
+        
+        start = time.perf_counter()
+        summary = runner.run(self.jobs)
+        elapsed = time.perf_counter() - start
+        
+        records = read_journal(self.output)
+        self.assertEqual(summary["completed"], 4)
+        self.assertEqual(progress, [1, 2, 3, 4])
+        self.assertEqual({r["job_id"] for r in records}, {job.job_id for job in self.jobs})
+        self.assertEqual(len(records[0]["session"]["conversation"]["rounds"]), 2)
+        # Sequentially this is 4 debates x 4 turns x latency
+        self.assertLess(elapsed, 16 * latency)
+        self.assertGreater(summary["p50_turn_latency_ms"], 0)
+        self.assertGreater(summary["tokens_per_min"], 0)
+    
+    def test_rerun_skips_completed_debates(self):
+        """Test that a second run only does the debates the first one missed."""
+        BatchRunner(self.output, concurrency=2).run(self.jobs[:3])
+        
+        summary = BatchRunner(self.output, concurrency=2).run(self.jobs)
+        
+        self.assertEqual(summary["skipped"], 3)
+        self.assertEqual(summary["completed"], 1)
+        self.assertEqual(len(read_journal(self.output)), 4)
+    
+    def test_invalid_lineup_is_recorded_as_failed(self):
+        """Test that a bad job fails on its own without stopping the batch."""
+        jobs = self.jobs[:1] + expand_matrix(TOPICS[:1], [["no_such_character"]])
+        
+        summary = BatchRunner(self.output).run(jobs)
+        
+        self.assertEqual((summary["completed"], summary["failed"]), (1, 1))
+        self.assertIn("error", [r for r in read_journal(self.output) if r["status"] == "failed"][0])
+    
+    def test_process_pool(self):
+        """Test running debates in worker processes."""
+        summary = BatchRunner(self.output, concurrency=2, processes=2).run(self.jobs[:2])
+        
+        self.assertEqual(summary["completed"], 2)
+        self.assertEqual(len(read_journal(self.output)), 2)
+    
+    def test_command_line(self):
+        """Test the command-line entry point with the mock client."""
+        matrix = os.path.join(self.tmp.name, "matrix.json")
+        with open(matrix, "w") as f:
+            json.dump({"topics": TOPICS[:1], "lineups": LINEUPS, "settings": [{"total_rounds": 1}]}, f)
+        
+        summary = main([matrix, "--out", self.output, "--mock", "--summary-out", os.path.join(self.tmp.name, "s.json")])
+        
+        self.assertEqual(summary["completed"], 1)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "s.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
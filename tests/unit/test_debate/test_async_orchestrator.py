@@ -0,0 +1,111 @@
+import asyncio
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.judge import AIDebateJudge
+from src.debate_simulator.domain.debate.models import DebateStatus
+from src.debate_simulator.infrastructure.ai_client import (
+    AsyncMockAIClient, MockAIClient, ThreadedAsyncAIClient, ensure_async_client
+)
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+
+class TestAsyncMockAIClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncMockAIClient."""
+    
+    async def test_latency_is_awaited(self):
+        """Test that concurrent calls overlap their injected latency."""
+        client = AsyncMockAIClient(fixed_response="Hi", latency=0.1)
+        
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.generate_response_async([{"role": "user", "content": "x"}]) for _ in range(10)
+        ])
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(responses, ["Hi"] * 10)
+        self.assertEqual(client.call_count, 10)
+        self.assertLess(elapsed, 0.5)
+    
+    async def test_ensure_async_client_wraps_sync_client(self):
+        """Test that synchronous clients are adapted to the async interface."""
+        sync_client = MockAIClient(fixed_response="Sync", fixed_judge_response="{}")
+        async_client = ensure_async_client(sync_client)
+        
+        self.assertIsInstance(async_client, ThreadedAsyncAIClient)
+        self.assertEqual(await async_client.generate_response_async([]), "Sync")
+        self.assertEqual(await async_client.generate_judge_response_async("judge"), "{}")
+        
+        native_client = AsyncMockAIClient()
+        self.assertIs(ensure_async_client(native_client), native_client)
+
+
+class TestAsyncDebateOrchestrator(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncDebateOrchestrator."""
+    
+    def _create_orchestrator(self, client, competitive_mode=False):
+        """Create an orchestrator with a fresh debate session."""
+        judge = AIDebateJudge(client) if competitive_mode else None
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            AsyncDebateOrchestrator, client, participants, judge, total_rounds=2, competitive_mode=competitive_mode
+        )
+        return orchestrator, participants
+    
+    async def test_debate_runs_to_completion(self):
+        """Test that a debate completes as a coroutine."""
+        client = AsyncMockAIClient(fixed_response="Async reply")
+        orchestrator, participants = self._create_orchestrator(client)
+        generated = []
+        orchestrator.on_message_generated = lambda msg, char: generated.append(msg)
+        
+        await orchestrator.start_debate_async(participants)
+        
+        session = orchestrator.current_session
+        self.assertEqual(session.status, DebateStatus.COMPLETED)
+        self.assertEqual(len(session.conversation.rounds), 2)
+        self.assertEqual(len(generated), 4)
+        self.assertEqual(client.call_count, 4)
+    
+    async def test_competitive_mode_uses_async_judge(self):
+        """Test that rounds are judged through the async judge path."""
+        client = AsyncMockAIClient(
+            fixed_response="Async reply",
+            fixed_judge_response='{"Alice": {"anger": 5, "patience": 0, "uniqueness": 0}}'
+        )
+        orchestrator, participants = self._create_orchestrator(client, competitive_mode=True)
+        
+        await orchestrator.start_debate_async(participants)
+        
+        self.assertEqual(client.judge_call_count, 2)
+        self.assertEqual(participants[0].stats.anger, 60)
+        self.assertIn("final_performance", orchestrator.current_session.metadata)
+    
+    async def test_many_debates_share_one_event_loop(self):
+        """Test that concurrent debates overlap their AI latency."""
+        latency = 0.05
+        runs = [self._create_orchestrator(AsyncMockAIClient(latency=latency)) for _ in range(10)]
+        
+        start = time.perf_counter()
+        await asyncio.gather(*[orch.start_debate_async(parts) for orch, parts in runs])
+        elapsed = time.perf_counter() - start
+        
+        # Ten debates of four turns each would take 2s if run one after another
+        self.assertLess(elapsed, 10 * 4 * latency / 2)
+        for orch, _ in runs:
+            self.assertEqual(orch.current_session.status, DebateStatus.COMPLETED)
+    
+    async def test_sync_client_runs_in_worker_thread(self):
+        """Test that a synchronous client still works with the async orchestrator."""
+        client = MockAIClient(fixed_response="Sync reply")
+        orchestrator, participants = self._create_orchestrator(client)
+        
+        await orchestrator.start_debate_async(participants)
+        
+        messages = orchestrator.current_session.conversation.get_all_messages()
+        self.assertEqual([m.message for m in messages], ["Sync reply"] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
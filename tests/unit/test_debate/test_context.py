@@ -0,0 +1,144 @@
+from datetime import datetime
+import unittest
+
+from src.debate_simulator.domain.debate.context import (
+    ContextBuilder, HeuristicTokenCounter, MESSAGE_OVERHEAD_TOKENS, create_token_counter
+)
+from src.debate_simulator.domain.debate.models import DebateConversation, DebateMessage, DebateRound
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+
+def make_history(count, words=20):
+    """Create ``count`` alternating messages, oldest first."""
+    return [
+        DebateMessage(
+            speaker_name="Alice" if i % 2 == 0 else "Bob",
+            message=f"message {i} " + "word " * words,
+            round_number=i // 2 + 1,
+            timestamp=datetime.now()
+        )
+        for i in range(count)
+    ]
+
+
+class TestHeuristicTokenCounter(unittest.TestCase):
+    """Test cases for the dependency-free token estimator."""
+    
+    def setUp(self):
+        """Set up the counter."""
+        self.counter = HeuristicTokenCounter()
+    
+    def test_common_words_are_single_tokens(self):
+        """Test that short words count as one token each."""
+        self.assertEqual(self.counter.count_text("the cat sat"), 3)
+    
+    def test_long_words_cost_more(self):
+        """Test that long words are split into several tokens."""
+        self.assertGreater(self.counter.count_text("antidisestablishmentarianism"), 1)
+    
+    def test_message_includes_framing_overhead(self):
+        """Test that chat messages include per-message overhead."""
+        message = {"role": "user", "content": "hi"}
+        self.assertEqual(self.counter.count_message(message), MESSAGE_OVERHEAD_TOKENS + 1)
+    
+    def test_factory_always_returns_counter(self):
+        """Test that the factory works with or without tiktoken."""
+        self.assertGreater(create_token_counter("gpt-4o").count_text("hello world"), 0)
+
+
+class TestContextBuilder(unittest.TestCase):
+    """Test cases for token-budgeted context packing."""
+    
+    def test_everything_fits_in_large_budget(self):
+        """Test that all history is kept, oldest first, when it fits."""
+        history = make_history(4)
+        window = ContextBuilder(prompt_token_budget=10000).build(
+            "You are Alice", reversed(history), "Alice", "Topic"
+        )
+        
+        self.assertEqual(window.history_included, 4)
+        self.assertFalse(window.history_truncated)
+        self.assertEqual(window.messages[0]["role"], "system")
+        self.assertEqual(window.messages[-1]["content"], "Topic")
+        self.assertEqual([m["content"] for m in window.messages[1:-1]], [m.message for m in history])
+        self.assertEqual(window.messages[1]["role"], "assistant")
+        self.assertEqual(window.messages[2]["role"], "user")
+    
+    def test_budget_drops_oldest_messages(self):
+        """Test that the oldest messages are dropped to stay within budget."""
+        counter = HeuristicTokenCounter()
+        history = make_history(10)
+        builder = ContextBuilder(counter, prompt_token_budget=120)
+        window = builder.build("You are Alice", reversed(history), "Alice", "Topic")
+        
+        self.assertTrue(window.history_truncated)
+        self.assertLess(window.history_included, 10)
+        self.assertLessEqual(window.prompt_tokens, 120)
+        self.assertEqual(window.prompt_tokens, counter.count_messages(window.messages))
+        self.assertEqual(window.messages[-2]["content"], history[-1].message)
+    
+    def test_history_consumed_lazily(self):
+        """Test that history iteration stops once the budget is exhausted."""
+        consumed = []
+        
+        def newest_first():
+            for msg in reversed(make_history(50)):
+                consumed.append(msg)
+                yield msg
+        
+        ContextBuilder(prompt_token_budget=100).build("You are Alice", newest_first(), "Alice", "Topic")
+        
+        self.assertLess(len(consumed), 50)
+    
+    def test_max_history_messages(self):
+        """Test the optional message-count cap."""
+        window = ContextBuilder(prompt_token_budget=10000, max_history_messages=3).build(
+            "You are Alice", reversed(make_history(8)), "Alice", "Topic"
+        )
+        
+        self.assertEqual(window.history_included, 3)
+        self.assertTrue(window.history_truncated)
+
+
+class TestConversationHistory(unittest.TestCase):
+    """Test cases for newest-first history iteration."""
+    
+    def test_iter_messages_newest_first(self):
+        """Test that messages are yielded newest first across rounds."""
+        conversation = DebateConversation(topic="Test")
+        history = make_history(5)
+        for msg in history:
+            if not conversation.rounds or conversation.rounds[-1].round_number != msg.round_number:
+                conversation.add_round(DebateRound(round_number=msg.round_number))
+            conversation.rounds[-1].add_message(msg)
+        
+        self.assertEqual(list(conversation.iter_messages_newest_first()), list(reversed(history)))
+
+
+class TestOrchestratorContext(unittest.TestCase):
+    """Test cases for the orchestrator's use of the context budget."""
+    
+    def test_prompt_tokens_recorded(self):
+        """Test that each message records its prompt size and respects the budget."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, MockAIClient(fixed_response="A reasonably long mock reply " * 5), participants,
+            total_rounds=4, context_token_budget=600
+        )
+        
+        orchestrator.start_debate(participants)
+        
+        messages = orchestrator.current_session.conversation.get_all_messages()
+        self.assertTrue(messages)
+        for msg in messages:
+            self.assertIn("prompt_tokens", msg.metadata)
+            self.assertLessEqual(msg.metadata["prompt_tokens"], 600)
+        self.assertLess(messages[-1].metadata["context_messages"], len(messages) - 1)
+        summary = orchestrator.get_session_summary()
+        self.assertGreater(summary["participant_stats"]["Alice"]["total_prompt_tokens"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
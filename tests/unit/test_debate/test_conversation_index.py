@@ -0,0 +1,99 @@
+from datetime import datetime
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.models import DebateConversation, DebateMessage, DebateRound, group_by_speaker
+
+
+def make_message(round_number, speaker, text, **metadata):
+    """Create a message with the current timestamp."""
+    return DebateMessage(round_number, speaker, text, datetime.now(), metadata)
+
+
+class TestConversationIndexes(unittest.TestCase):
+    """Test cases for the incrementally maintained DebateConversation indexes."""
+    
+    def setUp(self):
+        """Set up a two-round conversation built both ways the orchestrators do."""
+        self.conversation = DebateConversation(topic="Test")
+        
+        # Round 1: messages added before the round is attached
+        first = DebateRound(round_number=1)
+        first.add_message(make_message(1, "Alice", "one two three", prompt_tokens=10))
+        first.add_message(make_message(1, "Bob", "four five"))
+        self.conversation.add_round(first)
+        
+        # Round 2: messages added after the round is attached
+        second = DebateRound(round_number=2)
+        self.conversation.add_round(second)
+        second.add_message(make_message(2, "Alice", "six", prompt_tokens=5))
+        self.conversation.add_message(make_message(2, "Bob", "seven eight nine ten"))
+    
+    def test_messages_and_context_in_order(self):
+        """Test that the flat list and context window follow transcript order."""
+        texts = [m.message for m in self.conversation.get_all_messages()]
+        
+        self.assertEqual(texts, ["one two three", "four five", "six", "seven eight nine ten"])
+        self.assertEqual([m.message for m in self.conversation.get_messages_for_context(2)], texts[-2:])
+        self.assertEqual([m.message for m in self.conversation.iter_messages_newest_first()], texts[::-1])
+        self.assertEqual(len(self.conversation.rounds[1].messages), 2)
+    
+    def test_speaker_totals(self):
+        """Test per-speaker and overall counts, words and characters."""
+        alice = self.conversation.get_participant_totals("Alice")
+        
+        self.assertEqual(alice, {"messages": 2, "words": 4, "characters": 16, "prompt_tokens": 15})
+        self.assertEqual(self.conversation.get_participant_message_count("Bob"), 2)
+        self.assertEqual(self.conversation.get_participant_message_count("Nobody"), 0)
+        self.assertEqual(self.conversation.get_totals()["words"], 10)
+    
+    def test_group_by_speaker(self):
+        """Test bucketing the transcript by speaker in first-appearance order."""
+        grouped = group_by_speaker(self.conversation.get_all_messages())
+        
+        self.assertEqual(list(grouped), ["Alice", "Bob"])
+        self.assertEqual([m.message for m in grouped["Bob"]], ["four five", "seven eight nine ten"])
+    
+    def test_round_offsets(self):
+        """Test slicing the transcript from a given round."""
+        self.assertEqual([m.message for m in self.conversation.get_messages_since_round(1)], ["six", "seven eight nine ten"])
+        self.assertEqual(self.conversation.get_messages_since_round(5), [])
+    
+    def test_editing_earlier_round_reindexes(self):
+        """Test that adding to an old round keeps the indexes consistent."""
+        self.conversation.rounds[0].add_message(make_message(1, "Carol", "late"))
+        
+        texts = [m.message for m in self.conversation.get_all_messages()]
+        self.assertEqual(texts[2], "late")
+        self.assertEqual([m.message for m in self.conversation.get_messages_since_round(1)], texts[3:])
+    
+    def test_serialization_unchanged(self):
+        """Test that indexes are rebuilt on load and kept out of the dict form."""
+        data = self.conversation.to_dict()
+        
+        restored = DebateConversation.from_dict(data)
+        
+        self.assertEqual(set(data), {"topic", "rounds", "start_time", "end_time"})
+        self.assertEqual(restored.get_totals(), self.conversation.get_totals())
+        self.assertEqual(restored.to_dict(), data)
+    
+    def test_per_turn_reads_do_not_grow_with_history(self):
+        """Benchmark: context and count lookups stay flat as the debate grows."""
+        def time_reads(rounds):
+            conversation = DebateConversation(topic="Test")
+            for n in range(1, rounds + 1):
+                for speaker in ("Alice", "Bob"):
+                    conversation.add_message(make_message(n, speaker, "word " * 20))
+            start = time.perf_counter()
+            for _ in range(500):
+                conversation.get_messages_for_context()
+                conversation.get_participant_message_count("Alice")
+            return time.perf_counter() - start
+        
+        small, large = time_reads(10), time_reads(2000)
+        
+        self.assertLess(large, small * 5 + 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.debate_simulator.application.character_service import CharacterService
+from src.debate_simulator.application.debate_service import DebateService
+from src.debate_simulator.domain.characters.base import Character, CharacterStats
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.events import (
+    BackpressurePolicy, EventBus, MessageDelta, MessageGenerated, ProgressUpdate, RoundCompleted, SessionCompleted
+)
+from src.debate_simulator.domain.debate.models import DebateSettings, RoundMode
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+ALICE = Character(name="Alice", role="analyst", personality="Calm", style="Measured", stats=CharacterStats())
+
+
+def progress(value):
+    """Create a progress event."""
+    return ProgressUpdate(value, 1, "Alice")
+
+
+class TestEventSubscription(unittest.TestCase):
+    """Test cases for EventBus subscriptions and their backpressure policies."""
+    
+    def test_block_waits_for_consumer(self):
+        """Test that a full blocking buffer holds the publisher until an event is taken."""
+        bus = EventBus()
+        subscription = bus.subscribe(max_buffered=1)
+        bus.publish(progress(0.1))
+        publisher = threading.Thread(target=bus.publish, args=(progress(0.2),))
+        publisher.start()
+        time.sleep(0.1)
+        
+        self.assertTrue(publisher.is_alive())
+        self.assertEqual(subscription.get().progress, 0.1)
+        publisher.join(timeout=1.0)
+        
+        self.assertFalse(publisher.is_alive())
+        self.assertEqual(subscription.get().progress, 0.2)
+        self.assertGreater(subscription.get_stats()["blocked_seconds"], 0)
+    
+    def test_drop_progress_keeps_messages(self):
+        """Test that a full buffer drops transient events but never messages."""
+        bus = EventBus()
+        subscription = bus.subscribe(policy=BackpressurePolicy.DROP_PROGRESS, max_buffered=1)
+        
+        bus.publish(progress(0.1))
+        bus.publish(progress(0.2))
+        self.assertEqual(subscription.get_stats()["dropped"], 1)
+        
+        self.assertFalse(subscription.offer(RoundCompleted(None, 1)))
+    
+    def test_coalesce_merges_transient_events(self):
+        """Test that consecutive deltas concatenate and only the latest progress is kept."""
+        bus = EventBus()
+        subscription = bus.subscribe(policy=BackpressurePolicy.COALESCE)
+        
+        bus.publish(progress(0.1))
+        bus.publish(progress(0.2))
+        for delta in ("one ", "two ", "three"):
+            bus.publish(MessageDelta(delta, ALICE, 1))
+        subscription.close()
+        
+        events = list(subscription)
+        self.assertEqual([type(event) for event in events], [ProgressUpdate, MessageDelta])
+        self.assertEqual(events[0].progress, 0.2)
+        self.assertEqual(events[1].delta, "one two three")
+        self.assertEqual(subscription.get_stats()["coalesced"], 3)
+    
+    def test_subscribers_are_independent(self):
+        """Test that a stalled subscriber does not hold up a handler subscriber."""
+        bus = EventBus()
+        stalled = bus.subscribe(policy=BackpressurePolicy.DROP_PROGRESS, max_buffered=1)
+        handled = []
+        done = threading.Event()
+        bus.subscribe(lambda event: (handled.append(event.progress), event.progress == 0.3 and done.set()))
+        
+        for value in (0.1, 0.2, 0.3):
+            bus.publish(progress(value))
+        
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual(handled, [0.1, 0.2, 0.3])
+        self.assertEqual(stalled.get_stats()["dropped"], 2)
+    
+    def test_event_type_filter(self):
+        """Test that subscribers only see the event types they asked for."""
+        bus = EventBus()
+        subscription = bus.subscribe(event_types=[RoundCompleted])
+        
+        bus.publish(progress(0.1))
+        bus.publish(RoundCompleted(None, 1))
+        
+        self.assertTrue(bus.wants(RoundCompleted))
+        self.assertFalse(bus.wants(MessageDelta))
+        self.assertIsInstance(subscription.get(timeout=0), RoundCompleted)
+        self.assertIsNone(subscription.get(timeout=0))
+    
+    
+    def test_async_consumer_is_woken_by_publisher_thread(self):
+        """Test that an async consumer waits on its loop rather than polling from a worker thread."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        
+        def publish():
+            for value in (0.1, 0.2):
+                time.sleep(0.05)
+                bus.publish(progress(value))
+            subscription.close()
+        
+        async def consume():
+            threading.Thread(target=publish).start()
+            return [event.progress async for event in subscription]
+        
+        with patch("asyncio.to_thread", side_effect=AssertionError("polled from a worker thread")):
+            self.assertEqual(asyncio.run(consume()), [0.1, 0.2])
+
+
+class TestOrchestratorEvents(unittest.TestCase):
+    """Test cases for the orchestrator publishing typed events."""
+    
+    def test_debate_publishes_events_and_callbacks(self):
+        """Test that subscribers get typed events while callback attributes keep working."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(DebateOrchestrator, MockAIClient(), participants, total_rounds=2)
+        subscription = orchestrator.events.subscribe(
+            event_types=[MessageGenerated, RoundCompleted, SessionCompleted], max_buffered=100
+        )
+        announced = []
+        orchestrator.on_message_generated = lambda message, character: announced.append(character.name)
+        
+        orchestrator.start_debate(participants)
+        subscription.close()
+        
+        events = list(subscription)
+        self.assertEqual([type(event).__name__ for event in events], [
+            "MessageGenerated", "MessageGenerated", "RoundCompleted",
+            "MessageGenerated", "MessageGenerated", "RoundCompleted", "SessionCompleted"
+        ])
+        self.assertEqual(announced, ["Alice", "Bob", "Alice", "Bob"])
+        self.assertEqual(events[2].args(), (events[2].debate_round, 1))
+    
+    def test_delta_subscriber_enables_streaming(self):
+        """Test that subscribing to deltas streams replies without a delta callback."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(DebateOrchestrator, MockAIClient(fixed_response="Hello there friend"), participants)
+        subscription = orchestrator.events.subscribe(event_types=[MessageDelta], max_buffered=100)
+        
+        orchestrator.start_debate(participants)
+        subscription.close()
+        
+        self.assertEqual("".join(event.delta for event in subscription if event.character.name == "Alice"), "Hello there friend")
+    
+    def test_async_iteration(self):
+        """Test that subscribers can consume events on the debate's event loop."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(AsyncDebateOrchestrator, AsyncMockAIClient(), participants)
+        subscription = orchestrator.events.subscribe(event_types=[MessageGenerated], max_buffered=1)
+        
+        async def run():
+            names = []
+            
+            async def consume():
+                async for event in subscription:
+                    names.append(event.character.name)
+            
+            consumer = asyncio.create_task(consume())
+            await orchestrator.start_debate_async(participants)
+            subscription.close()
+            await consumer
+            return names
+        
+        self.assertEqual(sorted(asyncio.run(run())), ["Alice", "Bob"])
+
+
+class TestServiceEventDelivery(unittest.TestCase):
+    """Test cases for DebateService feeding UI callbacks from the event bus."""
+    
+    def test_slow_ui_does_not_stall_generation(self):
+        """Test that generation runs ahead of a slow UI callback, which runs on the calling thread."""
+        service = DebateService(MockAIClient(), CharacterService(), event_backpressure=BackpressurePolicy.COALESCE)
+        display_threads = set()
+        
+        def on_message(message, character):
+            display_threads.add(threading.current_thread())
+            time.sleep(0.05)
+        
+        service.register_ui_callback("message_generated", on_message)
+        result = service.create_debate_session(
+            topic="Test political debate topic",
+            selected_character_types=["democratic_commentator", "republican_commentator"],
+            settings=DebateSettings(total_rounds=3, response_delay=0.0)
+        )
+        
+        self.assertTrue(service.start_debate(result["participants"])["success"])
+        
+        stats = service.current_session.metadata["pacing_stats"]
+        self.assertEqual(display_threads, {threading.current_thread()})
+        self.assertEqual(stats["delivered"], 6)
+        self.assertLess(stats["generation_seconds"], 0.2)
+    
+    def test_async_debate_with_one_event_buffer(self):
+        """Test that a full blocking buffer never stalls the event loop the UI is drained on."""
+        service = DebateService(
+            AsyncMockAIClient(latency=0.01), CharacterService(),
+            event_backpressure=BackpressurePolicy.BLOCK, event_buffer_size=1
+        )
+        progress = []
+        service.register_ui_callback("progress_update", lambda *args: progress.append(args))
+        result = service.create_debate_session(
+            topic="Test political debate topic",
+            selected_character_types=["democratic_commentator", "republican_commentator", "democratic_commentator"],
+            settings=DebateSettings(total_rounds=2, response_delay=0.0, round_mode=RoundMode.SIMULTANEOUS)
+        )
+        outcome = {}
+        
+        def run():
+            outcome.update(asyncio.run(service.start_debate_async(result["participants"])))
+        
+        runner = threading.Thread(target=run, daemon=True)
+        runner.start()
+        runner.join(10)
+        
+        self.assertFalse(runner.is_alive(), "async debate deadlocked on a full event buffer")
+        self.assertTrue(outcome["success"])
+        self.assertEqual(len(progress), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import tempfile
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.judge import MockDebateJudge
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import MockAIClient
+from src.debate_simulator.infrastructure.session_journal import journal_path, read_journal
+from tests.fixtures.debate import make_participants
+
+ADJUSTMENTS = {"Alice": {"anger": 5, "patience": -2, "uniqueness": 0}, "Bob": {"anger": 0, "patience": 0, "uniqueness": 3}}
+
+
+class _ProcessCrash(BaseException):
+    """Stands in for the process dying; not caught by per-turn error handling."""
+
+
+class _CrashingClient(MockAIClient):
+    """Mock client that dies on a given call."""
+    
+    def __init__(self, crash_on_call):
+        super().__init__()
+        self.crash_on_call = crash_on_call
+    
+    def generate_response(self, messages):
+        if self.call_count + 1 == self.crash_on_call:
+            raise _ProcessCrash()
+        return super().generate_response(messages)
+
+
+class TestJournalResume(unittest.TestCase):
+    """Test cases for resuming a debate from its session journal."""
+    
+    def setUp(self):
+        """Run a competitive three-round debate that crashes on the fourth turn."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.participants = make_participants()
+        orchestrator = DebateOrchestrator(
+            _CrashingClient(crash_on_call=4), MockDebateJudge(ADJUSTMENTS), journal_dir=self.tmp.name
+        )
+        session = orchestrator.create_debate(
+            "Test political debate topic",
+            self.participants,
+            DebateSettings(total_rounds=3, response_delay=0.0, competitive_mode=True)
+        )
+        self.session_id = session.session_id
+        with self.assertRaises(_ProcessCrash):
+            orchestrator.start_debate(self.participants)
+        self.stats_at_crash = [p.stats.to_dict() for p in self.participants]
+    
+    def tearDown(self):
+        """Remove the journal directory."""
+        self.tmp.cleanup()
+    
+    def _restore(self, orchestrator_class=DebateOrchestrator, client=None):
+        """Restore the crashed session into a fresh orchestrator."""
+        orchestrator = orchestrator_class(client or MockAIClient(), MockDebateJudge(ADJUSTMENTS), journal_dir=self.tmp.name)
+        participants = orchestrator.resume_from_journal(self.session_id)
+        return orchestrator, participants
+    
+    def test_restores_transcript_and_stats(self):
+        """Test that completed turns, verdicts and stats come back without any AI calls."""
+        orchestrator, participants = self._restore()
+        
+        session = orchestrator.current_session
+        rounds = session.conversation.rounds
+        self.assertEqual(session.status, DebateStatus.PAUSED)
+        self.assertEqual([len(r.messages) for r in rounds], [2, 1])
+        self.assertEqual(rounds[0].judge_feedback, ADJUSTMENTS)
+        self.assertIsNone(rounds[1].end_time)
+        self.assertEqual([p.stats.to_dict() for p in participants], self.stats_at_crash)
+    
+    def test_resume_generates_only_missing_turns(self):
+        """Test that resuming finishes the cut-off round and the rest of the debate."""
+        client = MockAIClient()
+        orchestrator, participants = self._restore(client=client)
+        
+        orchestrator.resume_debate(participants)
+        
+        session = orchestrator.current_session
+        speakers = [[m.speaker_name for m in r.messages] for r in session.conversation.rounds]
+        self.assertEqual(client.call_count, 3)
+        self.assertEqual(speakers, [["Alice", "Bob"]] * 3)
+        self.assertEqual(session.status, DebateStatus.COMPLETED)
+        self.assertEqual(participants[0].stats.anger, 65)
+    
+    def test_resumed_session_is_journaled_again(self):
+        """Test that a resumed debate appends to the same journal and restores as completed."""
+        orchestrator, participants = self._restore()
+        orchestrator.resume_debate(participants)
+        
+        events = read_journal(journal_path(self.tmp.name, self.session_id))
+        restored, _ = self._restore()
+        
+        self.assertEqual(sum(1 for e in events if e["type"] == "session"), 1)
+        self.assertEqual(restored.current_session.status, DebateStatus.COMPLETED)
+        self.assertEqual(len(restored.current_session.conversation.get_all_messages()), 6)
+    
+    def test_passed_participants_are_restored_in_place(self):
+        """Test that callers' character objects get their journaled stats back."""
+        fresh = make_participants()
+        orchestrator = DebateOrchestrator(MockAIClient(), journal_dir=self.tmp.name)
+        
+        returned = orchestrator.resume_from_journal(self.session_id, fresh)
+        
+        self.assertIs(returned, fresh)
+        self.assertEqual(fresh[0].stats.to_dict(), self.stats_at_crash[0])
+
+
+class TestAsyncJournalResume(unittest.IsolatedAsyncioTestCase):
+    """Test cases for journaling with AsyncDebateOrchestrator."""
+    
+    async def test_async_debate_resumes_from_journal(self):
+        """Test that an async run journals every turn and can be restored."""
+        with tempfile.TemporaryDirectory() as tmp:
+            participants = make_participants()
+            orchestrator = AsyncDebateOrchestrator(MockAIClient(), journal_dir=tmp, journal_fsync_interval=0.0)
+            session = orchestrator.create_debate(
+                "Test political debate topic", participants, DebateSettings(total_rounds=2, response_delay=0.0)
+            )
+            await orchestrator.start_debate_async(participants)
+            
+            restored = AsyncDebateOrchestrator(MockAIClient(), journal_dir=tmp)
+            restored.resume_from_journal(session.session_id)
+            
+            self.assertEqual(
+                restored.current_session.conversation.to_dict()["rounds"],
+                session.conversation.to_dict()["rounds"]
+            )
+            self.assertGreater(session.metadata["journal_stats"]["syncs"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
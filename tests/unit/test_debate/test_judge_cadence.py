@@ -0,0 +1,169 @@
+from datetime import datetime
+import json
+import re
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.judge import AIDebateJudge
+from src.debate_simulator.domain.debate.models import DebateMessage, DebateSettings, DebateStatus, JudgeCadence
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+ROUND_PATTERN = re.compile(r"^ROUND (\d+):$", re.MULTILINE)
+
+
+def verdict(round_number):
+    """Adjustments that encode the round number in Alice's anger."""
+    return {"Alice": {"anger": round_number, "patience": 0, "uniqueness": 0}, "Bob": {"anger": 0, "patience": 0, "uniqueness": 1}}
+
+
+class _BatchJudgeClient(MockAIClient):
+    """Mock client whose judge replies cover every round named in the prompt."""
+    
+    def __init__(self):
+        super().__init__(fixed_response="Reply")
+        self.judge_prompts = []
+        self.judge_max_tokens = []
+    
+    def generate_judge_response(self, prompt, response_format=None, max_tokens=None):
+        self.judge_prompts.append(prompt)
+        self.judge_max_tokens.append(max_tokens)
+        rounds = [int(n) for n in ROUND_PATTERN.findall(prompt)]
+        if not rounds:
+            return json.dumps(verdict(0))
+        return json.dumps({str(n): verdict(n) for n in rounds})
+
+
+class _AsyncBatchJudgeClient(_BatchJudgeClient, AsyncMockAIClient):
+    """Async twin of ``_BatchJudgeClient``."""
+    
+    async def generate_judge_response_async(self, prompt, response_format=None, max_tokens=None):
+        return self.generate_judge_response(prompt, response_format, max_tokens)
+
+
+def make_round(round_number):
+    """Create the messages of one round."""
+    return [
+        DebateMessage(round_number, "Alice", f"Alice in round {round_number}", datetime.now()),
+        DebateMessage(round_number, "Bob", f"Bob in round {round_number}", datetime.now())
+    ]
+
+
+def run_debate(orchestrator_class=DebateOrchestrator, client=None, rounds=7, **settings):
+    """Run a competitive debate and return the orchestrator, client and judged round numbers."""
+    client = client or _BatchJudgeClient()
+    participants = make_participants()
+    orchestrator = create_orchestrator(
+        orchestrator_class, client, participants, AIDebateJudge(client),
+        total_rounds=rounds, competitive_mode=True, **settings
+    )
+    judged = []
+    orchestrator.on_judge_feedback = lambda adjustments, round_number: judged.append(round_number)
+    orchestrator.start_debate(participants)
+    return orchestrator, client, judged
+
+
+class TestJudgingRounds(unittest.TestCase):
+    """Test cases for when rounds go to the judge."""
+    
+    def test_cadences(self):
+        """Test which 0-based rounds trigger a judge call."""
+        def judging_rounds(**settings):
+            settings = DebateSettings(total_rounds=7, **settings)
+            return [n for n in range(7) if settings.is_judging_round(n)]
+        
+        self.assertEqual(judging_rounds(), list(range(7)))
+        self.assertEqual(judging_rounds(judge_cadence=JudgeCadence.EVERY_K_ROUNDS, judge_interval=3), [2, 5, 6])
+        self.assertEqual(judging_rounds(judge_cadence=JudgeCadence.END_OF_DEBATE), [6])
+    
+    def test_settings_round_trip(self):
+        """Test that the cadence survives serialization."""
+        settings = DebateSettings(judge_cadence=JudgeCadence.EVERY_K_ROUNDS, judge_interval=4)
+        
+        restored = DebateSettings.from_dict(settings.to_dict())
+        
+        self.assertEqual(restored.judge_cadence, JudgeCadence.EVERY_K_ROUNDS)
+        self.assertEqual(restored.judge_interval, 4)
+
+
+class TestBatchedJudge(unittest.TestCase):
+    """Test cases for AIDebateJudge.judge_rounds."""
+    
+    def test_one_call_for_several_rounds(self):
+        """Test that a batch shares one prompt and rubric and returns verdicts in order."""
+        client = _BatchJudgeClient()
+        
+        verdicts = AIDebateJudge(client).judge_rounds([make_round(n) for n in (4, 5, 6)], make_participants())
+        
+        self.assertEqual(len(client.judge_prompts), 1)
+        self.assertEqual(client.judge_prompts[0].count("1. ANGER"), 1)
+        self.assertEqual([v["Alice"]["anger"] for v in verdicts], [4, 5, 6])
+    
+    def test_reply_budget_scales_with_batch(self):
+        """Test that a batched verdict gets room for every round and participant, within the model's cap."""
+        client = _BatchJudgeClient()
+        judge = AIDebateJudge(client)
+        
+        judge.judge_round(make_round(1), make_participants())
+        judge.judge_rounds([make_round(n) for n in range(1, 9)], make_participants())
+        judge.judge_rounds([make_round(n) for n in range(1, 51)], make_participants() * 10)
+        
+        self.assertEqual(client.judge_max_tokens, [None, 300 + 40 * 8 * 2, 4096])
+    
+    def test_missing_or_malformed_rounds_are_neutral(self):
+        """Test that rounds the reply leaves out, or an unparseable reply, get neutral adjustments."""
+        participants = make_participants()
+        judge = AIDebateJudge(MockAIClient(fixed_judge_response=json.dumps({"2": verdict(2)})))
+        
+        verdicts = judge.judge_rounds([make_round(1), make_round(2)], participants)
+        self.assertEqual(verdicts[0], judge._neutral_adjustments(participants))
+        self.assertEqual(verdicts[1], verdict(2))
+        
+        judge.ai_client.fixed_judge_response = "Round 1 was great"
+        self.assertEqual(judge.judge_rounds([make_round(1), make_round(2)], participants), [judge._neutral_adjustments(participants)] * 2)
+
+
+class TestJudgeCadenceInDebate(unittest.TestCase):
+    """Test cases for batched judging in running debates."""
+    
+    def test_every_k_rounds(self):
+        """Test that every round is judged, in order, with far fewer judge calls."""
+        orchestrator, client, judged = run_debate(judge_cadence=JudgeCadence.EVERY_K_ROUNDS, judge_interval=3)
+        
+        session = orchestrator.current_session
+        self.assertEqual(session.status, DebateStatus.COMPLETED)
+        self.assertEqual(judged, [1, 2, 3, 4, 5, 6, 7])
+        # The lone final round keeps the single-round prompt, which carries no round marker
+        self.assertEqual([r.judge_feedback["Alice"]["anger"] for r in session.conversation.rounds], [1, 2, 3, 4, 5, 6, 0])
+        self.assertEqual(len(client.judge_prompts), 3)
+        self.assertEqual(session.metadata["judge_calls"], 3)
+    
+    def test_end_of_debate_uses_fewer_tokens(self):
+        """Test that one end-of-debate call sends much less prompt text than per-round calls."""
+        _, per_round, _ = run_debate(rounds=8)
+        _, batched, judged = run_debate(rounds=8, judge_cadence=JudgeCadence.END_OF_DEBATE)
+        
+        self.assertEqual(judged, list(range(1, 9)))
+        self.assertEqual((len(per_round.judge_prompts), len(batched.judge_prompts)), (8, 1))
+        self.assertLess(len(batched.judge_prompts[0]) * 2, sum(len(p) for p in per_round.judge_prompts))
+    
+    def test_pipelined_batches(self):
+        """Test that batches judged in the background still apply in round order."""
+        _, client, judged = run_debate(judge_cadence=JudgeCadence.EVERY_K_ROUNDS, judge_interval=2, pipelined_judging=True)
+        
+        self.assertEqual(judged, [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(len(client.judge_prompts), 4)
+    
+    def test_async_orchestrator(self):
+        """Test that the async orchestrator batches the same way."""
+        orchestrator, client, judged = run_debate(
+            AsyncDebateOrchestrator, _AsyncBatchJudgeClient(), judge_cadence=JudgeCadence.EVERY_K_ROUNDS
+        )
+        
+        self.assertEqual(judged, [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(len(client.judge_prompts), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+from datetime import datetime
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.judge import AIDebateJudge
+from src.debate_simulator.domain.debate.judging import JudgingPipeline
+from src.debate_simulator.domain.debate.models import DebateMessage, DebateRound, DebateStatus
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+JUDGE_RESPONSE = '{"Alice": {"anger": 5, "patience": 0, "uniqueness": 0}, "Bob": {"anger": 0, "patience": 0, "uniqueness": 5}}'
+
+
+class _RecordingJudge(AIDebateJudge):
+    """Judge that returns the round number it judged, after an optional delay."""
+    
+    def __init__(self, delays=None):
+        super().__init__(None)
+        self.delays = delays or {}
+    
+    def judge_round(self, round_messages, participants):
+        round_number = round_messages[0].round_number
+        time.sleep(self.delays.get(round_number, 0.0))
+        return {"round": round_number}
+
+
+def run_debate(orchestrator_class, client, pipelined, rounds=4):
+    """Run a competitive debate and return the orchestrator, participants and events."""
+    participants = make_participants()
+    orchestrator = create_orchestrator(
+        orchestrator_class, client, participants, AIDebateJudge(client),
+        total_rounds=rounds, competitive_mode=True, pipelined_judging=pipelined
+    )
+    events = []
+    orchestrator.on_message_generated = lambda msg, char: events.append(("message", msg.round_number))
+    orchestrator.on_judge_feedback = lambda adjustments, round_number: events.append(("judge", round_number))
+    return orchestrator, participants, events
+
+
+class TestJudgingPipeline(unittest.TestCase):
+    """Test cases for JudgingPipeline."""
+    
+    def setUp(self):
+        """Set up a pipeline over a judge whose first round is slowest."""
+        self.pipeline = JudgingPipeline(_RecordingJudge(delays={1: 0.1}))
+        self.rounds = [DebateRound(round_number=n) for n in (1, 2, 3)]
+    
+    def tearDown(self):
+        """Stop the worker."""
+        self.pipeline.shutdown()
+    
+    def _submit_all(self):
+        """Submit three rounds of messages."""
+        for debate_round in self.rounds:
+            message = DebateMessage(debate_round.round_number, "Alice", "Hi", datetime.now())
+            self.pipeline.submit(debate_round, [message], make_participants())
+    
+    def test_collect_does_not_block_by_default(self):
+        """Test that unfinished verdicts are left pending."""
+        self._submit_all()
+        
+        self.assertEqual(self.pipeline.collect(), [])
+    
+    def test_verdicts_returned_in_round_order(self):
+        """Test that draining yields every verdict in submission order."""
+        self._submit_all()
+        
+        verdicts = self.pipeline.drain()
+        
+        self.assertEqual([r.round_number for r, _ in verdicts], [1, 2, 3])
+        self.assertEqual([v["round"] for _, v in verdicts], [1, 2, 3])
+        self.assertGreater(self.pipeline.wait_seconds, 0.0)
+    
+    def test_collect_waits_only_up_to_requested_round(self):
+        """Test that blocking stops after the requested round."""
+        self.pipeline.judge.delays = {1: 0.05, 2: 0.2}
+        self._submit_all()
+        
+        verdicts = self.pipeline.collect(wait_for_round=1)
+        
+        self.assertEqual([r.round_number for r, _ in verdicts], [1])
+
+
+class TestPipelinedOrchestrator(unittest.TestCase):
+    """Test cases for pipelined judging in DebateOrchestrator."""
+    
+    def test_all_rounds_judged_in_order(self):
+        """Test that every round gets feedback and verdicts apply in round order."""
+        client = MockAIClient(fixed_response="Reply", fixed_judge_response=JUDGE_RESPONSE, judge_latency=0.03)
+        orchestrator, participants, events = run_debate(DebateOrchestrator, client, pipelined=True)
+        
+        orchestrator.start_debate(participants)
+        
+        session = orchestrator.current_session
+        self.assertEqual(session.status, DebateStatus.COMPLETED)
+        self.assertTrue(all(r.judge_feedback for r in session.conversation.rounds))
+        self.assertEqual([n for kind, n in events if kind == "judge"], [1, 2, 3, 4])
+        self.assertEqual(participants[0].stats.anger, 70)
+        self.assertIn("final_performance", session.metadata)
+    
+    def test_verdict_lands_before_round_after_next(self):
+        """Test that a verdict is never more than one round stale."""
+        client = MockAIClient(fixed_response="Reply", fixed_judge_response=JUDGE_RESPONSE, judge_latency=0.2)
+        orchestrator, participants, events = run_debate(DebateOrchestrator, client, pipelined=True)
+        
+        orchestrator.start_debate(participants)
+        
+        for judged_round in (1, 2):
+            judge_index = events.index(("judge", judged_round))
+            first_later_message = events.index(("message", judged_round + 2))
+            self.assertLess(judge_index, first_later_message)
+    
+    def test_pipelining_saves_wall_clock_time(self):
+        """Benchmark: overlapping the judge with the next round beats judging inline."""
+        def timed(pipelined):
+            client = MockAIClient(fixed_response="Reply", fixed_judge_response=JUDGE_RESPONSE, latency=0.05, judge_latency=0.08)
+            orchestrator, participants, _ = run_debate(DebateOrchestrator, client, pipelined=pipelined)
+            start = time.perf_counter()
+            orchestrator.start_debate(participants)
+            return time.perf_counter() - start
+        
+        sequential = timed(False)
+        pipelined = timed(True)
+        
+        # Inline: 4 x (2 x 0.05 + 0.08) = 0.72s; pipelined hides all but the last judge call
+        self.assertLess(pipelined, sequential - 0.15)
+
+
+class TestAsyncPipelinedOrchestrator(unittest.IsolatedAsyncioTestCase):
+    """Test cases for pipelined judging in AsyncDebateOrchestrator."""
+    
+    async def test_all_rounds_judged_in_order(self):
+        """Test that the async pipeline judges every round in order."""
+        client = AsyncMockAIClient(fixed_response="Reply", fixed_judge_response=JUDGE_RESPONSE, judge_latency=0.03)
+        orchestrator, participants, events = run_debate(AsyncDebateOrchestrator, client, pipelined=True)
+        
+        await orchestrator.start_debate_async(participants)
+        
+        self.assertEqual([n for kind, n in events if kind == "judge"], [1, 2, 3, 4])
+        self.assertEqual(client.judge_call_count, 4)
+        self.assertEqual(participants[0].stats.anger, 70)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime
+
+from src.debate_simulator.domain.debate.judge import AIDebateJudge, create_judge
+from src.debate_simulator.domain.debate.local_judge import CascadeJudge, LocalDebateJudge
+from src.debate_simulator.domain.debate.models import DebateMessage
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+CALM = "I understand your concern, and that is a fair point. Let us consider the evidence on wages together before we decide."
+ANGRY = "This is OUTRAGEOUS NONSENSE! You are CLUELESS about wages and frankly a LIAR! How dare you!"
+AI_VERDICT = {"Alice": {"anger": 7, "patience": 7, "uniqueness": 7}, "Bob": {"anger": 7, "patience": 7, "uniqueness": 7}}
+
+
+def make_round(round_number, alice, bob):
+    """Create a round where Alice and Bob each say one thing."""
+    return [
+        DebateMessage(round_number, "Alice", alice, datetime.now()),
+        DebateMessage(round_number, "Bob", bob, datetime.now())
+    ]
+
+
+class TestLocalDebateJudge(unittest.TestCase):
+    """Test cases for LocalDebateJudge."""
+    
+    def test_tone_drives_anger_and_patience(self):
+        """Test that shouting and insults raise anger while conciliatory language raises patience."""
+        adjustments = LocalDebateJudge().judge_round(make_round(1, CALM, ANGRY), make_participants())
+        
+        alice, bob = adjustments["Alice"], adjustments["Bob"]
+        self.assertLess(alice["anger"], 0)
+        self.assertGreater(alice["patience"], 0)
+        self.assertGreaterEqual(bob["anger"], 8)
+        self.assertLessEqual(bob["patience"], -8)
+    
+    def test_repeated_arguments_lose_uniqueness(self):
+        """Test that repeating earlier rounds scores below fresh material."""
+        judge = LocalDebateJudge()
+        participants = make_participants()
+        
+        first = judge.judge_round(make_round(1, CALM, "Tariffs protect factory jobs in the heartland."), participants)
+        second = judge.judge_round(
+            make_round(2, CALM, "Automation, not trade, explains most of the factory job losses since 2000."), participants
+        )
+        
+        self.assertGreater(first["Alice"]["uniqueness"], 0)
+        self.assertEqual(second["Alice"]["uniqueness"], -10)
+        self.assertGreater(second["Bob"]["uniqueness"], 0)
+    
+    def test_confidence_and_margin(self):
+        """Test that short replies and mixed signals lower confidence, and close standings a small margin."""
+        judge = LocalDebateJudge()
+        participants = make_participants()
+        
+        clear = judge.assess_round(make_round(1, CALM, ANGRY), participants)
+        short = judge.assess_round(make_round(2, "No.", ANGRY), participants)
+        mixed = judge.assess_round(make_round(3, "I RESPECT you but this plan is RIDICULOUS GARBAGE from top to bottom, my old friend", ANGRY), participants)
+        
+        self.assertEqual(clear.confidence, 1.0)
+        self.assertGreater(clear.margin, 10)
+        self.assertLess(short.confidence, 0.5)
+        self.assertEqual(mixed.confidence, 0.5)
+    
+    def test_silent_participants_are_neutral(self):
+        """Test that participants without messages get no change and do not affect confidence."""
+        assessment = LocalDebateJudge().assess_round([DebateMessage(1, "Alice", CALM, datetime.now())], make_participants())
+        
+        self.assertEqual(assessment.adjustments["Bob"], {"anger": 0, "patience": 0, "uniqueness": 0})
+        self.assertIsNone(assessment.margin)
+
+
+class TestCascadeJudge(unittest.TestCase):
+    """Test cases for CascadeJudge."""
+    
+    def make_cascade(self, client=None):
+        """Create a cascade over a mock AI judge."""
+        client = client or MockAIClient(fixed_judge_response=json.dumps(AI_VERDICT))
+        return CascadeJudge(LocalDebateJudge(), AIDebateJudge(client)), client
+    
+    def test_clear_round_stays_local(self):
+        """Test that a clear-cut round makes no AI call."""
+        judge, client = self.make_cascade()
+        
+        adjustments = judge.judge_round(make_round(1, CALM, ANGRY), make_participants())
+        
+        self.assertEqual(client.judge_call_count, 0)
+        self.assertNotEqual(adjustments, AI_VERDICT)
+    
+    def test_contested_round_escalates(self):
+        """Test that a tied or thin round goes to the AI judge."""
+        judge, client = self.make_cascade()
+        participants = make_participants()
+        
+        tied = judge.judge_round(make_round(1, CALM, CALM), participants)
+        thin = judge.judge_round(make_round(2, "Yes.", ANGRY), participants)
+        
+        self.assertEqual((tied, thin), (AI_VERDICT, AI_VERDICT))
+        self.assertEqual(client.judge_call_count, 2)
+        stats = judge.get_stats()
+        self.assertEqual((stats["rounds"], stats["escalated_rounds"], stats["escalation_rate"]), (2, 2, 1.0))
+        self.assertEqual(stats["escalation_judge"]["verdicts"], 2)
+    
+    def test_batch_escalates_contested_rounds_together(self):
+        """Test that a batch keeps clear rounds local and sends the contested ones in one AI call."""
+        judge, client = self.make_cascade(MockAIClient(fixed_judge_response=json.dumps({"1": AI_VERDICT, "3": AI_VERDICT})))
+        rounds = [
+            make_round(1, CALM, CALM),
+            make_round(2, "Minimum wage hikes lift earnings for millions of workers at the bottom, I understand the worry.", ANGRY),
+            make_round(3, "Fine.", "Sure.")
+        ]
+        
+        verdicts = judge.judge_rounds(rounds, make_participants())
+        
+        self.assertEqual(client.judge_call_count, 1)
+        self.assertEqual((verdicts[0], verdicts[2]), (AI_VERDICT, AI_VERDICT))
+        self.assertNotEqual(verdicts[1], AI_VERDICT)
+    
+    def test_async_escalation(self):
+        """Test that contested rounds escalate through the async interface."""
+        judge, client = self.make_cascade(AsyncMockAIClient(fixed_judge_response=json.dumps(AI_VERDICT)))
+        
+        verdict = asyncio.run(judge.judge_round_async(make_round(1, CALM, CALM), make_participants()))
+        
+        self.assertEqual(verdict, AI_VERDICT)
+        self.assertEqual(client.judge_call_count, 1)
+    
+    def test_factory(self):
+        """Test creating local and cascade judges by name."""
+        self.assertIsInstance(create_judge("local"), LocalDebateJudge)
+        self.assertIsInstance(create_judge("cascade", ai_client=MockAIClient(), min_margin=3), CascadeJudge)
+        with self.assertRaises(ValueError):
+            create_judge("cascade")
+    
+    def test_debate_records_cascade_stats(self):
+        """Test that a competitive debate judged by the cascade records its escalation metrics."""
+        client = MockAIClient(fixed_response="Reply", fixed_judge_response=json.dumps(AI_VERDICT))
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, client, participants, create_judge("cascade", ai_client=client),
+            total_rounds=3, competitive_mode=True
+        )
+        
+        orchestrator.start_debate(participants)
+        
+        stats = orchestrator.current_session.metadata["judge_stats"]
+        self.assertEqual(stats["rounds"], 3)
+        self.assertEqual(stats["escalated_rounds"], client.judge_call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
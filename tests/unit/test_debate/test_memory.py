@@ -0,0 +1,225 @@
+import threading
+import unittest
+from datetime import datetime
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.context import ContextBuilder
+from src.debate_simulator.domain.debate.memory import (
+    DebateMemory, ExtractiveSummarizer, Summarizer, create_summarizer, AISummarizer
+)
+from src.debate_simulator.domain.debate.models import DebateMessage, DebateRound, DebateSettings
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import make_participants
+
+
+def make_message(round_number, speaker, text):
+    """Create a debate message."""
+    return DebateMessage(round_number=round_number, speaker_name=speaker, message=text, timestamp=datetime.now())
+
+
+def make_round(round_number, *messages, finished=True):
+    """Create a round holding ``(speaker, text)`` messages."""
+    debate_round = DebateRound(round_number=round_number, messages=[], start_time=datetime.now())
+    for speaker, text in messages:
+        debate_round.add_message(make_message(round_number, speaker, text))
+    if finished:
+        debate_round.end_time = datetime.now()
+    return debate_round
+
+
+class _RecordingClient(MockAIClient):
+    """Mock client that gives numbered replies and records every prompt."""
+    
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+    
+    def generate_response(self, messages):
+        self.prompts.append(messages)
+        self.call_count += 1
+        return f"Point number {self.call_count}. Tariffs cost households {self.call_count} percent more."
+
+
+class _GatedSummarizer(Summarizer):
+    """Summarizer that waits for the test to release it."""
+    
+    def __init__(self, fail=False):
+        self.release = threading.Event()
+        self.fail = fail
+        self.calls = []
+    
+    def summarize(self, previous_summary, messages):
+        self.calls.append([msg.round_number for msg in messages])
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("Summary service down")
+        return f"{previous_summary}|{len(messages)}"
+
+
+class TestExtractiveSummarizer(unittest.TestCase):
+    """Test cases for ExtractiveSummarizer."""
+    
+    def test_keeps_representative_sentences_per_speaker(self):
+        """Test that each speaker's line keeps their sentences about the recurring topic."""
+        summarizer = ExtractiveSummarizer(sentences_per_speaker=1)
+        messages = [
+            make_message(1, "Alice", "Hello everyone. Tariffs raise consumer prices for every family."),
+            make_message(1, "Bob", "Tariffs protect jobs and prices will settle. Whatever."),
+        ]
+        
+        summary = summarizer.summarize("", messages)
+        
+        self.assertEqual(summary.splitlines(), [
+            "Alice: Tariffs raise consumer prices for every family.",
+            "Bob: Tariffs protect jobs and prices will settle."
+        ])
+    
+    def test_rolling_summary_trims_oldest_sentences(self):
+        """Test that the summary stays within its word budget as rounds are added."""
+        summarizer = ExtractiveSummarizer(sentences_per_speaker=1, max_words=12)
+        summary = ""
+        for number in range(1, 6):
+            summary = summarizer.summarize(summary, [make_message(number, "Alice", f"Claim {number} about the deficit.")])
+        
+        self.assertEqual(summary, "Alice: Claim 4 about the deficit. Claim 5 about the deficit.")
+    
+    def test_ai_summary_gets_a_reply_budget_for_its_word_limit(self):
+        """Test that AI summaries are not cut off at the character reply cap."""
+        client = MockAIClient(fixed_judge_response="Alice: Cut taxes.")
+        summary = AISummarizer(client, max_words=150).summarize("", [make_message(1, "Alice", "Cut taxes.")])
+        
+        self.assertEqual(summary, "Alice: Cut taxes.")
+        self.assertEqual(client.judge_max_tokens, [300])
+    
+    def test_factory(self):
+        """Test creating summarizers by name."""
+        self.assertIsInstance(create_summarizer("extractive"), ExtractiveSummarizer)
+        self.assertIsInstance(create_summarizer("ai", ai_client=MockAIClient()), AISummarizer)
+        with self.assertRaises(ValueError):
+            create_summarizer("ai")
+
+
+class TestDebateMemory(unittest.TestCase):
+    """Test cases for DebateMemory."""
+    
+    def test_summarizes_in_background_after_recent_window(self):
+        """Test that only rounds outside the recent window are summarized, without blocking."""
+        summarizer = _GatedSummarizer()
+        memory = DebateMemory(summarizer, recent_rounds=2)
+        rounds = [make_round(n, ("Alice", f"Round {n}.")) for n in (1, 2)]
+        
+        memory.update(rounds)
+        self.assertEqual(summarizer.calls, [])
+        
+        rounds.append(make_round(3, ("Alice", "Round 3.")))
+        memory.update(rounds)
+        self.assertEqual(memory.context(), ("", 0))
+        
+        summarizer.release.set()
+        memory.wait(1.0)
+        self.assertEqual(summarizer.calls, [[1]])
+        self.assertEqual(memory.context(), ("|1", 1))
+        memory.shutdown()
+    
+    def test_failed_summary_is_retried(self):
+        """Test that a failure keeps the previous summary and retries on the next update."""
+        summarizer = _GatedSummarizer(fail=True)
+        summarizer.release.set()
+        memory = DebateMemory(summarizer, recent_rounds=1)
+        rounds = [make_round(n, ("Alice", f"Round {n}.")) for n in (1, 2)]
+        
+        memory.update(rounds)
+        memory.wait(1.0)
+        self.assertEqual(memory.context(), ("", 0))
+        self.assertEqual(memory.failures, 1)
+        
+        summarizer.fail = False
+        memory.update(rounds)
+        memory.wait(1.0)
+        self.assertEqual(memory.context(), ("|1", 1))
+        memory.shutdown()
+    
+    def test_round_trip(self):
+        """Test that a saved summary is restored."""
+        memory = DebateMemory(ExtractiveSummarizer(), summary="Alice: Taxes.", summarized_through=4)
+        
+        restored = DebateMemory.from_dict(ExtractiveSummarizer(), memory.to_dict())
+        
+        self.assertEqual(restored.context(), ("Alice: Taxes.", 4))
+        memory.shutdown()
+        restored.shutdown()
+
+
+class TestContextWithSummary(unittest.TestCase):
+    """Test cases for injecting the summary into the prompt."""
+    
+    def test_summary_is_one_message_counted_in_budget(self):
+        """Test that the summary follows the system prompt and its tokens are counted."""
+        builder = ContextBuilder(prompt_token_budget=1500)
+        
+        plain = builder.build("You are Alice.", [], "Alice", "Go.")
+        window = builder.build("You are Alice.", [], "Alice", "Go.", summary="Bob: Taxes are theft.")
+        
+        self.assertEqual(window.messages[1]["role"], "system")
+        self.assertIn("Bob: Taxes are theft.", window.messages[1]["content"])
+        self.assertEqual(window.prompt_tokens, plain.prompt_tokens + window.summary_tokens)
+
+
+class TestOrchestratorMemory(unittest.TestCase):
+    """Test cases for summary memory in a running debate."""
+    
+    def run_debate(self, orchestrator_class=DebateOrchestrator, client=None, **settings):
+        """Run a long debate with extractive summary memory."""
+        participants = make_participants()
+        orchestrator = orchestrator_class(client or _RecordingClient(), summarizer=ExtractiveSummarizer())
+        orchestrator.create_debate(
+            "Test political debate topic",
+            participants,
+            DebateSettings(total_rounds=8, response_delay=0.0, summary_memory=True, memory_recent_rounds=2, **settings)
+        )
+        orchestrator.start_debate(participants)
+        return orchestrator
+    
+    def test_old_rounds_replaced_by_summary(self):
+        """Test that late turns carry a summary instead of the summarized rounds."""
+        client = _RecordingClient()
+        orchestrator = self.run_debate(client=client)
+        
+        last_prompt = client.prompts[-1]
+        last_message = orchestrator.current_session.conversation.get_all_messages()[-1]
+        summarized = last_message.metadata["summarized_rounds"]
+        self.assertGreaterEqual(summarized, 4)
+        self.assertIn("Summary of the earlier rounds", last_prompt[1]["content"])
+        self.assertNotIn("Point number 1.", " ".join(m["content"] for m in last_prompt[2:]))
+        self.assertEqual(orchestrator.current_session.metadata["memory"]["summarized_through"], summarized)
+    
+    def test_memory_off_by_default(self):
+        """Test that debates without the setting send no summary."""
+        client = _RecordingClient()
+        participants = make_participants()
+        orchestrator = DebateOrchestrator(client, summarizer=ExtractiveSummarizer())
+        orchestrator.create_debate("Test political debate topic", participants, DebateSettings(total_rounds=4, response_delay=0.0))
+        
+        orchestrator.start_debate(participants)
+        
+        self.assertNotIn("memory", orchestrator.current_session.metadata)
+        self.assertTrue(all(m["role"] != "system" for prompt in client.prompts for m in prompt[1:]))
+    
+    def test_async_orchestrator(self):
+        """Test that the async orchestrator keeps the summary too."""
+        participants = make_participants()
+        orchestrator = AsyncDebateOrchestrator(AsyncMockAIClient(), summarizer=ExtractiveSummarizer())
+        orchestrator.create_debate(
+            "Test political debate topic", participants,
+            DebateSettings(total_rounds=5, response_delay=0.0, summary_memory=True, memory_recent_rounds=1)
+        )
+        
+        orchestrator.start_debate(participants)
+        
+        self.assertGreater(orchestrator.current_session.metadata["memory"]["summarized_through"], 0)
+        self.assertTrue(orchestrator.current_session.metadata["memory"]["summary"])
+
+
+if __name__ == "__main__":
+    unittest.main()
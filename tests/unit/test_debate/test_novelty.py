@@ -0,0 +1,127 @@
+import unittest
+from datetime import datetime
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.judge import RuleBasedJudge
+from src.debate_simulator.domain.debate.local_judge import LocalDebateJudge
+from src.debate_simulator.domain.debate.models import DebateMessage
+from src.debate_simulator.domain.debate.novelty import NoveltyIndex, NoveltyScore
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+TARIFFS = "Tariffs raise prices for every family and invite retaliation against our farmers and factory workers."
+WAGES = "A higher minimum wage lifts earnings at the bottom without the job losses its critics keep predicting."
+
+
+def long_text(start, count=120):
+    """A long message of distinct words, so its shingles outnumber a sketch."""
+    return " ".join(f"word{n}" for n in range(start, start + count))
+
+
+class TestNoveltyIndex(unittest.TestCase):
+    """Test cases for NoveltyIndex."""
+    
+    def test_fresh_and_repeated_messages(self):
+        """Test that a new message scores no overlap and a repeat points back at the original."""
+        index = NoveltyIndex()
+        
+        first = index.add(TARIFFS, "first")
+        index.add(WAGES, "second")
+        repeat = index.add(TARIFFS.upper(), "third")
+        
+        self.assertEqual((first.overlap, first.novelty, first.nearest), (0.0, 1.0, None))
+        self.assertEqual((repeat.overlap, repeat.nearest_similarity, repeat.nearest), (1.0, 1.0, "first"))
+        self.assertEqual(len(index), 3)
+    
+    def test_partial_overlap_and_similarity_estimate(self):
+        """Test the recycled share and that the sketch estimate tracks the exact Jaccard similarity."""
+        index = NoveltyIndex(sketch_size=64)
+        index.add(long_text(0), "old")
+        
+        text = long_text(60)
+        score = index.score(text)
+        
+        old, new = index.shingles(long_text(0)), index.shingles(text)
+        exact = len(old & new) / len(old | new)
+        self.assertAlmostEqual(score.overlap, len(old & new) / len(new))
+        self.assertEqual(score.nearest, "old")
+        self.assertAlmostEqual(score.nearest_similarity, exact, delta=0.15)
+    
+    def test_score_does_not_add(self):
+        """Test that scoring leaves the history alone and short messages have no novelty."""
+        index = NoveltyIndex()
+        
+        index.score(TARIFFS)
+        
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.add(TARIFFS).overlap, 0.0)
+        self.assertIsNone(index.score("No way.").novelty)
+    
+    def test_only_sketch_neighbours_are_compared(self):
+        """Test that messages sharing no sketch hash are never looked at."""
+        index = NoveltyIndex()
+        for start in range(0, 50000, 500):
+            index.add(long_text(start, 40))
+        
+        shingles = index.shingles(long_text(1000, 40))
+        candidates = {i for value in index._sketch(shingles) for i in index._postings.get(value, ())}
+        
+        self.assertEqual(len(index), 100)
+        self.assertEqual(candidates, {2})
+    
+    def test_score_round_trip(self):
+        """Test that a recorded score survives serialization."""
+        score = NoveltyScore(10, 4, 0.25, [2, "Bob"])
+        
+        restored = NoveltyScore.from_dict(score.to_dict())
+        
+        self.assertEqual((restored.shingles, restored.repeated_shingles, restored.nearest), (10, 4, [2, "Bob"]))
+        self.assertEqual(restored.overlap, 0.4)
+
+
+class TestNoveltyInDebate(unittest.TestCase):
+    """Test cases for novelty scores in running debates and judges."""
+    
+    def run_debate(self, orchestrator_class=DebateOrchestrator, client=None):
+        """Run a short debate where every reply is the same."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            orchestrator_class, client or MockAIClient(fixed_response=TARIFFS), participants, total_rounds=2
+        )
+        orchestrator.start_debate(participants)
+        return orchestrator.current_session.conversation.get_all_messages()
+    
+    def test_messages_carry_novelty(self):
+        """Test that each message is scored against everything said before it."""
+        messages = self.run_debate()
+        
+        novelty = [message.metadata["novelty"] for message in messages]
+        self.assertEqual(novelty[0]["overlap"], 0.0)
+        self.assertTrue(all(n["overlap"] == 1.0 and n["nearest"] == [1, "Alice"] for n in novelty[1:]))
+    
+    def test_async_orchestrator(self):
+        """Test that the async orchestrator records novelty too."""
+        messages = self.run_debate(AsyncDebateOrchestrator, AsyncMockAIClient(fixed_response=TARIFFS))
+        
+        self.assertEqual(messages[-1].metadata["novelty"]["overlap"], 1.0)
+    
+    def test_judges_use_recorded_novelty(self):
+        """Test that the rule-based and local judges mark down a message recorded as recycled."""
+        participants = make_participants()
+        recycled = {"novelty": NoveltyScore(15, 15).to_dict()}
+        round_messages = [
+            DebateMessage(3, "Alice", TARIFFS, datetime.now(), metadata=dict(recycled)),
+            DebateMessage(3, "Bob", WAGES, datetime.now(), metadata={"novelty": NoveltyScore(15, 0).to_dict()})
+        ]
+        
+        rule = RuleBasedJudge().judge_round(round_messages, participants)
+        local = LocalDebateJudge().judge_round(round_messages, participants)
+        
+        self.assertEqual((rule["Alice"]["uniqueness"], rule["Bob"]["uniqueness"]), (-2, 0))
+        self.assertEqual(local["Alice"]["uniqueness"], -10)
+        self.assertGreater(local["Bob"]["uniqueness"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
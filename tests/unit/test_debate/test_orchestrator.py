@@ -0,0 +1,69 @@
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+
+class TestStreamingCallbacks(unittest.TestCase):
+    """Test cases for streamed message deltas."""
+    
+    def setUp(self):
+        """Set up an orchestrator with a streaming-capable mock client."""
+        self.client = MockAIClient(fixed_response="Streamed mock reply")
+        self.participants = make_participants()
+        self.orchestrator = create_orchestrator(DebateOrchestrator, self.client, self.participants)
+    
+    def test_deltas_forwarded_before_message_generated(self):
+        """Test that deltas arrive in order and precede the final message."""
+        events = []
+        self.orchestrator.on_message_delta = lambda delta, char, round_num: events.append(("delta", char.name, delta, round_num))
+        self.orchestrator.on_message_generated = lambda msg, char: events.append(("message", char.name, msg.message, msg.round_number))
+        
+        self.orchestrator.start_debate(self.participants)
+        
+        alice_events = [e for e in events if e[1] == "Alice"]
+        self.assertEqual([e[0] for e in alice_events], ["delta", "delta", "delta", "message"])
+        self.assertEqual("".join(e[2] for e in alice_events[:-1]), alice_events[-1][2])
+        self.assertTrue(all(e[3] == 1 for e in alice_events))
+    
+    def test_turn_timings_recorded(self):
+        """Test that streamed turns record time-to-first-token and latency."""
+        self.orchestrator.on_message_delta = lambda delta, char, round_num: None
+        
+        self.orchestrator.start_debate(self.participants)
+        
+        for message in self.orchestrator.current_session.conversation.get_all_messages():
+            self.assertIn("ttft_ms", message.metadata)
+            self.assertLessEqual(message.metadata["ttft_ms"], message.metadata["latency_ms"])
+    
+    def test_no_streaming_without_delta_callback(self):
+        """Test that turns without a delta callback use the plain completion path."""
+        self.orchestrator.start_debate(self.participants)
+        
+        message = self.orchestrator.current_session.conversation.get_all_messages()[0]
+        self.assertEqual(message.message, "Streamed mock reply")
+        self.assertNotIn("ttft_ms", message.metadata)
+        self.assertIn("latency_ms", message.metadata)
+
+
+class TestAsyncStreamingCallbacks(unittest.IsolatedAsyncioTestCase):
+    """Test cases for streamed deltas through the async orchestrator."""
+    
+    async def test_async_deltas_forwarded(self):
+        """Test that async streaming forwards deltas for every turn."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            AsyncDebateOrchestrator, AsyncMockAIClient(fixed_response="Async streamed reply"), participants
+        )
+        deltas = []
+        orchestrator.on_message_delta = lambda delta, char, round_num: deltas.append(delta)
+        
+        await orchestrator.start_debate_async(participants)
+        
+        self.assertEqual("".join(deltas), "Async streamed reply" * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
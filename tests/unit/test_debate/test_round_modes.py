@@ -0,0 +1,181 @@
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus, RoundMode
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_speakers
+
+
+class _SpeakerDelayClient(MockAIClient):
+    """Mock client whose latency depends on the speaker, so completion order is reversed."""
+    
+    def __init__(self, delays, failing=()):
+        super().__init__()
+        self.delays = delays
+        self.failing = failing
+        self.prompts = []
+    
+    def generate_response(self, messages):
+        system_prompt = messages[0]["content"]
+        speaker = next(name for name in self.delays if f"You are {name}," in system_prompt)
+        self.prompts.append(messages[-1]["content"])
+        time.sleep(self.delays[speaker])
+        if speaker in self.failing:
+            raise RuntimeError("boom")
+        return f"{speaker} statement"
+
+
+def resume_half_spoken_round(orchestrator, participants):
+    """Start a simultaneous round in which the first participant has already spoken; returns its arguments."""
+    progress = []
+    orchestrator.on_progress_update = lambda value, round_number, speaker: progress.append(speaker)
+    debate_round = orchestrator._begin_round(0)
+    earlier = orchestrator._create_message(0, participants[0], "Already said", {})
+    debate_round.add_message(earlier)
+    return progress, (0, debate_round, [earlier], participants, "Topic")
+
+
+class TestRoundModeSettings(unittest.TestCase):
+    """Test cases for round mode settings."""
+    
+    def test_opening_closing_rounds(self):
+        """Test that only the first and last rounds are simultaneous."""
+        settings = DebateSettings(total_rounds=4, round_mode=RoundMode.OPENING_CLOSING)
+        
+        self.assertEqual([settings.is_simultaneous_round(n) for n in range(4)], [True, False, False, True])
+    
+    def test_round_trip(self):
+        """Test that the round mode survives serialization."""
+        settings = DebateSettings(round_mode=RoundMode.SIMULTANEOUS, max_concurrent_responses=3)
+        
+        restored = DebateSettings.from_dict(settings.to_dict())
+        
+        self.assertEqual(restored.round_mode, RoundMode.SIMULTANEOUS)
+        self.assertEqual(restored.max_concurrent_responses, 3)
+        self.assertEqual(DebateSettings.from_dict({}).round_mode, RoundMode.SEQUENTIAL)
+
+
+class TestSimultaneousRounds(unittest.TestCase):
+    """Test cases for concurrent rounds in DebateOrchestrator."""
+    
+    def test_round_latency_is_about_one_rtt(self):
+        """Test that eight speakers answer in roughly one round-trip."""
+        latency = 0.1
+        participants = make_speakers(8)
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, MockAIClient(latency=latency), participants, round_mode=RoundMode.SIMULTANEOUS
+        )
+        
+        start = time.perf_counter()
+        orchestrator.start_debate(participants)
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(len(orchestrator.current_session.conversation.get_all_messages()), 8)
+        self.assertLess(elapsed, 3 * latency)
+    
+    def test_transcript_order_independent_of_completion_order(self):
+        """Test that messages are announced as they finish but stored in participant order."""
+        participants = make_speakers(3)
+        client = _SpeakerDelayClient({"Speaker0": 0.15, "Speaker1": 0.08, "Speaker2": 0.0})
+        orchestrator = create_orchestrator(DebateOrchestrator, client, participants, round_mode=RoundMode.SIMULTANEOUS)
+        announced = []
+        orchestrator.on_message_generated = lambda msg, char: announced.append(char.name)
+        
+        orchestrator.start_debate(participants)
+        
+        stored = [m.speaker_name for m in orchestrator.current_session.conversation.get_all_messages()]
+        self.assertEqual(stored, ["Speaker0", "Speaker1", "Speaker2"])
+        self.assertEqual(announced, ["Speaker2", "Speaker1", "Speaker0"])
+        self.assertEqual(len(set(client.prompts)), 1)
+    
+    def test_failed_speaker_keeps_its_slot(self):
+        """Test that an error message is stored in the failing participant's position."""
+        participants = make_speakers(3)
+        client = _SpeakerDelayClient({"Speaker0": 0.0, "Speaker1": 0.0, "Speaker2": 0.0}, failing=("Speaker1",))
+        orchestrator = create_orchestrator(DebateOrchestrator, client, participants, round_mode=RoundMode.SIMULTANEOUS)
+        
+        orchestrator.start_debate(participants)
+        
+        messages = orchestrator.current_session.conversation.get_all_messages()
+        self.assertEqual([m.speaker_name for m in messages], ["Speaker0", "Speaker1", "Speaker2"])
+        self.assertTrue(messages[1].metadata.get("error"))
+        self.assertEqual(orchestrator.current_session.status, DebateStatus.COMPLETED)
+    
+    def test_resumed_round_only_prepares_pending_speakers(self):
+        """Test that speakers who already answered get no new progress update."""
+        participants = make_speakers(2)
+        orchestrator = create_orchestrator(DebateOrchestrator, MockAIClient(), participants, round_mode=RoundMode.SIMULTANEOUS)
+        progress, args = resume_half_spoken_round(orchestrator, participants)
+        
+        orchestrator._run_simultaneous_round(*args)
+        
+        self.assertEqual(progress, ["Speaker1"])
+    
+    def test_opening_closing_mixes_modes(self):
+        """Test that middle rounds still reply to the previous speaker."""
+        participants = make_speakers(2)
+        client = _SpeakerDelayClient({"Speaker0": 0.0, "Speaker1": 0.0})
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, client, participants, round_mode=RoundMode.OPENING_CLOSING, total_rounds=3
+        )
+        
+        orchestrator.start_debate(participants)
+        
+        # Round 1 shares the topic prompt; round 2 speakers reply to each other
+        self.assertEqual(client.prompts[0], client.prompts[1])
+        self.assertNotEqual(client.prompts[2], client.prompts[3])
+        self.assertEqual(len(orchestrator.current_session.conversation.rounds), 3)
+
+
+class TestAsyncSimultaneousRounds(unittest.IsolatedAsyncioTestCase):
+    """Test cases for concurrent rounds in AsyncDebateOrchestrator."""
+    
+    async def test_round_latency_is_about_one_rtt(self):
+        """Test that the async orchestrator overlaps every speaker's latency."""
+        latency = 0.1
+        participants = make_speakers(10)
+        orchestrator = create_orchestrator(
+            AsyncDebateOrchestrator, AsyncMockAIClient(latency=latency), participants, round_mode=RoundMode.SIMULTANEOUS
+        )
+        announced = []
+        orchestrator.on_message_generated = lambda msg, char: announced.append(char.name)
+        
+        start = time.perf_counter()
+        await orchestrator.start_debate_async(participants)
+        elapsed = time.perf_counter() - start
+        
+        stored = [m.speaker_name for m in orchestrator.current_session.conversation.get_all_messages()]
+        self.assertEqual(stored, [p.name for p in participants])
+        self.assertEqual(sorted(announced), sorted(stored))
+        self.assertLess(elapsed, 3 * latency)
+    
+    async def test_resumed_round_only_prepares_pending_speakers(self):
+        """Test that speakers who already answered get no new progress update."""
+        participants = make_speakers(2)
+        orchestrator = create_orchestrator(AsyncDebateOrchestrator, AsyncMockAIClient(), participants, round_mode=RoundMode.SIMULTANEOUS)
+        progress, args = resume_half_spoken_round(orchestrator, participants)
+        
+        await orchestrator._run_simultaneous_round_async(*args)
+        
+        self.assertEqual(progress, ["Speaker1"])
+    
+    async def test_concurrency_is_bounded(self):
+        """Test that max_concurrent_responses limits in-flight calls."""
+        latency = 0.05
+        participants = make_speakers(6)
+        orchestrator = create_orchestrator(
+            AsyncDebateOrchestrator, AsyncMockAIClient(latency=latency), participants, round_mode=RoundMode.SIMULTANEOUS
+        )
+        orchestrator.current_session.settings.max_concurrent_responses = 2
+        
+        start = time.perf_counter()
+        await orchestrator.start_debate_async(participants)
+        elapsed = time.perf_counter() - start
+        
+        self.assertGreaterEqual(elapsed, 3 * latency)
+
+
+if __name__ == '__main__':
+    unittest.main()
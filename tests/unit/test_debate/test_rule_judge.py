@@ -0,0 +1,139 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.debate_simulator.domain.debate.judge import RuleBasedJudge, create_judge
+from src.debate_simulator.domain.debate.models import DebateMessage
+from src.debate_simulator.domain.debate.phrase_matcher import PhraseMatcher
+from tests.fixtures.debate import make_participants
+
+
+def make_message(speaker, text):
+    """Create a round 1 message."""
+    return DebateMessage(1, speaker, text, datetime.now())
+
+
+def scan_judge_round(criteria, round_messages, participants):
+    """Reference scoring with one substring scan per phrase, as the rule judge used to score."""
+    adjustments = {}
+    for participant in participants:
+        anger = patience = uniqueness = 0
+        for message in [msg for msg in round_messages if msg.speaker_name == participant.name]:
+            text = message.message.upper()
+            counts = {category: sum(1 for phrase in phrases if phrase.upper() in text) for category, phrases in criteria.items()}
+            if counts["anger_triggers"]:
+                anger += min(counts["anger_triggers"] * 2, 5)
+            if counts["patience_indicators"]:
+                patience += min(counts["patience_indicators"], 3)
+            if counts["uniqueness_indicators"]:
+                uniqueness += min(counts["uniqueness_indicators"], 3)
+            if len(message.message) > 100:
+                patience -= 1
+        adjustments[participant.name] = {"anger": anger, "patience": patience, "uniqueness": uniqueness}
+    return adjustments
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    """Test cases for PhraseMatcher."""
+    
+    def test_finds_distinct_phrases_per_category(self):
+        """Test case-insensitive matching, counted once per phrase."""
+        matcher = PhraseMatcher({"angry": ["FURIOUS", "!!!"], "calm": ["calm"]})
+        
+        found = matcher.find("I am furious!!!! Furious, not CALM")
+        
+        self.assertEqual(found, {"angry": {"furious", "!!!"}, "calm": {"calm"}})
+        self.assertEqual(matcher.count("nothing here"), {"angry": 0, "calm": 0})
+    
+    def test_overlapping_and_nested_phrases(self):
+        """Test that phrases sharing a start, inside another, or overlapping one are all found."""
+        matcher = PhraseMatcher({"words": ["calm", "calmest", "almost", "most", "stew"]})
+        
+        self.assertEqual(matcher.find("calmost")["words"], {"calm", "almost", "most"})
+        self.assertEqual(matcher.find("the calmestew")["words"], {"calm", "calmest", "stew"})
+    
+    def test_same_phrase_in_two_categories(self):
+        """Test that a phrase listed under two categories counts for both."""
+        matcher = PhraseMatcher({"a": ["unique"], "b": ["unique", "que"]})
+        
+        self.assertEqual(matcher.count("UNIQUE"), {"a": 1, "b": 2})
+    
+    def test_matches_substring_scan(self):
+        """Test that results agree with scanning for every phrase separately."""
+        phrases = {"x": ["ab", "abc", "bca", "ca", "!!!"], "y": ["cab", "b", "a!!"]}
+        matcher = PhraseMatcher(phrases)
+        rng = random.Random(7)
+        
+        for _ in range(300):
+            text = "".join(rng.choice("abcAB! ") for _ in range(rng.randint(0, 20)))
+            expected = {category: {p.lower() for p in items if p.lower() in text.lower()} for category, items in phrases.items()}
+            self.assertEqual(matcher.find(text), expected, text)
+
+
+class TestRuleBasedJudge(unittest.TestCase):
+    """Test cases for RuleBasedJudge."""
+    
+    def test_scores_match_substring_scan(self):
+        """Test that the compiled matcher scores rounds exactly as per-phrase scans do."""
+        judge = RuleBasedJudge()
+        participants = make_participants("Alice", "Bob")
+        words = ["I", "am", "OUTRAGED", "furious!!!", "calm", "and", "measured", "a", "fresh perspective", "unique", "CAPS", "ok"]
+        rng = random.Random(3)
+        
+        for _ in range(50):
+            round_messages = [
+                make_message(rng.choice(["Alice", "Bob", "Carol"]), " ".join(rng.choice(words) for _ in range(rng.randint(1, 30))))
+                for _ in range(4)
+            ]
+            self.assertEqual(
+                judge.judge_round(round_messages, participants),
+                scan_judge_round(judge.criteria, round_messages, participants)
+            )
+    
+    def test_example_round(self):
+        """Test scoring a round by hand."""
+        round_messages = [
+            make_message("Alice", "I am OUTRAGED and FURIOUS!!!"),
+            make_message("Bob", "Let us consider a calm, different approach.")
+        ]
+        
+        adjustments = RuleBasedJudge().judge_round(round_messages, make_participants("Alice", "Bob", "Carol"))
+        
+        self.assertEqual(adjustments, {
+            "Alice": {"anger": 5, "patience": 0, "uniqueness": 0},
+            "Bob": {"anger": 0, "patience": 2, "uniqueness": 1},
+            "Carol": {"anger": 0, "patience": 0, "uniqueness": 0}
+        })
+    
+    def test_criteria_file_extends_defaults(self):
+        """Test that phrases from a criteria file are added to the defaults."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "criteria.json")
+            with open(path, "w", encoding="utf-8") as criteria_file:
+                json.dump({"anger_triggers": ["disgrace"], "uniqueness_indicators": ["novel idea"]}, criteria_file)
+            
+            judge = create_judge("rule_based", criteria_file=path)
+        
+        adjustments = judge.judge_round([make_message("Alice", "A disgrace! Still a novel idea, and FURIOUS")], make_participants("Alice"))
+        
+        self.assertIn("CAPS", judge.criteria["anger_triggers"])
+        self.assertEqual(adjustments["Alice"], {"anger": 4, "patience": 0, "uniqueness": 1})
+    
+    def test_invalid_criteria(self):
+        """Test that unknown criteria names and malformed files are rejected."""
+        with self.assertRaises(ValueError):
+            RuleBasedJudge({"sarcasm_markers": ["sure, buddy"]})
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "criteria.json")
+            with open(path, "w", encoding="utf-8") as criteria_file:
+                json.dump({"anger_triggers": "disgrace"}, criteria_file)
+            with self.assertRaises(ValueError):
+                RuleBasedJudge(criteria_file=path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.models import DebateStatus, RoundMode
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+SLOW = 5.0
+
+
+class TestStopCancelsInFlightRequests(unittest.TestCase):
+    """Test cases for stopping a debate while an AI request is in flight."""
+    
+    def run_and_stop(self, orchestrator, participants, stop):
+        """Start the debate on a thread, call ``stop`` mid-request and time the shutdown."""
+        worker = threading.Thread(target=orchestrator.start_debate, args=(participants,))
+        worker.start()
+        time.sleep(0.1)
+        
+        start = time.perf_counter()
+        stop()
+        worker.join(timeout=SLOW)
+        return time.perf_counter() - start, worker
+    
+    def test_stop_returns_without_waiting_for_reply(self):
+        """Test that stop aborts the pending turn instead of waiting it out."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(DebateOrchestrator, MockAIClient(latency=SLOW), participants, total_rounds=3)
+        
+        elapsed, worker = self.run_and_stop(orchestrator, participants, orchestrator.stop_debate)
+        
+        self.assertFalse(worker.is_alive())
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(orchestrator.current_session.status, DebateStatus.STOPPED)
+        # The aborted turn is dropped, not recorded as a failed reply
+        self.assertEqual(orchestrator.current_session.conversation.get_all_messages(), [])
+    
+    def test_pause_aborts_simultaneous_round(self):
+        """Test that pausing cancels every concurrent turn of a simultaneous round."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, MockAIClient(latency=SLOW), participants, round_mode=RoundMode.SIMULTANEOUS, total_rounds=3
+        )
+        
+        elapsed, worker = self.run_and_stop(orchestrator, participants, orchestrator.pause_debate)
+        
+        self.assertFalse(worker.is_alive())
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(orchestrator.current_session.status, DebateStatus.PAUSED)
+        self.assertEqual(orchestrator.current_session.conversation.get_all_messages(), [])
+    
+    def test_resume_after_pause_gets_fresh_token(self):
+        """Test that a paused debate can resume and finish normally."""
+        participants = make_participants()
+        client = MockAIClient(latency=SLOW)
+        orchestrator = create_orchestrator(DebateOrchestrator, client, participants, total_rounds=3)
+        self.run_and_stop(orchestrator, participants, orchestrator.pause_debate)
+        
+        client.latency = 0.0
+        orchestrator.resume_debate(participants)
+        
+        self.assertEqual(orchestrator.current_session.status, DebateStatus.COMPLETED)
+        self.assertEqual(len(orchestrator.current_session.conversation.get_all_messages()), 6)
+
+
+class TestAsyncStopCancelsInFlightRequests(unittest.IsolatedAsyncioTestCase):
+    """Test cases for stopping an async debate while an AI request is awaited."""
+    
+    async def test_stop_cancels_awaited_request(self):
+        """Test that stop cancels the pending await on the event loop."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(AsyncDebateOrchestrator, AsyncMockAIClient(latency=SLOW), participants, total_rounds=3)
+        task = asyncio.create_task(orchestrator.start_debate_async(participants))
+        await asyncio.sleep(0.1)
+        
+        start = time.perf_counter()
+        orchestrator.stop_debate()
+        await asyncio.wait_for(task, timeout=SLOW)
+        
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(orchestrator.current_session.conversation.get_all_messages(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
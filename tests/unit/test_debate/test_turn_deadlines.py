@@ -0,0 +1,170 @@
+import time
+import unittest
+
+from src.debate_simulator.domain.debate.async_orchestrator import AsyncDebateOrchestrator
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus, TimeoutFallback
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncMockAIClient, MockAIClient, OpenAIClient
+from src.debate_simulator.infrastructure.cancellation import CancellationToken, cancellation_scope
+from src.debate_simulator.infrastructure.errors import DeadlineExceededError
+from src.debate_simulator.infrastructure.fake_openai_server import FakeOpenAIServer
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+SLOW = 5.0
+BUDGET = 0.1
+
+
+class _SlowSpeakerClient(MockAIClient):
+    """Mock client that stalls for one speaker once ``slow_after`` replies have been given."""
+    
+    def __init__(self, slow_speaker="Alice", slow_after=0):
+        super().__init__()
+        self.slow_speaker = slow_speaker
+        self.slow_after = slow_after
+        self.models = []
+    
+    def generate_response(self, messages):
+        is_slow_speaker = f"You are {self.slow_speaker}," in messages[0]["content"]
+        self.latency = SLOW if is_slow_speaker and self.call_count >= self.slow_after else 0.0
+        return super().generate_response(messages)
+    
+    def with_model(self, model):
+        self.models.append(model)
+        return MockAIClient(fixed_response=f"Quick reply from {model}")
+
+
+def run_debate(client, orchestrator_class=DebateOrchestrator, rounds=1, **settings):
+    """Run a debate to the end with the given deadline settings; returns the orchestrator and elapsed seconds."""
+    participants = make_participants()
+    settings.setdefault("timeout_per_response", BUDGET)
+    orchestrator = create_orchestrator(orchestrator_class, client, participants, total_rounds=rounds, **settings)
+    start = time.perf_counter()
+    orchestrator.start_debate(participants)
+    return orchestrator, time.perf_counter() - start
+
+
+def messages_by_speaker(orchestrator):
+    """Get the last message of each speaker."""
+    return {m.speaker_name: m for m in orchestrator.current_session.conversation.get_all_messages()}
+
+
+class TestTurnDeadlines(unittest.TestCase):
+    """Test cases for per-turn deadlines and their fallbacks."""
+    
+    def test_skip_records_miss(self):
+        """Test that a late speaker is skipped within the budget and the miss is recorded."""
+        orchestrator, elapsed = run_debate(_SlowSpeakerClient())
+        
+        alice, bob = messages_by_speaker(orchestrator)["Alice"], messages_by_speaker(orchestrator)["Bob"]
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(alice.metadata["error"])
+        self.assertEqual(alice.metadata["fallback"], "skip")
+        self.assertEqual(alice.metadata["deadline_misses"][0]["scope"], "turn")
+        self.assertNotIn("fallback", bob.metadata)
+        # Bob answers the topic, not the skipped turn
+        self.assertNotIn("Error", bob.message)
+    
+    def test_canned_line(self):
+        """Test that the canned fallback says the configured line."""
+        orchestrator, _ = run_debate(_SlowSpeakerClient(), timeout_fallback=TimeoutFallback.CANNED, fallback_line="Pass.")
+        
+        alice = messages_by_speaker(orchestrator)["Alice"]
+        self.assertEqual(alice.message, "Pass.")
+        self.assertEqual(alice.metadata["fallback"], "canned")
+        self.assertFalse(alice.metadata.get("error"))
+    
+    def test_cached_line_repeats_last_reply(self):
+        """Test that the cached fallback reuses the speaker's previous reply."""
+        orchestrator, _ = run_debate(_SlowSpeakerClient(slow_after=2), rounds=2, timeout_fallback=TimeoutFallback.CACHED)
+        
+        alice_messages = [m for m in orchestrator.current_session.conversation.get_all_messages() if m.speaker_name == "Alice"]
+        self.assertEqual(alice_messages[1].message, alice_messages[0].message)
+        self.assertEqual(alice_messages[1].metadata["fallback"], "cached")
+    
+    def test_cached_without_history_uses_canned_line(self):
+        """Test that the cached fallback falls back to the canned line on a first turn."""
+        orchestrator, _ = run_debate(_SlowSpeakerClient(), timeout_fallback=TimeoutFallback.CACHED)
+        
+        self.assertEqual(messages_by_speaker(orchestrator)["Alice"].metadata["fallback"], "canned")
+    
+    def test_fallback_model(self):
+        """Test that a miss is retried on the cheaper model with a fresh budget."""
+        client = _SlowSpeakerClient()
+        orchestrator, _ = run_debate(client, timeout_fallback=TimeoutFallback.MODEL, fallback_model="small-model")
+        
+        alice = messages_by_speaker(orchestrator)["Alice"]
+        self.assertEqual(alice.message, "Quick reply from small-model")
+        self.assertEqual(alice.metadata["fallback"], "model")
+        self.assertEqual(alice.metadata["fallback_model"], "small-model")
+        self.assertEqual(len(alice.metadata["deadline_misses"]), 1)
+        self.assertEqual(client.models, ["small-model"])
+    
+    def test_debate_deadline_stops_debate(self):
+        """Test that the overall deadline ends the debate and marks the cut-off turn."""
+        client = MockAIClient(latency=SLOW)
+        orchestrator, elapsed = run_debate(client, rounds=10, timeout_per_response=0, debate_timeout=0.2)
+        
+        messages = orchestrator.current_session.conversation.get_all_messages()
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(orchestrator.current_session.status, DebateStatus.STOPPED)
+        self.assertTrue(orchestrator.current_session.metadata["deadline_exceeded"])
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].metadata["deadline_misses"][0]["scope"], "debate")
+    
+    def test_settings_round_trip(self):
+        """Test that deadline settings survive serialization."""
+        settings = DebateSettings(debate_timeout=60, timeout_fallback=TimeoutFallback.MODEL, fallback_model="small")
+        
+        restored = DebateSettings.from_dict(settings.to_dict())
+        
+        self.assertEqual(restored.timeout_fallback, TimeoutFallback.MODEL)
+        self.assertEqual(restored.debate_timeout, 60)
+        self.assertEqual(restored.fallback_model, "small")
+
+
+class TestAsyncTurnDeadlines(unittest.IsolatedAsyncioTestCase):
+    """Test cases for per-turn deadlines in the async orchestrator."""
+    
+    async def test_skip_records_miss(self):
+        """Test that an awaited reply past its budget is cancelled and recorded."""
+        participants = make_participants()
+        orchestrator = create_orchestrator(
+            AsyncDebateOrchestrator, AsyncMockAIClient(latency=SLOW), participants, timeout_per_response=BUDGET
+        )
+        
+        start = time.perf_counter()
+        await orchestrator.start_debate_async(participants)
+        
+        messages = orchestrator.current_session.conversation.get_all_messages()
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual([m.metadata["fallback"] for m in messages], ["skip", "skip"])
+
+
+class TestTransportDeadline(unittest.TestCase):
+    """Test cases for deadlines reaching the HTTP transport."""
+    
+    def test_deadline_aborts_request_without_retry(self):
+        """Test that a request past its deadline is aborted and not retried."""
+        with FakeOpenAIServer(latency=SLOW) as server:
+            client = OpenAIClient(
+                api_key="sk-test123",
+                transport=PooledHTTPTransport(),
+                retry_policy=RetryPolicy(max_attempts=3, sleep=lambda delay: None),
+                circuit_breaker=CircuitBreaker(),
+                api_base=server.api_base
+            )
+            token = CancellationToken(timeout=0.2)
+            
+            start = time.perf_counter()
+            with cancellation_scope(token), self.assertRaises(DeadlineExceededError):
+                client.generate_response([{"role": "user", "content": "Hi"}])
+            
+            self.assertLess(time.perf_counter() - start, 1.0)
+            self.assertEqual(len(server.received), 1)
+            self.assertLessEqual(client._request_timeout(token), 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
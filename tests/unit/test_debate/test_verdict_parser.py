@@ -0,0 +1,158 @@
+import json
+import unittest
+from datetime import datetime
+
+from src.debate_simulator.domain.debate.judge import AIDebateJudge
+from src.debate_simulator.domain.debate.models import DebateMessage
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.domain.debate.verdict_parser import (
+    index_by_round, match_participant, normalize_adjustments, parse_json_reply
+)
+from src.debate_simulator.infrastructure.ai_client import MockAIClient
+from tests.fixtures.debate import create_orchestrator, make_participants
+
+NAMES = ["Alice Smith", "Bob Jones"]
+VERDICT = {
+    "Alice Smith": {"anger": 3, "patience": -2, "uniqueness": 1},
+    "Bob Jones": {"anger": -1, "patience": 4, "uniqueness": 0}
+}
+
+
+def make_round(round_number=1):
+    """Create the messages of one round."""
+    return [DebateMessage(round_number, name, f"{name} speaks", datetime.now()) for name in NAMES]
+
+
+class TestParseJsonReply(unittest.TestCase):
+    """Test cases for parse_json_reply."""
+    
+    def test_clean_reply(self):
+        """Test that valid JSON is parsed without repair."""
+        self.assertEqual(parse_json_reply(json.dumps(VERDICT)), (VERDICT, False))
+    
+    def test_fenced_reply_with_prose(self):
+        """Test that markdown fences and surrounding text are stripped."""
+        reply = f"Here is my verdict:\n```json\n{json.dumps(VERDICT, indent=2)}\n```\nHope this helps!"
+        
+        self.assertEqual(parse_json_reply(reply), (VERDICT, True))
+    
+    def test_trailing_comma(self):
+        """Test that a trailing comma does not waste the reply."""
+        reply = '{"Alice Smith": {"anger": 3, "patience": -2, "uniqueness": 1},}'
+        
+        self.assertEqual(parse_json_reply(reply)[0], {"Alice Smith": VERDICT["Alice Smith"]})
+    
+    def test_truncated_reply_keeps_complete_entries(self):
+        """Test that a reply cut off mid-object keeps everything before the cut."""
+        full = json.dumps(VERDICT)
+        
+        for cut in (len(full) - 1, full.index('"patience": 4') + 4, full.index('"uniqueness": 0') + 14):
+            with self.subTest(tail=full[cut - 10:cut]):
+                value, repaired = parse_json_reply(full[:cut])
+                self.assertTrue(repaired)
+                self.assertEqual(value["Alice Smith"], VERDICT["Alice Smith"])
+        
+        self.assertEqual(parse_json_reply(full[:-1])[0], VERDICT)
+    
+    def test_no_json(self):
+        """Test that a reply without an object gives None, and one cut off at once gives nothing usable."""
+        self.assertEqual(parse_json_reply("I cannot judge this round."), (None, True))
+        self.assertEqual(parse_json_reply('{"Alice'), ({}, True))
+        self.assertIsNone(normalize_adjustments({}, NAMES)[0])
+
+
+class TestNormalizeAdjustments(unittest.TestCase):
+    """Test cases for matching names and cleaning stat values."""
+    
+    def test_fuzzy_names(self):
+        """Test that near-miss names map to the participant they mean."""
+        self.assertEqual(match_participant("alice smith", NAMES), "Alice Smith")
+        self.assertEqual(match_participant("Sen. Bob Jones", NAMES), "Bob Jones")
+        self.assertEqual(match_participant("Alcie Smith", NAMES), "Alice Smith")
+        self.assertEqual(match_participant("Bob", NAMES), "Bob Jones")
+        self.assertIsNone(match_participant("Carol White", NAMES))
+    
+    def test_stats_coerced_clamped_and_filled(self):
+        """Test that stat values become in-range integers and missing participants get no change."""
+        adjustments, repaired = normalize_adjustments({"ALICE SMITH": {"Anger": "+4", "patience": 2.6, "uniqueness": 25}}, NAMES)
+        
+        self.assertTrue(repaired)
+        self.assertEqual(adjustments, {
+            "Alice Smith": {"anger": 4, "patience": 3, "uniqueness": 10},
+            "Bob Jones": {"anger": 0, "patience": 0, "uniqueness": 0}
+        })
+    
+    def test_non_finite_stats_are_neutral(self):
+        """Test that infinite or NaN stat values fall back to no change instead of crashing."""
+        verdict = {"Alice Smith": {"anger": float("inf"), "patience": float("nan"), "uniqueness": "9" * 400}}
+        adjustments, _ = normalize_adjustments(verdict, NAMES)
+        
+        self.assertEqual(adjustments["Alice Smith"], {"anger": 0, "patience": 0, "uniqueness": 0})
+    
+    def test_unmatched_verdict(self):
+        """Test that a verdict naming nobody in the debate is unusable."""
+        self.assertEqual(normalize_adjustments({"Character 1": {"anger": 1}}, NAMES), (None, True))
+        self.assertEqual(normalize_adjustments(["Alice Smith"], NAMES), (None, True))
+    
+    def test_round_keys(self):
+        """Test that batched replies are indexed by the number in each key."""
+        self.assertEqual(index_by_round({"1": "a", "Round 2": "b", "notes": "c"}), {1: "a", 2: "b"})
+
+
+class TestAIDebateJudgeParsing(unittest.TestCase):
+    """Test cases for AIDebateJudge's structured output and tolerant parsing."""
+    
+    def test_requests_schema_when_supported(self):
+        """Test that clients with structured output get a schema naming every participant."""
+        client = MockAIClient(fixed_judge_response=json.dumps(VERDICT), structured_output=True)
+        
+        AIDebateJudge(client).judge_round(make_round(), make_participants(*NAMES))
+        AIDebateJudge(MockAIClient(fixed_judge_response=json.dumps(VERDICT))).judge_round(make_round(), make_participants(*NAMES))
+        
+        response_format = client.judge_response_formats[0]
+        self.assertEqual(response_format["type"], "json_schema")
+        self.assertEqual(response_format["json_schema"]["schema"]["required"], NAMES)
+    
+    def test_batch_schema_keyed_by_round(self):
+        """Test that a batched call's schema has one required entry per round."""
+        client = MockAIClient(fixed_judge_response=json.dumps({"1": VERDICT, "2": VERDICT}), structured_output=True)
+        
+        AIDebateJudge(client).judge_rounds([make_round(1), make_round(2)], make_participants(*NAMES))
+        
+        self.assertEqual(client.judge_response_formats[0]["json_schema"]["schema"]["required"], ["1", "2"])
+    
+    def test_parse_failure_rate(self):
+        """Test that repaired replies are used and only unusable ones count as failures."""
+        client = MockAIClient()
+        judge = AIDebateJudge(client)
+        participants = make_participants(*NAMES)
+        replies = [json.dumps(VERDICT), f"```json\n{json.dumps(VERDICT)}\n```", json.dumps(VERDICT)[:-20], "No verdict."]
+        
+        results = []
+        for reply in replies:
+            client.fixed_judge_response = reply
+            results.append(judge.judge_round(make_round(), participants))
+        
+        self.assertEqual(results[:2], [VERDICT, VERDICT])
+        self.assertEqual(results[2]["Alice Smith"], VERDICT["Alice Smith"])
+        self.assertEqual(results[3], judge._neutral_adjustments(participants))
+        self.assertEqual(judge.get_stats(), {
+            "verdicts": 4, "repaired_verdicts": 2, "parse_failures": 1, "parse_failure_rate": 0.25, "call_failures": 0
+        })
+    
+    def test_stats_saved_on_session(self):
+        """Test that a competitive debate records the judge's parsing metrics."""
+        client = MockAIClient(fixed_response="Reply", fixed_judge_response=f"```\n{json.dumps(VERDICT)}\n```")
+        participants = make_participants(*NAMES)
+        orchestrator = create_orchestrator(
+            DebateOrchestrator, client, participants, AIDebateJudge(client), total_rounds=2, competitive_mode=True
+        )
+        
+        orchestrator.start_debate(participants)
+        
+        stats = orchestrator.current_session.metadata["judge_stats"]
+        self.assertEqual((stats["verdicts"], stats["repaired_verdicts"], stats["parse_failures"]), (2, 2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,21 @@
+import asyncio
 import unittest
 from unittest.mock import patch, Mock, MagicMock
 import json
+import time
 import requests
 
 from src.debate_simulator.infrastructure.ai_client import (
-    OpenAIClient, MockAIClient, AIClientError, 
-    create_ai_client, validate_api_key, test_ai_connection
+    OpenAIClient, AsyncOpenAIClient, MockAIClient, AsyncMockAIClient, AIClientError, 
+    SSE_DONE, parse_sse_delta, create_ai_client, validate_api_key, test_ai_connection
 )
+from src.debate_simulator.infrastructure.cancellation import CancellationToken, cancellation_scope
+from src.debate_simulator.infrastructure.errors import (
+    PermanentAIError, ServerError, AITimeoutError, CircuitOpenError, RequestCancelledError
+)
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+from tests.fixtures.fake_openai_server import FakeOpenAIServer
 
 
 class TestOpenAIClient(unittest.TestCase):
@@ -15,7 +24,13 @@ class TestOpenAIClient(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.api_key = "sk-test_key_1234567890abcdef"
-        self.client = OpenAIClient(api_key=self.api_key)
+        self.transport = Mock()
+        self.client = OpenAIClient(
+            api_key=self.api_key,
+            transport=self.transport,
+            retry_policy=RetryPolicy(sleep=lambda delay: None),
+            circuit_breaker=CircuitBreaker()
+        )
     
     def test_initialization(self):
         """Test client initialization."""
@@ -35,9 +50,9 @@ class TestOpenAIClient(unittest.TestCase):
                 OpenAIClient()
             self.assertIn("OpenAI API key is required", str(context.exception))
     
-    @patch('src.debate_simulator.infrastructure.ai_client.requests.post')
-    def test_generate_response_success(self, mock_post):
+    def test_generate_response_success(self):
         """Test successful response generation."""
+        mock_post = self.transport.post
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
@@ -58,9 +73,9 @@ class TestOpenAIClient(unittest.TestCase):
         self.assertIn('json', call_args.kwargs)
         self.assertEqual(call_args.kwargs['headers']['Authorization'], f"Bearer {self.api_key}")
     
-    @patch('src.debate_simulator.infrastructure.ai_client.requests.post')
-    def test_generate_response_http_error(self, mock_post):
+    def test_generate_response_http_error(self):
         """Test response generation with HTTP error."""
+        mock_post = self.transport.post
         # Mock HTTP error response
         mock_response = Mock()
         mock_response.status_code = 401
@@ -68,26 +83,28 @@ class TestOpenAIClient(unittest.TestCase):
         mock_post.return_value = mock_response
         
         messages = [{"role": "user", "content": "Test message"}]
-        response = self.client.generate_response(messages)
+        with self.assertRaises(PermanentAIError) as context:
+            self.client.generate_response(messages)
         
-        self.assertIn("Error: HTTP 401", response)
-        self.assertIn("Unauthorized", response)
+        self.assertEqual(context.exception.status_code, 401)
+        self.assertIn("Unauthorized", str(context.exception))
+        mock_post.assert_called_once()  # Client errors are not retried
     
-    @patch('src.debate_simulator.infrastructure.ai_client.requests.post')
-    def test_generate_response_network_error(self, mock_post):
+    def test_generate_response_network_error(self):
         """Test response generation with network error."""
+        mock_post = self.transport.post
         # Mock network error
         mock_post.side_effect = requests.exceptions.RequestException("Network error")
         
         messages = [{"role": "user", "content": "Test message"}]
-        response = self.client.generate_response(messages)
+        with self.assertRaises(AIClientError) as context:
+            self.client.generate_response(messages)
         
-        self.assertIn("Error generating response", response)
-        self.assertIn("Network error", response)
+        self.assertIn("Network error", str(context.exception))
     
-    @patch('src.debate_simulator.infrastructure.ai_client.requests.post')
-    def test_generate_judge_response_success(self, mock_post):
+    def test_generate_judge_response_success(self):
         """Test successful judge response generation."""
+        mock_post = self.transport.post
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
@@ -102,16 +119,225 @@ class TestOpenAIClient(unittest.TestCase):
         self.assertIn("participant", response)
         mock_post.assert_called_once()
     
-    @patch('src.debate_simulator.infrastructure.ai_client.requests.post')
-    def test_generate_judge_response_error(self, mock_post):
+    def test_generate_judge_response_error(self):
         """Test judge response generation with error."""
+        mock_post = self.transport.post
         # Mock error response
         mock_post.side_effect = requests.exceptions.RequestException("Error")
         
         prompt = "Judge this debate round"
-        response = self.client.generate_judge_response(prompt)
+        with self.assertRaises(AIClientError):
+            self.client.generate_judge_response(prompt)
+    
+    def test_judge_response_format_sent_when_requested(self):
+        """Test that a requested response format is added to the judge payload."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"choices": [{"message": {"content": "{}"}}]}
+        self.transport.post.return_value = mock_response
+        response_format = {"type": "json_schema", "json_schema": {"name": "round_verdict", "schema": {"type": "object"}}}
+        
+        self.client.generate_judge_response("Judge this debate round", response_format=response_format)
+        self.client.generate_judge_response("Judge this debate round")
+        
+        payloads = [call.kwargs["json"] for call in self.transport.post.call_args_list]
+        self.assertEqual(payloads[0]["response_format"], response_format)
+        self.assertNotIn("response_format", payloads[1])
+    
+    def test_judge_max_tokens_overrides_default(self):
+        """Test that a per-call reply budget replaces the default judge max_tokens."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"choices": [{"message": {"content": "{}"}}]}
+        self.transport.post.return_value = mock_response
+        
+        self.client.generate_judge_response("Judge these rounds", max_tokens=940)
+        self.client.generate_judge_response("Judge this round")
+        
+        payloads = [call.kwargs["json"] for call in self.transport.post.call_args_list]
+        self.assertEqual([payload["max_tokens"] for payload in payloads], [940, 300])
+    
+    def test_judge_response_format_dropped_when_rejected(self):
+        """Test that a backend refusing response_format gets a plain retry and no format afterwards."""
+        rejected = Mock(status_code=400, text="Unknown parameter: response_format", headers={})
+        accepted = Mock(status_code=200)
+        accepted.json.return_value = {"choices": [{"message": {"content": "{}"}}]}
+        self.transport.post.side_effect = [rejected, accepted, accepted]
+        response_format = {"type": "json_schema", "json_schema": {"name": "round_verdict", "schema": {"type": "object"}}}
+        
+        self.assertEqual(self.client.generate_judge_response("Judge", response_format=response_format), "{}")
+        self.client.generate_judge_response("Judge", response_format=response_format)
         
-        self.assertEqual(response, "{}")  # Should return empty JSON on error
+        payloads = [call.kwargs["json"] for call in self.transport.post.call_args_list]
+        self.assertEqual(["response_format" in payload for payload in payloads], [True, False, False])
+        self.assertFalse(self.client.structured_output)
+
+
+class TestStreamingResponses(unittest.TestCase):
+    """Test cases for server-sent event streaming."""
+    
+    def test_parse_sse_delta(self):
+        """Test parsing individual SSE lines."""
+        self.assertEqual(parse_sse_delta('data: {"choices": [{"delta": {"content": "Hi"}}]}'), "Hi")
+        self.assertIsNone(parse_sse_delta('data: {"choices": [{"delta": {"role": "assistant"}}]}'))
+        self.assertIsNone(parse_sse_delta(""))
+        self.assertIsNone(parse_sse_delta(": keep-alive"))
+        self.assertIs(parse_sse_delta("data: [DONE]"), SSE_DONE)
+    
+    def test_parse_sse_delta_skips_malformed_chunks(self):
+        """Test that a garbled data line is skipped instead of ending the stream."""
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(parse_sse_delta('data: {"choices": [{"delta": '))
+        self.assertIsNone(parse_sse_delta("data: 42"))
+    
+    def test_stream_response_yields_deltas_before_completion(self):
+        """Test that the first delta arrives well before the full reply."""
+        transport = PooledHTTPTransport()
+        with FakeOpenAIServer(reply="one two three four five", chunk_delay=0.05) as server:
+            client = OpenAIClient(api_key="sk-test123", transport=transport)
+            client.base_url = server.url
+            
+            start = time.perf_counter()
+            deltas = []
+            first_token_at = None
+            for delta in client.stream_response([{"role": "user", "content": "Hi"}]):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter() - start
+                deltas.append(delta)
+            total = time.perf_counter() - start
+        transport.close()
+        
+        self.assertEqual("".join(deltas), "one two three four five")
+        self.assertEqual(len(deltas), 5)
+        self.assertTrue(server.received[0]["stream"])
+        self.assertLess(first_token_at, total / 2)
+    
+    def test_stream_response_http_error(self):
+        """Test that an HTTP error raises once retries are exhausted."""
+        transport = Mock()
+        response = MagicMock()
+        response.status_code = 500
+        response.text = "Server error"
+        response.headers = {}
+        transport.post.return_value = response
+        client = OpenAIClient(
+            api_key="sk-test123",
+            transport=transport,
+            retry_policy=RetryPolicy(max_attempts=2, sleep=lambda delay: None),
+            circuit_breaker=CircuitBreaker()
+        )
+        
+        with self.assertRaises(ServerError):
+            list(client.stream_response([{"role": "user", "content": "Hi"}]))
+        self.assertEqual(transport.post.call_count, 2)
+    
+    def test_mock_client_streams_words(self):
+        """Test that the mock client streams a reply that reassembles exactly."""
+        client = MockAIClient(fixed_response="Fixed test response")
+        
+        deltas = list(client.stream_response([{"role": "user", "content": "Test"}]))
+        
+        self.assertEqual(deltas, ["Fixed", " test", " response"])
+        self.assertEqual(client.call_count, 1)
+
+
+class TestAsyncOpenAIClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncOpenAIClient."""
+    
+    async def test_generate_response_async(self):
+        """Test async response generation against a local server."""
+        with FakeOpenAIServer(reply="Async reply") as server:
+            client = AsyncOpenAIClient(api_key="sk-test123")
+            client.base_url = server.url
+            try:
+                response = await client.generate_response_async([{"role": "user", "content": "Hi"}])
+                judge_response = await client.generate_judge_response_async("Judge this")
+            finally:
+                await client.aclose()
+        
+        self.assertEqual(response, "Async reply")
+        self.assertEqual(judge_response, "Async reply")
+        self.assertEqual(server.received[0]["max_tokens"], 100)
+        self.assertEqual(server.received[1]["max_tokens"], 300)
+    
+    async def test_stream_response_async(self):
+        """Test async SSE streaming against a local server."""
+        with FakeOpenAIServer(reply="streamed async reply") as server:
+            client = AsyncOpenAIClient(api_key="sk-test123")
+            client.base_url = server.url
+            try:
+                deltas = [delta async for delta in client.stream_response_async([{"role": "user", "content": "Hi"}])]
+            finally:
+                await client.aclose()
+        
+        self.assertEqual(deltas, ["streamed", " async", " reply"])
+    
+    async def test_stream_timeout_capped_at_deadline(self):
+        """Test that opening a stream applies the turn deadline to the socket timeout."""
+        import httpx
+        client = AsyncOpenAIClient(
+            api_key="sk-test123", retry_policy=RetryPolicy(max_attempts=1), circuit_breaker=CircuitBreaker()
+        )
+        http_client = httpx.AsyncClient()
+        sent = []
+        
+        async def refuse(request, stream=False):
+            sent.append(request)
+            raise httpx.ConnectError("refused", request=request)
+        
+        http_client.send = refuse
+        token = CancellationToken(timeout=2.0)
+        try:
+            with patch.object(client, "_get_http_client", return_value=http_client), cancellation_scope(token):
+                with self.assertRaises(AITimeoutError):
+                    async for _ in client.stream_response_async([{"role": "user", "content": "Hi"}]):
+                        pass
+        finally:
+            token.close()
+            await http_client.aclose()
+        
+        self.assertLessEqual(sent[0].extensions["timeout"]["read"], 2.0)
+
+
+class TestAsyncOpenAIClientLifecycle(unittest.TestCase):
+    """Test cases for AsyncOpenAIClient used from more than one event loop."""
+    
+    def test_client_survives_successive_event_loops(self):
+        """Test that each asyncio.run gets a connection pool bound to its own loop."""
+        with FakeOpenAIServer(reply="Async reply") as server:
+            client = AsyncOpenAIClient(api_key="sk-test123", circuit_breaker=CircuitBreaker())
+            client.base_url = server.url
+            
+            for _ in range(2):
+                reply = asyncio.run(client.generate_response_async([{"role": "user", "content": "Hi"}]))
+                self.assertEqual(reply, "Async reply")
+    
+    def test_cancellation_stops_retries(self):
+        """Test that a token cancelled during backoff prevents the next attempt."""
+        token = CancellationToken()
+        policy = RetryPolicy(max_attempts=3)
+        
+        def cancel_during_backoff(attempt, error):
+            token.cancel()
+            return 0.0
+        
+        policy.compute_delay = cancel_during_backoff
+        
+        async def generate(client):
+            try:
+                with cancellation_scope(token):
+                    return await client.generate_response_async([{"role": "user", "content": "Hi"}])
+            finally:
+                await client.aclose()
+        
+        with FakeOpenAIServer(reply="Too late", fail_first=1) as server:
+            client = AsyncOpenAIClient(api_key="sk-test123", retry_policy=policy, circuit_breaker=CircuitBreaker())
+            client.base_url = server.url
+            
+            with self.assertRaises(RequestCancelledError):
+                asyncio.run(generate(client))
+        
+        self.assertEqual(len(server.received), 1)
 
 
 class TestMockAIClient(unittest.TestCase):
@@ -222,6 +448,14 @@ class TestFactoryFunctions(unittest.TestCase):
         self.assertIsInstance(client, MockAIClient)
         self.assertEqual(client.fixed_response, "Test")
     
+    def test_create_async_clients(self):
+        """Test creating async clients via factory."""
+        self.assertIsInstance(create_ai_client("openai_async", api_key="sk-test123"), AsyncOpenAIClient)
+        
+        mock_client = create_ai_client("mock_async", latency=0.01)
+        self.assertIsInstance(mock_client, AsyncMockAIClient)
+        self.assertEqual(mock_client.latency, 0.01)
+    
     def test_create_unknown_client_type(self):
         """Test creating unknown client type raises error."""
         with self.assertRaises(ValueError) as context:
@@ -296,41 +530,42 @@ class TestAIClientIntegration(unittest.TestCase):
     
     def test_openai_client_request_format(self):
         """Test that OpenAI client formats requests correctly."""
-        with patch('src.debate_simulator.infrastructure.ai_client.requests.post') as mock_post:
-            # Mock successful response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "choices": [{"message": {"content": "Response"}}]
-            }
-            mock_post.return_value = mock_response
-            
-            client = OpenAIClient(api_key="sk-test123")
-            messages = [
-                {"role": "system", "content": "System message"},
-                {"role": "user", "content": "User message"}
-            ]
-            
-            client.generate_response(messages)
-            
-            # Verify the request was made correctly
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            
-            # Check URL
-            self.assertEqual(call_args[0][0], "https://api.openai.com/v1/chat/completions")
-            
-            # Check headers
-            headers = call_args.kwargs['headers']
-            self.assertEqual(headers['Authorization'], "Bearer sk-test123")
-            self.assertEqual(headers['Content-Type'], "application/json")
-            
-            # Check request data
-            data = call_args.kwargs['json']
-            self.assertEqual(data['model'], "gpt-4o")
-            self.assertEqual(data['messages'], messages)
-            self.assertEqual(data['max_tokens'], 100)
-            self.assertEqual(data['temperature'], 0.8)
+        transport = Mock()
+        mock_post = transport.post
+        # Mock successful response
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Response"}}]
+        }
+        mock_post.return_value = mock_response
+        
+        client = OpenAIClient(api_key="sk-test123", transport=transport)
+        messages = [
+            {"role": "system", "content": "System message"},
+            {"role": "user", "content": "User message"}
+        ]
+        
+        client.generate_response(messages)
+        
+        # Verify the request was made correctly
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        
+        # Check URL
+        self.assertEqual(call_args[0][0], "https://api.openai.com/v1/chat/completions")
+        
+        # Check headers
+        headers = call_args.kwargs['headers']
+        self.assertEqual(headers['Authorization'], "Bearer sk-test123")
+        self.assertEqual(headers['Content-Type'], "application/json")
+        
+        # Check request data
+        data = call_args.kwargs['json']
+        self.assertEqual(data['model'], "gpt-4o")
+        self.assertEqual(data['messages'], messages)
+        self.assertEqual(data['max_tokens'], 100)
+        self.assertEqual(data['temperature'], 0.8)
     
     def test_mock_client_character_name_extraction(self):
         """Test that mock client extracts character names correctly."""
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.debate_simulator.infrastructure.ai_client import OpenAIClient
+from src.debate_simulator.infrastructure.cancellation import (
+    CancellationToken, await_cancellable, cancellation_scope, current_cancellation_token, run_cancellable
+)
+from src.debate_simulator.infrastructure.errors import RequestCancelledError, DeadlineExceededError
+from src.debate_simulator.infrastructure.fake_openai_server import FakeOpenAIServer
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+
+
+def cancel_later(token, delay=0.1):
+    """Cancel ``token`` from another thread after ``delay`` seconds."""
+    timer = threading.Timer(delay, token.cancel, args=("Stopped",))
+    timer.start()
+    return timer
+
+
+class TestCancellationToken(unittest.TestCase):
+    """Test cases for CancellationToken."""
+    
+    def test_cancel_runs_callbacks_once(self):
+        """Test that callbacks fire once and the reason is kept."""
+        token = CancellationToken()
+        calls = []
+        token.register(lambda: calls.append("a"))
+        unregister = token.register(lambda: calls.append("b"))
+        unregister()
+        
+        token.cancel("Stopped")
+        token.cancel("Again")
+        
+        self.assertEqual(calls, ["a"])
+        self.assertTrue(token.is_cancelled)
+        self.assertEqual(token.reason, "Stopped")
+    
+    def test_register_after_cancel_runs_immediately(self):
+        """Test that late registrations are not lost."""
+        token = CancellationToken()
+        token.cancel()
+        calls = []
+        
+        token.register(lambda: calls.append(1))
+        
+        self.assertEqual(calls, [1])
+        with self.assertRaises(RequestCancelledError):
+            token.raise_if_cancelled()
+    
+    def test_child_follows_parent_and_deadline(self):
+        """Test that a child is cancelled with its parent, and expires on its own."""
+        parent = CancellationToken()
+        child = parent.child()
+        expiring = parent.child(timeout=0.05)
+        
+        self.assertTrue(expiring.wait(1.0))
+        self.assertIsInstance(expiring.error(), DeadlineExceededError)
+        self.assertFalse(parent.is_cancelled)
+        
+        parent.cancel("Stopped")
+        self.assertTrue(child.is_cancelled)
+        self.assertNotIsInstance(child.error(), DeadlineExceededError)
+    
+    def test_closed_child_is_detached(self):
+        """Test that closing a child stops its timer and parent link."""
+        parent = CancellationToken()
+        child = parent.child(timeout=0.05)
+        child.close()
+        
+        parent.cancel()
+        
+        self.assertFalse(child.wait(0.1))
+    
+    def test_scope_sets_current_token(self):
+        """Test that the scope is visible only inside the block."""
+        token = CancellationToken()
+        
+        with cancellation_scope(token):
+            self.assertIs(current_cancellation_token(), token)
+        self.assertIsNone(current_cancellation_token())
+    
+    def test_await_cancellable(self):
+        """Test that a pending await is abandoned as soon as the token fires."""
+        token = CancellationToken()
+        cancel_later(token)
+        
+        async def run():
+            await await_cancellable(asyncio.sleep(5), token)
+        
+        start = time.perf_counter()
+        with self.assertRaises(RequestCancelledError):
+            asyncio.run(run())
+        self.assertLess(time.perf_counter() - start, 1.0)
+    
+    def test_run_cancellable_interrupted_by_poll(self):
+        """Test that an exception from the poll cancels the blocked operation."""
+        token = CancellationToken()
+        
+        def poll():
+            raise KeyboardInterrupt()
+        
+        with self.assertRaises(KeyboardInterrupt):
+            run_cancellable(lambda: token.wait(5), token, poll=poll, interval=0.01)
+        self.assertTrue(token.is_cancelled)
+    
+    def test_retry_backoff_wakes_on_cancel(self):
+        """Test that the default retry sleep is cut short by the scope's token."""
+        token = CancellationToken()
+        cancel_later(token)
+        
+        start = time.perf_counter()
+        with cancellation_scope(token), self.assertRaises(RequestCancelledError):
+            RetryPolicy().sleep(5)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestRequestCancellation(unittest.TestCase):
+    """Test cases for aborting HTTP requests that are already on the wire."""
+    
+    def make_client(self, server, breaker=None):
+        """Create a client pointed at the fake server."""
+        return OpenAIClient(
+            api_key="sk-test123",
+            transport=PooledHTTPTransport(),
+            retry_policy=RetryPolicy(max_attempts=3, sleep=lambda delay: None),
+            circuit_breaker=breaker or CircuitBreaker(failure_threshold=1),
+            api_base=server.api_base
+        )
+    
+    def test_cancel_aborts_in_flight_request(self):
+        """Test that cancelling closes the socket instead of waiting for the reply."""
+        with FakeOpenAIServer(latency=5.0) as server:
+            breaker = CircuitBreaker(failure_threshold=1)
+            client = self.make_client(server, breaker)
+            token = CancellationToken()
+            cancel_later(token)
+            
+            start = time.perf_counter()
+            with cancellation_scope(token), self.assertRaises(RequestCancelledError):
+                client.generate_response([{"role": "user", "content": "Hi"}])
+            
+            self.assertLess(time.perf_counter() - start, 1.0)
+            # A cancellation is neither retried nor counted against the provider
+            self.assertEqual(len(server.received), 1)
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_cancel_aborts_stream(self):
+        """Test that cancelling mid-stream stops the iteration promptly."""
+        with FakeOpenAIServer(reply="one two three four five six", chunk_delay=1.0) as server:
+            client = self.make_client(server)
+            token = CancellationToken()
+            cancel_later(token, 0.2)
+            
+            start = time.perf_counter()
+            with cancellation_scope(token), self.assertRaises(RequestCancelledError):
+                list(client.stream_response([{"role": "user", "content": "Hi"}]))
+            self.assertLess(time.perf_counter() - start, 1.5)
+    
+    def test_connection_reusable_after_completed_request(self):
+        """Test that a finished request's connection is not severed by a later cancel."""
+        with FakeOpenAIServer(reply="Done") as server:
+            client = self.make_client(server)
+            token = CancellationToken()
+            
+            with cancellation_scope(token):
+                self.assertEqual(client.generate_response([{"role": "user", "content": "Hi"}]), "Done")
+            token.cancel()
+            
+            self.assertEqual(client.generate_response([{"role": "user", "content": "Hi"}]), "Done")
+            self.assertEqual(client.transport.get_stats()["pool_hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
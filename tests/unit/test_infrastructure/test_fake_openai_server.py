@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from src.debate_simulator.infrastructure.ai_client import OpenAIClient
+from src.debate_simulator.infrastructure.errors import RateLimitError
+from src.debate_simulator.infrastructure.fake_openai_server import FakeOpenAIServer, LatencyModel
+from src.debate_simulator.infrastructure.http_transport import PooledHTTPTransport
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+
+
+class TestLatencyModel(unittest.TestCase):
+    """Test cases for LatencyModel."""
+    
+    def test_parse_specs(self):
+        """Test parsing fixed and parameterized distributions."""
+        self.assertEqual(LatencyModel.parse("0.25").sample(), 0.25)
+        
+        uniform = LatencyModel.parse("uniform:0.1,0.2", rng=random.Random(1))
+        for _ in range(20):
+            self.assertTrue(0.1 <= uniform.sample() <= 0.2)
+    
+    def test_samples_never_negative(self):
+        """Test that wide normal distributions are clamped at zero."""
+        model = LatencyModel("normal", 0.0, 1.0, rng=random.Random(3))
+        
+        self.assertTrue(all(model.sample() >= 0.0 for _ in range(50)))
+    
+    def test_lognormal_median(self):
+        """Test that lognormal samples center on the configured median."""
+        model = LatencyModel("lognormal", 0.3, 0.5, rng=random.Random(7))
+        samples = sorted(model.sample() for _ in range(501))
+        
+        self.assertAlmostEqual(samples[250], 0.3, delta=0.05)
+    
+    def test_unknown_distribution(self):
+        """Test that unknown distributions are rejected."""
+        with self.assertRaises(ValueError):
+            LatencyModel("pareto", 1.0)
+
+
+class TestFakeOpenAIServer(unittest.TestCase):
+    """Test cases for FakeOpenAIServer."""
+    
+    def make_client(self, server, max_attempts=1):
+        """Create a client pointed at the fake server."""
+        return OpenAIClient(
+            api_key="sk-test123",
+            transport=PooledHTTPTransport(),
+            retry_policy=RetryPolicy(max_attempts=max_attempts, sleep=lambda delay: None),
+            circuit_breaker=CircuitBreaker(),
+            api_base=server.api_base
+        )
+    
+    def test_client_points_at_api_base(self):
+        """Test that the client's endpoint is derived from the API root."""
+        with FakeOpenAIServer(reply="Hello from fake") as server:
+            client = self.make_client(server)
+            
+            self.assertEqual(client.base_url, server.url)
+            self.assertEqual(client.generate_response([{"role": "user", "content": "Hi"}]), "Hello from fake")
+    
+    def test_template_reply(self):
+        """Test that templated replies see the speaker and request number."""
+        with FakeOpenAIServer(template="{speaker} point #{n}") as server:
+            client = self.make_client(server)
+            messages = [{"role": "system", "content": "You are Alice, a pundit."}, {"role": "user", "content": "Go"}]
+            
+            self.assertEqual(client.generate_response(messages), "Alice point #1")
+            self.assertEqual(client.generate_response(messages), "Alice point #2")
+    
+    def test_canned_replies_cycle(self):
+        """Test cycling through canned replies, streamed and not."""
+        with FakeOpenAIServer(replies=["First", "Second reply"]) as server:
+            client = self.make_client(server)
+            
+            self.assertEqual(client.generate_response([{"role": "user", "content": "Hi"}]), "First")
+            self.assertEqual("".join(client.stream_response([{"role": "user", "content": "Hi"}])), "Second reply")
+    
+    def test_injected_rate_limit_is_retried(self):
+        """Test that an injected 429 carries Retry-After and is retried by the client."""
+        with FakeOpenAIServer(reply="After retry", fail_first=1, retry_after=2) as server:
+            sleeps = []
+            client = self.make_client(server, max_attempts=2)
+            client.retry_policy.sleep = sleeps.append
+            
+            self.assertEqual(client.generate_response([{"role": "user", "content": "Hi"}]), "After retry")
+            self.assertEqual(sleeps, [2.0])
+            self.assertEqual(server.status_counts, {429: 1, 200: 1})
+    
+    def test_random_fault_injection(self):
+        """Test that a 100% rate-limit rate always fails."""
+        with FakeOpenAIServer(rate_limit_rate=1.0, seed=0) as server:
+            client = self.make_client(server)
+            
+            with self.assertRaises(RateLimitError):
+                client.generate_response([{"role": "user", "content": "Hi"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.debate_simulator.infrastructure.ai_client import OpenAIClient
+from src.debate_simulator.infrastructure.cancellation import CancellationToken
+from src.debate_simulator.infrastructure.config import AppConfig
+from src.debate_simulator.infrastructure.http_transport import (
+    PooledHTTPTransport, TransportStats, diff_transport_stats,
+    get_shared_transport, set_shared_transport
+)
+from tests.fixtures.fake_openai_server import FakeOpenAIServer
+
+
+class TestTransportStats(unittest.TestCase):
+    """Test cases for TransportStats."""
+    
+    def test_hits_and_misses(self):
+        """Test hit/miss accounting."""
+        stats = TransportStats()
+        for _ in range(5):
+            stats.record_request()
+        stats.record_connection(0.2)
+        
+        self.assertEqual(stats.pool_hits, 4)
+        self.assertEqual(stats.pool_misses, 1)
+        self.assertAlmostEqual(stats.estimated_seconds_saved, 0.8)
+    
+    def test_diff_transport_stats(self):
+        """Test computing per-debate deltas from snapshots."""
+        stats = TransportStats()
+        stats.record_request()
+        stats.record_connection(0.1)
+        before = stats.to_dict()
+        
+        for _ in range(3):
+            stats.record_request()
+        delta = diff_transport_stats(before, stats.to_dict())
+        
+        self.assertEqual(delta["requests"], 3)
+        self.assertEqual(delta["pool_hits"], 3)
+        self.assertEqual(delta["pool_misses"], 0)
+        self.assertAlmostEqual(delta["estimated_seconds_saved"], 0.3)
+
+
+class TestPooledHTTPTransport(unittest.TestCase):
+    """Test cases for PooledHTTPTransport against a local server."""
+    
+    def test_connection_reused_across_requests(self):
+        """Test that sequential requests share one keep-alive connection."""
+        transport = PooledHTTPTransport()
+        with FakeOpenAIServer() as server:
+            for _ in range(5):
+                response = transport.post(server.url, json={"messages": []}, timeout=5)
+                self.assertEqual(response.status_code, 200)
+        transport.close()
+        
+        self.assertEqual(transport.stats.requests, 5)
+        self.assertEqual(transport.stats.pool_misses, 1)
+        self.assertEqual(transport.stats.pool_hits, 4)
+    
+    def test_reused_connection_leaves_earlier_cancel_scope(self):
+        """Test that cancelling a finished stream does not sever its connection once another request took it over."""
+        transport = PooledHTTPTransport()
+        with FakeOpenAIServer() as server:
+            first = CancellationToken()
+            streamed = transport.post(server.url, cancel_token=first, json={"messages": []}, timeout=5, stream=True)
+            streamed.content  # Body read, so the connection is back in the pool while the hook is still armed
+            transport.post(server.url, cancel_token=CancellationToken(), json={"messages": []}, timeout=5)
+            first.cancel()
+            
+            self.assertEqual(transport.post(server.url, json={"messages": []}, timeout=5).status_code, 200)
+        transport.close()
+        
+        self.assertEqual(transport.stats.pool_misses, 1)
+    
+    def test_concurrent_requests_bounded_by_pool(self):
+        """Test that concurrent callers never open more connections than requests."""
+        transport = PooledHTTPTransport(pool_maxsize=4)
+        with FakeOpenAIServer() as server:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(
+                    lambda _: transport.post(server.url, json={}, timeout=5).status_code,
+                    range(20)
+                ))
+        transport.close()
+        
+        self.assertEqual(results, [200] * 20)
+        self.assertLessEqual(transport.stats.pool_misses, 20)
+        self.assertGreater(transport.stats.pool_hits, 0)
+    
+    def test_from_config(self):
+        """Test creating a transport from AppConfig."""
+        config = AppConfig(http_pool_connections=3, http_pool_maxsize=7)
+        transport = PooledHTTPTransport.from_config(config)
+        
+        self.assertEqual(transport.pool_connections, 3)
+        self.assertEqual(transport.pool_maxsize, 7)
+    
+    def test_clients_share_transport(self):
+        """Test that client instances reuse the process-wide transport."""
+        shared = PooledHTTPTransport()
+        set_shared_transport(shared)
+        try:
+            first = OpenAIClient(api_key="sk-test123")
+            second = OpenAIClient(api_key="sk-test456")
+            self.assertIs(first.transport, shared)
+            self.assertIs(second.transport, shared)
+            self.assertIs(get_shared_transport(), shared)
+        finally:
+            set_shared_transport(None)
+    
+    def test_openai_client_over_pool(self):
+        """Test that an OpenAI client reuses connections across turns."""
+        transport = PooledHTTPTransport()
+        with FakeOpenAIServer(reply="Pooled reply") as server:
+            client = OpenAIClient(api_key="sk-test123", transport=transport)
+            client.base_url = server.url
+            responses = [client.generate_response([{"role": "user", "content": "Hi"}]) for _ in range(3)]
+        transport.close()
+        
+        self.assertEqual(responses, ["Pooled reply"] * 3)
+        self.assertEqual(transport.stats.pool_hits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
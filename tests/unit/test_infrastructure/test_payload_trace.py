@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.debate_simulator.infrastructure import payload_trace
+from src.debate_simulator.infrastructure.payload_trace import (
+    PayloadTracer, configure_payload_trace, get_payload_tracer, set_payload_tracer
+)
+
+
+class _ListHandler(logging.Handler):
+    """Collect formatted records in memory."""
+    
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+    
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+
+def make_payload(system_prompt="You are Alice, a pundit", user="Topic"):
+    """Build a chat completion payload."""
+    return {
+        "model": "gpt-4o",
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user}
+        ],
+        "max_tokens": 100
+    }
+
+
+class TestPayloadTracer(unittest.TestCase):
+    """Test cases for PayloadTracer."""
+    
+    def setUp(self):
+        """Set up a tracer on an isolated DEBUG logger."""
+        self.logger = logging.getLogger("test.payload_trace")
+        self.logger.handlers = []
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.handler = _ListHandler()
+        self.logger.addHandler(self.handler)
+        self.tracer = PayloadTracer(self.logger)
+    
+    def records(self):
+        """Parse the captured JSON lines."""
+        return [json.loads(line) for line in self.handler.lines]
+    
+    def test_nothing_serialized_when_debug_disabled(self):
+        """Test that no JSON is built when the level is off."""
+        self.logger.setLevel(logging.INFO)
+        
+        with patch.object(payload_trace.json, "dumps") as dumps:
+            trace_id = self.tracer.trace_request("response", make_payload())
+            self.tracer.trace_response(trace_id, "reply")
+        
+        self.assertIsNone(trace_id)
+        dumps.assert_not_called()
+        self.assertEqual(self.handler.lines, [])
+    
+    def test_request_and_response_are_compact_json_lines(self):
+        """Test that records are single-line JSON linked by id."""
+        trace_id = self.tracer.trace_request("response", make_payload())
+        self.tracer.trace_response(trace_id, "reply")
+        
+        for line in self.handler.lines:
+            self.assertNotIn("\n", line)
+        events = self.records()
+        self.assertEqual([e["event"] for e in events], ["system_prompt", "request", "response"])
+        self.assertEqual(events[1]["id"], events[2]["id"])
+        self.assertEqual(events[1]["payload"]["max_tokens"], 100)
+        self.assertEqual(events[2]["content"], "reply")
+    
+    def test_system_prompt_logged_once_per_hash(self):
+        """Test that repeated system prompts are replaced by a hash reference."""
+        self.tracer.trace_request("response", make_payload(user="First"))
+        self.tracer.trace_request("response", make_payload(user="Second"))
+        self.tracer.trace_request("response", make_payload(system_prompt="You are Bob, a host"))
+        
+        events = self.records()
+        prompts = [e for e in events if e["event"] == "system_prompt"]
+        requests = [e for e in events if e["event"] == "request"]
+        self.assertEqual(len(prompts), 2)
+        self.assertEqual(requests[0]["payload"]["messages"][0], {"role": "system", "ref": prompts[0]["hash"]})
+        self.assertEqual(requests[1]["payload"]["messages"][0]["ref"], prompts[0]["hash"])
+        self.assertEqual(requests[2]["payload"]["messages"][0]["ref"], prompts[1]["hash"])
+        self.assertNotIn("You are Alice", json.dumps(requests))
+    
+    def test_sampling_skips_requests(self):
+        """Test that unsampled requests and their responses are not traced."""
+        tracer = PayloadTracer(self.logger, sample_rate=0.5, rng=lambda: 0.75)
+        
+        trace_id = tracer.trace_request("judge", make_payload())
+        tracer.trace_response(trace_id, "reply")
+        
+        self.assertIsNone(trace_id)
+        self.assertEqual(self.handler.lines, [])
+    
+    def test_invalid_sample_rate(self):
+        """Test that the sample rate is validated."""
+        with self.assertRaises(ValueError):
+            PayloadTracer(self.logger, sample_rate=1.5)
+
+
+class TestConfigurePayloadTrace(unittest.TestCase):
+    """Test cases for the dedicated trace sink."""
+    
+    def setUp(self):
+        """Remember the global tracer and logger state."""
+        self.previous_tracer = get_payload_tracer()
+        self.logger = logging.getLogger(payload_trace.PAYLOAD_LOGGER_NAME)
+        self.previous_state = (list(self.logger.handlers), self.logger.level, self.logger.propagate)
+        self.temp_dir = tempfile.mkdtemp()
+        self.listener = None
+    
+    def tearDown(self):
+        """Restore the global tracer and logger state."""
+        if self.listener is not None:
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+        payload_trace._payload_trace_listener = None
+        set_payload_tracer(self.previous_tracer)
+        self.logger.handlers, self.logger.level, self.logger.propagate = self.previous_state
+    
+    def test_traces_written_to_jsonl_file(self):
+        """Test that traces reach the file through the background listener."""
+        path = os.path.join(self.temp_dir, "trace.jsonl")
+        self.listener = configure_payload_trace(path)
+        
+        tracer = get_payload_tracer()
+        trace_id = tracer.trace_request("response", make_payload())
+        tracer.trace_response(trace_id, "reply")
+        self.listener.stop()
+        self.listener.handlers[0].close()
+        self.listener = None
+        
+        with open(path, encoding="utf-8") as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([e["event"] for e in events], ["system_prompt", "request", "response"])
+        self.assertFalse(self.logger.propagate)
+        self.assertTrue(payload_trace.is_payload_trace_configured())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.debate_simulator.infrastructure.ai_client import MockAIClient, AsyncMockAIClient
+from src.debate_simulator.infrastructure.cancellation import CancellationToken, cancellation_scope
+from src.debate_simulator.infrastructure.config import AppConfig
+from src.debate_simulator.infrastructure.errors import RateLimiterRejectedError, RequestCancelledError
+from src.debate_simulator.infrastructure.rate_limiter import (
+    RateLimiter, RateLimitedAIClient, TokenBucket, estimate_tokens
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+    
+    def test_refill_rate(self):
+        """Test that budget refills at the per-minute rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        bucket.take(60)
+        
+        self.assertAlmostEqual(bucket.wait_time(1), 1.0)
+        clock.now = 0.5
+        self.assertAlmostEqual(bucket.wait_time(1), 0.5)
+        clock.now = 1.0
+        self.assertEqual(bucket.wait_time(1), 0.0)
+    
+    def test_oversized_request_clamped(self):
+        """Test that a request larger than the budget can still be admitted."""
+        bucket = TokenBucket(10, FakeClock())
+        
+        self.assertEqual(bucket.wait_time(50), 0.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+    
+    def test_unlimited_by_default(self):
+        """Test that a limiter without budgets never waits."""
+        limiter = RateLimiter()
+        
+        self.assertFalse(limiter.enabled)
+        self.assertEqual(limiter.acquire(10_000), 0.0)
+    
+    def test_waits_for_token_budget(self):
+        """Test that callers block until the token budget refills."""
+        limiter = RateLimiter(tokens_per_minute=6000)
+        limiter.acquire(6000)
+        
+        waited = limiter.acquire(20)
+        
+        self.assertGreaterEqual(waited, 0.15)
+        self.assertLess(waited, 1.0)
+        self.assertEqual(limiter.get_stats()["admitted"], 2)
+    
+    def test_fifo_order(self):
+        """Test that a small request does not overtake a queued large one."""
+        limiter = RateLimiter(tokens_per_minute=6000)
+        limiter.acquire(6000)
+        order = []
+        
+        large = threading.Thread(target=lambda: (limiter.acquire(30), order.append("large")))
+        small = threading.Thread(target=lambda: (limiter.acquire(1), order.append("small")))
+        large.start()
+        time.sleep(0.05)
+        small.start()
+        large.join(5)
+        small.join(5)
+        
+        self.assertEqual(order, ["large", "small"])
+        self.assertEqual(limiter.get_stats()["max_queue_depth"], 2)
+    
+    def test_rejects_when_queue_full(self):
+        """Test that callers beyond the queue bound are rejected."""
+        limiter = RateLimiter(requests_per_minute=60, max_queue=1)
+        for _ in range(60):
+            limiter.acquire()
+        waiter = threading.Thread(target=limiter.acquire)
+        waiter.start()
+        time.sleep(0.05)
+        
+        with self.assertRaises(RateLimiterRejectedError):
+            limiter.acquire()
+        
+        waiter.join(5)
+        self.assertEqual(limiter.get_stats()["rejections"], 1)
+    
+    def test_rejects_after_max_wait(self):
+        """Test that a caller who cannot be admitted in time is rejected."""
+        limiter = RateLimiter(requests_per_minute=1, max_wait=0.5)
+        limiter.acquire()
+        
+        with self.assertRaises(RateLimiterRejectedError):
+            limiter.acquire()
+        self.assertEqual(limiter.get_stats()["queue_depth"], 0)
+    
+    def test_cancelled_waiter_leaves_the_queue(self):
+        """Test that cancellation wakes a queued caller instead of waiting out max_wait."""
+        limiter = RateLimiter(requests_per_minute=1, max_wait=60.0)
+        limiter.acquire()
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel).start()
+        
+        started = time.monotonic()
+        with cancellation_scope(token), self.assertRaises(RequestCancelledError):
+            limiter.acquire()
+        
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(limiter.get_stats()["queue_depth"], 0)
+    
+    def test_from_config(self):
+        """Test creating a limiter from AppConfig."""
+        limiter = RateLimiter.from_config(AppConfig(rate_limit_rpm=500, rate_limit_tpm=0))
+        
+        self.assertTrue(limiter.enabled)
+        self.assertEqual(limiter.requests_per_minute, 500)
+        self.assertIsNone(limiter.tokens_per_minute)
+
+
+class TestRateLimiterAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async admission."""
+    
+    async def test_async_waiters_do_not_block_loop(self):
+        """Test that waiting for budget leaves the event loop free."""
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire_async(6000)
+        ticks = []
+        
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.02)
+        
+        waited, _ = await asyncio.gather(limiter.acquire_async(20), ticker())
+        
+        self.assertGreaterEqual(waited, 0.15)
+        self.assertEqual(len(ticks), 5)
+    
+    async def test_cancelled_async_waiter_leaves_the_queue(self):
+        """Test that cancellation wakes a queued async caller."""
+        limiter = RateLimiter(requests_per_minute=1, max_wait=60.0)
+        await limiter.acquire_async()
+        token = CancellationToken()
+        asyncio.get_running_loop().call_later(0.1, token.cancel)
+        
+        started = time.monotonic()
+        with cancellation_scope(token), self.assertRaises(RequestCancelledError):
+            await limiter.acquire_async()
+        
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(limiter.get_stats()["queue_depth"], 0)
+
+
+class TestRateLimitedAIClient(unittest.TestCase):
+    """Test cases for RateLimitedAIClient."""
+    
+    def test_calls_go_through_limiter(self):
+        """Test that every call is admitted and counted."""
+        limiter = RateLimiter(requests_per_minute=100)
+        client = RateLimitedAIClient(MockAIClient(fixed_response="Limited"), limiter)
+        
+        client.generate_response([{"role": "user", "content": "Hi"}])
+        client.generate_judge_response("Judge")
+        list(client.stream_response([{"role": "user", "content": "Hi"}]))
+        
+        self.assertEqual(client.get_rate_limit_stats()["admitted"], 3)
+    
+    def test_token_estimate(self):
+        """Test the rough prompt plus completion token estimate."""
+        self.assertEqual(estimate_tokens([{"role": "user", "content": "x" * 40}], 100), 114)
+
+
+class TestRateLimitedAIClientAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async paths of RateLimitedAIClient."""
+    
+    async def test_async_calls_go_through_limiter(self):
+        """Test that async calls share the same limiter."""
+        limiter = RateLimiter(requests_per_minute=100)
+        client = RateLimitedAIClient(AsyncMockAIClient(fixed_response="Limited"), limiter)
+        
+        await asyncio.gather(*[client.generate_response_async([{"role": "user", "content": "Hi"}]) for _ in range(5)])
+        
+        self.assertEqual(limiter.get_stats()["admitted"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import requests
+
+from src.debate_simulator.domain.characters.base import Character, CharacterStats
+from src.debate_simulator.domain.debate.models import DebateSettings, DebateStatus
+from src.debate_simulator.domain.debate.orchestrator import DebateOrchestrator
+from src.debate_simulator.infrastructure.ai_client import AsyncOpenAIClient, OpenAIClient, MockAIClient
+from src.debate_simulator.infrastructure.errors import (
+    RateLimitError, ServerError, PermanentAIError, CircuitOpenError,
+    classify_http_error, parse_retry_after
+)
+from src.debate_simulator.infrastructure.resilience import RetryPolicy, CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_response(status_code, content="OK", headers=None):
+    """Build a fake HTTP response."""
+    response = Mock()
+    response.status_code = status_code
+    response.text = content
+    response.headers = headers or {}
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    return response
+
+
+class TestErrorClassification(unittest.TestCase):
+    """Test cases for HTTP error classification."""
+    
+    def test_classify_statuses(self):
+        """Test mapping statuses to typed errors."""
+        self.assertIsInstance(classify_http_error(429, "slow down"), RateLimitError)
+        self.assertIsInstance(classify_http_error(503, "unavailable"), ServerError)
+        self.assertIsInstance(classify_http_error(400, "bad request"), PermanentAIError)
+        self.assertIsInstance(classify_http_error(401, "unauthorized"), PermanentAIError)
+    
+    def test_retry_after_header(self):
+        """Test that Retry-After is parsed from seconds and carried on the error."""
+        error = classify_http_error(429, "slow down", {"Retry-After": "7"})
+        
+        self.assertEqual(error.retry_after, 7.0)
+        self.assertIsNone(parse_retry_after("not a date"))
+        self.assertEqual(parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT"), 0.0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for RetryPolicy."""
+    
+    def setUp(self):
+        """Set up a policy that records sleeps instead of sleeping."""
+        self.sleeps = []
+        self.policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=5.0, sleep=self.sleeps.append, rng=lambda: 1.0)
+    
+    def test_exponential_backoff_capped(self):
+        """Test that delays double up to the maximum."""
+        operation = Mock(side_effect=ServerError("boom", 500))
+        
+        with self.assertRaises(ServerError):
+            self.policy.call(operation)
+        
+        self.assertEqual(operation.call_count, 4)
+        self.assertEqual(self.sleeps, [1.0, 2.0, 4.0])
+    
+    def test_honors_retry_after(self):
+        """Test that a server-provided delay overrides the backoff."""
+        operation = Mock(side_effect=[RateLimitError("slow down", 429, retry_after=3.0), "done"])
+        
+        self.assertEqual(self.policy.call(operation), "done")
+        self.assertEqual(self.sleeps, [3.0])
+    
+    def test_permanent_errors_not_retried(self):
+        """Test that non-transient errors propagate immediately."""
+        operation = Mock(side_effect=PermanentAIError("bad request", 400))
+        
+        with self.assertRaises(PermanentAIError):
+            self.policy.call(operation)
+        
+        self.assertEqual(operation.call_count, 1)
+        self.assertEqual(self.sleeps, [])
+    
+    def test_jitter_spreads_delays(self):
+        """Test that the jitter scales the delay by the random draw."""
+        policy = RetryPolicy(base_delay=2.0, rng=lambda: 0.25)
+        
+        self.assertEqual(policy.compute_delay(2, ServerError("boom")), 1.0)
+
+
+class TestRetryPolicyAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for async retries."""
+    
+    async def test_call_async_retries(self):
+        """Test that async operations are retried on transient failure."""
+        attempts = []
+        
+        async def operation():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ServerError("boom", 502)
+            return "ok"
+        
+        result = await RetryPolicy(base_delay=0.001).call_async(operation)
+        
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(attempts), 3)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for CircuitBreaker."""
+    
+    def setUp(self):
+        """Set up a breaker on a fake clock."""
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=self.clock)
+    
+    def test_opens_after_threshold(self):
+        """Test that the breaker fails fast once the threshold is reached."""
+        self.breaker.record_failure()
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.before_call()
+        self.assertEqual(context.exception.retry_after, 10)
+    
+    def test_half_open_allows_single_trial(self):
+        """Test that one trial call is let through after the cool-down."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        
+        self.breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+        
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_failed_trial_reopens(self):
+        """Test that a failing trial call reopens the breaker."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.get_stats()["times_opened"], 2)
+
+
+class TestOpenAIClientResilience(unittest.TestCase):
+    """Test cases for retries and circuit breaking in OpenAIClient."""
+    
+    def setUp(self):
+        """Set up a client on a mock transport."""
+        self.transport = Mock()
+        self.sleeps = []
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+        self.client = OpenAIClient(
+            api_key="sk-test123",
+            transport=self.transport,
+            retry_policy=RetryPolicy(max_attempts=3, sleep=self.sleeps.append),
+            circuit_breaker=self.breaker
+        )
+    
+    def test_rate_limit_then_success(self):
+        """Test that a 429 is retried after the Retry-After delay."""
+        self.transport.post.side_effect = [
+            make_response(429, "rate limited", {"Retry-After": "2"}),
+            make_response(200, "Recovered")
+        ]
+        
+        self.assertEqual(self.client.generate_response([{"role": "user", "content": "Hi"}]), "Recovered")
+        self.assertEqual(self.sleeps, [2.0])
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_outage_opens_circuit(self):
+        """Test that repeated 5xx failures open the breaker and later calls fail fast."""
+        self.transport.post.return_value = make_response(503, "unavailable")
+        
+        with self.assertRaises(ServerError):
+            self.client.generate_response([{"role": "user", "content": "Hi"}])
+        with self.assertRaises(CircuitOpenError):
+            self.client.generate_judge_response("Judge")
+        
+        self.assertEqual(self.transport.post.call_count, 3)
+    
+    def open_breaker_for_trial(self):
+        """Trip the breaker and let its cool-down pass, so the next call is the half-open trial."""
+        clock = FakeClock()
+        self.breaker = self.client._circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        self.breaker.record_failure()
+        clock.now = 10
+    
+    def test_unexpected_error_in_trial_frees_the_slot(self):
+        """Test that a half-open trial failing with a generic request error does not wedge the breaker."""
+        self.open_breaker_for_trial()
+        self.transport.post.side_effect = [requests.exceptions.InvalidURL("bad url"), make_response(200, "Recovered")]
+        
+        with self.assertRaises(PermanentAIError):
+            self.client.generate_response([{"role": "user", "content": "Hi"}])
+        
+        self.assertEqual(self.client.generate_response([{"role": "user", "content": "Hi"}]), "Recovered")
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_unexpected_error_in_async_trial_frees_the_slot(self):
+        """Test the same for the async client, where the HTTP client raises something unclassified."""
+        client = AsyncOpenAIClient(api_key="sk-test123", retry_policy=RetryPolicy(max_attempts=1))
+        self.client = client
+        self.open_breaker_for_trial()
+        http_client = Mock()
+        http_client.post = AsyncMock(side_effect=httpx.InvalidURL("bad url"))
+        
+        with patch.object(client, "_get_http_client", return_value=http_client):
+            with self.assertRaises(httpx.InvalidURL):
+                asyncio.run(client.generate_response_async([{"role": "user", "content": "Hi"}]))
+            http_client.post.side_effect = None
+            http_client.post.return_value = make_response(200, "Recovered")
+            asyncio.run(client.generate_response_async([{"role": "user", "content": "Hi"}]))
+        
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestOrchestratorOutage(unittest.TestCase):
+    """Test cases for the orchestrator reacting to an open circuit."""
+    
+    def test_circuit_open_pauses_debate(self):
+        """Test that the debate pauses instead of recording failed turns."""
+        client = MockAIClient()
+        client.generate_response = Mock(side_effect=CircuitOpenError("provider down", retry_after=12.0))
+        orchestrator = DebateOrchestrator(client)
+        participants = [
+            Character(name="Alice", role="analyst", personality="Calm", style="Measured", stats=CharacterStats()),
+            Character(name="Bob", role="pundit", personality="Loud", style="Brash", stats=CharacterStats())
+        ]
+        session = orchestrator.create_debate("Test political debate topic", participants, DebateSettings(total_rounds=2, response_delay=0.0))
+        
+        orchestrator.start_debate(participants)
+        
+        self.assertEqual(session.status, DebateStatus.PAUSED)
+        self.assertEqual(session.metadata["retry_after"], 12.0)
+        self.assertEqual(client.generate_response.call_count, 1)
+        self.assertEqual(session.conversation.get_all_messages(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
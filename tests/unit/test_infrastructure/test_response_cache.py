@@ -0,0 +1,200 @@
+import os
+import tempfile
+import unittest
+
+from src.debate_simulator.infrastructure.ai_client import MockAIClient, AsyncMockAIClient, OpenAIClient
+from src.debate_simulator.infrastructure.config import AppConfig
+from src.debate_simulator.infrastructure.response_cache import (
+    ResponseCache, CachingAIClient, request_fingerprint
+)
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestRequestFingerprint(unittest.TestCase):
+    """Test cases for request_fingerprint."""
+    
+    def test_stable_across_key_order(self):
+        """Test that parameter ordering does not change the fingerprint."""
+        messages = [{"role": "user", "content": "Hi"}]
+        first = request_fingerprint("gpt-4o", messages, {"temperature": 0.8, "max_tokens": 100})
+        second = request_fingerprint("gpt-4o", messages, {"max_tokens": 100, "temperature": 0.8})
+        
+        self.assertEqual(first, second)
+    
+    def test_sensitive_to_model_messages_and_params(self):
+        """Test that any request difference changes the fingerprint."""
+        messages = [{"role": "user", "content": "Hi"}]
+        base = request_fingerprint("gpt-4o", messages, {"temperature": 0.8})
+        
+        self.assertNotEqual(base, request_fingerprint("gpt-4o-mini", messages, {"temperature": 0.8}))
+        self.assertNotEqual(base, request_fingerprint("gpt-4o", [{"role": "user", "content": "Hey"}], {"temperature": 0.8}))
+        self.assertNotEqual(base, request_fingerprint("gpt-4o", messages, {"temperature": 0.3}))
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+        
+        self.assertEqual(cache.get("a"), "A")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(len(cache), 2)
+    
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are dropped."""
+        clock = FakeClock()
+        cache = ResponseCache(ttl_seconds=60, clock=clock)
+        cache.set("a", "A")
+        
+        clock.now += 30
+        self.assertEqual(cache.get("a"), "A")
+        clock.now += 31
+        self.assertIsNone(cache.get("a"))
+        
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["expirations"], 1)
+    
+    def test_disk_tier_survives_restart(self):
+        """Test that entries persist in SQLite across cache instances."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "responses.db")
+            first = ResponseCache(disk_path=path)
+            first.set("a", "A")
+            first.close()
+            
+            second = ResponseCache(disk_path=path)
+            self.assertEqual(second.get("a"), "A")
+            self.assertEqual(second.stats.disk_hits, 1)
+            second.close()
+    
+    def test_disk_tier_backs_evicted_entries(self):
+        """Test that entries evicted from memory are still served from disk."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(max_entries=1, disk_path=os.path.join(tmp, "responses.db"))
+            cache.set("a", "A")
+            cache.set("b", "B")
+            
+            self.assertEqual(cache.get("a"), "A")
+            self.assertEqual(cache.stats.disk_hits, 1)
+            cache.close()
+    
+    def test_from_config(self):
+        """Test creating a cache from AppConfig."""
+        cache = ResponseCache.from_config(AppConfig(response_cache_max_entries=5, response_cache_ttl=0))
+        
+        self.assertEqual(cache.max_entries, 5)
+        self.assertIsNone(cache.ttl_seconds)
+    
+    def test_invalid_size(self):
+        """Test that an empty cache is rejected."""
+        with self.assertRaises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestCachingAIClient(unittest.TestCase):
+    """Test cases for CachingAIClient."""
+    
+    def setUp(self):
+        """Set up a caching wrapper around a counting mock client."""
+        self.inner = MockAIClient(fixed_response="Cached reply", fixed_judge_response='{"A": {}}')
+        self.client = CachingAIClient(self.inner)
+        self.messages = [{"role": "system", "content": "You are Alice"}, {"role": "user", "content": "Topic"}]
+    
+    def test_repeated_request_served_from_cache(self):
+        """Test that identical prompts reach the wrapped client once."""
+        first = self.client.generate_response(self.messages)
+        second = self.client.generate_response(list(self.messages))
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.inner.call_count, 1)
+        self.assertEqual(self.client.get_cache_stats()["hits"], 1)
+    
+    def test_judge_and_response_keys_are_separate(self):
+        """Test that judge prompts do not collide with character prompts."""
+        self.client.generate_response([{"role": "user", "content": "Same"}])
+        judge = self.client.generate_judge_response("Same")
+        
+        self.assertEqual(judge, '{"A": {}}')
+        self.assertEqual(self.inner.judge_call_count, 1)
+    
+    def test_stream_replays_cached_deltas(self):
+        """Test that a cached response streams back as word deltas."""
+        streamed = "".join(self.client.stream_response(self.messages))
+        replayed = list(self.client.stream_response(self.messages))
+        
+        self.assertEqual(streamed, "Cached reply")
+        self.assertEqual(replayed, ["Cached", " reply"])
+        self.assertEqual(self.inner.call_count, 1)
+    
+    def test_errors_not_cached(self):
+        """Test that error strings are never stored."""
+        inner = MockAIClient(fixed_response="Error: HTTP 500 - boom")
+        client = CachingAIClient(inner)
+        client.generate_response(self.messages)
+        client.generate_response(self.messages)
+        
+        self.assertEqual(inner.call_count, 2)
+    
+    def test_skip_nonzero_temperature(self):
+        """Test the opt-out for sampled (non-deterministic) requests."""
+        inner = OpenAIClient(api_key="sk-test123")
+        client = CachingAIClient(inner, skip_nonzero_temperature=True)
+        
+        self.assertIsNone(client._response_key(self.messages))
+        self.assertIsNone(client._judge_key("prompt"))
+        self.assertEqual(client.cache.stats.bypasses, 2)
+    
+    def test_sampled_requests_bypass_by_default(self):
+        """Test that sampled replies are not replayed unless caching them is asked for."""
+        inner = OpenAIClient(api_key="sk-test123")
+        
+        self.assertIsNone(CachingAIClient(inner)._response_key(self.messages))
+        self.assertIsNotNone(CachingAIClient(inner, skip_nonzero_temperature=False)._response_key(self.messages))
+        self.assertTrue(AppConfig().response_cache_skip_nonzero_temperature)
+    
+    def test_wrapped_attributes_exposed(self):
+        """Test that attributes of the wrapped client pass through."""
+        self.client.generate_response(self.messages)
+        
+        self.assertEqual(self.client.call_count, 1)
+        self.assertEqual(self.client.fixed_response, "Cached reply")
+
+
+class TestCachingAIClientAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the async paths of CachingAIClient."""
+    
+    async def test_async_hit_after_sync_miss(self):
+        """Test that sync and async calls share cache entries."""
+        inner = AsyncMockAIClient(fixed_response="Shared reply")
+        client = CachingAIClient(inner)
+        messages = [{"role": "user", "content": "Topic"}]
+        
+        client.generate_response(messages)
+        response = await client.generate_response_async(messages)
+        deltas = [delta async for delta in client.stream_response_async(messages)]
+        
+        self.assertEqual(response, "Shared reply")
+        self.assertEqual("".join(deltas), "Shared reply")
+        self.assertEqual(inner.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
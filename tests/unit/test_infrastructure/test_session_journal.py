@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from src.debate_simulator.infrastructure.session_journal import SessionJournal, journal_path, read_journal
+
+
+class FakeClock:
+    """Manually advanced clock for fsync interval tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestSessionJournal(unittest.TestCase):
+    """Test cases for SessionJournal."""
+    
+    def setUp(self):
+        """Set up a temporary journal directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = journal_path(os.path.join(self.tmp.name, "journals"), "abc123")
+    
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+    
+    def test_events_round_trip_in_order(self):
+        """Test that appended events are read back in order."""
+        journal = SessionJournal(self.path)
+        self.assertTrue(journal.is_empty)
+        
+        journal.append("round_start", round=1)
+        journal.append("message", message={"speaker": "Alice"})
+        journal.close()
+        
+        events = read_journal(self.path)
+        self.assertEqual([e["type"] for e in events], ["round_start", "message"])
+        self.assertEqual(events[1]["message"], {"speaker": "Alice"})
+        self.assertFalse(SessionJournal(self.path).is_empty)
+    
+    def test_fsync_is_batched_by_interval(self):
+        """Test that events inside one interval share a single fsync."""
+        clock = FakeClock()
+        journal = SessionJournal(self.path, fsync_interval=1.0, clock=clock)
+        
+        for _ in range(5):
+            journal.append("message")
+        self.assertEqual(journal.syncs, 0)
+        
+        clock.now = 1.5
+        journal.append("message")
+        self.assertEqual(journal.syncs, 1)
+        
+        journal.close()
+        self.assertEqual(journal.get_stats()["events_written"], 6)
+    
+    def test_zero_interval_syncs_every_event(self):
+        """Test that an interval of 0 makes every event durable."""
+        journal = SessionJournal(self.path, fsync_interval=0.0, clock=FakeClock())
+        
+        journal.append("message")
+        journal.append("message")
+        
+        self.assertEqual(journal.syncs, 2)
+        journal.close()
+    
+    def test_torn_last_line_is_skipped(self):
+        """Test that a partially written event does not hide earlier ones."""
+        journal = SessionJournal(self.path)
+        journal.append("message", text="complete")
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "message", "text": "cut sh')
+        
+        with self.assertLogs(level="WARNING"):
+            events = read_journal(self.path)
+        
+        self.assertEqual([e["text"] for e in events], ["complete"])
+
+
+if __name__ == '__main__':
+    unittest.main()
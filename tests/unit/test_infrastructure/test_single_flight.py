@@ -0,0 +1,223 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.debate_simulator.infrastructure.ai_client import MockAIClient, AsyncMockAIClient
+from src.debate_simulator.infrastructure.cancellation import CancellationToken, cancellation_scope, current_cancellation_token
+from src.debate_simulator.infrastructure.errors import RequestCancelledError
+from src.debate_simulator.infrastructure.single_flight import SingleFlight, SingleFlightAIClient
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are Alice, a policy analyst."},
+    {"role": "user", "content": "Debate topic: universal basic income"}
+]
+
+
+class TestSingleFlightAIClient(unittest.TestCase):
+    """Test cases for coalescing with the threaded sync client."""
+    
+    def test_identical_concurrent_requests_share_one_call(self):
+        """Test that concurrent identical prompts reach the wrapped client once."""
+        inner = MockAIClient(fixed_response="Shared opening", latency=0.2)
+        client = SingleFlightAIClient(inner)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: client.generate_response(MESSAGES), range(5)))
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(results, ["Shared opening"] * 5)
+        self.assertEqual(inner.call_count, 1)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(client.get_single_flight_stats()["coalesced"], 4)
+    
+    def test_different_requests_not_coalesced(self):
+        """Test that distinct prompts each get their own call."""
+        inner = MockAIClient(fixed_response="Reply", latency=0.05)
+        client = SingleFlightAIClient(inner)
+        other = MESSAGES[:1] + [{"role": "user", "content": "Debate topic: tariffs"}]
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(client.generate_response, [MESSAGES, other]))
+        
+        self.assertEqual(inner.call_count, 2)
+    
+    def test_sequential_requests_not_coalesced(self):
+        """Test that only in-flight calls are shared (this is not a cache)."""
+        inner = MockAIClient(fixed_response="Reply")
+        client = SingleFlightAIClient(inner)
+        
+        client.generate_response(MESSAGES)
+        client.generate_response(MESSAGES)
+        
+        self.assertEqual(inner.call_count, 2)
+        self.assertEqual(client.get_single_flight_stats()["in_flight"], 0)
+    
+    def test_error_shared_with_followers(self):
+        """Test that followers receive the leader's error."""
+        group = SingleFlight()
+        
+        def failing():
+            time.sleep(0.1)
+            raise RuntimeError("upstream failed")
+        
+        def call(_):
+            try:
+                return group.do("key", failing)
+            except RuntimeError as e:
+                return str(e)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(call, range(3)))
+        
+        self.assertEqual(results, ["upstream failed"] * 3)
+        self.assertEqual(group.get_stats()["executed"], 1)
+    
+    def test_cancelled_leader_hands_over_to_follower(self):
+        """Test that a follower whose leader was cancelled makes the call itself instead of failing."""
+        group = SingleFlight()
+        leader_token = CancellationToken()
+        calls = []
+        
+        def operation():
+            calls.append(current_cancellation_token())
+            if len(calls) == 1:
+                leader_token.wait(5)
+                leader_token.raise_if_cancelled()
+            return "Fresh reply"
+        
+        def lead():
+            with cancellation_scope(leader_token):
+                return group.do("key", operation)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(lead)
+            time.sleep(0.05)
+            follower = executor.submit(group.do, "key", operation)
+            time.sleep(0.05)
+            leader_token.cancel("Stop pressed")
+            
+            with self.assertRaises(RequestCancelledError):
+                leader.result(1)
+            self.assertEqual(follower.result(1), "Fresh reply")
+        
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(group.get_stats()["in_flight"], 0)
+    
+    def test_follower_wait_honours_its_own_token(self):
+        """Test that a cancelled follower stops waiting while the leader carries on."""
+        group = SingleFlight()
+        release = CancellationToken()
+        follower_token = CancellationToken()
+        
+        def operation():
+            release.wait(5)
+            return "Leader reply"
+        
+        def follow():
+            with cancellation_scope(follower_token):
+                return group.do("key", operation)
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(group.do, "key", operation)
+            time.sleep(0.05)
+            follower = executor.submit(follow)
+            time.sleep(0.05)
+            follower_token.cancel()
+            
+            with self.assertRaises(RequestCancelledError):
+                follower.result(1)
+            release.cancel()
+            self.assertEqual(leader.result(1), "Leader reply")
+    
+    def test_stream_followers_replay_leader_text(self):
+        """Test that streaming followers receive the leader's full reply."""
+        inner = MockAIClient(fixed_response="Streamed opening statement", latency=0.1)
+        client = SingleFlightAIClient(inner)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda _: "".join(client.stream_response(MESSAGES)), range(3)))
+        
+        self.assertEqual(results, ["Streamed opening statement"] * 3)
+        self.assertEqual(inner.call_count, 1)
+
+
+class TestSingleFlightAIClientAsync(unittest.IsolatedAsyncioTestCase):
+    """Test cases for coalescing with the async client."""
+    
+    async def test_identical_concurrent_requests_share_one_call(self):
+        """Test that concurrent identical coroutines reach the wrapped client once."""
+        inner = AsyncMockAIClient(fixed_response="Shared opening", latency=0.1)
+        client = SingleFlightAIClient(inner)
+        
+        results = await asyncio.gather(*[client.generate_response_async(MESSAGES) for _ in range(10)])
+        
+        self.assertEqual(results, ["Shared opening"] * 10)
+        self.assertEqual(inner.call_count, 1)
+    
+    async def test_cancelled_follower_does_not_cancel_leader(self):
+        """Test that a follower giving up leaves the shared call running."""
+        inner = AsyncMockAIClient(fixed_response="Survives", latency=0.1)
+        client = SingleFlightAIClient(inner)
+        
+        leader = asyncio.create_task(client.generate_response_async(MESSAGES))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.generate_response_async(MESSAGES))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        
+        self.assertEqual(await leader, "Survives")
+        with self.assertRaises(asyncio.CancelledError):
+            await follower
+    
+    async def test_cancelled_leader_hands_over_to_follower(self):
+        """Test that cancelling the leading task leaves its followers running and one of them re-issues the call."""
+        inner = AsyncMockAIClient(fixed_response="Survives", latency=0.1)
+        client = SingleFlightAIClient(inner)
+        
+        leader = asyncio.create_task(client.generate_response_async(MESSAGES))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(client.generate_response_async(MESSAGES)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        
+        self.assertEqual(await asyncio.gather(*followers), ["Survives", "Survives"])
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.assertEqual(client.get_single_flight_stats()["executed"], 2)
+    
+    async def test_abandoned_stream_leader_hands_over(self):
+        """Test that a streaming leader whose consumer stops early does not fail its followers."""
+        inner = AsyncMockAIClient(fixed_response="Async streamed opening", latency=0.05)
+        client = SingleFlightAIClient(inner)
+        
+        async def collect():
+            return "".join([delta async for delta in client.stream_response_async(MESSAGES)])
+        
+        stream = client.stream_response_async(MESSAGES)
+        first = await stream.__anext__()
+        follower = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+        
+        self.assertEqual(first, "Async")
+        self.assertEqual(await follower, "Async streamed opening")
+    
+    async def test_async_stream_followers(self):
+        """Test that async streaming followers replay the leader's text."""
+        inner = AsyncMockAIClient(fixed_response="Async streamed opening", latency=0.05)
+        client = SingleFlightAIClient(inner)
+        
+        async def collect():
+            return "".join([delta async for delta in client.stream_response_async(MESSAGES)])
+        
+        results = await asyncio.gather(*[collect() for _ in range(3)])
+        
+        self.assertEqual(results, ["Async streamed opening"] * 3)
+        self.assertEqual(inner.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()